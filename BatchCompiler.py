@@ -0,0 +1,347 @@
+"""
+Filename: BatchCompiler.py
+Tested using Python 3.5.1
+
+David Dalcino
+CS 6110
+Prof. Reiter
+Winter 2017
+CSU East Bay
+
+This script compiles every Go-- source file in one or more directories, each
+one on its own, across a pool of worker processes, and reports what happened
+to each file as JSON, for build tools to read.
+
+Usage: python3 BatchCompiler.py [--bounds-check] [--memoize] [--incremental]
+            [--workers=N] [--extensions=EXT{,EXT}] [--output-dir=DIR]
+            [--summary=FILE] <directory_or_pattern> {<another>}
+
+Each argument may be a directory, which is searched for source files with
+one of the extensions EXT (.gomm and .txt by default), along with the
+directories inside it; a glob pattern, like "tests/**/*.gomm", whose quotes
+keep the shell from expanding it; or the name of one source file. Hidden
+directories, like .gommcache, are not searched.
+
+Each file is compiled to a file with the same name and the extension .asm,
+like GommCompiler.py does; with --output-dir, the .asm files are put in DIR
+instead, in the same directories, relative to DIR, that the sources are in
+relative to the directory they were found in. The other options are the
+same as GommCompiler.py's. N worker processes (one for each CPU, by default)
+compile the files, largest first: each worker takes the next file as soon as
+it finishes the last one, so a large file that is started late does not
+leave the others waiting while one worker compiles it.
+
+The summary is written to FILE, or printed if --summary is not given. It
+holds "ok" (true if every file compiled), the number of "files", "succeeded"
+and "failed", the number of "workers", "wall_ms" (how long the whole batch
+took) and "compile_ms" (the time spent compiling, summed over the files);
+and "results", a list with one dict for each file, in the order the files
+were found: its "source", its "asm" file, "ok", "bytes" (the size of the
+source), "ms" (how long it took to compile), "worker" (the process id of the
+worker that compiled it), "errors" (each one a dict from ParseError.to_dict())
+and "error_count". A file that did not compile also has "messages", the last
+lines the compiler printed about it; and "exception", if the compiler raised
+one. Two files that would be compiled to the same .asm file, like a.gomm and
+a.txt, are not compiled at all; both are reported as failures, with a
+message that names the other. The script exits with status 1 if any file
+failed to compile.
+"""
+
+import contextlib
+import glob
+import io
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+
+SOURCE_EXTENSIONS = (".gomm", ".txt")   # The files a directory is searched
+                                        # for, by default
+MESSAGE_LINES = 10      # How many lines of messages to keep for each failure
+
+
+#################################################################
+# FINDING SOURCE FILES
+
+def find_sources(arguments, extensions=SOURCE_EXTENSIONS):
+    """
+    Finds the source files named by a list of directories, glob patterns and
+    file names.
+    :param arguments:   The directories, patterns and file names
+    :param extensions:  The extensions of the files to find in a directory
+    :return:            A list of (source file name, root) tuples, in the
+                        order they were found, sorted within each argument.
+                        root is the directory the file was found in, or the
+                        directory it is in, if it was named by a pattern or
+                        by name. Each file is listed only once.
+    """
+    sources = []
+    seen = set()
+
+    def add(filename, root):
+        key = os.path.realpath(filename)
+        if key not in seen:
+            seen.add(key)
+            sources.append((filename, root))
+
+    for argument in arguments:
+        if os.path.isdir(argument):
+            for directory, subdirectories, filenames in os.walk(argument):
+                # Search the directories in order, skipping hidden ones
+                subdirectories[:] = sorted(
+                    name for name in subdirectories
+                    if not name.startswith("."))
+                for name in sorted(filenames):
+                    if os.path.splitext(name)[1] in extensions:
+                        add(os.path.join(directory, name), argument)
+        elif any(ch in argument for ch in "*?["):
+            for filename in sorted(glob.glob(argument, recursive=True)):
+                if os.path.isfile(filename):
+                    add(filename, os.path.dirname(filename))
+        else:
+            # A single file is compiled whatever its extension is, and one
+            # that does not exist is reported as a failure
+            add(argument, os.path.dirname(argument))
+    return sources
+
+
+
+def asm_filename(source_filename, root, output_dir=None):
+    """
+    :param source_filename: The name of a source file
+    :param root:            The directory it was found in
+    :param output_dir:      If not None, the directory to put the asm file
+                            in, instead of next to the source file
+    :return:                The name of the asm file to compile it to
+    """
+    base = os.path.splitext(source_filename)[0]
+    if output_dir is not None:
+        base = os.path.join(output_dir, os.path.relpath(base, root or "."))
+    return base + ".asm"
+
+
+
+#################################################################
+# WORKER PROCESSES
+
+def init_worker(cache_dir):
+    """
+    Gets a worker process ready to compile.
+    :param cache_dir:   If not None, a directory where the workers share
+                        their signature indexes, generated functions and
+                        tokens
+    """
+    # The compiler is only imported by the workers, so that the batch
+    # starts quickly
+    from FunctionCache import FunctionCache
+    from SignatureIndex import SignatureIndex
+    from TokenCache import TokenCache
+    SignatureIndex.cache_dir = cache_dir
+    FunctionCache.cache_dir = cache_dir
+    TokenCache.cache_dir = cache_dir
+
+
+
+def compile_file(job):
+    """
+    Compiles one file, in a worker process.
+    :param job:     A (source file name, asm file name, options) tuple;
+                    options is a dict that may set "bounds_check", "memoize"
+                    and "incremental" to True
+    :return:        The result, as a dict; see the top of this file
+    """
+    from OutputFile import OutputFile
+    from ParseOptions import ParseOptions
+    from ParserWithST import Parser
+    source_filename, asm_out, options = job
+    messages = io.StringIO()
+    result = {"source": source_filename, "asm": asm_out, "ok": False,
+              "worker": os.getpid()}
+    Parser.diagnostics = []
+    Parser.error_count = 0
+
+    start_time = time.perf_counter()
+    with contextlib.redirect_stdout(messages):
+        try:
+            result["bytes"] = os.path.getsize(source_filename)
+            os.makedirs(os.path.dirname(asm_out) or ".", exist_ok=True)
+            result["ok"] = Parser.parse(
+                source_filename, asm_out,
+                ParseOptions(
+                    bounds_check=options.get("bounds_check", False),
+                    memoize=options.get("memoize", False),
+                    use_function_cache=options.get("incremental", False),
+                    use_token_cache=options.get("incremental", False),
+                    print_diagnostics=False, print_trace=False))
+        except Exception as ex:
+            result["exception"] = "%s: %s" % (type(ex).__name__, ex)
+    result["ms"] = round((time.perf_counter() - start_time) * 1000, 3)
+
+    result["errors"] = [ex.to_dict() for ex in Parser.diagnostics]
+    result["error_count"] = Parser.error_count
+    if not result["ok"]:
+        OutputFile.remove(asm_out)
+        lines = [line for line in messages.getvalue().splitlines()
+                 if line.strip()]
+        result["messages"] = lines[-MESSAGE_LINES:]
+    return result
+
+
+
+#################################################################
+# THE BATCH
+
+def conflicting_result(job, sources):
+    """
+    :param job:     A job that is not compiled, because other files would be
+                    compiled to the same asm file
+    :param sources: The names of every source file that would be compiled
+                    to it
+    :return:        The job's result, as a failure; see the top of this
+                    file
+    """
+    source_filename, asm_out, options = job
+    others = [other for other in sources if other != source_filename]
+    return {"source": source_filename, "asm": asm_out, "ok": False,
+            "worker": None, "ms": 0.0, "errors": [], "error_count": 0,
+            "bytes": os.path.getsize(source_filename)
+            if os.path.isfile(source_filename) else None,
+            "messages": ["%s would also be compiled from %s" %
+                         (asm_out, ", ".join(others))]}
+
+
+
+
+def compile_batch(sources, options=None, workers=None, output_dir=None,
+                  cache_dir=None):
+    """
+    Compiles every source file, across a pool of worker processes.
+    :param sources:     A list of (source file name, root) tuples, from
+                        find_sources()
+    :param options:     A dict of the compiler options; see compile_file()
+    :param workers:     How many worker processes to start; one for each
+                        CPU if None. With 1, the files are compiled in this
+                        process instead.
+    :param output_dir:  If not None, the directory to put the asm files in
+    :param cache_dir:   If not None, a directory where the workers share
+                        their caches
+    :return:            The summary, as a dict; see the top of this file
+    """
+    if options is None:
+        options = {}
+    if workers is None:
+        workers = os.cpu_count() or 1
+    jobs = [(source_filename, asm_filename(source_filename, root, output_dir),
+             options) for source_filename, root in sources]
+    order = {job[0]: i for i, job in enumerate(jobs)}
+
+    # Files that would be compiled to the same asm file, like a.gomm and
+    # a.txt, are not compiled at all, since one would replace the other
+    targets = {}
+    for job in jobs:
+        targets.setdefault(os.path.normcase(os.path.abspath(job[1])),
+                           []).append(job)
+    conflicts = []
+    for target_jobs in targets.values():
+        if len(target_jobs) > 1:
+            sources = [job[0] for job in target_jobs]
+            conflicts += [conflicting_result(job, sources)
+                          for job in target_jobs]
+    jobs = [target_jobs[0] for target_jobs in targets.values()
+            if len(target_jobs) == 1]
+
+    # Largest first, so that the last files to be started are small ones
+    def size(job):
+        try:
+            return os.path.getsize(job[0])
+        except OSError:
+            return 0
+    jobs.sort(key=size, reverse=True)
+
+    start_time = time.perf_counter()
+    if workers <= 1 or len(jobs) <= 1:
+        workers = 1
+        init_worker(cache_dir)
+        results = [compile_file(job) for job in jobs]
+    else:
+        workers = min(workers, len(jobs))
+        pool = multiprocessing.Pool(workers, initializer=init_worker,
+                                    initargs=(cache_dir,))
+        try:
+            # One file at a time, so an idle worker always takes the next
+            # one from the shared queue
+            results = list(pool.imap_unordered(compile_file, jobs,
+                                               chunksize=1))
+        finally:
+            pool.terminate()
+            pool.join()
+    wall_ms = round((time.perf_counter() - start_time) * 1000, 3)
+
+    results += conflicts
+    results.sort(key=lambda result: order[result["source"]])
+    succeeded = sum(1 for result in results if result["ok"])
+    return {
+        "ok": succeeded == len(results),
+        "files": len(results),
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "workers": workers,
+        "wall_ms": wall_ms,
+        "compile_ms": round(sum(result["ms"] for result in results), 3),
+        "results": results,
+    }
+
+
+
+#################################################################
+# MAIN
+
+if __name__ == "__main__":
+    options = [arg for arg in sys.argv[1:] if arg.startswith("--")]
+    arg_list = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    compile_options = {"bounds_check": "--bounds-check" in options,
+                       "memoize": "--memoize" in options,
+                       "incremental": "--incremental" in options}
+    workers = None
+    extensions = SOURCE_EXTENSIONS
+    output_dir = None
+    summary_filename = None
+    for option in options:
+        if option.startswith("--workers="):
+            workers = int(option.split("=", 1)[1])
+        elif option.startswith("--extensions="):
+            extensions = tuple(
+                ext if ext.startswith(".") else "." + ext
+                for ext in option.split("=", 1)[1].split(","))
+        elif option.startswith("--output-dir="):
+            output_dir = option.split("=", 1)[1]
+        elif option.startswith("--summary="):
+            summary_filename = option.split("=", 1)[1]
+
+    if len(arg_list) == 0:
+        print("Usage: python3 BatchCompiler.py [--bounds-check] [--memoize] "
+              "[--incremental] [--workers=N] [--extensions=EXT{,EXT}] "
+              "[--output-dir=DIR] [--summary=FILE] directory_or_pattern "
+              "{another}")
+        sys.exit(1)
+
+    cache_dir = None
+    if compile_options["incremental"]:
+        from GommCompiler import CACHE_DIR
+        cache_dir = CACHE_DIR
+
+    summary = compile_batch(find_sources(arg_list, extensions),
+                            compile_options, workers, output_dir, cache_dir)
+    if summary_filename is None:
+        json.dump(summary, sys.stdout, indent=1, sort_keys=True)
+        print()
+    else:
+        from OutputFile import OutputFile
+        with OutputFile(summary_filename) as f:
+            json.dump(summary, f, indent=1, sort_keys=True)
+        print("%d of %d files compiled successfully, in %.1f ms" %
+              (summary["succeeded"], summary["files"], summary["wall_ms"]))
+    if not summary["ok"]:
+        sys.exit(1)
@@ -0,0 +1,285 @@
+"""
+Filename: BenchmarkCompiler.py
+Tested using Python 3.5.1
+
+David Dalcino
+CS 6110
+Prof. Reiter
+Winter 2017
+CSU East Bay
+
+This script measures how fast the compiler is, on programs written by the
+ProgramGenerator, so that a change that slows down the Scanner, the Parser
+or the Code Generator is noticed before it is released.
+
+Usage: python3 BenchmarkCompiler.py [--runs=N] [--seed=N]
+           [--sizes=NAME{,NAME}] [--output=FILE] [--baseline=FILE]
+           [--tolerance=F]
+
+Each program is compiled N times (5 by default), and the median times are
+reported, in milliseconds, for these phases:
+    scan:       reading every token with Scanner.get_token()
+    index:      finding the function signatures, with SignatureIndex
+    parse:      parsing, not counting scan and index
+    codegen:    generating code, to os.devnull
+    output:     writing the code to a real file
+    total:      compiling the program to a file, as GommCompiler.py does
+Scanning, parsing and code generation happen in the same pass, so parse is
+measured by compiling with code generation turned off, and codegen and
+output are what each adds to the time of the compile before it.
+
+The sizes are the names in SIZES. The results are written to FILE as JSON,
+or printed if --output is not given. If a baseline is given (the results of
+an earlier run), each phase that is more than F times slower than it was
+(0.25 by default), and more than MIN_REGRESSION_MS slower, is reported, and
+the script exits with status 1.
+"""
+
+import contextlib
+import io
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from CodeGenerator import CG
+from FileReader import FileReader
+from ParserWithST import Parser
+from ProgramGenerator import ProgramGenerator
+from Scanner import Scanner
+from SignatureIndex import SignatureIndex
+from Token import TokenType
+
+
+# The programs to compile: settings for the ProgramGenerator
+SIZES = {
+    "small":        {"functions": 10, "depth": 2, "statements": 6},
+    "medium":       {"functions": 100, "depth": 3, "statements": 8},
+    "large":        {"functions": 400, "depth": 3, "statements": 8},
+    "deep":         {"functions": 40, "depth": 7, "statements": 5},
+    "arrays":       {"functions": 100, "depth": 3, "statements": 8,
+                     "arrays": 0.8},
+    "floats":       {"functions": 100, "depth": 3, "statements": 8,
+                     "floats": 0.8},
+    "strings":      {"functions": 100, "depth": 3, "statements": 8,
+                     "strings": 0.7},
+    "protos":       {"functions": 100, "depth": 3, "statements": 8,
+                     "protos": 1.0},
+}
+DEFAULT_SIZES = ("small", "medium", "large", "deep", "arrays", "floats",
+                 "strings", "protos")
+
+PHASES = ("scan", "index", "parse", "codegen", "output", "total")
+
+DEFAULT_RUNS = 5
+DEFAULT_TOLERANCE = 0.25
+MIN_REGRESSION_MS = 1.0     # Smaller changes are noise
+
+
+
+@contextlib.contextmanager
+def code_generation_off():
+    """
+    Turns off code generation while the Parser runs, by marking the code as
+    bad as soon as the Code Generator is initialized; CG.code_gen() and
+    CG.output() do nothing once the code is bad.
+    """
+    init = CG.__dict__["init"]
+
+    def init_without_code(*args, **kwargs):
+        init.__func__(*args, **kwargs)
+        CG.is_code_ok = False
+
+    CG.init = staticmethod(init_without_code)
+    try:
+        yield
+    finally:
+        CG.init = init
+
+
+
+def time_scan(source_filename):
+    """
+    :param source_filename: The name of a Go-- source file
+    :return:                A tuple (time in ms, number of tokens) that it
+                            takes to read every token in the file
+    """
+    start = time.perf_counter()
+    tokens = 0
+    with FileReader(source_filename) as fr:
+        while Scanner.get_token(fr).t_type != TokenType.EndOfFile:
+            tokens += 1
+    return (time.perf_counter() - start) * 1000, tokens
+
+
+
+def time_index(source_filename):
+    """
+    :param source_filename: The name of a Go-- source file
+    :return:                The time in ms that it takes to index the file's
+                            function signatures, without the cache
+    """
+    start = time.perf_counter()
+    with open(source_filename, 'r') as f:
+        SignatureIndex.build(f.read())
+    return (time.perf_counter() - start) * 1000
+
+
+
+def time_compile(source_filename, asm_filename):
+    """
+    Compiles a file, without any caches.
+    :param source_filename: The name of a Go-- source file
+    :param asm_filename:    The name of the file to write the code to
+    :return:                A tuple (time in ms, True if it compiled)
+    """
+    SignatureIndex.cache = {}
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        success = Parser.parse(source_filename, asm_filename)
+        elapsed = time.perf_counter() - start
+    return elapsed * 1000, success
+
+
+
+def benchmark(name, settings, seed, runs, temp_dir):
+    """
+    Generates a program, and measures how long each phase of compiling it
+    takes.
+    :param name:        The name of the program's size, from SIZES
+    :param settings:    The settings for the ProgramGenerator
+    :param seed:        The seed for the ProgramGenerator
+    :param runs:        How many times to compile the program
+    :param temp_dir:    A directory for the program and its code
+    :return:            The results, as a dict
+    """
+    source_filename = os.path.join(temp_dir, name + ".txt")
+    asm_filename = os.path.join(temp_dir, name + ".asm")
+    program = ProgramGenerator(seed=seed, **settings).generate()
+    with open(source_filename, 'w') as f:
+        f.write(program)
+
+    times = {"scan": [], "index": [], "front_end": [], "devnull": [],
+             "total": []}
+    tokens = 0
+    success = True
+    for i in range(runs):
+        scan_ms, tokens = time_scan(source_filename)
+        times["scan"].append(scan_ms)
+        times["index"].append(time_index(source_filename))
+        with code_generation_off():
+            times["front_end"].append(
+                time_compile(source_filename, os.devnull)[0])
+        times["devnull"].append(time_compile(source_filename, os.devnull)[0])
+        total_ms, compiled = time_compile(source_filename, asm_filename)
+        times["total"].append(total_ms)
+        success = success and compiled
+
+    median = {key: statistics.median(values) for key, values in times.items()}
+    phases = {
+        "scan": median["scan"],
+        "index": median["index"],
+        "parse": max(median["front_end"] - median["scan"] - median["index"],
+                     0.0),
+        "codegen": max(median["devnull"] - median["front_end"], 0.0),
+        "output": max(median["total"] - median["devnull"], 0.0),
+        "total": median["total"],
+    }
+    return {
+        "name": name,
+        "settings": settings,
+        "ok": success,
+        "lines": program.count("\n"),
+        "bytes": len(program),
+        "tokens": tokens,
+        "phases_ms": {phase: round(ms, 3) for phase, ms in phases.items()},
+        "lines_per_second": round(program.count("\n") /
+                                  (median["total"] / 1000)),
+    }
+
+
+
+def find_regressions(results, baseline, tolerance):
+    """
+    :param results:     The results of this run
+    :param baseline:    The results of an earlier run
+    :param tolerance:   How much slower a phase may be, as a fraction
+    :return:            A list of strings that describe each phase of each
+                        program that is slower than it was
+    """
+    regressions = []
+    earlier = {program["name"]: program for program in baseline["programs"]}
+    for program in results["programs"]:
+        if program["name"] not in earlier:
+            continue
+        for phase in PHASES:
+            then = earlier[program["name"]]["phases_ms"][phase]
+            now = program["phases_ms"][phase]
+            if now > then * (1 + tolerance) and \
+                    now - then > MIN_REGRESSION_MS:
+                regressions.append("%s %s: %.1f ms, was %.1f ms" %
+                                   (program["name"], phase, now, then))
+    return regressions
+
+
+
+if __name__ == "__main__":
+    options = [arg for arg in sys.argv[1:] if arg.startswith("--")]
+    runs = DEFAULT_RUNS
+    seed = 0
+    sizes = DEFAULT_SIZES
+    output_filename = None
+    baseline_filename = None
+    tolerance = DEFAULT_TOLERANCE
+    for option in options:
+        key, unused, value = option[2:].partition("=")
+        if key == "runs":
+            runs = int(value)
+        elif key == "seed":
+            seed = int(value)
+        elif key == "sizes":
+            sizes = value.split(",")
+        elif key == "output":
+            output_filename = value
+        elif key == "baseline":
+            baseline_filename = value
+        elif key == "tolerance":
+            tolerance = float(value)
+        else:
+            print("Unknown option: " + option)
+            sys.exit(1)
+
+    results = {"python": sys.version.split()[0], "runs": runs, "seed": seed,
+               "programs": []}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for name in sizes:
+            result = benchmark(name, SIZES[name], seed, runs, temp_dir)
+            results["programs"].append(result)
+            print("%-8s %6d lines  " % (name, result["lines"]) +
+                  "  ".join("%s %7.1f" % (phase, result["phases_ms"][phase])
+                            for phase in PHASES) +
+                  ("" if result["ok"] else "  FAILED TO COMPILE"),
+                  file=sys.stderr)
+
+    if output_filename is None:
+        print(json.dumps(results, indent=1, sort_keys=True))
+    else:
+        with open(output_filename, 'w') as f:
+            json.dump(results, f, indent=1, sort_keys=True)
+
+    failed = [program["name"] for program in results["programs"]
+              if not program["ok"]]
+    if failed:
+        print("These programs did not compile: " + ", ".join(failed),
+              file=sys.stderr)
+        sys.exit(1)
+
+    if baseline_filename is not None:
+        with open(baseline_filename, 'r') as f:
+            regressions = find_regressions(results, json.load(f), tolerance)
+        if regressions:
+            print("Slower than the baseline:", file=sys.stderr)
+            for regression in regressions:
+                print("  " + regression, file=sys.stderr)
+            sys.exit(1)
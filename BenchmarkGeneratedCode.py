@@ -0,0 +1,188 @@
+"""
+Filename: BenchmarkGeneratedCode.py
+Tested using Python 3.5.1
+
+David Dalcino
+CS 6110
+Prof. Reiter
+Winter 2017
+CSU East Bay
+
+This script measures how good the code is that the compiler generates, so
+that every change to the Code Generator shows what it does to the programs
+it compiles. Each program in KERNELS is compiled with each set of options
+in CONFIGURATIONS, and run on the MipsSimulator with its scripted input.
+For each one, it records:
+    static:     how many instructions are in the program
+    dynamic:    how many instructions the program ran
+    loads:      how many of those were loads
+    stores:     how many of those were stores
+    output:     a hash of what the program printed
+
+Usage: python3 BenchmarkGeneratedCode.py [--baseline=FILE] [--save]
+           [--output=FILE]
+
+The results are compared with the baseline in FILE (BASELINE_FILENAME by
+default), and every count that changed is listed. If a program printed
+something different than it did in the baseline, the generated code is
+wrong, and the script exits with status 1. With --save, the results are
+written to the baseline file, to compare later changes with; with
+--output, they are written to another file.
+"""
+
+import contextlib
+import hashlib
+import io
+import json
+import os
+import sys
+import tempfile
+from MipsSimulator import MipsSimulator
+from ParseOptions import ParseOptions
+from ParserWithST import Parser
+
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+KERNEL_DIR = os.path.join(SCRIPT_DIR, "testCodeGen")
+BASELINE_FILENAME = os.path.join(KERNEL_DIR, "benchmarkBaseline.json")
+
+# The programs to run, from KERNEL_DIR, with the input each one reads
+KERNELS = {
+    "calculator":       "3+4*2=(1+2)*3=",
+    "testArrays":       "",
+    "testExpressions":  "",
+    "testFloat":        "",
+    "testFunctions":    "",
+    "testIf":           "5\n3\n7\n2\n0\n",
+    "testPassByRef":    "1\n2\n3\n4\n5\n",
+    "testProgram1":     "1\n2\n3\n4\n5\n6\n7\n8\n9\n10\n11\n12\n",
+    "testRecurse":      "5\n7\n-1\n",
+    "testRecursiveFib": "",
+}
+
+# The options to compile each program with, by name
+CONFIGURATIONS = {
+    "default":      {},
+    "bounds_check": {"bounds_check": True},
+    "memoize":      {"memoize": True},
+}
+
+METRICS = ("static", "dynamic", "loads", "stores")
+
+
+
+def measure(kernel, options, temp_dir):
+    """
+    Compiles a program and runs it.
+    :param kernel:      The name of the program, from KERNELS
+    :param options:     The compiler options, as keyword arguments for
+                        ParseOptions
+    :param temp_dir:    A directory for the program's code
+    :return:            The program's counts, as a dict; or None if it did
+                        not compile
+    """
+    asm_filename = os.path.join(temp_dir, kernel + ".asm")
+    with contextlib.redirect_stdout(io.StringIO()):
+        if not Parser.parse(os.path.join(KERNEL_DIR, kernel + ".txt"),
+                            asm_filename, ParseOptions(**options)):
+            return None
+    with open(asm_filename, 'r') as f:
+        simulator = MipsSimulator(f.read(), KERNELS[kernel])
+    output = simulator.run()
+    return {
+        "static": len(simulator.instructions),
+        "dynamic": simulator.instruction_count,
+        "loads": simulator.loads,
+        "stores": simulator.stores,
+        "output": hashlib.sha1(output.encode("utf-8")).hexdigest(),
+    }
+
+
+
+def compare(results, baseline):
+    """
+    Prints every count that is different from the baseline.
+    :param results:     The results of this run
+    :param baseline:    The results of an earlier run
+    :return:            A list of the programs whose output changed
+    """
+    changed_output = []
+    for name in sorted(results):
+        if name not in baseline or results[name] is None or \
+                baseline[name] is None:
+            continue
+        now = results[name]
+        then = baseline[name]
+        for metric in METRICS:
+            if now[metric] != then[metric]:
+                print("  %-30s %-8s %9d -> %9d (%+.1f%%)" %
+                      (name, metric, then[metric], now[metric],
+                       100.0 * (now[metric] - then[metric]) /
+                       max(then[metric], 1)))
+        if now["output"] != then["output"]:
+            changed_output.append(name)
+    return changed_output
+
+
+
+if __name__ == "__main__":
+    options = [arg for arg in sys.argv[1:] if arg.startswith("--")]
+    baseline_filename = BASELINE_FILENAME
+    output_filename = None
+    for option in options:
+        key, unused, value = option[2:].partition("=")
+        if key == "baseline":
+            baseline_filename = value
+        elif key == "save":
+            output_filename = baseline_filename
+        elif key == "output":
+            output_filename = value
+        else:
+            print("Unknown option: " + option)
+            sys.exit(1)
+
+    # Results are keyed by "kernel/configuration"
+    results = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for configuration in sorted(CONFIGURATIONS):
+            for kernel in sorted(KERNELS):
+                name = "%s/%s" % (kernel, configuration)
+                results[name] = measure(kernel,
+                                        CONFIGURATIONS[configuration],
+                                        temp_dir)
+                if results[name] is None:
+                    print("%-30s did not compile" % name)
+                else:
+                    print("%-30s " % name +
+                          "  ".join("%s %8d" % (metric, results[name][metric])
+                                    for metric in METRICS))
+
+    failed = [name for name in sorted(results) if results[name] is None]
+    baseline = None
+    if os.path.isfile(baseline_filename):
+        with open(baseline_filename, 'r') as f:
+            baseline = json.load(f)
+
+    changed_output = []
+    if baseline is not None:
+        print("\nChanges from %s:" % baseline_filename)
+        changed_output = compare(results, baseline)
+        for metric in ("dynamic", "loads", "stores"):
+            names = [name for name in results if results[name] is not None
+                     and baseline.get(name) is not None]
+            then = sum(baseline[name][metric] for name in names)
+            now = sum(results[name][metric] for name in names)
+            print("Total %-8s %9d -> %9d (%+.1f%%)" %
+                  (metric, then, now, 100.0 * (now - then) / max(then, 1)))
+
+    if output_filename is not None:
+        with open(output_filename, 'w') as f:
+            json.dump(results, f, indent=1, sort_keys=True)
+
+    if failed:
+        print("\nThese programs did not compile: " + ", ".join(failed))
+    if changed_output:
+        print("\nThese programs printed something different than they did "
+              "in the baseline: " + ", ".join(changed_output))
+    if failed or changed_output:
+        sys.exit(1)
@@ -0,0 +1,140 @@
+"""
+Filename: BenchmarkStartup.py
+Tested using Python 3.5.1
+
+David Dalcino
+CS 6110
+Prof. Reiter
+Winter 2017
+CSU East Bay
+
+This script measures how long GommCompiler.py takes to start up and compile
+a file whose functions are all in the FunctionCache, which is the common
+case when a file is compiled every time it is saved. Most of that time is
+spent starting Python and importing the compiler, so the script also runs
+the compiler with 'python -X importtime', and lists the imports that take
+the longest.
+
+Usage: python3 BenchmarkStartup.py [--runs=N] [--compiler=PATH] [source_file]
+
+The source file defaults to testCodeGen/testProgram1.txt. The compiler is
+run N times (15 by default) in a temporary directory, after one run that
+fills the cache, and the median times are reported. The time it takes
+Python to start up without importing anything is measured the same way, and
+subtracted. If the rest takes longer than STARTUP_TARGET_MS, the script
+exits with status 1.
+
+The compiled bytecode for the compiler must be cached for the numbers to
+mean anything, so PYTHONDONTWRITEBYTECODE is ignored. Set
+PYTHONPYCACHEPREFIX to keep the bytecode out of the source directory.
+"""
+
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+
+# How long a cache hit may take, on top of starting Python, in milliseconds
+STARTUP_TARGET_MS = 30
+
+DEFAULT_RUNS = 15
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_SOURCE = os.path.join(SCRIPT_DIR, "testCodeGen", "testProgram1.txt")
+DEFAULT_COMPILER = os.path.join(SCRIPT_DIR, "GommCompiler.py")
+
+
+
+def run(args, cwd, env):
+    """
+    Runs Python once.
+    :param args:    The arguments to give Python
+    :param cwd:     The directory to run it in
+    :param env:     The environment to run it in
+    :return:        A tuple (wall time in ms, what it wrote to stderr)
+    """
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable] + args, cwd=cwd, env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                            universal_newlines=True)
+    return (time.perf_counter() - start) * 1000, result.stderr
+
+
+
+def parse_importtime(stderr):
+    """
+    Reads the output of 'python -X importtime'.
+    :param stderr:  What Python wrote to stderr
+    :return:        A tuple (total import time in ms, list of (cumulative
+                    time in ms, module name) tuples for each module imported
+                    directly or indirectly by the script)
+    """
+    total = 0
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        unused_self, cumulative, name = line[len("import time:"):].split("|")
+        cumulative_ms = int(cumulative) / 1000
+        if not name.startswith("  "):
+            # Only count modules imported at the top level, since their
+            # times include everything they imported
+            total += cumulative_ms
+        modules.append((cumulative_ms, name.rstrip()))
+    return total, modules
+
+
+
+if __name__ == "__main__":
+    options = [arg for arg in sys.argv[1:] if arg.startswith("--")]
+    arg_list = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    runs = DEFAULT_RUNS
+    compiler = DEFAULT_COMPILER
+    for option in options:
+        if option.startswith("--runs="):
+            runs = int(option.split("=", 1)[1])
+        elif option.startswith("--compiler="):
+            compiler = os.path.abspath(option.split("=", 1)[1])
+    source = DEFAULT_SOURCE if len(arg_list) == 0 else arg_list[0]
+
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        source_copy = os.path.join(temp_dir, os.path.basename(source))
+        shutil.copy(source, source_copy)
+        compile_args = [compiler, "--incremental", source_copy]
+
+        # Fill the caches
+        run(compile_args, temp_dir, env)
+
+        bare_times = []
+        hit_times = []
+        import_times = []
+        modules = []
+        for i in range(runs):
+            bare_times.append(run(["-c", "pass"], temp_dir, env)[0])
+            hit_times.append(run(compile_args, temp_dir, env)[0])
+            import_time, modules = parse_importtime(
+                run(["-X", "importtime"] + compile_args, temp_dir, env)[1])
+            import_times.append(import_time)
+
+    bare = statistics.median(bare_times)
+    hit = statistics.median(hit_times)
+    print("Python startup:              %6.1f ms" % bare)
+    print("Compile with cache hits:     %6.1f ms" % hit)
+    print("  of which imports:          %6.1f ms" %
+          statistics.median(import_times))
+    print("Compiler startup and work:   %6.1f ms (target %d ms)" %
+          (hit - bare, STARTUP_TARGET_MS))
+    print("\nSlowest imports (cumulative):")
+    for cumulative_ms, name in sorted(modules, reverse=True)[:10]:
+        print("  %6.1f ms  %s" % (cumulative_ms, name))
+
+    if hit - bare > STARTUP_TARGET_MS:
+        print("\nStartup is slower than the target.")
+        sys.exit(1)
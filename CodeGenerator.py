@@ -38,12 +38,56 @@ class CG:
     next_offset = -8        # The offset of the next available position on
                             # the stack
     num_labels_made = None      # A dictionary that keeps track of how many
-                                # labels were made of each type
+                                # labels were made of each type in the
+                                # current function
     source_file_reader = None   # A FileReader that contains the source code.
                                 # Used only for error messages.
     last_instruction = None     # A record of the last instruction generated,
                                 # for use in peephole optimization. Only
                                 # accessed or written to by CG.code_gen().
+    instructions_emitted = 0    # How many instructions CG.code_gen() has
+    instructions_eliminated = 0 # generated, and how many the peephole
+                                # optimization left out, since CG.init()
+    literal_labels = None       # A dictionary that pairs (datatype, value)
+                                # with the label of a string or float literal
+                                # that has already been written to the
+                                # .data section by the current function, so
+                                # that it can be reused
+    loops = None                # A stack of records for the while loops
+                                # currently being generated; see
+                                # CG.begin_loop()
+    block_bindings = None       # Array addresses held in registers that are
+                                # only valid until the end of the current
+                                # basic block; see CG.find_element_register()
+    bounds_check = False        # If True, array subscripts are checked
+                                # at runtime
+    proven_subscripts = None    # A dictionary that pairs a subscript key
+                                # (see CG.subscript_key()) with n, where the
+                                # subscript is known to be in [0, n) until
+                                # the end of the basic block
+    upper_bounds = None         # A dictionary that pairs a subscript key
+                                # with n, where the subscript is known to be
+                                # less than n until the end of the basic block
+    nonnegative = None          # A set of the locations of int variables
+                                # that are known to be >= 0 until the end of
+                                # the basic block
+    current_token = None        # The parser's current token; errors are
+                                # reported at the position just past it
+    next_store_increment = None # A tuple (loc, n), set by
+                                # CG.code_gen_assign() just before it stores
+                                # the variable at loc($fp) plus n back into
+                                # the same variable
+    current_function = None     # A record of the side effects of the
+                                # function being generated; see
+                                # CG.begin_function()
+    memoize = False             # If True, pure recursive functions keep a
+                                # table of the results they have returned
+    module_name = None          # If not None, the code file is a fragment of
+                                # a program, to be put together with other
+                                # fragments by the Linker
+    recording = None            # If not None, a list that every line
+                                # written to the code file is added to, so
+                                # that the FunctionCache can keep it
 
     #################################################################
     # STATIC CONSTANT DATA:
@@ -103,6 +147,42 @@ class CG:
     LINE_ENDING = "\n"                  # "\r\n" for windows
 
 
+    # Registers used to hold array base pointers and the addresses of array
+    # elements. Nothing else in the generated code uses these registers, and
+    # they are not preserved across function calls.
+    ADDRESS_REGISTERS = ("$s0", "$s1", "$s2", "$s3",
+                         "$s4", "$s5", "$s6", "$s7")
+
+
+    # The number of results that a memoized function can remember. A
+    # function with n parameters remembers the results for every parameter
+    # between 0 and the nth root of this number.
+    MEMO_TABLE_ENTRIES = 1024
+
+
+    # A label that array bounds checks branch to when they fail
+    BOUNDS_ERROR_LABEL = "bounds_error"
+
+
+    # Prints an error message and ends the program; written after the
+    # epilogue when bounds checking is turned on
+    BOUNDS_ERROR_HANDLER = BOUNDS_ERROR_LABEL + ':' + LINE_ENDING + \
+               '\tla $a0,BoundsErrorMsg' + LINE_ENDING + \
+               '\tli $v0,4                    # Print Syscall' + LINE_ENDING + \
+               '\tsyscall' + LINE_ENDING + \
+               '\tli $v0,10                   # Exit Syscall' + LINE_ENDING + \
+               '\tsyscall' + LINE_ENDING + \
+               '\t.data' + LINE_ENDING + \
+               'BoundsErrorMsg:\t.asciiz\t"\\nArray subscript out of ' \
+               'range\\n"' + LINE_ENDING + \
+               '\t.text' + LINE_ENDING
+
+
+    # The types of labels that CG.gen_label() makes. None of them contain
+    # an underscore, so that a label can only be made in one way.
+    LABEL_TYPES = ("string", "float", "else", "while")
+
+
     # A label used as the program entry point. The prologue jumps to this
     # label, and when the CG.gen_label() is asked to create a label for the
     # main function, it returns this label.
@@ -136,28 +216,31 @@ class CG:
     # STATIC MEMBER FUNCTIONS:
 
     @staticmethod
-    def init(code_file, source_file_reader):
+    def init(code_file, source_file_reader, bounds_check=False,
+             memoize=False, module_name=None):
         """
         Initializes the Code Generator, so that it will be ready to write a
         code file. This function must be run before using CG for anything else.
         :param code_file:   A file object that the user has opened with the
-                            builtin Python 'open' command. Must be writable.
+                            builtin Python 'open' command, or any other
+                            object with a write() method. Must be writable.
         :param source_file_reader:  A FileReader that is being used to read
                                     the source code file. Used only for
                                     printing errors.
+        :param bounds_check:    If True, generate code that checks array
+                                subscripts at runtime
+        :param memoize:         If True, pure recursive functions remember
+                                their results
+        :param module_name:     If not None, the name of the module being
+                                compiled. Instead of a whole program, a
+                                fragment is written, without the prologue or
+                                epilogue.
         """
-        assert(code_file.writable())
+        assert(not hasattr(code_file, "writable") or code_file.writable())
         CG.code_file = code_file
         CG.is_code_ok = True
         CG.next_offset = -8
-        CG.num_labels_made = {
-            "string": 0,
-            "float": 0,
-            "function": 0,
-            "else": 0,
-            "after_else": 0,
-            "while": 0,
-        }
+        CG.num_labels_made = dict.fromkeys(CG.LABEL_TYPES, 0)
         CG.BUILT_IN_FUNCTIONS = {
             "print":        (CG.gen_print, None),
             "read_int":     (CG.gen_read, DataTypes.INT),
@@ -168,6 +251,21 @@ class CG:
             # "cast_char":    (CG.gen_cast, DataTypes.CHAR), # Planned for later
         }
         CG.source_file_reader = source_file_reader
+        CG.current_token = None
+        CG.literal_labels = {}
+        CG.loops = []
+        CG.block_bindings = {}
+        CG.next_store_increment = None
+        CG.bounds_check = bounds_check
+        CG.proven_subscripts = {}
+        CG.upper_bounds = {}
+        CG.nonnegative = set()
+        CG.current_function = None
+        CG.memoize = memoize
+        CG.module_name = module_name
+        CG.recording = None
+        CG.instructions_emitted = 0
+        CG.instructions_eliminated = 0
 
 
 
@@ -175,19 +273,25 @@ class CG:
     def gen_label(type):
         """
         Generates two labels, with a unique number attached to them,
-        and keeps track of how many of that type have been made.
-        :param type:    A string; must be in ("string","float","else","while")
-        :return:        Two labels that look like: TYPE_lbl_N, after_TYPE_lbl_N,
-                        where TYPE is the parameter type, and N is the number of
-                        labels that have been made of that type. The 'after'
-                        labels will only be useful for the 'else' and 'while'
-                        types, but they will be made for the others to keep
-                        things simple.
-        """
-        if type in ("string", "float", "else", "while"):
-            label = "%s_lbl_%d" % (type, CG.num_labels_made[type])
-            after_label = "after_%s_lbl_%d" % \
-                          (type, CG.num_labels_made[type])
+        and keeps track of how many of that type have been made in the
+        current function. Labels are numbered separately in each function,
+        so a change to one function does not change the labels in any other.
+        :param type:    A string; must be in CG.LABEL_TYPES
+        :return:        Two labels that look like: L_FUNC_TYPE_N, L_FUNC_endTYPE_N,
+                        where FUNC is the label of the current function, TYPE
+                        is the parameter type, and N is the number of labels
+                        that have been made of that type in the function. The
+                        'end' labels will only be useful for the 'else' and
+                        'while' types, but they will be made for the others to
+                        keep things simple.
+        """
+        if type in CG.LABEL_TYPES:
+            scope = "global"
+            if CG.current_function:
+                scope = CG.current_function["signature"].label
+            label = "L_%s_%s_%d" % (scope, type, CG.num_labels_made[type])
+            after_label = "L_%s_end%s_%d" % \
+                          (scope, type, CG.num_labels_made[type])
             CG.num_labels_made[type] += 1
             return label, after_label
         else:
@@ -200,11 +304,13 @@ class CG:
     @staticmethod
     def gen_function_label(function_id):
         """
-        Makes a unique label for each function.
+        Makes a unique label for each function. Function identifiers are
+        unique within a program, so the label depends only on the identifier;
+        it stays the same from one build to the next, and a module can call
+        a function in another module by its label.
         :param function_id:     the function identifier
-        :return:                a label that looks like func_ID_N, where ID
-                                is the identifier, and N is the number of
-                                function labels that have been made so far.
+        :return:                a label that looks like func_ID, where ID
+                                is the identifier.
                                 If function_id is 'main', then the unique
                                 program entry point label is returned; it is
                                 hard-coded to be CG.ENTRY_POINT_LABEL because
@@ -213,39 +319,96 @@ class CG:
         if function_id == "main":
             return CG.ENTRY_POINT_LABEL
         else:
-            label = "func_%d_%s" % (CG.num_labels_made["function"], function_id)
-            CG.num_labels_made["function"] += 1
-            return label
+            return "func_" + function_id
 
 
 
     @staticmethod
     def output(line_of_code):
         """
-        Outputs a line of code to the code file, and adds an end of line character
+        Outputs a line of code to the code file, and adds an end of line
+        character. While a loop is being generated, the line is held in the
+        loop's buffer instead, until CG.end_loop() is called. Likewise, the
+        body of a function that may be memoized is held until
+        CG.end_function() is called.
         :param line_of_code:    A line of code to write
         """
-        CG.code_file.write(line_of_code + CG.LINE_ENDING)
+        if not CG.is_code_ok:
+            return
+        if CG.loops:
+            CG.loops[-1]["buffer"].append(line_of_code)
+        elif CG.current_function and \
+                CG.current_function["buffer"] is not None:
+            CG.current_function["buffer"].append(line_of_code)
+        else:
+            CG.code_file.write(line_of_code + CG.LINE_ENDING)
+            if CG.recording is not None:
+                CG.recording.append(line_of_code)
+
+
+
+    @staticmethod
+    def splice(lines_of_code):
+        """
+        Writes lines of code that were generated earlier, and saved by the
+        FunctionCache, as if they had just been generated.
+        :param lines_of_code:   A list of lines of code, without end of line
+                                characters
+        """
+        if CG.is_code_ok and not CG.loops and not (
+                CG.current_function and
+                CG.current_function["buffer"] is not None):
+            # Write them all at once, as CG.output() would one at a time
+            if lines_of_code:
+                CG.code_file.write(CG.LINE_ENDING.join(lines_of_code) +
+                                   CG.LINE_ENDING)
+            if CG.recording is not None:
+                CG.recording.extend(lines_of_code)
+        else:
+            for line in lines_of_code:
+                CG.output(line)
+        # The peephole optimizer must not look back into spliced code
+        CG.last_instruction = None
 
 
 
     @staticmethod
     def write_prolog():
         """
-        Writes a prologue to the asm file
+        Writes a prologue to the asm file, unless it is a fragment; the
+        Linker writes the prologue for the whole program
         :return:
         """
-        CG.output(CG.PROLOGUE)
+        if CG.module_name is None:
+            CG.output(CG.PROLOGUE)
+
+
+
+    @staticmethod
+    def token_length():
+        """
+        :return:    The length of the parser's current token, for errors that
+                    are reported at the position just past it; 0 if there is
+                    none
+        """
+        if CG.current_token is None:
+            return 0
+        return CG.current_token.length()
 
 
 
     @staticmethod
     def write_epilogue():
         """
-        Writes an epilogue to the asm file
+        Writes an epilogue to the asm file, unless it is a fragment; the
+        Linker writes the epilogue for the whole program
         :return:
         """
+        if CG.module_name is not None:
+            return
         CG.output(CG.EPILOGUE)
+        if CG.bounds_check:
+            CG.output(CG.BOUNDS_ERROR_HANDLER)
 
 
 
@@ -268,13 +431,27 @@ class CG:
         if er_lhs.data_type != er_rhs.data_type:
             raise SemanticError("Left expression is not the same type as "
                                 "right expression.",
-                                CG.source_file_reader.get_line_data())
+                                CG.source_file_reader.get_position(),
+                                length=CG.token_length())
         if operator not in CG.MIPS_INST.keys() or \
                 er_lhs.data_type not in CG.MIPS_INST[operator].keys():
             raise SemanticError(
-                "Unsupported operation: %s on values of type %r." %
-                (operator, er_lhs.data_type),
-                CG.source_file_reader.get_line_data())
+                "Unsupported operation: %s on values of type %r.",
+                CG.source_file_reader.get_position(),
+                operator, er_lhs.data_type, length=CG.token_length())
+
+        # Is this a variable plus or minus an int literal? If it is stored
+        # back into the same variable, array addresses that depend on the
+        # variable can be adjusted instead of recalculated.
+        increment_of = None
+        if operator == "+" and er_lhs.is_literal() and \
+                CG.subscript_key(er_rhs) == ("variable", er_rhs.loc):
+            increment_of = (er_rhs.loc, er_lhs.literal_value)
+        elif operator in ("+", "-") and er_rhs.is_literal() and \
+                CG.subscript_key(er_lhs) == ("variable", er_lhs.loc):
+            increment_of = (er_lhs.loc, er_rhs.literal_value)
+            if operator == "-":
+                increment_of = (er_lhs.loc, -er_rhs.literal_value)
 
         # Can we overwrite er_lhs?
         if er_lhs.is_temp:
@@ -302,6 +479,7 @@ class CG:
 
             CG.store_reg(er_result, reg_src="$t0", reg_temp="$t1",
                          reg_temp2="$t2")
+            er_result.increment_of = increment_of
             return er_result
 
         elif er_result.data_type == DataTypes.FLOAT:
@@ -313,9 +491,9 @@ class CG:
                          reg_temp2="$t1", use_coprocessor_1=True)
             return er_result
         raise SemanticError(
-            "Unsupported operation: %s on values of type %r." %
-            (operator, er_lhs.data_type),
-            CG.source_file_reader.get_line_data())
+            "Unsupported operation: %s on values of type %r.",
+            CG.source_file_reader.get_position(), operator, er_lhs.data_type,
+            length=CG.token_length())
 
 
 
@@ -332,7 +510,21 @@ class CG:
                 isinstance(er_rhs, ExpressionRecord)
         if er_lhs.data_type != er_rhs.data_type:
             raise SemanticError("Types must match to use relational operator",
-                                CG.source_file_reader.get_line_data())
+                                CG.source_file_reader.get_position(),
+                                length=CG.token_length())
+
+        # Does this test put an upper bound on a variable? If so, array
+        # bounds checks that use the variable can be simplified.
+        upper_bound_of = None
+        if er_lhs.data_type == DataTypes.INT:
+            if er_rhs.is_literal() and operator in ("<", "<=") and \
+                    CG.subscript_key(er_lhs) == ("variable", er_lhs.loc):
+                upper_bound_of = (er_lhs.loc, er_rhs.literal_value)
+            elif er_lhs.is_literal() and operator in (">", ">=") and \
+                    CG.subscript_key(er_rhs) == ("variable", er_rhs.loc):
+                upper_bound_of = (er_rhs.loc, er_lhs.literal_value)
+            if upper_bound_of and operator in ("<=", ">="):
+                upper_bound_of = (upper_bound_of[0], upper_bound_of[1] + 1)
 
         # Can we overwrite er_lhs?
         if er_lhs.is_temp:
@@ -369,9 +561,9 @@ class CG:
                 CG.code_gen_label("2")
                 CG.store_reg(er_result, "$t0", "$t1", "$t2")
             else:
-                raise SemanticError("Operator %s incompatible with type BOOL"
-                                    % operator,
-                                    CG.source_file_reader.get_line_data())
+                raise SemanticError("Operator %s incompatible with type BOOL",
+                                    CG.source_file_reader.get_position(),
+                                    operator, length=CG.token_length())
 
         elif    er_lhs.data_type == DataTypes.INT or \
                 er_lhs.data_type == DataTypes.CHAR:
@@ -398,9 +590,10 @@ class CG:
                 CG.code_gen("sub", "$t0", "$t1", "$t0", comment="t0=t1-t0")
                 CG.code_gen("bgez", "$t0", "1f")
             else:
-                raise SemanticError("Operator %s incompatible with type %r"
-                                    % (operator, er_lhs.data_type),
-                                    CG.source_file_reader.get_line_data())
+                raise SemanticError("Operator %s incompatible with type %r",
+                                    CG.source_file_reader.get_position(),
+                                    operator, er_lhs.data_type,
+                                    length=CG.token_length())
             CG.code_gen("li", "$t0", 1, comment="Test was true")
             CG.code_gen("b", "2f")
             CG.code_gen_label("1", comment="Failed test")
@@ -408,6 +601,7 @@ class CG:
             CG.code_gen_label("2", comment="After test result saved to t0")
             er_result.data_type=DataTypes.BOOL       # boolean 1=T, 0=F
             CG.store_reg(er_result, "$t0", "$t1", "$t2")
+            er_result.upper_bound_of = upper_bound_of
 
 
         elif er_lhs.data_type == DataTypes.FLOAT:
@@ -434,9 +628,9 @@ class CG:
             elif operator == ">":
                 CG.code_gen("c.lt.s", "$f1", "$f0")
             else:
-                raise SemanticError("Operator %s incompatible with type FLOAT"
-                                    % operator,
-                                    CG.source_file_reader.get_line_data())
+                raise SemanticError("Operator %s incompatible with type FLOAT",
+                                    CG.source_file_reader.get_position(),
+                                    operator, length=CG.token_length())
             CG.code_gen(branch_inst, "1f")
             CG.code_gen("li", "$t0", 1, comment="Test was true")
             CG.code_gen("b", "2f")
@@ -448,8 +642,10 @@ class CG:
 
         else:
             raise SemanticError("Cannot make comparison between types %r and "
-                                "%r" % (er_lhs.data_type, er_rhs.data_type),
-                                CG.source_file_reader.get_line_data())
+                                "%r",
+                                CG.source_file_reader.get_position(),
+                                er_lhs.data_type, er_rhs.data_type,
+                                length=CG.token_length())
 
         return er_result
 
@@ -472,6 +668,10 @@ class CG:
         :param comment: Any comment to be added on this line of code
         :return:        None
         """
+        # Once there is an error, the code file will be thrown away, so
+        # there is no point generating any more code
+        if not CG.is_code_ok:
+            return
 
         # Peephole code optimization: size is one instruction
         if CG.last_instruction:
@@ -484,6 +684,7 @@ class CG:
                 # we are attempting to load the same word we just stored in
                 # the last instruction, and it's already in the right register,
                 # so we can eliminate this instruction.
+                CG.instructions_eliminated += 1
                 return
 
         CG.last_instruction = {
@@ -505,6 +706,8 @@ class CG:
             start = "%s:" % instruction
         elif instruction is None:       # it's just a comment
             start = "\t"
+        else:
+            CG.instructions_emitted += 1
 
         if rd is None:
             line_of_code = "%s\t\t\t%s" % (start, f_comment)
@@ -517,6 +720,11 @@ class CG:
                            (start, rd, rt, rs, f_comment)
         CG.output(line_of_code)
 
+        # Keep array addresses held in registers up to date
+        if instruction in ("sw", "swc1") and isinstance(rt, str) and \
+                rt.endswith("($fp)"):
+            CG.note_frame_store(int(rt[:-len("($fp)")]))
+
 
 
     @staticmethod
@@ -526,6 +734,13 @@ class CG:
         :param label:       The label to print
         :param comment:     The comment to print. Optional
         """
+        # Control can reach a label from somewhere else, so registers
+        # cached within the basic block can no longer be trusted. Numeric
+        # local labels are only used within a relational expression, where
+        # both paths leave these registers alone.
+        if not label.isdigit():
+            CG.clear_block_bindings()
+            CG.forget_subscript_facts()
         CG.code_gen(label, comment=comment, has_label=True)
 
 
@@ -564,7 +779,7 @@ class CG:
         :return:
         """
         var = ExpressionRecord(data_type=data_type, loc=CG.next_offset,
-                               is_temp=False)
+                               is_temp=False, size=size)
         CG.next_offset -= 4*size
         # CG.code_gen("addi", "$sp", "$sp", -4*size,
         CG.code_gen_comment(comment="Reserve %d words on stack for var %s at"
@@ -584,6 +799,9 @@ class CG:
                                is_reference=True)
         CG.next_offset -= 4
 
+        # literals need to be on the stack before we can point at them
+        CG.materialize_literal(source_exp_rec)
+
         # if source is a reference, just copy the reference
         if source_exp_rec.is_ref:
             CG.code_gen("lw", "$t0", "%d($fp)" % source_exp_rec.loc,
@@ -619,12 +837,15 @@ class CG:
     @staticmethod
     def create_literal(data_type, value):
         """
-        Creates a literal and puts it on the stack. Ints and chars are loaded as
-        immediates, within the instruction; floats are added to labels and
-        then loaded into the stack. Strings are written in code, associated
-        with a label, and then a pointer to the string is stored on the stack.
+        Creates a literal. Space is reserved on the stack for it, but no code
+        is generated yet: ints and chars will be loaded as immediates
+        wherever they are used, and floats and strings will be added to
+        labels and loaded by address. If the literal ever needs to exist on
+        the stack (for example, to be passed by reference), it will be
+        written there by CG.materialize_literal().
         :param data_type:    A DataTypes object (an enum defined in Token)
-        :param value:   The value to be stored on the stack
+        :param value:   The value of the literal. Chars and strings should be
+                        passed as their lexemes, including quotes.
         :return:        An ExpressionRecord that contains the type and
                         stack offset that defines where the literal exists
         """
@@ -633,10 +854,7 @@ class CG:
         # make space on stack for literal
         literal = CG.create_temp(data_type)
 
-        if data_type == DataTypes.INT:
-            CG.code_gen("li", "$t0", value)
-            CG.code_gen("sw", "$t0", "%d($fp)" % literal.loc)
-        elif data_type == DataTypes.CHAR:
+        if data_type == DataTypes.CHAR:
             # Trim quotes off of character's lexeme
             value = value[1:-1]
             # map escape characters in lexeme
@@ -648,24 +866,84 @@ class CG:
             }
             if value in mapping.keys():
                 value = mapping[value]
-            CG.code_gen("li", "$t0", ord(value))
-            CG.code_gen("sw", "$t0", "%d($fp)" % literal.loc)
-        elif data_type == DataTypes.FLOAT:
-            # make a label
-            label, unused_label = CG.gen_label("float")
+            value = ord(value)
+
+        literal.literal_value = value
+        return literal
+
+
+
+    @staticmethod
+    def get_literal_label(data_type, value):
+        """
+        Finds the label for a string or float literal, writing the literal
+        into the .data section the first time it is seen. Identical literals
+        in the same function share a single label; each function writes its
+        own, so that its code does not depend on the functions before it.
+        :param data_type:   DataTypes.STRING or DataTypes.FLOAT
+        :param value:       The value of the literal; strings must include
+                            their quotes
+        :return:            The label where the literal is stored
+        """
+        key = (data_type, value)
+        if key not in CG.literal_labels:
+            if data_type == DataTypes.STRING:
+                label, unused_label = CG.gen_label("string")
+            else:
+                label, unused_label = CG.gen_label("float")
             # put value into code, at that label
             CG.gen_labelled_data(label, data_type, value)
-            CG.code_gen("la", "$t0", label)     # load address of float
-            CG.code_gen("lw", "$t0", "($t0)")   # store float in $t0
-            # store float on stack
-            CG.code_gen("sw", "$t0", "%d($fp)" % literal.loc)
+            CG.literal_labels[key] = label
+        return CG.literal_labels[key]
+
+
+
+    @staticmethod
+    def load_literal(reg_dest, er_literal, reg_temp, use_coprocessor_1=False):
+        """
+        Loads a literal directly into a register, without going through the
+        stack.
+        :param reg_dest:        The register that will hold the literal
+        :param er_literal:      The ExpressionRecord for the literal
+        :param reg_temp:        A temp register, used to hold the address of
+                                a float when loading into coprocessor 1
+        :param use_coprocessor_1:   Set to True to load a float into a
+                                    floating point register.
+        :return:                None
+        """
+        assert er_literal.is_literal()
+        data_type = er_literal.data_type
+        value = er_literal.literal_value
+
+        if data_type in (DataTypes.INT, DataTypes.CHAR):
+            CG.code_gen("li", reg_dest, value)
+        elif data_type == DataTypes.FLOAT:
+            label = CG.get_literal_label(data_type, value)
+            if use_coprocessor_1:
+                CG.code_gen("la", reg_temp, label)  # load address of float
+                CG.code_gen("lwc1", reg_dest, "(%s)" % reg_temp)
+            else:
+                CG.code_gen("la", reg_dest, label)  # load address of float
+                CG.code_gen("lw", reg_dest, "(%s)" % reg_dest)
         elif data_type == DataTypes.STRING:
-            label, unused_label = CG.gen_label("string")
-            CG.gen_labelled_data(label, data_type, value)
-            CG.code_gen("la", "$t0", label)
-            # store pointer to string on the stack
-            CG.code_gen("sw", "$t0", "%d($fp)" % literal.loc)
-        return literal
+            CG.code_gen("la", reg_dest, CG.get_literal_label(data_type, value))
+
+
+
+    @staticmethod
+    def materialize_literal(er_literal, reg_temp="$t0"):
+        """
+        Writes a literal onto the stack, at the location reserved for it by
+        CG.create_literal(). Does nothing if er_literal is not a literal.
+        :param er_literal:  The ExpressionRecord for the literal
+        :param reg_temp:    The register to use to move the value
+        :return:            None
+        """
+        if not er_literal.is_literal():
+            return
+        CG.load_literal(reg_temp, er_literal, reg_temp)
+        er_literal.literal_value = None
+        CG.code_gen("sw", reg_temp, "%d($fp)" % er_literal.loc)
 
 
 
@@ -698,11 +976,25 @@ class CG:
         if not is_cast and dest_type != source_type:
             raise SemanticError("Left hand side is not the same type as "
                                 "the right hand side.",
-                                CG.source_file_reader.get_line_data())
+                                CG.source_file_reader.get_position(),
+                                length=CG.token_length())
+
+        if er_source.increment_of and dest_subscript is None and \
+                er_source.increment_of[0] == er_dest.loc and \
+                CG.subscript_key(er_dest) == ("variable", er_dest.loc):
+            CG.next_store_increment = er_source.increment_of
 
         CG.store_er(er_dest=er_dest, er_src=er_source,
                     src_subscript=src_subscript, dest_subscript=dest_subscript)
 
+        # A variable set to an int literal >= 0 can be used as a subscript
+        # without checking it against 0
+        if dest_subscript is None and er_source.is_literal() and \
+                er_source.data_type == DataTypes.INT and \
+                er_source.literal_value >= 0 and \
+                CG.subscript_key(er_dest) == ("variable", er_dest.loc):
+            CG.nonnegative.add(er_dest.loc)
+
 
 
     @staticmethod
@@ -719,33 +1011,62 @@ class CG:
 
         CG.code_gen("beq", "$t0", "$0", lbl_on_failed_test)
 
+        # If the test passed, whatever it tells us about a variable holds
+        # until the variable is changed or the basic block ends
+        if er_condition.upper_bound_of:
+            loc, bound = er_condition.upper_bound_of
+            CG.upper_bounds[("variable", loc)] = bound
+
 
 
     @staticmethod
     def make_pointer_to_element_in_array(er_array, er_subscript,
                                          reg_dest, reg_temp):
         """
-        Makes a pointer to a value at array[subscript], and puts it in the
-        destination register
+        Makes a pointer to a value at array[subscript]. If the address is
+        already held in one of CG.ADDRESS_REGISTERS, no code is generated and
+        that register is returned instead of reg_dest.
         :param er_array:        The ExpressionRecord for an array
         :param er_subscript:    The subscript into that array,
                                 as an ExpressionRecord
         :param reg_dest:        The destination register
         :param reg_temp:        The temp register
-        :return:                A temporary ExpressionRecord, holds value at
-                                er_array[er_subscript]
+        :return:                The register that holds the pointer to the
+                                value at er_array[er_subscript]
         """
         assert(isinstance(er_array, ExpressionRecord) and
                isinstance(er_subscript, ExpressionRecord))
 
+        check = None
+        if CG.bounds_check:
+            check = CG.get_bounds_check(er_array, er_subscript)
+
+        reg_element = CG.find_element_register(er_array, er_subscript)
+        if reg_element:
+            if check:
+                CG.load_reg(reg_temp, er_subscript, reg_dest)
+                CG.gen_bounds_check(check, er_array, er_subscript,
+                                    reg_temp, reg_dest)
+            return reg_element
+
         # Put subscript into temp register
         CG.load_reg(reg_temp, er_subscript, reg_dest)
+        if check:
+            CG.gen_bounds_check(check, er_array, er_subscript,
+                                reg_temp, reg_dest)
         # CG.code_gen("lw", reg_temp, "%d($fp)" % er_subscript.loc,
         #             comment="put subscript in "+reg_temp)
         CG.code_gen("sll", reg_temp, reg_temp, 2,
                     comment="multiply subscript by 4")
 
         # make a pointer to the array, store it in destination register
+        reg_base = CG.find_base_register(er_array)
+        if reg_base:
+            # reg_dest = location of array - subscript*4
+            CG.code_gen("sub", reg_dest, reg_base, reg_temp,
+                        comment=reg_dest+" points to value at array[subscript]")
+            return reg_dest
+
         if er_array.is_ref:
             # load pointer to array into reg_dest
             CG.code_gen("lw", reg_dest, "%d($fp)" % er_array.loc,
@@ -759,6 +1080,745 @@ class CG:
         # reg_dest = location of array - subscript*4
         CG.code_gen("sub", reg_dest, reg_dest, reg_temp,
                     comment=reg_dest+" points to value at array[subscript]")
+        return reg_dest
+
+
+
+    @staticmethod
+    def check_literal_subscript(er_array, er_subscript, position, length=0):
+        """
+        Checks a subscript that is a literal against the size of an array at
+        compile time, if bounds checking is turned on. The parser calls this
+        as soon as the subscript is parsed, so that an error points at the
+        subscript, and not at whatever has been read since.
+        :param er_array:        The ExpressionRecord for an array
+        :param er_subscript:    The subscript into that array,
+                                as an ExpressionRecord
+        :param position:        Where the subscript is, from
+                                FileReader.get_position()
+        :param length:          The length of the subscript's first token
+        """
+        if not CG.bounds_check or not er_subscript.is_literal() or \
+                not isinstance(er_array, ExpressionRecord) or \
+                not er_array.is_array():
+            return
+        if not 0 <= er_subscript.literal_value < er_array.size:
+            raise SemanticError("Subscript %d is out of range for an "
+                                "array of size %d", position,
+                                er_subscript.literal_value, er_array.size,
+                                length=length)
+
+
+
+    @staticmethod
+    def get_bounds_check(er_array, er_subscript):
+        """
+        Decides what kind of check is needed to be sure that a subscript is
+        within the bounds of an array. Subscripts that are literals are
+        checked at compile time.
+        :param er_array:        The ExpressionRecord for an array
+        :param er_subscript:    The subscript into that array,
+                                as an ExpressionRecord
+        :return:                None if no check is needed, "lower" if only
+                                the check against 0 is needed, or "full"
+        """
+        key = CG.subscript_key(er_subscript)
+        if key is None:
+            return "full"
+        if key[0] == "literal":
+            # already checked by CG.check_literal_subscript(), when it was
+            # parsed
+            return None
+        if CG.proven_subscripts.get(key, er_array.size + 1) <= er_array.size:
+            # already checked against this array, or a smaller one
+            return None
+        if CG.upper_bounds.get(key, er_array.size + 1) <= er_array.size:
+            # the subscript was just tested against the length of the array
+            return "lower"
+        return "full"
+
+
+
+    @staticmethod
+    def gen_bounds_check(check, er_array, er_subscript, reg_subscript,
+                         reg_temp):
+        """
+        Generates code that branches to CG.BOUNDS_ERROR_LABEL if a subscript
+        is not within the bounds of an array.
+        :param check:           "lower" or "full"; see CG.get_bounds_check()
+        :param er_array:        The ExpressionRecord for an array
+        :param er_subscript:    The subscript, as an ExpressionRecord
+        :param reg_subscript:   A register that holds the subscript
+        :param reg_temp:        A temp register
+        """
+        size = er_array.size
+        if check == "lower":
+            loc = CG.subscript_key(er_subscript)[1]
+            if loc not in CG.nonnegative and CG.loops:
+                # Whether the check is needed is only known once the whole
+                # loop has been seen; see CG.resolve_lower_check()
+                CG.loops[-1]["buffer"].append(
+                    ("lower check", loc, reg_subscript))
+                CG.last_instruction = None
+            elif loc not in CG.nonnegative:
+                CG.gen_lower_check(reg_subscript)
+            size = CG.upper_bounds[CG.subscript_key(er_subscript)]
+        else:
+            # A negative subscript looks like a very large unsigned number,
+            # so one unsigned comparison checks both bounds
+            if size < 0x8000:
+                CG.code_gen("sltiu", reg_temp, reg_subscript, size)
+            else:
+                CG.code_gen("li", reg_temp, size)
+                CG.code_gen("sltu", reg_temp, reg_subscript, reg_temp)
+            CG.code_gen("beq", reg_temp, "$0", CG.BOUNDS_ERROR_LABEL,
+                        comment="check subscript is in [0, %d)" % size)
+
+        key = CG.subscript_key(er_subscript)
+        if key is not None:
+            CG.proven_subscripts[key] = size
+
+
+
+    @staticmethod
+    def gen_lower_check(reg_subscript):
+        """
+        Generates code that branches to CG.BOUNDS_ERROR_LABEL if a subscript
+        is negative.
+        :param reg_subscript:   A register that holds the subscript
+        """
+        CG.code_gen("bltz", reg_subscript, CG.BOUNDS_ERROR_LABEL,
+                    comment="check subscript >= 0")
+
+
+
+    @staticmethod
+    def resolve_lower_check(loop, marker):
+        """
+        Decides, once a while loop is finished, whether a check that a
+        subscript variable is >= 0, made inside the loop, is needed. It is
+        not, if the variable was >= 0 when the loop started and the loop
+        only ever adds constants >= 0 to it; add traps on overflow, so the
+        variable can never wrap around to a negative number. If the variable
+        was not known to be >= 0 when the loop started, the enclosing loop
+        decides instead, since the same holds for the inner loop if it holds
+        for the enclosing one.
+        :param loop:    The loop that was just finished; see CG.begin_loop()
+        :param marker:  ("lower check", loc, reg), for the variable at
+                        loc($fp), whose value is in the register reg
+        """
+        unused, loc, reg_subscript = marker
+        if loc in loop["decreased"]:
+            CG.gen_lower_check(reg_subscript)
+        elif loc in loop["entry_nonnegative"]:
+            return
+        elif CG.loops:
+            CG.loops[-1]["buffer"].append(marker)
+        else:
+            CG.gen_lower_check(reg_subscript)
+
+
+
+    @staticmethod
+    def forget_subscript_facts(loc=None):
+        """
+        Forgets what is known about the range of subscript variables.
+        :param loc:     Only forget facts about the variable at loc($fp). If
+                        None, forget everything.
+        """
+        if loc is None:
+            CG.proven_subscripts = {}
+            CG.upper_bounds = {}
+            CG.nonnegative = set()
+        else:
+            CG.proven_subscripts.pop(("variable", loc), None)
+            CG.upper_bounds.pop(("variable", loc), None)
+            CG.nonnegative.discard(loc)
+
+
+
+    #################################################################
+    # ARRAY ADDRESS REGISTERS:
+    # Array base pointers and element addresses may be kept in
+    # CG.ADDRESS_REGISTERS. Each register is described by a binding, a dict
+    # that holds the register, the array, and (for elements) the subscript.
+    #
+    # Inside a while loop, bindings belong to the innermost loop. Their
+    # registers are set up in a preheader, placed just before the loop by
+    # CG.end_loop(), so they are valid everywhere in the loop. Every store
+    # to a variable and every function call inside the loop leaves a marker
+    # in the loop's buffer; when the loop is finished, each marker is
+    # replaced by code that adjusts or reloads the affected registers. A
+    # subscript variable that is only ever incremented by a constant thus
+    # becomes a pointer increment.
+    #
+    # Outside of loops, bindings last until the end of the basic block, and
+    # are set up the first time the address is needed.
+
+    @staticmethod
+    def subscript_key(er_subscript):
+        """
+        Describes a subscript whose value can be tracked while its address is
+        held in a register.
+        :param er_subscript:    The subscript, as an ExpressionRecord
+        :return:                ("literal", value) for an int literal,
+                                ("variable", loc) for an int variable that
+                                lives directly on the stack, or None
+        """
+        if er_subscript.data_type != DataTypes.INT:
+            return None
+        if er_subscript.is_literal():
+            return "literal", er_subscript.literal_value
+        if not er_subscript.is_temp and not er_subscript.is_ref:
+            return "variable", er_subscript.loc
+        return None
+
+
+
+    @staticmethod
+    def current_bindings():
+        """ Returns the dict of bindings that new bindings should go in """
+        if CG.loops:
+            return CG.loops[-1]["bindings"]
+        return CG.block_bindings
+
+
+
+    @staticmethod
+    def allocate_address_register():
+        """
+        Finds a register in CG.ADDRESS_REGISTERS that is not in use.
+        :return:    The name of the register, or None if all are taken
+        """
+        in_use = set(b["reg"] for b in CG.block_bindings.values())
+        for loop in CG.loops:
+            in_use.update(b["reg"] for b in loop["bindings"].values())
+        if CG.loops:
+            # registers used by inner loops that have already been generated
+            in_use.update(CG.loops[-1]["reserved"])
+        for reg in CG.ADDRESS_REGISTERS:
+            if reg not in in_use:
+                if CG.current_function:
+                    CG.current_function["uses_address_registers"] = True
+                return reg
+        return None
+
+
+
+    @staticmethod
+    def find_base_register(er_array):
+        """
+        Finds or makes a register that holds a pointer to the start of an
+        array.
+        :param er_array:    The ExpressionRecord for an array
+        :return:            The register, or None if none are available
+        """
+        bindings = CG.current_bindings()
+        key = ("base", er_array.loc)
+        if key not in bindings:
+            reg = CG.allocate_address_register()
+            if reg is None:
+                return None
+            bindings[key] = {"reg": reg, "array": er_array,
+                             "subscript": None, "base": None}
+            if not CG.loops:
+                CG.gen_binding(bindings[key])
+        return bindings[key]["reg"]
+
+
+
+    @staticmethod
+    def find_element_register(er_array, er_subscript):
+        """
+        Finds or makes a register that holds a pointer to
+        er_array[er_subscript].
+        :param er_array:        The ExpressionRecord for an array
+        :param er_subscript:    The subscript into that array,
+                                as an ExpressionRecord
+        :return:                The register, or None if the subscript
+                                cannot be tracked or no registers are
+                                available
+        """
+        subscript_key = CG.subscript_key(er_subscript)
+        if subscript_key is None:
+            return None
+
+        bindings = CG.current_bindings()
+        key = ("element", er_array.loc, subscript_key)
+        if key not in bindings:
+            base = None
+            if er_array.is_ref:
+                # The element's address is worked out from a register that
+                # holds the array's base pointer
+                if CG.find_base_register(er_array) is None:
+                    return None
+                base = bindings[("base", er_array.loc)]
+            reg = CG.allocate_address_register()
+            if reg is None:
+                return None
+            bindings[key] = {"reg": reg, "array": er_array,
+                             "subscript": subscript_key, "base": base}
+            if not CG.loops:
+                CG.gen_binding(bindings[key])
+        return bindings[key]["reg"]
+
+
+
+    @staticmethod
+    def gen_binding(binding):
+        """
+        Generates code that sets the register in a binding to the address it
+        is meant to hold. Only the registers of the binding and its base are
+        used, so it is safe to call between any two instructions.
+        :param binding:     A binding, as made by CG.find_base_register() or
+                            CG.find_element_register()
+        """
+        reg = binding["reg"]
+        er_array = binding["array"]
+        if binding["subscript"] is None:
+            if er_array.is_ref:
+                CG.code_gen("lw", reg, "%d($fp)" % er_array.loc,
+                            comment="load pointer to array into " + reg)
+            else:
+                CG.code_gen("addi", reg, "$fp", er_array.loc,
+                            comment="make pointer to array in " + reg)
+            return
+
+        kind, value = binding["subscript"]
+        if kind == "literal":
+            if er_array.is_ref:
+                CG.code_gen("addi", reg, binding["base"]["reg"], -4*value,
+                            comment=reg + " points to array[%d]" % value)
+            else:
+                CG.code_gen("addi", reg, "$fp", er_array.loc - 4*value,
+                            comment=reg + " points to array[%d]" % value)
+        else:
+            CG.code_gen("lw", reg, "%d($fp)" % value,
+                        comment="put subscript in " + reg)
+            CG.code_gen("sll", reg, reg, 2, comment="multiply subscript by 4")
+            if er_array.is_ref:
+                CG.code_gen("sub", reg, binding["base"]["reg"], reg,
+                            comment=reg + " points to array[subscript]")
+            else:
+                CG.code_gen("sub", reg, "$fp", reg)
+                CG.code_gen("addi", reg, reg, er_array.loc,
+                            comment=reg + " points to array[subscript]")
+
+
+
+    @staticmethod
+    def update_bindings(bindings, event):
+        """
+        Generates code that brings the registers in a set of bindings up to
+        date after a store to a variable, or after a function call.
+        :param bindings:    A dict of bindings
+        :param event:       ("store", loc, increment) after a store to
+                            loc($fp); increment is the amount that was added
+                            to the variable, or None if unknown.
+                            ("call",) after a function call.
+        """
+        # Don't let these instructions interfere with peephole optimization
+        last_instruction = CG.last_instruction
+
+        if event[0] == "call":
+            # Function calls may use any of the registers: reload them all,
+            # base pointers first
+            for binding in sorted(bindings.values(),
+                                  key=lambda b: b["subscript"] is not None):
+                CG.gen_binding(binding)
+        else:
+            unused, loc, increment = event
+            for binding in bindings.values():
+                if binding["subscript"] != ("variable", loc):
+                    continue
+                if increment is None:
+                    CG.gen_binding(binding)
+                elif increment != 0:
+                    CG.code_gen("addi", binding["reg"], binding["reg"],
+                                -4*increment,
+                                comment="subscript changed by %d" % increment)
+
+        CG.last_instruction = last_instruction
+
+
+
+    @staticmethod
+    def note_frame_store(loc):
+        """
+        Called by CG.code_gen() whenever a word is stored at loc($fp).
+        :param loc:     The offset from $fp that was written to
+        """
+        increment = None
+        if CG.next_store_increment and CG.next_store_increment[0] == loc:
+            increment = CG.next_store_increment[1]
+        CG.next_store_increment = None
+
+        was_nonnegative = loc in CG.nonnegative
+        CG.forget_subscript_facts(loc)
+        if increment is not None and increment >= 0:
+            if was_nonnegative:
+                CG.nonnegative.add(loc)
+        else:
+            for loop in CG.loops:
+                loop["decreased"].add(loc)
+
+        if CG.loops:
+            CG.loops[-1]["buffer"].append(("store", loc, increment))
+        elif CG.block_bindings:
+            CG.update_bindings(CG.block_bindings, ("store", loc, increment))
+
+
+
+    @staticmethod
+    def note_function_call(func_rec, params):
+        """
+        Called after a function call. Uses the function's summary to find out
+        which of the variables passed to it may have changed, and whether the
+        array address registers may have changed.
+        :param func_rec:    The FunctionSignature of the function that was
+                            called
+        :param params:      A list of ExpressionRecords for the parameters
+                            that were sent to the function
+        """
+        uses_address_registers = func_rec.uses_address_registers or \
+            not func_rec.is_summarized()
+        # The side effects of a recursive call are added to the summary by
+        # CG.end_function(), once the rest of the function is known
+        is_recursive = CG.current_function is not None and \
+            func_rec is CG.current_function["signature"]
+        if CG.current_function:
+            func_rec_caller = CG.current_function["signature"]
+            func_rec_caller.callees.add(func_rec.identifier)
+            if not is_recursive:
+                if uses_address_registers:
+                    CG.current_function["uses_address_registers"] = True
+                if not func_rec.is_pure:
+                    CG.current_function["calls_impure"] = True
+
+        for i, er_param in enumerate(params):
+            if not func_rec.may_modify_param(i):
+                continue
+            if er_param.is_ref and is_recursive:
+                param_index = CG.get_param_index(er_param)
+                if param_index is not None:
+                    CG.current_function["passed_params"].add(
+                        (i, param_index))
+            elif er_param.is_ref:
+                # Passed on from the caller's own parameter
+                CG.note_param_write(er_param)
+            elif er_param.is_temp:
+                pass
+            elif uses_address_registers:
+                # Every register is about to be reloaded anyway
+                CG.forget_subscript_facts(er_param.loc)
+                for loop in CG.loops:
+                    loop["decreased"].add(er_param.loc)
+            else:
+                # A local variable was changed through its address
+                CG.note_frame_store(er_param.loc)
+
+        if uses_address_registers:
+            if CG.loops:
+                CG.loops[-1]["buffer"].append(("call", ))
+            else:
+                CG.clear_block_bindings()
+
+
+
+    @staticmethod
+    def begin_function(func_rec):
+        """
+        Starts generating a function, and starts recording its side effects.
+        :param func_rec:    The FunctionSignature of the function
+        """
+        CG.num_labels_made = dict.fromkeys(CG.LABEL_TYPES, 0)
+        CG.literal_labels = {}
+        CG.current_function = {
+            "signature": func_rec,
+            "modified_params": set(),       # indices of params written to
+            "passed_params": set(),         # pairs (i, j): param j was
+                                            # passed to a recursive call
+                                            # as param i
+            "uses_address_registers": False,
+            "does_io": False,               # calls print or read_*
+            "calls_impure": False,          # calls an impure function
+            "buffer": None,                 # lines of code held back until
+                                            # the function is finished
+        }
+        if CG.memoize and CG.memo_table_width(func_rec):
+            CG.current_function["buffer"] = []
+
+
+
+    @staticmethod
+    def end_function():
+        """
+        Finishes generating a function, and saves the summary of its side
+        effects in its FunctionSignature. Calls generated after this point
+        can rely on the summary.
+        """
+        record = CG.current_function
+        func_rec = record["signature"]
+
+        # A recursive call writes to a param if the function does
+        modified_params = set(record["modified_params"])
+        changed = True
+        while changed:
+            changed = False
+            for i, j in record["passed_params"]:
+                if i in modified_params and j not in modified_params:
+                    modified_params.add(j)
+                    changed = True
+        record["modified_params"] = modified_params
+
+        func_rec.modified_params = modified_params
+        func_rec.uses_address_registers = record["uses_address_registers"]
+        func_rec.is_pure = not (record["modified_params"] or
+                                record["does_io"] or record["calls_impure"])
+        CG.current_function = None
+
+        if record["buffer"] is None:
+            return
+        if func_rec.is_pure and func_rec.identifier in func_rec.callees:
+            CG.gen_memoized_body(func_rec, record["buffer"])
+        else:
+            for line in record["buffer"]:
+                CG.output(line)
+
+
+
+    @staticmethod
+    def memo_table_width(func_rec):
+        """
+        Finds out how many values of each parameter a memoized function
+        could remember.
+        :param func_rec:    The FunctionSignature of a function
+        :return:            The number of values, or 0 if the function's
+                            parameters and return value are not all ints,
+                            or it has no parameters
+        """
+        num_params = len(func_rec.param_list_types)
+        if num_params == 0 or func_rec.return_type != DataTypes.INT or \
+                any(t != DataTypes.INT for t in func_rec.param_list_types):
+            return 0
+        width = int(round(CG.MEMO_TABLE_ENTRIES ** (1.0 / num_params)))
+        while width ** num_params > CG.MEMO_TABLE_ENTRIES:
+            width -= 1
+        return width if width > 1 else 0
+
+
+
+    @staticmethod
+    def memo_label(func_rec):
+        """
+        :param func_rec:    The FunctionSignature of a memoized function
+        :return:            The start of the labels used by its memo table
+        """
+        return "memo_" + func_rec.identifier
+
+
+
+    @staticmethod
+    def gen_memo_table_index(func_rec, lbl_out_of_range):
+        """
+        Generates code that puts the address of a function's entry in its
+        memo table in $t0. Uses $t1 and $t2.
+        :param func_rec:            The FunctionSignature of the function
+                                    being generated
+        :param lbl_out_of_range:    A label to branch to if a parameter is
+                                    too large or too small for the table
+        """
+        width = CG.memo_table_width(func_rec)
+        num_params = len(func_rec.param_list_types)
+        for i in range(num_params):
+            reg = "$t0" if i == 0 else "$t1"
+            CG.code_gen("lw", reg, "%d($fp)" % (4*(num_params - i)),
+                        comment="load pointer to param %d" % i)
+            CG.code_gen("lw", reg, "(%s)" % reg)
+            CG.code_gen("sltiu", "$t2", reg, width)
+            CG.code_gen("beq", "$t2", "$0", lbl_out_of_range,
+                        comment="param %d is not in [0, %d)" % (i, width))
+            if i > 0:
+                CG.code_gen("li", "$t2", width)
+                CG.code_gen("mul", "$t0", "$t0", "$t2")
+                CG.code_gen("add", "$t0", "$t0", "$t1")
+        # Each entry is two words: a flag that is set once the entry is
+        # filled in, and the result
+        CG.code_gen("sll", "$t0", "$t0", 3)
+        CG.code_gen("la", "$t1", CG.memo_label(func_rec) + "_table")
+        CG.code_gen("add", "$t0", "$t0", "$t1",
+                    comment="$t0 points to the memo table entry")
+
+
+
+    @staticmethod
+    def gen_memoized_body(func_rec, body):
+        """
+        Writes the body of a pure function, wrapped in code that looks up its
+        parameters in a memo table before doing any work, and fills in the
+        table before returning. Parameters outside of the table's range
+        fall back to running the body every time.
+        :param func_rec:    The FunctionSignature of the function
+        :param body:        The lines of code generated for the function,
+                            after its label
+        """
+        label = CG.memo_label(func_rec)
+        loc_return_val = 4*len(func_rec.param_list_types) + 4
+        table_size = 8*CG.memo_table_width(func_rec) ** \
+            len(func_rec.param_list_types)
+
+        # Nothing from the end of the function carries over to its start
+        CG.clear_block_bindings()
+        CG.forget_subscript_facts()
+        CG.last_instruction = None
+
+        CG.code_gen_comment("%s is pure: look up its result in the memo "
+                            "table" % func_rec.identifier)
+        CG.gen_memo_table_index(func_rec, label + "_miss")
+        CG.code_gen("lw", "$t1", "($t0)")
+        CG.code_gen("beq", "$t1", "$0", label + "_miss")
+        CG.code_gen("lw", "$t1", "4($t0)", comment="found the result")
+        CG.code_gen("sw", "$t1", "%d($fp)" % loc_return_val)
+        CG.code_gen("jr", "$ra")
+        CG.code_gen_label(label + "_miss")
+
+        # Every return goes by way of the code that fills in the table; the
+        # one at the end of the function can just fall through to it
+        while body and body[-1].split() == ["jr", "$ra"]:
+            body = body[:-1]
+        for line in body:
+            if line.split() == ["jr", "$ra"]:
+                line = "\tb\t%s_save" % label
+            CG.output(line)
+
+        CG.last_instruction = None
+        CG.code_gen_label(label + "_save")
+        CG.gen_memo_table_index(func_rec, label + "_done")
+        CG.code_gen("li", "$t1", 1)
+        CG.code_gen("sw", "$t1", "($t0)")
+        CG.code_gen("lw", "$t1", "%d($fp)" % loc_return_val)
+        CG.code_gen("sw", "$t1", "4($t0)", comment="remember the result")
+        CG.code_gen_label(label + "_done")
+        CG.code_gen("jr", "$ra")
+
+        CG.output("")
+        CG.output("\t.data")
+        CG.output("\t.align\t2")
+        CG.output("%s_table:\t.space\t%d" % (label, table_size))
+        CG.output("")
+        CG.output("\t.text")
+
+
+
+    @staticmethod
+    def note_param_write(er_dest):
+        """
+        Called whenever a variable is written to. If the variable is one of
+        the current function's reference parameters, it is added to the
+        function's summary.
+        :param er_dest:     The ExpressionRecord that was written to
+        """
+        param_index = CG.get_param_index(er_dest)
+        if param_index is not None:
+            CG.current_function["modified_params"].add(param_index)
+
+
+
+    @staticmethod
+    def get_param_index(er_param):
+        """
+        Finds out which of the current function's parameters an
+        ExpressionRecord refers to.
+        :param er_param:    An ExpressionRecord
+        :return:            The position of the parameter, starting at 0, or
+                            None if er_param is not a parameter
+        """
+        # Parameters are the only references that live above $fp; the
+        # first one is at 4*len(params)($fp), and the last one is at 4($fp)
+        if not CG.current_function or not er_param.is_ref or \
+                er_param.loc <= 0:
+            return None
+        num_params = len(CG.current_function["signature"].param_list_types)
+        return num_params - er_param.loc // 4
+
+
+
+    @staticmethod
+    def clear_block_bindings():
+        """ Forgets every address held in a register for the basic block """
+        CG.block_bindings = {}
+
+
+
+    @staticmethod
+    def abandon_function():
+        """
+        Forgets about the function being generated, after an error that
+        the Parser could only recover from by skipping the rest of it.
+        """
+        CG.loops = []
+        CG.current_function = None
+        CG.block_bindings = {}
+        CG.next_offset = -8
+
+
+
+    @staticmethod
+    def begin_loop():
+        """
+        Starts generating a while loop. Everything that is generated from
+        here on is held back until CG.end_loop() is called, so that
+        registers used by the loop can be set up in front of it.
+        """
+        CG.clear_block_bindings()
+        CG.loops.append({
+            "buffer": [],       # lines of code, and markers for stores,
+                                # function calls and subscript checks
+            "bindings": {},     # registers set up before the loop
+            "reserved": set(),  # registers used by inner loops
+            # the locations of the variables that are >= 0 when the loop
+            # starts, and of those that the loop may change by anything
+            # but adding a constant >= 0
+            "entry_nonnegative": set(CG.nonnegative),
+            "decreased": set(),
+        })
+
+
+
+    @staticmethod
+    def end_loop():
+        """
+        Finishes generating a while loop: writes the loop's preheader,
+        then the loop itself, with every store and function call marker
+        replaced by code that keeps the loop's registers up to date, and
+        every subscript check marker by the check, if it is still needed.
+        """
+        loop = CG.loops.pop()
+        last_instruction = CG.last_instruction
+
+        if loop["bindings"]:
+            CG.code_gen_comment("Array addresses hoisted out of while loop")
+            for binding in sorted(loop["bindings"].values(),
+                                  key=lambda b: b["subscript"] is not None):
+                CG.gen_binding(binding)
+
+        for line in loop["buffer"]:
+            if isinstance(line, str):
+                CG.output(line)
+            elif line[0] == "lower check":
+                CG.resolve_lower_check(loop, line)
+            else:
+                CG.update_bindings(loop["bindings"], line)
+                if CG.loops:
+                    # The enclosing loop needs to see it too
+                    CG.loops[-1]["buffer"].append(line)
+
+        if CG.loops:
+            CG.loops[-1]["reserved"].update(loop["reserved"])
+            CG.loops[-1]["reserved"].update(
+                b["reg"] for b in loop["bindings"].values())
+
+        CG.last_instruction = last_instruction
 
 
 
@@ -766,14 +1826,40 @@ class CG:
     def gen_print(datatype, param_list):
         """
         Generates inline code that calls the syscalls necessary to print
-        every ExpressionRecord in the parameter list
+        every ExpressionRecord in the parameter list. Consecutive string, char
+        and int literals are merged into one string, so that they can be
+        printed with a single syscall.
         :param datatype:    Not used. Necessary for the other built-in
                             functions, but this one can get the necessary
                             datatype info from param_list
         :param param_list:  the list of ExpressionRecords that holds the
                             values we want to print.
         """
-        for er_param in param_list:
+        if CG.current_function:
+            CG.current_function["does_io"] = True
+
+        i = 0
+        while i < len(param_list):
+            # Collect a run of literals that can be printed as one string
+            run_end = i
+            while run_end < len(param_list) and \
+                    CG.literal_as_asciiz(param_list[run_end]) is not None:
+                run_end += 1
+
+            if run_end - i > 1 or (run_end > i and
+                                   param_list[i].data_type == DataTypes.STRING):
+                text = "".join(CG.literal_as_asciiz(er_param)
+                               for er_param in param_list[i:run_end])
+                label = CG.get_literal_label(DataTypes.STRING, '"%s"' % text)
+                CG.code_gen_comment("print(string)")
+                CG.code_gen("la", "$a0", label)
+                CG.code_gen("li", "$v0", 4, comment="Syscall for print_string")
+                CG.code_gen("syscall")
+                i = run_end
+                continue
+
+            er_param = param_list[i]
+            i += 1
             assert(isinstance(er_param, ExpressionRecord))
             if er_param.data_type == DataTypes.INT:
                 CG.code_gen_comment("print(int)")
@@ -798,7 +1884,41 @@ class CG:
                 CG.code_gen("syscall")
             else:
                 raise SemanticError("Unsupported argument for print()",
-                                    CG.source_file_reader.get_line_data())
+                                    CG.source_file_reader.get_position(),
+                                    length=CG.token_length())
+
+
+
+    @staticmethod
+    def literal_as_asciiz(er_param):
+        """
+        Translates a string, char or int literal into the text that print()
+        would show for it, written so that it can be placed inside an
+        .asciiz directive.
+        :param er_param:    An ExpressionRecord
+        :return:            A string, or None if er_param is not a literal or
+                            cannot be printed as part of a string
+        """
+        if not er_param.is_literal():
+            return None
+        if er_param.data_type == DataTypes.STRING:
+            # Trim quotes off of string's lexeme; escapes are left for the
+            # assembler to interpret
+            return er_param.literal_value[1:-1]
+        if er_param.data_type == DataTypes.INT:
+            return "%d" % er_param.literal_value
+        if er_param.data_type == DataTypes.CHAR:
+            mapping = {
+                '\n': "\\n",
+                '\t': "\\t",
+                '\r': "\\r",
+                '\\': "\\\\",
+                '"': '\\"',
+            }
+            ch = chr(er_param.literal_value)
+            return mapping.get(ch, ch)
+        # Floats are formatted by the simulator, so they must use a syscall
+        return None
 
 
 
@@ -811,6 +1931,9 @@ class CG:
         :param param_list:  Not used. Required for other built-in functions.
         :return:            An ExpressionRecord that holds the result.
         """
+        if CG.current_function:
+            CG.current_function["does_io"] = True
+
         # Make a temp ExpressionRecord to hold the result
         exp_rec = CG.create_temp(datatype)
 
@@ -883,13 +2006,20 @@ class CG:
         if use_coprocessor_1:
             instruction = "lwc1"
 
+        if er_src.is_literal():
+            if not use_coprocessor_1 or er_src.data_type == DataTypes.FLOAT:
+                CG.load_literal(reg_dest, er_src, reg_temp, use_coprocessor_1)
+                return
+            # An int can only reach coprocessor 1 by way of memory
+            CG.materialize_literal(er_src, reg_temp)
+
         if er_src.is_array():
             assert isinstance(src_subscript, ExpressionRecord)
             # put ptr to source data in reg_value_to_store
-            CG.make_pointer_to_element_in_array(er_src, src_subscript,
-                                                reg_dest, reg_temp)
+            reg_pointer = CG.make_pointer_to_element_in_array(
+                er_src, src_subscript, reg_dest, reg_temp)
             # dereference ptr to source data; put it in reg_value_to_store
-            CG.code_gen(instruction, reg_dest, "(%s)" % reg_dest)
+            CG.code_gen(instruction, reg_dest, "(%s)" % reg_pointer)
         elif er_src.is_ref:
             # put ptr to source data in reg_temp
             CG.code_gen("lw", reg_temp, "%d($fp)" % er_src.loc)
@@ -924,14 +2054,22 @@ class CG:
         if use_coprocessor_1:
             store_inst = "swc1"
 
+        # If a temp that held a literal is reused, its value is now on the
+        # stack instead
+        er_dest.literal_value = None
+        er_dest.increment_of = None
+        er_dest.upper_bound_of = None
+
+        CG.note_param_write(er_dest)
+
         if er_dest.is_array():
             assert isinstance(dest_subscript, ExpressionRecord)
 
             # put ptr to destination in reg_temp
-            CG.make_pointer_to_element_in_array(er_dest, dest_subscript,
-                                                reg_temp, reg_temp2)
+            reg_pointer = CG.make_pointer_to_element_in_array(
+                er_dest, dest_subscript, reg_temp, reg_temp2)
             # store source data in destination
-            CG.code_gen(store_inst, reg_src, "(%s)" % reg_temp,
+            CG.code_gen(store_inst, reg_src, "(%s)" % reg_pointer,
                         comment="Store data at array[subscript]")
         elif er_dest.is_ref:
             # put ptr to destination in reg_temp
@@ -955,7 +2093,8 @@ class CG:
         """
         if len(param_list) != 1:
             raise SemanticError("Casting functions require one argument",
-                                CG.source_file_reader.get_line_data())
+                                CG.source_file_reader.get_position(),
+                                length=CG.token_length())
         er_input = param_list[0]
         assert(isinstance(er_input, ExpressionRecord))
         assert(isinstance(destination_type, DataTypes))
@@ -983,9 +2122,9 @@ class CG:
                          use_coprocessor_1=True)
         else:
             raise SemanticError(
-                "Unsupported operation: cast value of type %r to %r." %
-                (er_input.data_type, destination_type),
-                CG.source_file_reader.get_line_data())
+                "Unsupported operation: cast value of type %r to %r.",
+                CG.source_file_reader.get_position(),
+                er_input.data_type, destination_type, length=CG.token_length())
         return er_output
 
 
@@ -1036,6 +2175,8 @@ class CG:
                     comment="remove params and control link from stack")
         CG.code_gen("lw", "$fp", "($fp)", comment="restore old fp")
 
+        CG.note_function_call(func_rec, params)
+
         return er_retval
 
 
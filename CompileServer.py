@@ -0,0 +1,285 @@
+"""
+Filename: CompileServer.py
+Tested using Python 3.5.1
+
+David Dalcino
+CS 6110
+Prof. Reiter
+Winter 2017
+CSU East Bay
+
+This script runs the Go-- compiler as a long-running server, so that each
+compile does not pay for starting Python and importing the compiler. The
+server listens on a Unix socket; a thin client (also in this file) sends it
+compile requests, and gets back the generated code and whatever the
+compiler printed.
+
+The Parser and the Code Generator keep their state in static members, so
+only one compile can run in a process at a time. The server hands requests
+to a pool of worker processes instead; each one keeps the compiler imported,
+along with its own in-memory SignatureIndex, FunctionCache and TokenCache,
+so a file that is compiled again is mostly taken from the cache. Each
+worker's TokenCache holds at most MB megabytes of tokens (16 by default).
+
+Usage:  python3 CompileServer.py serve <socket_path> [--workers=N]
+            [--cache-dir=DIR] [--token-cache-mb=MB]
+        python3 CompileServer.py compile <socket_path> [--bounds-check]
+            [--memoize] [--json-diagnostics] <source_file>
+            {<another_source_file>}
+
+Requests and responses are JSON objects, one per line. A request holds
+either "path", the name of a source file the server can read, or "source",
+the source code itself; and optionally "options", a dict that may set
+"bounds_check", "memoize" and "json_diagnostics" to true. A response holds
+"ok" (true if the compile succeeded), "asm" (the generated code, if it did),
+"diagnostics" (everything the compiler printed, except the trace of the
+productions it expanded), "errors" (a list of the errors found, each one a
+dict from ParseError.to_dict()) and "error_count" (how many errors were
+found, which may be more than the list holds). If "json_diagnostics" is
+set, the errors are left out of "diagnostics", so that they are only
+formatted once, by the client. A request that is not a JSON object gets a
+response whose "diagnostics" begin with "Bad request".
+"""
+
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import signal
+import socket
+import socketserver
+import sys
+
+
+DEFAULT_WORKERS = 4     # How many compiles can run at once
+
+
+#################################################################
+# WORKER PROCESSES
+
+def init_worker(cache_dir, token_cache_mb=None):
+    """
+    Gets a worker process ready to compile.
+    :param cache_dir:       If not None, a directory where the workers share
+                            their signature indexes, generated functions and
+                            tokens
+    :param token_cache_mb:  If not None, the most megabytes of tokens each
+                            worker keeps in memory
+    """
+    # The compiler is only imported by the workers, so that the client
+    # starts quickly
+    from FunctionCache import FunctionCache
+    from SignatureIndex import SignatureIndex
+    from TokenCache import TokenCache
+    SignatureIndex.cache_dir = cache_dir
+    FunctionCache.cache_dir = cache_dir
+    TokenCache.cache_dir = cache_dir
+    if token_cache_mb is not None:
+        TokenCache.max_memory = int(token_cache_mb * 1024 * 1024)
+
+
+
+def compile_request(request):
+    """
+    Compiles one request, in a worker process.
+    :param request:     A request, as a dict; see the top of this file
+    :return:            A response, as a dict
+    """
+    from ParseOptions import ParseOptions
+    from ParserWithST import Parser
+    options = request.get("options", {})
+    diagnostics = io.StringIO()
+    asm = None
+    success = False
+    Parser.diagnostics = []
+    Parser.error_count = 0
+
+    # A request's source code is compiled where it is, in memory, and the
+    # code is written to memory, so no temporary files are needed
+    source_filename = request.get("path")
+    source = None
+    if source_filename is None:
+        source_filename = "<source>"
+        source = request.get("source", "")
+    code = io.StringIO()
+
+    with contextlib.redirect_stdout(diagnostics):
+        try:
+            success = Parser.parse(
+                source_filename, None,
+                ParseOptions(
+                    bounds_check=bool(options.get("bounds_check")),
+                    memoize=bool(options.get("memoize")),
+                    use_function_cache=True,
+                    use_token_cache=True,
+                    print_diagnostics=not options.get("json_diagnostics"),
+                    print_trace=False),
+                source=source, asm_file=code)
+        except Exception as ex:
+            print("\nException occurred while parsing file %s:\n%s" %
+                  (source_filename, ex))
+
+    if success:
+        asm = code.getvalue()
+
+    return {"ok": success, "asm": asm, "diagnostics": diagnostics.getvalue(),
+            "errors": [ex.to_dict() for ex in Parser.diagnostics],
+            "error_count": Parser.error_count}
+
+
+
+#################################################################
+# SERVER
+
+class CompileRequestHandler(socketserver.StreamRequestHandler):
+    """
+    Answers the requests sent over one connection to the server, by handing
+    them to the server's pool of workers.
+    """
+    def handle(self):
+        for line in self.rfile:
+            try:
+                request = json.loads(line.decode("utf-8"))
+                if not isinstance(request, dict):
+                    raise ValueError("expected a JSON object, not %s" %
+                                     type(request).__name__)
+                if not isinstance(request.get("options", {}), dict):
+                    raise ValueError("options must be a JSON object")
+                response = self.server.pool.apply(compile_request, (request,))
+            except ValueError as ex:
+                response = {"ok": False, "asm": None,
+                            "diagnostics": "Bad request: %s\n" % ex,
+                            "errors": [], "error_count": 0}
+            self.wfile.write(json.dumps(response).encode("utf-8") + b'\n')
+            self.wfile.flush()
+
+
+
+class CompileServer(socketserver.ThreadingMixIn,
+                    socketserver.UnixStreamServer):
+    """
+    A server that compiles Go-- code for clients on the same machine. Each
+    connection gets its own thread, which waits for a worker process to
+    compile each of its requests.
+    """
+    daemon_threads = True
+
+    def __init__(self, socket_path, workers=DEFAULT_WORKERS, cache_dir=None,
+                 token_cache_mb=None):
+        """
+        Starts the worker processes, and binds the server to a socket.
+        :param socket_path: The name of the Unix socket to listen on. If a
+                            file by that name exists, it is removed.
+        :param workers:     How many worker processes to start
+        :param cache_dir:   If not None, a directory where the workers save
+                            their caches, so that they share them, and so
+                            that they survive a restart of the server
+        :param token_cache_mb:  If not None, the most megabytes of tokens
+                                each worker keeps in memory
+        """
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        self.pool = multiprocessing.Pool(workers, initializer=init_worker,
+                                         initargs=(cache_dir,
+                                                   token_cache_mb))
+        socketserver.UnixStreamServer.__init__(self, socket_path,
+                                               CompileRequestHandler)
+
+
+
+    def server_close(self):
+        """ Stops listening, and stops the worker processes """
+        socketserver.UnixStreamServer.server_close(self)
+        self.pool.terminate()
+        self.pool.join()
+        if os.path.exists(self.server_address):
+            os.remove(self.server_address)
+
+
+
+#################################################################
+# CLIENT
+
+def send_request(socket_path, request):
+    """
+    Sends one request to a running server, and waits for the response.
+    :param socket_path: The name of the Unix socket the server listens on
+    :param request:     A request, as a dict; see the top of this file
+    :return:            The response, as a dict
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        sock.sendall(json.dumps(request).encode("utf-8") + b'\n')
+        with sock.makefile('rb') as f:
+            return json.loads(f.readline().decode("utf-8"))
+
+
+
+if __name__ == "__main__":
+    options = [arg for arg in sys.argv[1:] if arg.startswith("--")]
+    arg_list = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+
+    if len(arg_list) >= 2 and arg_list[0] == "serve":
+        workers = DEFAULT_WORKERS
+        cache_dir = None
+        token_cache_mb = None
+        for option in options:
+            if option.startswith("--workers="):
+                workers = int(option.split("=", 1)[1])
+            elif option.startswith("--cache-dir="):
+                cache_dir = option.split("=", 1)[1]
+            elif option.startswith("--token-cache-mb="):
+                token_cache_mb = float(option.split("=", 1)[1])
+        server = CompileServer(arg_list[1], workers, cache_dir,
+                               token_cache_mb)
+        print("Listening on %s with %d workers" % (arg_list[1], workers))
+        # Shut down cleanly when killed, too
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+
+    elif len(arg_list) >= 3 and arg_list[0] == "compile":
+        from OutputFile import OutputFile
+        compile_options = {"bounds_check": "--bounds-check" in options,
+                           "memoize": "--memoize" in options,
+                           "json_diagnostics": "--json-diagnostics" in options}
+        list_of_failed_compilations = []
+        for f in arg_list[2:]:
+            # Output filename: replace the extension with .asm, or add it
+            asm_out = f + ".asm"
+            if '.' in os.path.basename(f):
+                asm_out = '.'.join(f.split('.')[:-1]) + ".asm"
+
+            response = send_request(arg_list[1], {
+                "path": os.path.abspath(f),
+                "options": compile_options})
+            print(response["diagnostics"])
+            if compile_options["json_diagnostics"]:
+                for error in response["errors"]:
+                    print(json.dumps(dict(error, file=f), sort_keys=True))
+            if response["ok"]:
+                with OutputFile(asm_out) as out:
+                    out.write(response["asm"])
+            else:
+                OutputFile.remove(asm_out)
+                list_of_failed_compilations.append(f)
+        if len(list_of_failed_compilations) > 0:
+            print("The following file(s) failed to compile:")
+            for f in list_of_failed_compilations:
+                print(f)
+            sys.exit(1)
+        else:
+            print("All files compiled successfully!")
+
+    else:
+        print("Usage: python3 CompileServer.py serve socket_path "
+              "[--workers=N] [--cache-dir=DIR] [--token-cache-mb=MB]\n"
+              "       python3 CompileServer.py compile socket_path "
+              "[--bounds-check] [--memoize] [--json-diagnostics] "
+              "source_code.gomm "
+              "{more_source_files.gomm}")
@@ -20,10 +20,72 @@ exceptions
 class ParseError(Exception):
     """
     An error that only the Parser can raise; a parent class for
-    RedeclaredVariableError, UseUndeclaredVariableError, MatchError, and
-    ProductionNotFoundError
+    RedeclaredVariableError, UseUndeclaredVariableError, MatchError,
+    ProductionNotFoundError and SemanticError
+
+    A ParseError is a light record of what went wrong, and where: a code
+    that names the kind of error, the position in the source file, and the
+    arguments for its message. The message is only put together when the
+    error is shown, by str(), or turned into a dict, by to_dict(), so that a
+    file with many errors can be compiled quickly.
     """
-    pass
+
+    CODE = "parse-error"    # Names the kind of error, for to_dict()
+    TEMPLATE = "%s"         # The message, to be formatted with the arguments
+
+    def __init__(self, position, *message_args, length=0):
+        """
+        Constructs an error.
+        :param position:        A (line number, column, line) tuple that
+                                tells where the error was found, from
+                                FileReader.get_position()
+        :param message_args:    The arguments for the message template
+        :param length:          How many characters of the line the error
+                                covers, ending at the column: the length
+                                of the token that the error was found at,
+                                since the position is just past it
+        """
+        Exception.__init__(self, position, *message_args)
+        self.line_number, self.column, self.line = position
+        self.message_args = message_args
+        self.length = length
+
+
+
+    def message(self):
+        """
+        :return:    The message, without the position or the source line
+        """
+        return self.TEMPLATE % self.message_args
+
+
+
+    def __str__(self):
+        """
+        :return:    The message, after the position, followed by the source
+                    line with an arrow under the column
+        """
+        return "At line %d, column %d: %s\n%s%s^\n" % (
+            self.line_number, self.column, self.message(),
+            self.line, " " * self.column)
+
+
+
+    def to_dict(self):
+        """
+        :return:    The error as a dict that can be written as JSON, with its
+                    "code", "line", "column", "length", message "args" and
+                    "message". The source line is left out.
+        """
+        return {
+            "code": self.CODE,
+            "line": self.line_number,
+            "column": self.column,
+            "length": self.length,
+            "args": [arg if isinstance(arg, (str, int, float)) else repr(arg)
+                     for arg in self.message_args],
+            "message": self.message(),
+        }
 
 
 
@@ -31,7 +93,8 @@ class RedeclaredVariableError(ParseError):
     """
     An error that only the Parser can raise; used by error_on_variable_usage()
     """
-    pass
+    CODE = "redeclared-variable"
+    TEMPLATE = "Attempt to redeclare variable %s."
 
 
 
@@ -39,7 +102,8 @@ class UseUndeclaredVariableError(ParseError):
     """
     An error that only the Parser can raise; used by error_on_variable_usage()
     """
-    pass
+    CODE = "undeclared-variable"
+    TEMPLATE = "Attempt to use undeclared variable %s."
 
 
 
@@ -47,7 +111,8 @@ class MatchError(ParseError):
     """
     An error that only the Parser can raise; used by match()
     """
-    pass
+    CODE = "unexpected-token"
+    TEMPLATE = "Expected %r but found %r, but they were unequal."
 
 
 
@@ -56,27 +121,50 @@ class ProductionNotFoundError(ParseError):
     An error that only the Parser can raise; used by
     raise_production_not_found_error()
     """
+    CODE = "no-production"
+    TEMPLATE = "Could not find a production for terminal %r in " \
+               "non-terminal %s"
+
+
+class LinkError(Exception):
+    """
+    An error that only the Linker can raise, when the modules of a program
+    do not fit together
+    """
     pass
 
 
+
 class SemanticError(ParseError):
     """
     A semantic error, raised by the Parser or Code Generator.
     """
-    def __init__(self, message, line_data):
+    CODE = "semantic-error"
+
+    def __init__(self, message, position, *message_args, length=0):
         """
         Constructs an error.
-        :param message:     A descriptive error message
-        :param line_data:   a dictionary that holds information about the
-                            current line being processed. Should be populated
-                            by FileReader.get_line_data()
+        :param message:         A descriptive error message. If there are
+                                message_args, they are formatted into it
+                                when the error is shown.
+        :param position:        A (line number, column, line) tuple that
+                                tells where the error was found, from
+                                FileReader.get_position()
+        :param message_args:    The arguments for the message
+        :param length:          How many characters of the line the error
+                                covers, ending at the column: the length
+                                of the token that the error was found at,
+                                since the position is just past it
         """
-        full_msg = \
-            "At line %d, column %d: " % (line_data["Line_Num"],
-                                         line_data["Column"]) + \
-            message + \
-            "\n%s" % line_data["Line"] + \
-            " " * line_data["Column"] + "^\n"
-        Exception.__init__(self, full_msg)
+        ParseError.__init__(self, position, *message_args, length=length)
+        self.template = message
+
 
 
+    def message(self):
+        """
+        :return:    The message, without the position or the source line
+        """
+        if self.message_args:
+            return self.template % self.message_args
+        return self.template
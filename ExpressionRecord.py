@@ -22,7 +22,7 @@ class ExpressionRecord:
     Variables have ExpressionRecords that are stored in the symbol table.
     """
 
-    def __init__(self, data_type, loc, is_temp, is_reference=False):
+    def __init__(self, data_type, loc, is_temp, is_reference=False, size=1):
         """
 
         :param data_type:   A Token.DataTypes object. INT|FLOAT|CHAR|STRING|BOOL
@@ -34,6 +34,7 @@ class ExpressionRecord:
         :param is_reference: A boolean, lets us know if the value is a
                             reference or not, and will need to be
                             dereferenced before use
+        :param size:        The number of elements, if this is an array
         :return:
         """
         assert(isinstance(data_type, DataTypes))
@@ -46,6 +47,17 @@ class ExpressionRecord:
                                     # loc($fp) is a pointer to somewhere else in
                                     # the stack, and will need to be
                                     # dereferenced before being used
+        self.size = size            # The number of elements in an array;
+                                    # always 1 for anything else
+        self.literal_value = None   # If not None, the value of a literal
+                                    # that has not been written to loc($fp)
+                                    # yet; see CG.create_literal()
+        self.increment_of = None    # A tuple (loc, n) if this temp holds the
+                                    # value of the variable at loc($fp) plus
+                                    # the int literal n
+        self.upper_bound_of = None  # A tuple (loc, n) if this temp holds the
+                                    # result of testing that the variable at
+                                    # loc($fp) is less than the int literal n
 
 
 
@@ -57,6 +69,15 @@ class ExpressionRecord:
 
 
 
+    def is_literal(self):
+        """
+        :return:    a bool that tells you if this is a literal whose value is
+                    known at compile time, and has not been put on the stack
+        """
+        return self.literal_value is not None
+
+
+
     def __str__(self):
         """ String representation that tells location and datatype """
         return str(self.data_type).split('.')[-1] + " @%d" % self.loc
@@ -75,26 +96,136 @@ class FunctionSignature:
     FunctionSignatures are stored in the SymbolTable, associated with
     function identifiers. Because functions can only be declared in the
     global scope, FunctionSignatures are only found in the global scope.
+
+    Once a function has been defined, its FunctionSignature also holds a
+    summary of its side effects: the functions it calls, the reference
+    parameters it may write to (directly, or by passing them on to another
+    function), and whether it may change the array address registers. Until
+    the definition is finished, the summary is unknown, and callers must
+    assume the worst. A function is pure if it does no input or output,
+    writes to none of its parameters, and only calls pure functions.
     """
     def __init__(self, identifier, label=None,
                  param_list_types=None,
+                 param_sizes=None,
                  return_type=None,
-                 is_prototype=False):
+                 is_prototype=False,
+                 is_indexed=False):
 
         self.identifier = identifier        # The name of the function
         self.label = label                  # The label where it starts
         self.param_list_types = param_list_types    # Parameter types & order
+        self.param_sizes = param_sizes      # The number of elements in each
+                                            # parameter; 1 unless it is an
+                                            # array. A call must pass arrays
+                                            # of exactly these sizes.
         self.return_type = return_type      # The return type
         self.is_prototype = is_prototype    # If true, it was forward
                                             # declared and not yet defined;
                                             # otherwise, it was defined already.
+        self.is_indexed = is_indexed        # If true, it was declared
+                                            # before parsing began, by the
+                                            # SignatureIndex or from another
+                                            # module's interface
+        self.callees = set()                # Identifiers of the functions
+                                            # that it calls
+        self.modified_params = None         # Indices of the parameters that
+                                            # it may write to; None if not
+                                            # known yet
+        self.uses_address_registers = True  # If False, calling it leaves
+                                            # CG.ADDRESS_REGISTERS alone
+        self.is_pure = False                # If True, it has no side
+                                            # effects, and its result depends
+                                            # only on its parameters
+
+
+
+    def is_complete(self):
+        """
+        :return:    a bool that tells you if the whole header of the function
+                    was parsed. A header with an error in it leaves a
+                    signature without its parameter types, its return type
+                    or its label, which cannot be called.
+        """
+        return self.label is not None and \
+            self.param_list_types is not None and \
+            self.param_sizes is not None and \
+            self.return_type is not None
+
+
+
+    def is_summarized(self):
+        """
+        :return:    a bool that tells you if the side effects of calling this
+                    function are known
+        """
+        return self.modified_params is not None
+
+
+
+    def may_modify_param(self, index):
+        """
+        :param index:   The position of a parameter, starting at 0
+        :return:        a bool that tells you if calling this function may
+                        change the variable passed in that position
+        """
+        return not self.is_summarized() or index in self.modified_params
+
+
+
+    def to_dict(self):
+        """
+        Describes the signature and its summary with basic Python types, so
+        that it can be written to a module interface file as JSON.
+        :return:    a dict; FunctionSignature.from_dict() turns it back into
+                    a FunctionSignature
+        """
+        modified_params = None
+        if self.modified_params is not None:
+            modified_params = sorted(self.modified_params)
+        return {
+            "identifier": self.identifier,
+            "label": self.label,
+            "param_list_types": [t.name for t in self.param_list_types],
+            "param_sizes": list(self.param_sizes),
+            "return_type": self.return_type.name,
+            "modified_params": modified_params,
+            "uses_address_registers": self.uses_address_registers,
+            "is_pure": self.is_pure,
+        }
+
+
+
+    @staticmethod
+    def from_dict(d):
+        """
+        Makes a FunctionSignature for a function defined in another module.
+        :param d:   a dict made by FunctionSignature.to_dict()
+        :return:    a FunctionSignature that is declared but not defined,
+                    like a prototype, and that keeps the summary in d
+        """
+        signature = FunctionSignature(
+            identifier=d["identifier"],
+            label=d["label"],
+            param_list_types=[DataTypes[t] for t in d["param_list_types"]],
+            param_sizes=list(d["param_sizes"]),
+            return_type=DataTypes[d["return_type"]],
+            is_prototype=True,
+            is_indexed=True)
+        if d["modified_params"] is not None:
+            signature.modified_params = set(d["modified_params"])
+        signature.uses_address_registers = d["uses_address_registers"]
+        signature.is_pure = d["is_pure"]
+        return signature
 
 
 
     def __str__(self):
         """ String representation of FunctionSignature """
-        params_str = ', '.join(
-            [str(x).split('.')[-1] for x in self.param_list_types])
+        params_str = "?"
+        if self.param_list_types is not None:
+            params_str = ', '.join(
+                [str(x).split('.')[-1] for x in self.param_list_types])
         return_type_str = str(self.return_type).split('.')[-1]
 
         return self.identifier + "(" + params_str + ") " + return_type_str
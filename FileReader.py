@@ -23,10 +23,14 @@ class FileReader:
             file_reader.get_char()
             # ...
     """
-    def __init__(self, filename):
+    def __init__(self, filename, file=None):
         """
         Constructor for FileReader.
         :param filename:    The name of the file to open
+        :param file:        An open file, or any object with a readline()
+                            method that works like a text file's, to read
+                            instead of opening filename. It is not closed
+                            by the FileReader.
         :return:            FileReader object
         """
         # The name of the file to open
@@ -34,7 +38,9 @@ class FileReader:
         # Open file pointer; should be populated by using 'with ... as'
         # syntax to ensure that files are closed automatically when they are
         # no longer needed
-        self.file = None
+        self.file = file
+        # True if the FileReader opened the file, and must close it
+        self.owns_file = file is None
         # The current line being processed
         self.current_line = " "
         # The last line that was processed
@@ -44,6 +50,11 @@ class FileReader:
         self.current_line_index = 0
         # The line number of the current line.
         self.current_line_number = 0
+        # The offsets into the file, counted in characters, of the first
+        # characters of the last line, the current line, and the next line
+        self.last_line_offset = 0
+        self.current_line_offset = 0
+        self.next_line_offset = 0
 
 
 
@@ -55,7 +66,8 @@ class FileReader:
         when they are no longer needed
         """
         # Open file for reading
-        self.file = open(self.filename, 'r')
+        if self.owns_file:
+            self.file = open(self.filename, 'r')
         # Fill the current_line buffer
         self.fill_buffer()
         return self
@@ -67,7 +79,8 @@ class FileReader:
         Ensures that files are closed when they are no longer needed. Called
         automatically when a 'with ... as' block is exited.
         """
-        self.file.close()
+        if self.owns_file:
+            self.file.close()
 
 
 
@@ -128,11 +141,40 @@ class FileReader:
         """
         # hang on to the last line, in case we need to back up
         self.last_line = self.current_line
+        self.last_line_offset = self.current_line_offset
 
         # if self.file.readline() returns "", we are at end of file
         self.current_line = self.file.readline()
         self.current_line_index = 0
         self.current_line_number += 1
+        self.current_line_offset = self.next_line_offset
+        self.next_line_offset += len(self.current_line)
+
+
+
+    def skip_to(self, line_number, column):
+        """
+        Skips ahead, so that the next character returned by get_char() is the
+        one at the given position.
+        :param line_number: The line number of the position, which must not
+                            be before the last character returned
+        :param column:      The column of the position
+        :return:            None
+        """
+        if self.current_line_index < 0 and \
+                line_number == self.current_line_number - 1:
+            # The position is in the line that was put back
+            self.current_line_index = column - len(self.last_line)
+            return
+
+        while self.current_line_number < line_number and \
+                self.current_line != "":
+            self.fill_buffer()
+        self.current_line_index = column
+
+        # If we've gone past the end of the line, advance to the next line
+        if self.current_line_index >= len(self.current_line):
+            self.fill_buffer()
 
 
 
@@ -181,9 +223,85 @@ class FileReader:
 
 
 
+    def get_offset(self):
+        """
+        :return:    The offset into the file, counted in characters, of the
+                    character that would next be returned by get_char()
+        """
+        if self.current_line_index < 0:
+            return self.last_line_offset + len(self.last_line) + \
+                self.current_line_index
+        return self.current_line_offset + self.current_line_index
+
+
+
+    def get_position(self):
+        """
+        A cheaper get_line_data(), for errors and for telling tokens apart.
+        :return:    A (line number, column, line) tuple for the character that
+                    would next be returned by get_char()
+        """
+        if self.current_line_index < 0:
+            return (self.current_line_number - 1,
+                    len(self.last_line) + self.current_line_index,
+                    self.last_line)
+        return (self.current_line_number, self.current_line_index,
+                self.current_line)
+
+
+
     class PutBackTooManyCharacters(Exception):
         """
         An empty class used as an exception, raised when the user calls
         put_back() more times than the FileReader can support
         """
         pass
+
+
+
+class StringLines:
+    """
+    Reads lines from source code that is already in memory, as a str, for a
+    FileReader to read instead of a file. Each line is sliced out of the
+    str as it is read, so the source code is never copied as a whole.
+    """
+
+    def __init__(self, text):
+        """
+        Constructor for StringLines.
+        :param text:    The source code, as a str
+        """
+        self.text = text
+        self.next_line_start = 0    # The offset of the next line
+
+
+
+    def readline(self):
+        """
+        :return:    The next line, with its newline; or "" at the end of the
+                    source code
+        """
+        start = self.next_line_start
+        end = self.text.find("\n", start) + 1 or len(self.text)
+        self.next_line_start = end
+        return self.text[start:end]
+
+
+
+    @staticmethod
+    def text_of(source):
+        """
+        :param source:  Source code, as a str; as UTF-8 bytes, or any other
+                        bytes-like object; or as a file-like object with a
+                        read() method, which returns either of those
+        :return:        The source code, as a str, with its newlines
+                        translated like a file opened in text mode. A str
+                        that needs no translating is returned as it is.
+        """
+        if hasattr(source, "read"):
+            source = source.read()
+        if not isinstance(source, str):
+            source = str(source, "utf-8")
+        if "\r" in source:
+            source = source.replace("\r\n", "\n").replace("\r", "\n")
+        return source
@@ -0,0 +1,219 @@
+"""
+Filename: FunctionCache.py
+Tested using Python 3.5.1
+
+David Dalcino
+CS 6110
+Prof. Reiter
+Winter 2017
+CSU East Bay
+
+This file implements FunctionCache, which remembers the code generated for
+each function, so that a function that has not changed since the last time
+it was compiled does not need to be parsed or generated again.
+
+The code for a function depends on three things: the function's source code,
+the compiler options, and the signatures and side effect summaries of the
+functions it calls (see FunctionSignature). The source code and the options
+make up the key of a cache entry. The signatures of the functions it calls
+are saved in the entry, and the entry can only be used if they are the same
+when the function is compiled again. Functions whose entries cannot be used
+(because they were edited, or because a function they call was) are
+compiled as usual, and their entries are replaced.
+
+The key uses the function's source text, not just its tokens, because the
+generated code includes each line of source code as a comment.
+
+Entries are kept in memory, and if FunctionCache.cache_dir is set, they are
+also saved there with marshal, so that they survive from one run of the
+compiler to the next.
+"""
+
+import bisect
+import hashlib
+import marshal
+import os
+import re
+from ExpressionRecord import FunctionSignature
+from OutputFile import OutputFile
+from SignatureIndex import SignatureIndex
+
+
+class FunctionCache:
+    """
+    A static class that remembers the code generated for each function.
+    """
+
+    #################################################################
+    # STATIC DATA MEMBERS
+
+    entries = {}            # A dict that pairs the key of a function (see
+                            # FunctionCache.find_functions()) with its entry
+    cache_dir = None        # If not None, a directory where entries are
+                            # saved between runs
+    hits = 0                # How many functions were taken from the cache,
+    misses = 0              # and how many were compiled, since the counts
+                            # were last reset
+
+    #################################################################
+    # STATIC CONSTANT DATA
+
+    # Part of every key. Change it whenever the code generator changes, so
+    # that entries saved by an older compiler are not used.
+    VERSION = "1"
+
+
+
+    #################################################################
+    # STATIC MEMBER FUNCTIONS
+
+    @staticmethod
+    def find_functions(text, options):
+        """
+        Finds every function definition in Go-- source code, and works out
+        its key.
+        :param text:    The source code, as a string
+        :param options: A dict of the compiler options that affect the code
+                        generated
+        :return:        A dict that pairs the position just after each 'func'
+                        keyword, as a (line number, column) tuple like the
+                        ones from FileReader.get_position(), with a dict
+                        that describes the function: its "key", its
+                        "signature" (a tuple; see SignatureIndex.read_header)
+                        and the position just after its closing brace, "end"
+        """
+        functions = {}
+        line_starts = [0] + [match.end()
+                             for match in re.finditer("\n", text)]
+
+        def position(offset):
+            line = bisect.bisect_right(line_starts, offset) - 1
+            return line + 1, offset - line_starts[line]
+
+        depth = 0
+        start = None        # Where the current function started
+        for match in SignatureIndex.STRUCTURE_RE.finditer(text):
+            piece = match.group()
+            if piece == "{":
+                depth += 1
+            elif piece == "}":
+                depth = max(depth - 1, 0)
+                if depth == 0 and start is not None:
+                    signature = SignatureIndex.read_header(text, start.start())
+                    if signature is not None:
+                        functions[position(start.end())] = {
+                            "key": FunctionCache.function_key(
+                                text[start.start():match.end()], options),
+                            "signature": signature,
+                            "end": position(match.end()),
+                        }
+                    start = None
+            elif piece == "func" and depth == 0:
+                start = match
+        return functions
+
+
+
+    @staticmethod
+    def function_key(source, options):
+        """
+        :param source:  The source code of a function, from the 'func'
+                        keyword to its closing brace
+        :param options: A dict of the compiler options that affect the code
+                        generated
+        :return:        The function's key
+        """
+        return hashlib.sha1((FunctionCache.VERSION + '\n' +
+                             repr(sorted(options.items())) + '\n' +
+                             source).encode("utf-8")).hexdigest()
+
+
+
+    @staticmethod
+    def lookup(key, s_table):
+        """
+        Finds the entry for a function, if it can be used.
+        :param key:     The function's key
+        :param s_table: The SymbolTable, as it is just before the function
+                        is parsed
+        :return:        The entry, or None if there is no entry, or the
+                        functions it calls have changed since it was made,
+                        or could not be declared
+        """
+        entry = FunctionCache.entries.get(key)
+        if entry is None:
+            entry = FunctionCache.load(key)
+            if entry is None:
+                return None
+            FunctionCache.entries[key] = entry
+
+        for func_id, saved in entry["callees"].items():
+            signature = s_table.find(func_id)
+            if not isinstance(signature, FunctionSignature) or \
+                    not signature.is_complete() or \
+                    signature.to_dict() != saved:
+                return None
+        return entry
+
+
+
+    @staticmethod
+    def store(key, func_rec, s_table, code):
+        """
+        Makes an entry for a function that has just been compiled.
+        :param key:         The function's key
+        :param func_rec:    The function's FunctionSignature, with its summary
+        :param s_table:     The SymbolTable
+        :param code:        The lines of code generated for the function
+        """
+        entry = {
+            # What the code assumed about the functions it calls. A
+            # recursive call assumed nothing; the function was not yet
+            # defined.
+            "callees": {func_id: s_table.find(func_id).to_dict()
+                        for func_id in func_rec.callees
+                        if func_id != func_rec.identifier},
+            "summary": {
+                "modified_params": sorted(func_rec.modified_params),
+                "uses_address_registers": func_rec.uses_address_registers,
+                "is_pure": func_rec.is_pure,
+                "callees": sorted(func_rec.callees),
+            },
+            "code": code,
+        }
+        FunctionCache.entries[key] = entry
+        FunctionCache.save(key, entry)
+
+
+
+    @staticmethod
+    def load(key):
+        """
+        Loads an entry from FunctionCache.cache_dir.
+        :param key:     The function's key
+        :return:        The entry, or None if it was not saved
+        """
+        if FunctionCache.cache_dir is None:
+            return None
+        path = os.path.join(FunctionCache.cache_dir, key + ".func")
+        try:
+            with open(path, 'rb') as f:
+                return marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            # A missing or damaged file, or one saved by another version of
+            # Python, just means compiling again
+            return None
+
+
+
+    @staticmethod
+    def save(key, entry):
+        """
+        Saves an entry in FunctionCache.cache_dir, if it is set.
+        :param key:     The function's key
+        :param entry:   The entry
+        """
+        if FunctionCache.cache_dir is None:
+            return
+        OutputFile.write_cache_file(FunctionCache.cache_dir, key + ".func",
+                                    marshal.dumps(entry))
@@ -12,27 +12,149 @@ CSU East Bay
 This script invokes the Go-- compiler. It is meant to be run from the command
 line, with the path to one or more Go-- source code files as arguments.
 
-Usage: python3 GommCompiler.py <source_file> {<another_source_file>}
+Usage: python3 GommCompiler.py [--bounds-check] [--memoize] [--symbol-dump]
+            [--separate] [--incremental] [--profile[=json]] [--profile-calls]
+            [--profile-memory] <source_file> {<another_source_file>}
+
+Options:
+    --bounds-check      Generate code that checks every array subscript at
+                        runtime, and stops the program with an error message
+                        if a subscript is out of range.
+    --memoize           Make pure recursive functions with int parameters
+                        remember the results they have returned, so that
+                        they are not worked out again.
+    --symbol-dump       Write every scope in the symbol table to a file with
+                        the same name as the source code and the extension
+                        .sym, for use by debuggers.
+    --separate          Treat the source files as the modules of one
+                        program. Each module is compiled to a fragment with
+                        the extension .frag.asm and an interface file with
+                        the extension .gommi, and the fragments are linked
+                        into one .asm file named after the first source
+                        file. Modules that have not changed since they were
+                        last compiled are not compiled again.
+    --incremental       Keep the code generated for each function, and the
+                        tokens in each file, in the directory .gommcache,
+                        and reuse them for functions and files that have
+                        not changed the next time they are compiled.
+    --profile           Print how long each phase of compiling each file
+                        took (reading, scanning, parsing, symbol lookups,
+                        code generation and output), and how many tokens,
+                        productions, symbol lookups and instructions there
+                        were. With --profile=json, the same is written to a
+                        file with the extension .profile.json instead.
+    --profile-calls     Also run cProfile, and report the functions in the
+                        compiler that took the most time.
+    --profile-memory    Also run tracemalloc, and report the peak memory
+                        use and the lines that allocated the most memory.
 
 If compilation succeeds, the output will be in a file with the same name as
 the source code, with its extension replaced by .asm. If the source file has
 no extension, the .asm extension will be appended to the name of the source
 file.
 
+A directory may be given in place of a source file, to compile every file
+in it (and in the directories inside it) with the extension .gomm or .txt;
+so may a glob pattern, in quotes. To compile many files in parallel, and get
+a summary of the results as JSON, use BatchCompiler.py instead.
+
+A source file named - is read from standard input, and its output is written
+to standard output, if compilation succeeds. Everything else the compiler
+prints then goes to standard error instead, so it does not mix with the
+code. The output is not written to standard output until it is complete.
+
 """
 
 
+# The compiler itself is imported below, only once it is needed, so that
+# the usage message appears quickly; see BenchmarkStartup.py
 import sys
 import os
-from ParserWithST import Parser
+
+CACHE_DIR = ".gommcache"    # Where --incremental keeps the code it reuses
 
 if __name__ == "__main__":
-    arg_list = sys.argv[1:]
+    # Separate options from the list of source files
+    options = [arg for arg in sys.argv[1:] if arg.startswith("--")]
+    arg_list = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    bounds_check = "--bounds-check" in options
+    memoize = "--memoize" in options
+    symbol_dump = "--symbol-dump" in options
+    separate = "--separate" in options
+    incremental = "--incremental" in options
+    profile_calls = "--profile-calls" in options
+    profile_memory = "--profile-memory" in options
+    profile = None              # None, "text" or "json"
+    if "--profile=json" in options:
+        profile = "json"
+    elif "--profile" in options or profile_calls or profile_memory:
+        profile = "text"
+    if profile is not None:
+        from Profiler import Profiler
+        import json
+
+    def start_profile():
+        if profile is not None:
+            Profiler.start(call_profile=profile_calls,
+                           trace_memory=profile_memory)
+
+    def stop_profile(name, base_filename):
+        if profile is None:
+            return
+        report = Profiler.stop(name)
+        if profile == "json":
+            with open(base_filename + ".profile.json", 'w') as f:
+                json.dump(report, f, indent=1, sort_keys=True)
+        else:
+            print("\n" + Profiler.format_report(report))
+    if incremental:
+        from FunctionCache import FunctionCache
+        from SignatureIndex import SignatureIndex
+        from TokenCache import TokenCache
+        SignatureIndex.cache_dir = CACHE_DIR
+        FunctionCache.cache_dir = CACHE_DIR
+        TokenCache.cache_dir = CACHE_DIR
+
+    # A directory or a glob pattern stands for the source files in it
+    if any(os.path.isdir(arg) or any(ch in arg for ch in "*?[")
+           for arg in arg_list):
+        from BatchCompiler import find_sources
+        arg_list = [name for name, root in find_sources(arg_list)]
+
+    # Keep standard output for code compiled from standard input
+    code_stdout = sys.stdout
+    if "-" in arg_list:
+        sys.stdout = sys.stderr
 
     if arg_list is None or len(arg_list) == 0:
-        print("Usage: python3 GommCompiler.py source_code.gomm {"
-              "more_source_files.gomm}")
+        print("Usage: python3 GommCompiler.py [--bounds-check] [--memoize] "
+              "[--symbol-dump] [--separate] [--incremental] "
+              "[--profile[=json]] [--profile-calls] [--profile-memory] "
+              "source_code.gomm {more_source_files.gomm}")
+    elif separate and "-" in arg_list:
+        print("Modules cannot be read from standard input.")
+    elif separate:
+        from Linker import Linker
+        from Errors import LinkError
+        asm_out = Linker.base_filename(arg_list[0]) + ".asm"
+        start_profile()
+        try:
+            success = Linker.build(arg_list, asm_out,
+                                   bounds_check=bounds_check,
+                                   memoize=memoize,
+                                   use_function_cache=incremental,
+                                   use_token_cache=incremental)
+        except LinkError as ex:
+            print("\nLink error: %s" % ex)
+            success = False
+        finally:
+            stop_profile(asm_out, Linker.base_filename(arg_list[0]))
+        if not success:
+            print("The program failed to build.")
     else:
+        from ParserWithST import Parser
+        from ParseOptions import ParseOptions
+        from OutputFile import OutputFile
         list_of_failed_compilations = []
         # For every file in the argument list,
         for f in arg_list:
@@ -41,21 +163,47 @@ if __name__ == "__main__":
             input_filename = f
 
             # Output filename: add extension .asm
-            asm_out = f + ".asm"
+            base_filename = f
             # If there was an extension, replace it instead
             if '.' in f:
-                asm_out = '.'.join(f.split('.')[:-1]) + ".asm"
+                base_filename = '.'.join(f.split('.')[:-1])
+            asm_out = base_filename + ".asm"
+            if f == "-":
+                input_filename = "<stdin>"
+                base_filename = "stdin"
+                asm_out = None
+            sym_out = base_filename + ".sym"
 
             print("\nParsing file " + f)
 
+            parse_options = ParseOptions(
+                bounds_check=bounds_check, memoize=memoize,
+                symbol_dump_filename=(sym_out if symbol_dump else None),
+                use_function_cache=incremental,
+                use_token_cache=incremental)
+
+            start_profile()
             try:
-                success = Parser.parse(input_filename, asm_out)
+                if asm_out is None:
+                    code = Parser.compile_source(
+                        sys.stdin, filename=input_filename,
+                        options=parse_options)
+                    success = code is not None
+                    if success:
+                        code_stdout.write(code)
+                        code_stdout.flush()
+                else:
+                    success = Parser.parse(input_filename, asm_out,
+                                           parse_options)
             except Exception as ex:
                 print("\nException occurred while parsing file %s:\n%s" % (f, ex))
+            finally:
+                stop_profile(f, base_filename)
 
 
             if not success:
-                os.remove(asm_out)
+                if asm_out is not None:
+                    OutputFile.remove(asm_out)
                 list_of_failed_compilations.append(f)
         if len(list_of_failed_compilations) > 0:
             print("The following file(s) failed to compile:")
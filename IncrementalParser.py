@@ -0,0 +1,324 @@
+"""
+Filename: IncrementalParser.py
+Tested using Python 3.5.1
+
+David Dalcino
+CS 6110
+Prof. Reiter
+Winter 2017
+CSU East Bay
+
+This file implements IncrementalParser, which keeps a Go-- source file's
+tokens and functions between compiles, so that an editor (or a server
+working for one) can send it small edits, and each compile after an edit
+only parses the functions that the edit touched.
+
+Functions can only be defined at the top level of a file, so each one is a
+run of tokens, from its 'func' keyword to its closing brace, that can be
+parsed on its own. For each function, an IncrementalParser keeps the range
+of its tokens, its signature, its FunctionCache key, and the errors found
+in it the last time it was compiled. The code generated for it, and the
+summary of its side effects, are kept in the FunctionCache, which also
+checks that the functions it calls have not changed in ways that matter
+to it.
+
+After an edit, the tokens are scanned again with TokenStream.rescan(), and
+only the functions around the tokens that changed are found again; the
+functions after them are the same as before, only moved, once a function
+starts at brace depth 0 where an old one did. The signatures of the
+functions are known from the same pass, so the file does not have to be
+indexed again, and the Parser skips over every function whose key has not
+changed.
+
+Usage: python3 IncrementalParser.py source_file
+    Compiles the file, then times an edit at the end of each function, and
+    a compile after each one.
+"""
+
+import bisect
+from FunctionCache import FunctionCache
+from ParseOptions import ParseOptions
+from ParserWithST import Parser
+from SignatureIndex import SignatureIndex
+from Token import TokenType
+from TokenCache import TokenReader
+from TokenDump import TokenDump, TokenStream
+
+
+class IncrementalParser:
+    """
+    Keeps the tokens and functions of one source file between compiles.
+    """
+
+    # The ids of the token types that mark out functions
+    FUNC = TokenType.KeywordFunc.value
+    OPEN_CURLY = TokenType.OpenCurly.value
+    CLOSE_CURLY = TokenType.CloseCurly.value
+
+    def __init__(self, filename, source=None, bounds_check=False,
+                 memoize=False):
+        """
+        Constructor for IncrementalParser. Scans the file, and finds its
+        functions.
+        :param filename:        The name of the source file
+        :param source:          The file's contents, as UTF-8 bytes, if they
+                                are not to be read from the file
+        :param bounds_check:    If True, array subscripts are checked at
+                                runtime
+        :param memoize:         If True, pure recursive functions remember
+                                their results
+        :raises Scanner.IllegalCharacterError: If the file has a character
+                                that the Scanner does not accept
+        """
+        self.filename = filename
+        self.bounds_check = bounds_check
+        self.memoize = memoize
+        if source is None:
+            source = TokenDump.read_source(filename)
+        self.stream = TokenStream(TokenDump.dumps(filename, source), source)
+        self.reparsed = 0       # How many functions the last edit changed
+        # A list of dicts, one for each 'func' keyword at brace depth 0, in
+        # order: the index of the keyword's token, "start"; the index of
+        # the function's closing brace, "close", or None if it has none;
+        # its "signature" (see SignatureIndex.read_header()), or None if
+        # its header is malformed; its FunctionCache "key"; and the
+        # "diagnostics" found in it by the last compile
+        self.functions = self.find_functions(0, 0, [], 0)
+
+
+
+    def edit(self, start, end, replacement):
+        """
+        Replaces part of the source, and finds the functions it changed.
+        :param start:       The offset of the first byte to replace
+        :param end:         The offset just after the last byte to replace;
+                            start, for an insertion
+        :param replacement: The text to put in its place, as UTF-8 bytes
+        :raises Scanner.IllegalCharacterError: If the edited source has a
+                            character that the Scanner does not accept
+        """
+        self.stream, first, old_stop, new_stop = self.stream.rescan(
+            start, end, replacement)
+
+        # Keep the functions that end before the first changed token
+        kept = 0
+        for i, function in enumerate(self.functions):
+            if function["start"] >= first:
+                break
+            if function["close"] is not None and function["close"] < first:
+                kept = i + 1
+        resume = 0
+        if kept > 0:
+            resume = self.functions[kept - 1]["close"] + 1
+        # The functions after the last changed token may be reused, moved
+        later = [function for function in self.functions[kept:]
+                 if function["start"] >= old_stop]
+        self.functions = self.find_functions(
+            resume, new_stop, later, new_stop - old_stop,
+            self.functions[:kept])
+
+
+
+    def find_functions(self, index, reuse_from, later, shift, found=None):
+        """
+        Finds the functions in the tokens, from a token at brace depth 0.
+        :param index:       The index of the token to start at
+        :param reuse_from:  The index of the first token that an edit left
+                            unchanged
+        :param later:       Functions found before the edit, whose tokens
+                            are all at or after reuse_from
+        :param shift:       How far the tokens at or after reuse_from have
+                            moved
+        :param found:       The functions found before index
+        :return:            A list of every function in the file
+        """
+        if found is None:
+            found = []
+        records = self.stream.records
+        fields = TokenDump.FIELDS
+        later_starts = [function["start"] + shift for function in later]
+        self.reparsed = 0
+
+        depth = 0
+        function = None     # The function whose body we are in
+        for i in range(index, len(self.stream)):
+            token_type = records[i * fields]
+            if token_type == IncrementalParser.OPEN_CURLY:
+                depth += 1
+            elif token_type == IncrementalParser.CLOSE_CURLY:
+                depth = max(depth - 1, 0)
+                if depth == 0 and function is not None:
+                    function["close"] = i
+                    function["key"] = FunctionCache.function_key(
+                        self.text(function["start"], i),
+                        {"bounds_check": self.bounds_check,
+                         "memoize": self.memoize})
+                    function = None
+            elif token_type == IncrementalParser.FUNC and depth == 0:
+                if i >= reuse_from:
+                    j = bisect.bisect_left(later_starts, i)
+                    if j < len(later_starts) and later_starts[j] == i:
+                        # From here on, nothing has changed
+                        for old in later[j:]:
+                            old["start"] += shift
+                            if old["close"] is not None:
+                                old["close"] += shift
+                            found.append(old)
+                        return found
+                function = {"start": i, "close": None, "key": None,
+                            "signature": self.read_header(i),
+                            "diagnostics": []}
+                found.append(function)
+                self.reparsed += 1
+        return found
+
+
+
+    def read_header(self, index):
+        """
+        :param index:   The index of a 'func' keyword's token
+        :return:        The signature in the function header that starts
+                        there; see SignatureIndex.read_header()
+        """
+        # The header ends with the brace that opens the function body
+        records = self.stream.records
+        last = index
+        while records[last * TokenDump.FIELDS] not in (
+                IncrementalParser.OPEN_CURLY, TokenType.EndOfFile.value):
+            last += 1
+        return SignatureIndex.read_header(self.text(index, last), 0)
+
+
+
+    def text(self, first, last):
+        """
+        :param first:   The index of a token
+        :param last:    The index of a later token
+        :return:        The source code from the start of the first token to
+                        the end of the last, as a str
+        """
+        fields = TokenDump.FIELDS
+        records = self.stream.records
+        start = records[first * fields + 1]
+        end = records[last * fields + 1] + records[last * fields + 2]
+        return self.stream.source[start:end].tobytes().decode("utf-8")
+
+
+
+    def reader(self):
+        """
+        :return:    A TokenReader over the tokens, for the Parser
+        """
+        return TokenReader(self.stream)
+
+
+
+    def signatures(self):
+        """
+        :return:    The signatures of the functions defined in the file, as
+                    SignatureIndex.for_file() would find them
+        """
+        return [function["signature"] for function in self.functions
+                if function["signature"] is not None]
+
+
+
+    def cached_functions(self, reader):
+        """
+        :param reader:  The TokenReader the Parser is reading from
+        :return:        A dict that describes every function that may be
+                        taken from the FunctionCache, as
+                        FunctionCache.find_functions() would find them
+        """
+        records = self.stream.records
+        fields = TokenDump.FIELDS
+        functions = {}
+        for function in self.functions:
+            if function["close"] is None or function["signature"] is None:
+                continue
+            func_end = records[function["start"] * fields + 1] + \
+                records[function["start"] * fields + 2]
+            close_end = records[function["close"] * fields + 1] + \
+                records[function["close"] * fields + 2]
+            functions[reader.position_of(func_end)[:2]] = {
+                "key": function["key"],
+                "signature": function["signature"],
+                "end": reader.position_of(close_end)[:2],
+            }
+        return functions
+
+
+
+    def compile(self, asm_output_filename, print_diagnostics=True):
+        """
+        Compiles the file, as it is after the edits so far. Functions that
+        have not changed, and that compiled without errors last time, are
+        taken from the FunctionCache.
+        :param asm_output_filename: The name of the file to write code to
+        :param print_diagnostics:   If False, errors are not printed; they
+                                    are only kept in each function's
+                                    "diagnostics", and in Parser.diagnostics
+        :return:                    True if compiled successfully; else
+                                    False
+        """
+        success = Parser.parse(self.filename, asm_output_filename,
+                               ParseOptions(
+                                   bounds_check=self.bounds_check,
+                                   memoize=self.memoize,
+                                   print_diagnostics=print_diagnostics,
+                                   incremental=self))
+
+        # Give each error to the function it was found in
+        reader = self.reader()
+        records = self.stream.records
+        fields = TokenDump.FIELDS
+        starts = [reader.position_of(records[function["start"] * fields + 1])
+                  [:2] for function in self.functions]
+        for function in self.functions:
+            function["diagnostics"] = []
+        for error in Parser.diagnostics:
+            i = bisect.bisect_right(starts, (error.line_number,
+                                             error.column)) - 1
+            if i >= 0:
+                self.functions[i]["diagnostics"].append(error)
+        return success
+
+
+
+if __name__ == "__main__":
+    import contextlib
+    import io
+    import os
+    import sys
+    import time
+
+    if len(sys.argv) != 2:
+        print("Usage: python3 IncrementalParser.py source_file")
+        sys.exit(1)
+    source_filename = sys.argv[1]
+    asm_filename = os.devnull
+
+    start_time = time.perf_counter()
+    session = IncrementalParser(source_filename)
+    with contextlib.redirect_stdout(io.StringIO()):
+        session.compile(asm_filename)
+    print("First compile: %.1f ms, %d functions" %
+          ((time.perf_counter() - start_time) * 1000,
+           len(session.functions)))
+
+    times = []
+    for n in range(len(session.functions)):
+        function = session.functions[n]
+        if function["close"] is None:
+            continue
+        # Add a blank line just inside the function's closing brace
+        offset = session.stream.offset(function["close"])
+        start_time = time.perf_counter()
+        session.edit(offset, offset, b"\n")
+        with contextlib.redirect_stdout(io.StringIO()):
+            session.compile(asm_filename)
+        times.append((time.perf_counter() - start_time) * 1000)
+    if times:
+        times.sort()
+        print("Edit and compile: median %.1f ms, slowest %.1f ms, over %d "
+              "edits" % (times[len(times) // 2], times[-1], len(times)))
@@ -0,0 +1,394 @@
+"""
+Filename: Linker.py
+Tested using Python 3.5.1
+
+David Dalcino
+CS 6110
+Prof. Reiter
+Winter 2017
+CSU East Bay
+
+This file implements the Linker, which lets a Go-- program be split over
+several source files, called modules, and compiled one module at a time.
+
+Each module is compiled by the Parser to an asm fragment: the code for the
+functions the module defines, without the prologue or the epilogue. Next to
+the fragment, the Linker writes an interface file that describes the module:
+the FunctionSignatures of the functions it exports (the ones it defines),
+and of the functions it imports (the ones it calls, but does not define),
+along with the side effect summaries that the code in the fragment assumed
+for them. The Linker checks that every import is exported by exactly one
+module, with the same signature and summary, and then writes one prologue
+and one epilogue, followed by every fragment, to the program's asm file.
+
+Function labels depend only on the function's identifier, so a fragment can
+call into another one without knowing anything about how it was compiled.
+Every other label in a fragment is made from the label of the function it
+belongs to, so labels from different fragments never clash.
+
+When a program is built again, a module is only compiled again if its source
+code or the compiler options have changed since its fragment was written, or
+if a function it imports no longer has the summary its code was made for.
+"""
+
+import hashlib
+import json
+import os
+import re
+from CodeGenerator import CG
+from Errors import LinkError
+from ExpressionRecord import FunctionSignature
+from OutputFile import OutputFile
+from ParseOptions import ParseOptions
+from ParserWithST import Parser
+from SignatureIndex import SignatureIndex
+
+
+class Linker:
+    """
+    A static class that compiles the modules of a program, and puts their
+    asm fragments together into one asm file.
+    """
+
+    #################################################################
+    # STATIC CONSTANT DATA
+
+    FRAGMENT_EXTENSION = ".frag.asm"    # Added to a module's base filename
+    INTERFACE_EXTENSION = ".gommi"      # to name its fragment and interface
+
+    # The summary fields that an import and its export must agree on
+    SUMMARY_KEYS = ("modified_params", "uses_address_registers", "is_pure")
+
+
+
+    #################################################################
+    # STATIC MEMBER FUNCTIONS
+
+    @staticmethod
+    def base_filename(source_filename):
+        """
+        :param source_filename: The name of a module's source file
+        :return:                The name without its extension, if it has one
+        """
+        head, tail = os.path.split(source_filename)
+        if '.' in tail:
+            tail = '.'.join(tail.split('.')[:-1])
+        return os.path.join(head, tail)
+
+
+
+    @staticmethod
+    def module_name(source_filename):
+        """
+        :param source_filename: The name of a module's source file
+        :return:                The name of the module: the source file's
+                                name without its directory or extension,
+                                changed so that it can be used in a label
+        """
+        name = os.path.basename(Linker.base_filename(source_filename))
+        return re.sub(r"[^A-Za-z0-9_]", "_", name)
+
+
+
+    @staticmethod
+    def source_hash(source_filename):
+        """
+        :param source_filename: The name of a module's source file
+        :return:                A hash of the file's contents
+        """
+        with open(source_filename, 'rb') as f:
+            return hashlib.sha1(f.read()).hexdigest()
+
+
+
+    @staticmethod
+    def compile_module(source_filename, externs, bounds_check=False,
+                       memoize=False, use_function_cache=False,
+                       use_token_cache=False):
+        """
+        Compiles one module to an asm fragment, and writes its interface file.
+        :param source_filename: The name of the module's source file
+        :param externs:         A list of FunctionSignatures of the functions
+                                that the other modules define
+        :param bounds_check:    If True, array subscripts are checked at
+                                runtime
+        :param memoize:         If True, pure recursive functions remember
+                                their results
+        :param use_function_cache:  If True, unchanged functions are taken
+                                    from the FunctionCache
+        :param use_token_cache: If True, the tokens of an unchanged file are
+                                taken from the TokenCache
+        :return:                The module's interface, as a dict; or None
+                                if the module did not compile
+        """
+        base = Linker.base_filename(source_filename)
+        fragment_filename = base + Linker.FRAGMENT_EXTENSION
+        name = Linker.module_name(source_filename)
+
+        print("\nParsing module " + source_filename)
+        options = ParseOptions(bounds_check=bounds_check, memoize=memoize,
+                               module_name=name, externs=externs,
+                               use_function_cache=use_function_cache,
+                               use_token_cache=use_token_cache)
+        if not Parser.parse(source_filename, fragment_filename, options):
+            OutputFile.remove(fragment_filename)
+            return None
+
+        # Everything this module defines is exported; everything else
+        # that its functions call is imported
+        global_scope = Parser.s_table.open_scopes[0].data
+        exports = [sig for sig in global_scope.values()
+                   if isinstance(sig, FunctionSignature)
+                   and not sig.is_prototype]
+        export_ids = {sig.identifier for sig in exports}
+        call_graph = Parser.s_table.get_call_graph()
+        import_ids = set()
+        for func_id in export_ids:
+            import_ids.update(call_graph[func_id])
+        import_ids -= export_ids
+
+        interface = {
+            "module": name,
+            "source": source_filename,
+            "source_hash": Linker.source_hash(source_filename),
+            "fragment": fragment_filename,
+            "options": {"bounds_check": bounds_check, "memoize": memoize},
+            "exports": [sig.to_dict() for sig in exports],
+            "imports": [global_scope[func_id].to_dict()
+                        for func_id in sorted(import_ids)],
+        }
+        Linker.write_interface(base + Linker.INTERFACE_EXTENSION, interface)
+        return interface
+
+
+
+    @staticmethod
+    def write_interface(filename, interface):
+        """
+        Writes a module's interface file.
+        :param filename:    The name of the interface file
+        :param interface:   The interface, as a dict
+        """
+        with OutputFile(filename) as f:
+            json.dump(interface, f, indent=1, sort_keys=True)
+
+
+
+    @staticmethod
+    def read_interface(filename):
+        """
+        Reads a module's interface file.
+        :param filename:    The name of the interface file
+        :return:            The interface, as a dict; or None if the file is
+                            missing or damaged
+        """
+        try:
+            with open(filename, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+
+
+    @staticmethod
+    def is_up_to_date(interface, source_filename, options):
+        """
+        :param interface:       A module's interface, as read from its
+                                interface file, or None
+        :param source_filename: The name of the module's source file
+        :param options:         A dict of the compiler options for this build
+        :return:                a bool that tells you if the module's fragment
+                                can be used without compiling it again. An
+                                interface written before the sizes of array
+                                parameters were recorded cannot.
+        """
+        return interface is not None and \
+            interface.get("options") == options and \
+            interface.get("source_hash") == \
+            Linker.source_hash(source_filename) and \
+            os.path.isfile(interface.get("fragment", "")) and \
+            all("param_sizes" in d for d in interface.get("exports", []) +
+                interface.get("imports", []))
+
+
+
+    @staticmethod
+    def is_compatible(imported, exported):
+        """
+        :param imported:    An import from a module's interface
+        :param exported:    The export from another module's interface with
+                            the same identifier
+        :return:            a bool that tells you if the code that uses the
+                            import is correct for the exported function
+        """
+        if imported["label"] != exported["label"] or \
+                imported["param_list_types"] != exported["param_list_types"] or \
+                imported["param_sizes"] != exported["param_sizes"] or \
+                imported["return_type"] != exported["return_type"]:
+            return False
+        if imported["modified_params"] is None:
+            # The importing module assumed the worst about this function
+            return True
+        return all(imported[key] == exported[key]
+                   for key in Linker.SUMMARY_KEYS)
+
+
+
+    @staticmethod
+    def build(source_filenames, output_filename, bounds_check=False,
+              memoize=False, use_function_cache=False,
+              use_token_cache=False):
+        """
+        Compiles each module that has changed since it was last compiled,
+        then links every module into one asm file.
+        :param source_filenames:    The names of the modules' source files
+        :param output_filename:     The name of the asm file to write
+        :param bounds_check:        If True, array subscripts are checked at
+                                    runtime
+        :param memoize:             If True, pure recursive functions remember
+                                    their results
+        :param use_function_cache:  If True, unchanged functions in the
+                                    modules that are compiled are taken from
+                                    the FunctionCache
+        :param use_token_cache:     If True, the tokens of unchanged modules
+                                    are taken from the TokenCache
+        :return:                    True if the program was built; else False
+        """
+        options = {"bounds_check": bounds_check, "memoize": memoize}
+
+        names = [Linker.module_name(f) for f in source_filenames]
+        for name in names:
+            if names.count(name) > 1:
+                raise LinkError("Two modules are named %s" % name)
+
+        # Read the interfaces of the modules that do not need compiling
+        interfaces = {}
+        for source_filename in source_filenames:
+            interface = Linker.read_interface(
+                Linker.base_filename(source_filename) +
+                Linker.INTERFACE_EXTENSION)
+            if Linker.is_up_to_date(interface, source_filename, options):
+                interfaces[source_filename] = interface
+
+        def externs_for(source_filename):
+            # Functions from modules that are compiled come with their
+            # summaries; the others are only known by their signatures
+            externs = []
+            for other in source_filenames:
+                if other == source_filename:
+                    continue
+                if other in interfaces:
+                    externs.extend(FunctionSignature.from_dict(d)
+                                   for d in interfaces[other]["exports"])
+                else:
+                    for func_id, param_types, param_sizes, return_type in \
+                            SignatureIndex.for_file(other):
+                        externs.append(FunctionSignature(
+                            identifier=func_id,
+                            label=CG.gen_function_label(func_id),
+                            param_list_types=param_types,
+                            param_sizes=param_sizes,
+                            return_type=return_type,
+                            is_prototype=True,
+                            is_indexed=True))
+            return externs
+
+        def compile_module(source_filename):
+            interface = Linker.compile_module(
+                source_filename, externs_for(source_filename),
+                bounds_check=bounds_check, memoize=memoize,
+                use_function_cache=use_function_cache,
+                use_token_cache=use_token_cache)
+            if interface is None:
+                return False
+            interfaces[source_filename] = interface
+            return True
+
+        for source_filename in source_filenames:
+            if source_filename not in interfaces:
+                if not compile_module(source_filename):
+                    return False
+
+        # A module whose code assumed an out of date summary for one of
+        # its imports is compiled again. Its own summaries may change, so
+        # repeat until every module agrees.
+        for _ in range(len(source_filenames)):
+            exports = Linker.collect_exports(
+                [interfaces[f] for f in source_filenames])
+            stale = [f for f in source_filenames
+                     if any(d["identifier"] in exports and
+                            not Linker.is_compatible(
+                                d, exports[d["identifier"]][1])
+                            for d in interfaces[f]["imports"])]
+            if not stale:
+                break
+            for source_filename in stale:
+                if not compile_module(source_filename):
+                    return False
+
+        Linker.link([interfaces[f] for f in source_filenames],
+                    output_filename)
+        print("\nSuccessfully linked %s\n" % output_filename)
+        return True
+
+
+
+    @staticmethod
+    def collect_exports(interfaces):
+        """
+        :param interfaces:  The interfaces of every module in the program
+        :return:            A dict that pairs each exported function's
+                            identifier with a (module name, export) tuple
+        """
+        exports = {}
+        for interface in interfaces:
+            for d in interface["exports"]:
+                if d["identifier"] in exports:
+                    raise LinkError(
+                        "Function %s is defined in modules %s and %s" %
+                        (d["identifier"], exports[d["identifier"]][0],
+                         interface["module"]))
+                exports[d["identifier"]] = (interface["module"], d)
+        return exports
+
+
+
+    @staticmethod
+    def link(interfaces, output_filename):
+        """
+        Checks that the modules of a program fit together, then writes the
+        prologue, the epilogue and every module's fragment to one asm file.
+        :param interfaces:      The interfaces of every module in the program
+        :param output_filename: The name of the asm file to write
+        """
+        exports = Linker.collect_exports(interfaces)
+
+        for interface in interfaces:
+            for d in interface["imports"]:
+                if d["identifier"] not in exports:
+                    raise LinkError(
+                        "Function %s is called in module %s, but is not "
+                        "defined in any module" %
+                        (d["identifier"], interface["module"]))
+                if not Linker.is_compatible(d, exports[d["identifier"]][1]):
+                    raise LinkError(
+                        "Module %s was compiled for a different version of "
+                        "function %s than module %s defines" %
+                        (interface["module"], d["identifier"],
+                         exports[d["identifier"]][0]))
+
+        if "main" not in exports:
+            raise LinkError("No main function found in program; point of "
+                            "entry required")
+
+        bounds_check = any(interface["options"]["bounds_check"]
+                           for interface in interfaces)
+
+        with OutputFile(output_filename) as file_out:
+            file_out.write(CG.PROLOGUE + CG.LINE_ENDING)
+            file_out.write(CG.EPILOGUE + CG.LINE_ENDING)
+            if bounds_check:
+                file_out.write(CG.BOUNDS_ERROR_HANDLER + CG.LINE_ENDING)
+            for interface in interfaces:
+                with open(interface["fragment"], 'r') as fragment:
+                    file_out.write(fragment.read())
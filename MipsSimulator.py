@@ -0,0 +1,519 @@
+"""
+Filename: MipsSimulator.py
+Tested using Python 3.5.1
+
+David Dalcino
+CS 6110
+Prof. Reiter
+Winter 2017
+CSU East Bay
+
+This file implements MipsSimulator, a small simulator for the MIPS assembly
+code that the Code Generator writes, so that generated code can be run and
+measured without SPIM or MARS. It supports the instructions, pseudo
+instructions, directives and syscalls that the Code Generator uses, and
+nothing more.
+
+Besides the program's output, the simulator counts the instructions it ran
+(the dynamic instruction count), and how many of them were loads and stores.
+Pseudo instructions are counted once each, although an assembler may turn
+some of them into more than one instruction.
+
+Usage: python3 MipsSimulator.py <asm_file> [input]
+
+The input is what the program reads, with escapes like \\n; the program's
+output is printed, followed by the counts.
+"""
+
+import struct
+import sys
+
+
+#################################################################
+# HELPER FUNCTIONS
+
+def float_to_bits(value):
+    """ :return: The bits of a single precision float, as an int """
+    return struct.unpack("<I", struct.pack("<f", value))[0]
+
+
+
+def bits_to_float(bits):
+    """ :return: The single precision float that has these bits """
+    return struct.unpack("<f", struct.pack("<I", bits & 0xffffffff))[0]
+
+
+
+def to_signed(value):
+    """ :return: The value, wrapped to a signed 32 bit int """
+    value &= 0xffffffff
+    return value - (1 << 32) if value & 0x80000000 else value
+
+
+
+def unescape(text):
+    """ :return: The contents of a string literal, with escapes replaced """
+    escapes = {"n": "\n", "t": "\t", "r": "\r", "\\": "\\", '"': '"',
+               "0": "\0"}
+    chars = []
+    i = 0
+    while i < len(text):
+        if text[i] == "\\" and i + 1 < len(text):
+            chars.append(escapes.get(text[i + 1], text[i + 1]))
+            i += 2
+        else:
+            chars.append(text[i])
+            i += 1
+    return "".join(chars)
+
+
+
+def strip_comment(line):
+    """ :return: The line, without any comment that follows the code """
+    in_string = False
+    for i, ch in enumerate(line):
+        if ch == '"' and (i == 0 or line[i - 1] != "\\"):
+            in_string = not in_string
+        elif ch == "#" and not in_string:
+            return line[:i]
+    return line
+
+
+
+class MipsSimulator:
+    """
+    Runs one MIPS program. Memory is split into a data segment, which holds
+    everything declared in the .data sections, and a stack, which is kept
+    as a dict of words.
+    """
+
+    #################################################################
+    # STATIC CONSTANT DATA
+
+    REGISTERS = {"$zero": 0, "$0": 0, "$at": 1, "$v0": 2, "$v1": 3,
+                 "$a0": 4, "$a1": 5, "$a2": 6, "$a3": 7, "$t0": 8, "$t1": 9,
+                 "$t2": 10, "$t3": 11, "$t4": 12, "$t5": 13, "$t6": 14,
+                 "$t7": 15, "$s0": 16, "$s1": 17, "$s2": 18, "$s3": 19,
+                 "$s4": 20, "$s5": 21, "$s6": 22, "$s7": 23, "$t8": 24,
+                 "$t9": 25, "$gp": 28, "$sp": 29, "$fp": 30, "$ra": 31}
+
+    DATA_BASE = 0x10010000      # The address of the data segment
+    STACK_TOP = 0x7fffeffc      # The first value of $sp
+    GLOBAL_POINTER = 0x10008000 # The first value of $gp
+
+    DEFAULT_LIMIT = 50000000    # The most instructions a program may run
+
+    # Branches that compare a register with 0, and then two values
+    ZERO_BRANCHES = {"bgez": lambda x: x >= 0, "bgtz": lambda x: x > 0,
+                     "bltz": lambda x: x < 0, "blez": lambda x: x <= 0,
+                     "beqz": lambda x: x == 0, "bnez": lambda x: x != 0}
+    COMPARE_BRANCHES = {"bge": lambda x, y: x >= y,
+                        "bgt": lambda x, y: x > y,
+                        "blt": lambda x, y: x < y,
+                        "ble": lambda x, y: x <= y,
+                        "bgeu": lambda x, y: x >= y,
+                        "bltu": lambda x, y: x < y}
+    FLOAT_OPERATIONS = {"add.s": lambda x, y: x + y,
+                        "sub.s": lambda x, y: x - y,
+                        "mul.s": lambda x, y: x * y,
+                        "div.s": lambda x, y: x / y}
+    FLOAT_COMPARISONS = {"c.eq.s": lambda x, y: x == y,
+                         "c.le.s": lambda x, y: x <= y,
+                         "c.lt.s": lambda x, y: x < y}
+
+
+
+    def __init__(self, asm_text, input_text=""):
+        """
+        Assembles a program, and gets it ready to run.
+        :param asm_text:    The program's assembly code
+        :param input_text:  Everything the program will read
+        """
+        self.instructions, self.labels, data = \
+            MipsSimulator.assemble(asm_text)
+        self.data = data + bytearray(64)
+        self.stack = {}
+        self.registers = [0] * 32
+        self.float_registers = [0] * 32     # Held as bits
+        self.hi = 0
+        self.lo = 0
+        self.condition_flag = False
+        self.registers[29] = MipsSimulator.STACK_TOP
+        self.registers[28] = MipsSimulator.GLOBAL_POINTER
+        self.input_text = input_text
+        self.input_position = 0
+        self.output = []
+
+        self.instruction_count = 0          # The dynamic instruction count
+        self.loads = 0
+        self.stores = 0
+
+
+
+    #################################################################
+    # ASSEMBLY
+
+    @staticmethod
+    def assemble(asm_text):
+        """
+        Turns a program's assembly code into a form that can be run.
+        :param asm_text:    The program's assembly code
+        :return:            A tuple (list of [op, args] instructions, dict
+                            that pairs each label with a ("text", index) or
+                            ("data", address) tuple, the data segment as a
+                            bytearray). Numeric local labels used as
+                            branch targets, like 1f and 2b, are replaced
+                            by ("L", index) tuples.
+        """
+        data = bytearray()
+        instructions = []
+        labels = {}
+        local_labels = []       # (name, index) tuples
+        pending_labels = []     # Data labels waiting for their directive
+        segment = "text"
+        for raw_line in asm_text.splitlines():
+            line = strip_comment(raw_line).strip()
+            while ":" in line and not line.startswith(".") and \
+                    '"' not in line.split(":")[0]:
+                name, line = line.split(":", 1)
+                name = name.strip()
+                line = line.strip()
+                if segment == "data":
+                    pending_labels.append(name)
+                elif name.isdigit():
+                    local_labels.append((name, len(instructions)))
+                else:
+                    labels[name] = ("text", len(instructions))
+            if not line:
+                continue
+
+            if line.startswith("."):
+                parts = line.split(None, 1)
+                directive = parts[0]
+                if directive in (".word", ".float"):
+                    while len(data) % 4:
+                        data.append(0)
+                for name in pending_labels:
+                    labels[name] = ("data", MipsSimulator.DATA_BASE +
+                                    len(data))
+                pending_labels = []
+                if directive == ".text":
+                    segment = "text"
+                elif directive == ".data":
+                    segment = "data"
+                elif directive == ".asciiz":
+                    literal = parts[1].strip()
+                    data += unescape(literal[1:-1]).encode("latin-1") + b"\0"
+                elif directive == ".word":
+                    for value in parts[1].split(","):
+                        data += struct.pack("<i", int(value))
+                elif directive == ".float":
+                    for value in parts[1].split(","):
+                        data += struct.pack("<f", float(value))
+                elif directive == ".byte":
+                    for value in parts[1].split(","):
+                        data.append(int(value) & 0xff)
+                elif directive == ".space":
+                    data += bytes(int(parts[1]))
+                elif directive == ".align":
+                    while len(data) % (1 << int(parts[1])):
+                        data.append(0)
+                continue
+
+            parts = line.split(None, 1)
+            args = [arg.strip() for arg in parts[1].split(",")] \
+                if len(parts) > 1 else []
+            instructions.append([parts[0], args])
+
+        for index, (op, args) in enumerate(instructions):
+            for j, arg in enumerate(args):
+                if len(arg) >= 2 and arg[:-1].isdigit() and arg[-1] in "fb":
+                    name = arg[:-1]
+                    if arg[-1] == "f":
+                        target = min(i for n, i in local_labels
+                                     if n == name and i > index)
+                    else:
+                        target = max(i for n, i in local_labels
+                                     if n == name and i <= index)
+                    args[j] = ("L", target)
+        return instructions, labels, data
+
+
+
+    #################################################################
+    # MEMORY AND OPERANDS
+
+    def address(self, arg):
+        """ :return: The address an operand like 8($fp) or a label refers to """
+        if "(" in arg:
+            offset, register = arg[:-1].split("(")
+            offset = int(offset) if offset else 0
+            return (self.registers[MipsSimulator.REGISTERS[register]] +
+                    offset) & 0xffffffff
+        return self.labels[arg][1]
+
+
+
+    def target(self, arg):
+        """ :return: The index of the instruction a branch goes to """
+        if isinstance(arg, tuple):
+            return arg[1]
+        return self.labels[arg][1]
+
+
+
+    def value(self, arg):
+        """ :return: The value of an operand that is a register or a number """
+        if arg.startswith("$"):
+            return self.registers[MipsSimulator.REGISTERS[arg]]
+        return int(arg, 0)
+
+
+
+    def load_word(self, address):
+        """ :return: The word at an address """
+        if MipsSimulator.DATA_BASE <= address < \
+                MipsSimulator.DATA_BASE + len(self.data):
+            offset = address - MipsSimulator.DATA_BASE
+            return struct.unpack("<i", bytes(self.data[offset:offset + 4]))[0]
+        return self.stack.get(address, 0)
+
+
+
+    def store_word(self, address, value):
+        """ Stores a word at an address """
+        value = to_signed(value)
+        if MipsSimulator.DATA_BASE <= address < \
+                MipsSimulator.DATA_BASE + len(self.data):
+            offset = address - MipsSimulator.DATA_BASE
+            self.data[offset:offset + 4] = struct.pack("<i", value)
+        else:
+            self.stack[address] = value
+
+
+
+    def load_byte(self, address):
+        """ :return: The unsigned byte at an address """
+        if MipsSimulator.DATA_BASE <= address < \
+                MipsSimulator.DATA_BASE + len(self.data):
+            return self.data[address - MipsSimulator.DATA_BASE]
+        word = self.stack.get(address & ~3, 0) & 0xffffffff
+        return (word >> (8 * (address & 3))) & 0xff
+
+
+
+    def read_input_token(self):
+        """
+        :return:    The next word of input, for read_int() and read_float().
+                    The newline after it is read too.
+        """
+        text = self.input_text
+        while self.input_position < len(text) and \
+                text[self.input_position].isspace():
+            self.input_position += 1
+        start = self.input_position
+        while self.input_position < len(text) and \
+                not text[self.input_position].isspace():
+            self.input_position += 1
+        token = text[start:self.input_position]
+        if self.input_position < len(text) and \
+                text[self.input_position] == "\n":
+            self.input_position += 1
+        return token
+
+
+
+    def syscall(self):
+        """
+        Does what a syscall asks for.
+        :return:    True if the program should stop
+        """
+        service = self.registers[2]
+        if service == 1:
+            self.output.append(str(to_signed(self.registers[4])))
+        elif service == 2:
+            self.output.append(repr(round(
+                bits_to_float(self.float_registers[12]), 6)))
+        elif service == 4:
+            address = self.registers[4] & 0xffffffff
+            chars = []
+            while self.load_byte(address) != 0:
+                chars.append(chr(self.load_byte(address)))
+                address += 1
+            self.output.append("".join(chars))
+        elif service == 5:
+            self.registers[2] = int(self.read_input_token() or 0)
+        elif service == 6:
+            self.float_registers[0] = float_to_bits(
+                float(self.read_input_token() or 0))
+        elif service == 10:
+            return True
+        elif service == 11:
+            self.output.append(chr(self.registers[4] & 0xff))
+        elif service == 12:
+            if self.input_position >= len(self.input_text):
+                # Out of input: stop the program
+                return True
+            self.registers[2] = ord(self.input_text[self.input_position])
+            self.input_position += 1
+        else:
+            raise RuntimeError("Unsupported syscall %d" % service)
+        return False
+
+
+
+    #################################################################
+    # EXECUTION
+
+    def run(self, limit=DEFAULT_LIMIT):
+        """
+        Runs the program from the label main, until it exits, returns from
+        main, or runs out of instructions.
+        :param limit:   The most instructions the program may run
+        :return:        Everything the program printed, as a string
+        """
+        reg = MipsSimulator.REGISTERS
+        r = self.registers
+        f = self.float_registers
+        instructions = self.instructions
+        return_address = len(instructions) + 1000   # Returning here stops
+        r[31] = return_address
+        pc = self.labels["main"][1]
+
+        while pc < len(instructions):
+            op, a = instructions[pc]
+            self.instruction_count += 1
+            if self.instruction_count > limit:
+                raise RuntimeError("The program ran more than %d "
+                                   "instructions" % limit)
+            next_pc = pc + 1
+
+            if op == "lw":
+                self.loads += 1
+                r[reg[a[0]]] = self.load_word(self.address(a[1]))
+            elif op == "sw":
+                self.stores += 1
+                self.store_word(self.address(a[1]), r[reg[a[0]]])
+            elif op == "lwc1":
+                self.loads += 1
+                f[int(a[0][2:])] = \
+                    self.load_word(self.address(a[1])) & 0xffffffff
+            elif op == "swc1":
+                self.stores += 1
+                self.store_word(self.address(a[1]), f[int(a[0][2:])])
+            elif op == "lb":
+                self.loads += 1
+                byte = self.load_byte(self.address(a[1]))
+                r[reg[a[0]]] = byte - 256 if byte & 0x80 else byte
+            elif op == "li":
+                r[reg[a[0]]] = to_signed(int(a[1], 0))
+            elif op == "la":
+                r[reg[a[0]]] = self.address(a[1])
+            elif op == "move":
+                r[reg[a[0]]] = r[reg[a[1]]]
+            elif op in ("add", "addu", "addi", "addiu"):
+                r[reg[a[0]]] = to_signed(r[reg[a[1]]] + self.value(a[2]))
+            elif op in ("sub", "subu"):
+                r[reg[a[0]]] = to_signed(r[reg[a[1]]] - self.value(a[2]))
+            elif op == "mul":
+                r[reg[a[0]]] = to_signed(r[reg[a[1]]] * self.value(a[2]))
+            elif op == "div":
+                # Either the pseudo instruction div rd, rs, rt or the real
+                # div rs, rt; both set hi and lo
+                if len(a) == 3:
+                    x, y = r[reg[a[1]]], r[reg[a[2]]]
+                else:
+                    x, y = r[reg[a[0]]], r[reg[a[1]]]
+                quotient = abs(x) // abs(y) * \
+                    (1 if (x < 0) == (y < 0) else -1)
+                self.lo, self.hi = quotient, x - quotient * y
+                if len(a) == 3:
+                    r[reg[a[0]]] = quotient
+            elif op == "mfhi":
+                r[reg[a[0]]] = self.hi
+            elif op == "mflo":
+                r[reg[a[0]]] = self.lo
+            elif op == "sll":
+                r[reg[a[0]]] = to_signed(r[reg[a[1]]] << int(a[2]))
+            elif op == "sra":
+                r[reg[a[0]]] = r[reg[a[1]]] >> int(a[2])
+            elif op in ("slt", "slti"):
+                r[reg[a[0]]] = int(r[reg[a[1]]] < self.value(a[2]))
+            elif op in ("sltu", "sltiu"):
+                r[reg[a[0]]] = int((r[reg[a[1]]] & 0xffffffff) <
+                                   (self.value(a[2]) & 0xffffffff))
+            elif op == "b" or op == "j":
+                next_pc = self.target(a[0])
+            elif op == "beq":
+                if r[reg[a[0]]] == self.value(a[1]):
+                    next_pc = self.target(a[2])
+            elif op == "bne":
+                if r[reg[a[0]]] != self.value(a[1]):
+                    next_pc = self.target(a[2])
+            elif op in MipsSimulator.ZERO_BRANCHES:
+                if MipsSimulator.ZERO_BRANCHES[op](r[reg[a[0]]]):
+                    next_pc = self.target(a[1])
+            elif op in MipsSimulator.COMPARE_BRANCHES:
+                x, y = r[reg[a[0]]], self.value(a[1])
+                if op.endswith("u"):
+                    x &= 0xffffffff
+                    y &= 0xffffffff
+                if MipsSimulator.COMPARE_BRANCHES[op](x, y):
+                    next_pc = self.target(a[2])
+            elif op == "jal":
+                r[31] = pc + 1
+                next_pc = self.target(a[0])
+            elif op == "jr":
+                next_pc = r[reg[a[0]]]
+                if next_pc == return_address:
+                    break
+            elif op == "syscall":
+                if self.syscall():
+                    break
+            elif op in MipsSimulator.FLOAT_OPERATIONS:
+                f[int(a[0][2:])] = float_to_bits(
+                    MipsSimulator.FLOAT_OPERATIONS[op](
+                        bits_to_float(f[int(a[1][2:])]),
+                        bits_to_float(f[int(a[2][2:])])))
+            elif op == "mov.s":
+                f[int(a[0][2:])] = f[int(a[1][2:])]
+            elif op == "cvt.s.w":
+                f[int(a[0][2:])] = float_to_bits(
+                    float(to_signed(f[int(a[1][2:])])))
+            elif op == "cvt.w.s":
+                f[int(a[0][2:])] = \
+                    int(bits_to_float(f[int(a[1][2:])])) & 0xffffffff
+            elif op in MipsSimulator.FLOAT_COMPARISONS:
+                self.condition_flag = MipsSimulator.FLOAT_COMPARISONS[op](
+                    bits_to_float(f[int(a[0][2:])]),
+                    bits_to_float(f[int(a[1][2:])]))
+            elif op == "bc1f":
+                if not self.condition_flag:
+                    next_pc = self.target(a[0])
+            elif op == "bc1t":
+                if self.condition_flag:
+                    next_pc = self.target(a[0])
+            elif op == "nop":
+                pass
+            else:
+                raise RuntimeError("Unsupported instruction %s" % op)
+            r[0] = 0
+            pc = next_pc
+        return "".join(self.output)
+
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python3 MipsSimulator.py asm_file [input]")
+        sys.exit(1)
+    with open(sys.argv[1], 'r') as asm_file:
+        simulator = MipsSimulator(
+            asm_file.read(),
+            sys.argv[2].encode().decode("unicode_escape")
+            if len(sys.argv) > 2 else "")
+    sys.stdout.write(simulator.run())
+    sys.stderr.write("\nstatic=%d dynamic=%d loads=%d stores=%d\n" %
+                     (len(simulator.instructions),
+                      simulator.instruction_count, simulator.loads,
+                      simulator.stores))
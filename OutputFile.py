@@ -0,0 +1,202 @@
+"""
+Filename: OutputFile.py
+Tested using Python 3.5.1
+
+David Dalcino
+CS 6110
+Prof. Reiter
+Winter 2017
+CSU East Bay
+
+This file implements OutputFile, which writes a file that other programs may
+be reading, so that they never see it half written.
+
+An OutputFile is used like a file opened with open(filename, 'w'), but what
+is written goes to a temporary file in the same directory. When the 'with'
+block ends without an exception, the temporary file is renamed over the real
+one, which replaces it in one step. If the block raises an exception, or
+discard() is called, the temporary file is deleted and the real file is left
+as it was. If the new contents are the same as the old ones, the real file
+is not replaced at all, so its modification time does not change, and build
+tools that look at it do not think it needs to be used again.
+"""
+
+import os
+import tempfile
+
+
+class OutputFile:
+    """
+    A file that is written to a temporary file, and then renamed over the
+    real one. Please instantiate using 'with ... as' syntax, like this:
+        with OutputFile(filename) as file_out:
+            file_out.write(text)
+    """
+
+    # The permissions a new file gets from open(), worked out once, when
+    # this module is imported; see OutputFile.read_umask()
+    default_mode = None
+
+    def __init__(self, filename, binary=False):
+        """
+        Constructor for OutputFile.
+        :param filename:    The name of the file to write
+        :param binary:      If True, bytes are written, as with
+                            open(filename, 'wb')
+        """
+        self.filename = filename
+        self.mode = 'wb' if binary else 'w'
+        self.temp_filename = None   # The name of the temporary file
+        self.file = None            # The temporary file, while it is open
+        self.discarded = False      # True if nothing is to be written
+
+
+
+    def __enter__(self):
+        """
+        Opens a temporary file in the same directory as the real one. A
+        device or a pipe, like /dev/null, cannot be replaced, so it is
+        written to directly.
+        """
+        if os.path.exists(self.filename) and \
+                not os.path.isfile(self.filename):
+            self.file = open(self.filename, self.mode)
+            self.write = self.file.write
+            return self
+        directory, name = os.path.split(self.filename)
+        fd, self.temp_filename = tempfile.mkstemp(
+            prefix="." + name + ".", suffix=".tmp", dir=directory or ".")
+        self.file = os.fdopen(fd, self.mode)
+        # Writes go straight to the temporary file
+        self.write = self.file.write
+        return self
+
+
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        Puts the new file in place of the real one, unless an exception was
+        raised or discard() was called; then the temporary file is deleted.
+        """
+        self.file.close()
+        if self.temp_filename is None:
+            return
+        if exc_type is not None or self.discarded:
+            os.remove(self.temp_filename)
+        else:
+            self.commit()
+
+
+
+    def writable(self):
+        """ :return: True, like any file opened for writing """
+        return True
+
+
+
+    def discard(self):
+        """
+        Leaves the real file as it is, once the 'with' block ends.
+        """
+        self.discarded = True
+
+
+
+    def commit(self):
+        """
+        Renames the temporary file over the real one, or deletes it if the
+        real one already holds the same bytes.
+        """
+        if os.path.isfile(self.filename):
+            if self.is_unchanged():
+                os.remove(self.temp_filename)
+                return
+            mode = os.stat(self.filename).st_mode & 0o7777
+        else:
+            mode = OutputFile.get_default_mode()
+        # mkstemp() makes files that only their owner can read
+        os.chmod(self.temp_filename, mode)
+        os.replace(self.temp_filename, self.filename)
+
+
+
+    def is_unchanged(self):
+        """
+        :return:    True if the temporary file holds the same bytes as the
+                    real one
+        """
+        if os.path.getsize(self.temp_filename) != \
+                os.path.getsize(self.filename):
+            return False
+        with open(self.temp_filename, 'rb') as new, \
+                open(self.filename, 'rb') as old:
+            return new.read() == old.read()
+
+
+
+    @staticmethod
+    def get_default_mode():
+        """
+        :return:    The permissions that open() gives a new file, under the
+                    process's umask
+        """
+        return OutputFile.default_mode
+
+
+
+    @staticmethod
+    def read_umask():
+        """
+        Finds the process's umask. Linux reports it in /proc; elsewhere, the
+        only way to read it is to set it and put it back, and another thread
+        that creates a file in between would get the wrong permissions, so
+        this is only done once, when this module is imported.
+        :return:    The umask
+        """
+        try:
+            with open("/proc/self/status", 'r') as f:
+                for line in f:
+                    if line.startswith("Umask:"):
+                        return int(line.split()[1], 8)
+        except (OSError, ValueError, IndexError):
+            pass
+        umask = os.umask(0)
+        os.umask(umask)
+        return umask
+
+
+
+    @staticmethod
+    def write_cache_file(directory, name, data):
+        """
+        Saves an entry of one of the compiler's caches, making the directory
+        if it does not exist yet. Other processes may be reading the cache,
+        so the file is written as an OutputFile, and they never see it only
+        partly written. If the file cannot be written, nothing happens; the
+        cache is only an optimization.
+        :param directory:   The cache directory
+        :param name:        The name of the file in it
+        :param data:        What to write, as bytes
+        """
+        try:
+            os.makedirs(directory, exist_ok=True)
+            with OutputFile(os.path.join(directory, name), binary=True) as f:
+                f.write(data)
+        except OSError:
+            pass
+
+
+
+    @staticmethod
+    def remove(filename):
+        """
+        Deletes an output file that is out of date, if there is one.
+        :param filename:    The name of the file
+        """
+        try:
+            os.remove(filename)
+        except FileNotFoundError:
+            pass
+
+
+OutputFile.default_mode = 0o666 & ~OutputFile.read_umask()
@@ -0,0 +1,91 @@
+"""
+Filename: ParseOptions.py
+Tested using Python 3.5.1
+
+David Dalcino
+CS 6110
+Prof. Reiter
+Winter 2017
+CSU East Bay
+
+This file implements ParseOptions, which holds the options that
+Parser.parse() compiles a file with: the ones that change the code that is
+generated, the caches to use, and what to print.
+
+Usage:
+    options = ParseOptions(bounds_check=True, print_trace=False)
+    Parser.parse(source_filename, asm_filename, options)
+"""
+
+
+class ParseOptions:
+    """
+    The options for one call to Parser.parse(). Every option has a default,
+    so ParseOptions() compiles a file the way GommCompiler.py does with no
+    options at all.
+    """
+
+    def __init__(self, bounds_check=False, memoize=False,
+                 keep_closed_scopes=False, symbol_dump_filename=None,
+                 module_name=None, externs=(), use_function_cache=False,
+                 use_token_cache=False, incremental=None,
+                 print_diagnostics=True, print_trace=True):
+        """
+        Constructor for ParseOptions.
+        :param bounds_check:    If True, array subscripts are checked at
+                                runtime
+        :param memoize:     If True, pure recursive functions remember
+                            their results
+        :param keep_closed_scopes:  If True, closed scopes are kept, so that
+                                    display_symbol_table() can show them
+        :param symbol_dump_filename:    If not None, every scope is written
+                                        to a file with this name
+        :param module_name: If not None, the file is compiled as one module
+                            of a larger program, to an asm fragment that
+                            the Linker puts together with the others. A
+                            module needs no main function, and may call
+                            functions that it does not define.
+        :param externs:     FunctionSignatures of functions defined in other
+                            modules, which this file may call
+        :param use_function_cache:  If True, functions that have not changed
+                                    since they were last compiled are taken
+                                    from the FunctionCache. They do not
+                                    appear in the symbol table display or
+                                    dump file, so the cache is not used
+                                    when closed scopes are kept.
+        :param use_token_cache: If True, the tokens in the file are taken
+                                from the TokenCache, if the file has not
+                                changed since it was last scanned
+        :param incremental: If not None, an IncrementalParser that holds
+                            the file's tokens and functions. The file is
+                            parsed from there instead of being read, and
+                            its unchanged functions are taken from the
+                            FunctionCache.
+        :param print_diagnostics:   If False, errors are not printed; they
+                                    are only kept in Parser.diagnostics, to
+                                    be shown some other way
+        :param print_trace: If False, the productions expanded are not
+                            printed, so that only errors and the result are
+                            shown
+        """
+        self.bounds_check = bounds_check
+        self.memoize = memoize
+        self.keep_closed_scopes = keep_closed_scopes
+        self.symbol_dump_filename = symbol_dump_filename
+        self.module_name = module_name
+        self.externs = externs
+        self.use_function_cache = use_function_cache
+        self.use_token_cache = use_token_cache
+        self.incremental = incremental
+        self.print_diagnostics = print_diagnostics
+        self.print_trace = print_trace
+
+
+
+    def code_options(self):
+        """
+        :return:    A dict of the options that change the code that is
+                    generated; code compiled with the same ones can be
+                    reused
+        """
+        return {"bounds_check": self.bounds_check, "memoize": self.memoize}
@@ -112,15 +112,20 @@ The grammar implemented is summarized here:
 
 """
 
+import contextlib
+import io
 from Token import TokenType, Token
 from Scanner import Scanner
-from FileReader import FileReader
+from FileReader import FileReader, StringLines
+from OutputFile import OutputFile
 from SymbolTable import SymbolTable
 from Errors import *
 from CodeGenerator import CG
 from ExpressionRecord import ExpressionRecord, FunctionSignature, DataTypes
-import os
-import traceback
+from SignatureIndex import SignatureIndex
+from FunctionCache import FunctionCache
+from TokenCache import TokenCache
+from ParseOptions import ParseOptions
 
 
 class Parser:
@@ -146,48 +151,190 @@ class Parser:
     # program
     s_table = None
 
+    # diagnostics: A list of the errors found in the file, as ParseErrors.
+    # Only the first MAX_DIAGNOSTICS are kept; error_count counts them all.
+    diagnostics = None
+    error_count = 0
+
+    # print_diagnostics: If True, each error is printed as it is found.
+    # Otherwise, the errors are only kept in diagnostics.
+    print_diagnostics = True
+
+    # print_trace: If True, the number of each production is printed as it
+    # is expanded; see trace()
+    print_trace = True
+
+    # cached_functions: If the FunctionCache is in use, a dict that describes
+    # every function definition in the file; see
+    # FunctionCache.find_functions(). Otherwise, None.
+    cached_functions = None
+
+    #################################################################
+    # STATIC CONSTANT DATA
+
+    # MAX_DIAGNOSTICS: The most errors that are kept and printed for a file
+    MAX_DIAGNOSTICS = 100
+
+    # STATEMENT_KEYWORDS: Keywords that start a <basic_statement>. After an
+    # error in a statement, parsing can resume at any of these.
+    STATEMENT_KEYWORDS = (TokenType.KeywordReturn, TokenType.KeywordIf,
+                          TokenType.KeywordWhile, TokenType.KeywordVar)
+
+    # FUNCTION_SYNC: After an error outside a statement, parsing resumes at
+    # the next function declaration or prototype
+    FUNCTION_SYNC = (TokenType.KeywordFunc, TokenType.KeywordProto,
+                     TokenType.EndOfFile)
+
 
 
     #################################################################
     # HELPER FUNCTIONS
 
     @staticmethod
-    def parse(filename, asm_output_filename):
+    def parse(filename, asm_output_filename, options=None, source=None,
+              asm_file=None):
         """
         Uses recursive descent to parse an input file, printing a list of
         productions as it goes. Opens the input file, and calls 'program()',
         which begins recursive descent until an EndOfFile token is reached.
         If no errors occur, it prints "Success!!!"
         :param filename:    The name of the file to parse.
+        :param asm_output_filename: The name of the file to write code to.
+                                    It is written to a temporary file, which
+                                    only replaces it if the file compiles,
+                                    and its contents have changed.
+        :param options:     The options to compile the file with, as a
+                            ParseOptions; if None, the defaults are used
+        :param source:      If not None, the file's contents, which are
+                            parsed instead of reading the file: a str; UTF-8
+                            bytes, or any other bytes-like object; or a
+                            file-like object with a read() method. The
+                            filename is then only used in messages.
+        :param asm_file:    If not None, an open file, or any object with a
+                            write() method, to write the code to instead of
+                            opening asm_output_filename. It is not closed.
         :return:            True if compiled successfully; else False
         """
-        with FileReader(filename) as fr:
-
-            with open(asm_output_filename, 'w') as file_out:
-
-                CG.init(file_out, fr)
+        if options is None:
+            options = ParseOptions()
+        incremental = options.incremental
+
+        # Closed scopes are thrown away, unless they are needed for a symbol
+        # dump file or for display_symbol_table()
+        closed_scope_policy = SymbolTable.DISCARD
+        if options.keep_closed_scopes:
+            closed_scope_policy = SymbolTable.COMPACT
+        dump_file = None
+        if options.symbol_dump_filename is not None:
+            closed_scope_policy = SymbolTable.DUMP
+            dump_file = open(options.symbol_dump_filename, 'w')
+
+        text = None
+        if source is not None:
+            text = StringLines.text_of(source)
 
-                Parser.file_reader = fr
-                Parser.s_table = SymbolTable()
-                current_token = Scanner.get_token(Parser.file_reader)
-                Parser.program(current_token)
-                Parser.match(current_token, TokenType.EndOfFile)
-
-                # Search for main in open symbol table:
-                # if not found, compilation has failed
-                if not Parser.s_table.find("main"):
-                    print("No main function found in program; point of entry "
-                          "required")
-                    CG.is_code_ok = False
-
-                # Search for FunctionSignatures in the symbol table,
-                # and check that each has been defined; if not, compilation
-                # has failed
-                undefined_proto_ids = Parser.s_table.get_undefined_prototypes()
-                for func_id in undefined_proto_ids:
-                    print("Function %s was forward declared, but was never "
-                          "defined." % func_id)
-                    CG.is_code_ok = False
+        try:
+            if incremental is not None:
+                reader = incremental.reader()
+            elif options.use_token_cache:
+                reader = TokenCache.reader(filename, text)
+            elif text is not None:
+                reader = FileReader(filename, StringLines(text))
+            else:
+                reader = FileReader(filename)
+            with reader as fr:
+
+                with Parser.open_output(asm_output_filename,
+                                        asm_file) as file_out:
+
+                    CG.init(file_out, fr,
+                            bounds_check=options.bounds_check,
+                            memoize=options.memoize,
+                            module_name=options.module_name)
+
+                    Parser.file_reader = fr
+                    Parser.diagnostics = []
+                    Parser.error_count = 0
+                    Parser.print_diagnostics = options.print_diagnostics
+                    Parser.print_trace = options.print_trace
+                    Parser.s_table = SymbolTable(closed_scope_policy,
+                                                 dump_file)
+                    for func_signature in options.externs:
+                        Parser.s_table.insert(func_signature.identifier,
+                                              func_signature)
+                    if incremental is not None:
+                        Parser.declare_indexed_functions(
+                            incremental.signatures())
+                    elif text is not None:
+                        Parser.declare_indexed_functions(
+                            SignatureIndex.for_text(text))
+                    else:
+                        Parser.declare_indexed_functions(
+                            SignatureIndex.for_file(filename))
+
+                    Parser.cached_functions = None
+                    if closed_scope_policy == SymbolTable.DISCARD and \
+                            incremental is not None:
+                        Parser.cached_functions = \
+                            incremental.cached_functions(fr)
+                    elif options.use_function_cache and \
+                            closed_scope_policy == SymbolTable.DISCARD:
+                        if text is None:
+                            with open(filename, 'r') as f:
+                                text = f.read()
+                        Parser.cached_functions = \
+                            FunctionCache.find_functions(
+                                text, options.code_options())
+                    if Parser.cached_functions is not None:
+                        FunctionCache.hits = 0
+                        FunctionCache.misses = 0
+
+                    current_token = Scanner.get_token(Parser.file_reader)
+                    CG.current_token = current_token
+                    Parser.program(current_token)
+                    Parser.match(current_token, TokenType.EndOfFile)
+
+                    # Search for main in open symbol table:
+                    # if not found, compilation has failed. A module
+                    # does not need one; the Linker checks that the
+                    # program has one.
+                    if options.module_name is None and \
+                            not Parser.s_table.find("main"):
+                        print("No main function found in program; point "
+                              "of entry required")
+                        CG.is_code_ok = False
+
+                    # Search for FunctionSignatures in the symbol table,
+                    # and check that each has been defined; if not,
+                    # compilation has failed. In a module, they are
+                    # imported from other modules by the Linker.
+                    undefined_proto_ids = []
+                    if options.module_name is None:
+                        undefined_proto_ids = \
+                            Parser.s_table.get_undefined_prototypes()
+                    for func_id in undefined_proto_ids:
+                        print("Function %s was forward declared, but was "
+                              "never defined." % func_id)
+                        CG.is_code_ok = False
+
+                    Parser.s_table.dump_open_scopes()
+
+                    if options.print_diagnostics and \
+                            Parser.error_count > len(Parser.diagnostics):
+                        print("\n%d more errors were found, but not shown" %
+                              (Parser.error_count - len(Parser.diagnostics)))
+
+                    if Parser.cached_functions is not None:
+                        print("\nReused %d of %d functions from the cache" %
+                              (FunctionCache.hits,
+                               FunctionCache.hits + FunctionCache.misses))
+
+                    # The asm file is only replaced by code that compiled
+                    if not CG.is_code_ok and asm_file is None:
+                        file_out.discard()
+        finally:
+            if dump_file is not None:
+                dump_file.close()
 
 
         if CG.is_code_ok:
@@ -200,6 +347,79 @@ class Parser:
         
     
     
+    @staticmethod
+    def compile_source(source, asm_file=None, filename="<source>",
+                       options=None):
+        """
+        Compiles source code that is already in memory, without reading or
+        writing any files.
+        :param source:      The source code: a str; UTF-8 bytes, or any other
+                            bytes-like object; or a file-like object with a
+                            read() method
+        :param asm_file:    If not None, an open file, or any object with a
+                            write() method, to write the code to
+        :param filename:    The name to give the source code in messages
+        :param options:     The options to compile it with, as a
+                            ParseOptions; if None, the defaults are used
+        :return:            If asm_file is None, the code, as a str, or None
+                            if compilation failed; else True if compiled
+                            successfully, or False
+        """
+        if asm_file is not None:
+            return Parser.parse(filename, None, options, source=source,
+                                asm_file=asm_file)
+        code = io.StringIO()
+        if Parser.parse(filename, None, options, source=source,
+                        asm_file=code):
+            return code.getvalue()
+        return None
+
+
+
+    @staticmethod
+    @contextlib.contextmanager
+    def open_output(asm_output_filename, asm_file=None):
+        """
+        Opens the file that parse() writes code to, in a 'with' statement,
+        as an OutputFile.
+        :param asm_output_filename: The name of the file to open
+        :param asm_file:            If not None, a file that is already
+                                    open, which is used instead, and is not
+                                    closed afterward
+        """
+        if asm_file is not None:
+            yield asm_file
+        else:
+            with OutputFile(asm_output_filename) as file_out:
+                yield file_out
+
+
+
+    @staticmethod
+    def declare_indexed_functions(signatures):
+        """
+        Puts a FunctionSignature in the global scope for every function that
+        the SignatureIndex finds in a file, so that functions can be called
+        before they are defined. Each one is treated like a prototype until
+        the function's definition is parsed.
+        :param signatures:  The signatures of the functions defined in the
+                            file being parsed, from SignatureIndex.for_file()
+        """
+        for function_id, param_types, param_sizes, return_type in signatures:
+            if Parser.s_table.find(function_id) is not None:
+                # defined twice; the Parser reports it at the second one
+                continue
+            Parser.s_table.insert(function_id, FunctionSignature(
+                identifier=function_id,
+                label=CG.gen_function_label(function_id),
+                param_list_types=param_types,
+                param_sizes=param_sizes,
+                return_type=return_type,
+                is_prototype=True,
+                is_indexed=True))
+
+
+
     @staticmethod
     def match(current_token, expected_tt):
         """
@@ -218,16 +438,11 @@ class Parser:
             # then get the next token and put it in current_token
             current_token.assignTo(Scanner.get_token(Parser.file_reader))
         else:
-            # otherwise, we have an error.
-            line_data = Parser.file_reader.get_line_data()
-            raise MatchError(
-                "At line %d, column %d: " % (line_data["Line_Num"],
-                                             line_data["Column"]) +
-                "Expected %r but found %r, but they were unequal.\n" %
-                (expected_tt, current_token) +
-                "%s" % line_data["Line"] +
-                " " * line_data["Column"] + "^\n"
-            )
+            # otherwise, we have an error. The token is copied, since
+            # current_token will be reused.
+            raise MatchError(Parser.file_reader.get_position(), expected_tt,
+                             Token(current_token.t_type, current_token.lexeme),
+                             length=current_token.length())
 
 
 
@@ -240,32 +455,163 @@ class Parser:
         :param token_type:  The token type on which to stop.
         :return:            None
         """
-        while current_token.t_type != token_type and \
+        Parser.skip_tokens_until((token_type,), current_token)
+
+
+
+    @staticmethod
+    def skip_tokens_until(token_types, current_token):
+        """
+        Causes the scanner to skip past tokens until one with a type in
+        token_types (a synchronization set) is encountered, or the end of the
+        file is reached.
+        :param token_types: A collection of the token types on which to stop
+        :return:            None
+        """
+        while current_token.t_type not in token_types and \
                 current_token.t_type != TokenType.EndOfFile:
             current_token.assignTo(Scanner.get_token(Parser.file_reader))
 
 
+
+    @staticmethod
+    def token_position():
+        """
+        :return:    A (line number, column) tuple that tells the current
+                    token apart from every other token in the file
+        """
+        return Parser.file_reader.get_position()[:2]
+
+
+
+    @staticmethod
+    def trace(production, end=" "):
+        """
+        Prints the number of a production as it is expanded, so that the
+        path that recursive descent takes through the grammar can be
+        followed; unless print_trace is False.
+        :param production:  The number of the production, or "" to end the
+                            line
+        :param end:         What to print after it
+        """
+        if Parser.print_trace:
+            print(production, end=end)
+
+
+
+    @staticmethod
+    def report_error(ex):
+        """
+        Records an error, so that it can be reported along with the rest of
+        the errors in the file. Once there has been an error, no more code
+        is generated. The error's message is only put together if it is
+        printed.
+        :param ex:  The ParseError that was raised
+        """
+        CG.is_code_ok = False
+        Parser.error_count += 1
+        if len(Parser.diagnostics) < Parser.MAX_DIAGNOSTICS:
+            Parser.diagnostics.append(ex)
+            if Parser.print_diagnostics:
+                print("\nException occurred: \n" + str(ex))
+
+
+
+    @staticmethod
+    def recover_from_statement_error(token, start, scope_depth):
+        """
+        Skips past the rest of a statement that could not be parsed: up to
+        and including the next semicolon, or up to the closing brace of the
+        enclosing block, or up to the next statement keyword. Blocks within
+        the statement are skipped entirely, along with any else clause.
+        :param token:       The current token
+        :param start:       The position of the token that started the
+                            statement, from Parser.token_position()
+        :param scope_depth: How many scopes were open before the statement
+        """
+        while len(Parser.s_table.open_scopes) > scope_depth:
+            Parser.s_table.close_scope()
+
+        if Parser.token_position() == start:
+            # Nothing was parsed; skip a token so the same error does not
+            # happen again
+            Parser.skip_token(token)
+
+        depth = 0           # How many braces deep we are within the statement
+        while token.t_type not in Parser.FUNCTION_SYNC:
+            if depth == 0:
+                if token.t_type == TokenType.Semicolon:
+                    Parser.skip_token(token)
+                    return
+                if token.t_type == TokenType.CloseCurly or \
+                        token.t_type in Parser.STATEMENT_KEYWORDS:
+                    return
+
+            if token.t_type == TokenType.OpenCurly:
+                depth += 1
+            elif token.t_type == TokenType.CloseCurly:
+                depth -= 1
+                if depth == 0:
+                    Parser.skip_token(token)
+                    if token.t_type != TokenType.KeywordElse:
+                        return
+                    continue
+            Parser.skip_token(token)
+
+
+
+    @staticmethod
+    def recover_from_function_error(token, start):
+        """
+        Skips past the rest of a function declaration or prototype that could
+        not be parsed, up to the next one.
+        :param token:   The current token
+        :param start:   The position of the token that started the
+                        declaration, from Parser.token_position()
+        """
+        while len(Parser.s_table.open_scopes) > 1:
+            Parser.s_table.close_scope()
+        CG.abandon_function()
+        # A function whose header had an error stays in the global scope,
+        # so that calling it is not also reported as using an undeclared
+        # identifier; its signature is not complete, so call_function()
+        # reports an error instead of calling it
+
+        if Parser.token_position() == start:
+            # Nothing was parsed; skip a token so the same error does not
+            # happen again
+            Parser.skip_token(token)
+        Parser.skip_tokens_until(Parser.FUNCTION_SYNC, token)
+
+
+
+    @staticmethod
+    def skip_token(token):
+        """
+        Reads the next token into token, whatever type the current one is
+        :param token:   The current token
+        """
+        if token.t_type != TokenType.EndOfFile:
+            token.assignTo(Scanner.get_token(Parser.file_reader))
+
+
     
     @staticmethod
     def raise_production_not_found_error(current_token, non_terminal):
         """
-        Gets data from the file reader and formats it as an error message
+        Raises an error that says no production of non_terminal starts with
+        the current token
         """
-        line_data = Parser.file_reader.get_line_data()
         raise ProductionNotFoundError(
-            "At line %d, column %d: " % (line_data["Line_Num"],
-                                         line_data["Column"]) +
-            "Could not find a production for terminal %r in non-terminal %s" %
-            (current_token, non_terminal) +
-            "\n%s" % line_data["Line"] +
-            " " * line_data["Column"] + "^\n"
-        )
+            Parser.file_reader.get_position(),
+            Token(current_token.t_type, current_token.lexeme), non_terminal,
+            length=current_token.length())
 
 
 
     @staticmethod
     def error_on_variable_usage(identifier, is_decl_stmt=False,
-                                is_prototype=False):
+                                is_prototype=False, position=None):
         """
         Verifies that an identifier has been is_decl_stmt before use, and is
         currently in an open scope. If not, raises an error.
@@ -277,21 +623,24 @@ class Parser:
                                 errors when the identifier has already been
                                 declared and is in scope. (use this to prevent
                                 redeclaration of a variable)
-        :param is_prototype:    TODO
+        :param is_prototype:    If True, the identifier is being declared
+                                by a prototype. A prototype may repeat a
+                                function that was found by the
+                                SignatureIndex, but not yet defined.
+        :param position:        Where the identifier is, from
+                                FileReader.get_position(), if it is no
+                                longer the current token
         :return:                None
         """
+        if position is None:
+            position = Parser.file_reader.get_position()
+
         # if we are using the variable without having declared it earlier,
         if not is_decl_stmt and \
                 Parser.s_table.find_in_all_scopes(identifier) is None:
             # report an error
-            line_data = Parser.file_reader.get_line_data()
-            raise UseUndeclaredVariableError(
-                "At line %d, column %d: " % (line_data["Line_Num"],
-                                             line_data["Column"]) +
-                "Attempt to use undeclared variable %s.\n" % identifier +
-                "%s" % line_data["Line"] +
-                " " * line_data["Column"] + "^\n"
-            )
+            raise UseUndeclaredVariableError(position, identifier,
+                                             length=len(identifier))
 
         # previously defined record of identifier
         prev_record = Parser.s_table.find(identifier)
@@ -305,18 +654,13 @@ class Parser:
             # of the function.
             # Any other case is an error.
             if isinstance(prev_record, FunctionSignature) and \
-                    prev_record.is_prototype and not is_prototype:
+                    prev_record.is_prototype and \
+                    (not is_prototype or prev_record.is_indexed):
                 return
 
             # report an error
-            line_data = Parser.file_reader.get_line_data()
-            raise RedeclaredVariableError(
-                "At line %d, column %d: " % (line_data["Line_Num"],
-                                             line_data["Column"]) +
-                "Attempt to redeclare variable %s.\n" % identifier +
-                "%s" % line_data["Line"] +
-                " " * line_data["Column"] + "^\n"
-            )
+            raise RedeclaredVariableError(position, identifier,
+                                          length=len(identifier))
 
 
 
@@ -343,11 +687,16 @@ class Parser:
         CG.write_prolog()
         CG.write_epilogue()
 
-        print(1, end=" ")
-        if token.t_type in (TokenType.KeywordFunc, TokenType.KeywordProto):
-            while token.t_type in (TokenType.KeywordFunc,
-                                   TokenType.KeywordProto):
+        Parser.trace(1)
+        while token.t_type != TokenType.EndOfFile:
+            # Parse <func_decl_or_proto>, but recover if any errors occur,
+            # and advance to the next function or prototype
+            start = Parser.token_position()
+            try:
                 Parser.func_decl_or_proto(token)
+            except ParseError as ex:
+                Parser.report_error(ex)
+                Parser.recover_from_function_error(token, start)
 
 
 
@@ -359,18 +708,78 @@ class Parser:
             2 <function_decl> |
             3 <function_prototype>
         """
-        print("")           # Newline, for readability
+        Parser.trace("", end="\n")    # Newline, for readability
         if token.t_type == TokenType.KeywordFunc:
-            print(2, end=" ")
-            Parser.function_decl(token)
+            Parser.trace(2)
+            Parser.cached_function_decl(token)
         elif token.t_type == TokenType.KeywordProto:
-            print(3, end=" ")
+            Parser.trace(3)
             Parser.function_prototype(token)
         else:
             Parser.raise_production_not_found_error(token, 'func_decl_or_proto')
 
 
 
+    @staticmethod
+    def cached_function_decl(token):
+        """
+        Takes the code for a function definition from the FunctionCache, if
+        the function has not changed since it was last compiled, and skips
+        past its tokens. Otherwise, parses it with function_decl(), and
+        saves its code in the FunctionCache.
+        """
+        function = None
+        if Parser.cached_functions is not None:
+            function = Parser.cached_functions.get(
+                Parser.file_reader.get_position()[:2])
+        if function is None:
+            Parser.function_decl(token)
+            return
+
+        # The function must be declared, but not yet defined, with the
+        # signature in its header
+        function_id, param_types, param_sizes, return_type = \
+            function["signature"]
+        func_signature = Parser.s_table.find(function_id)
+        entry = None
+        if isinstance(func_signature, FunctionSignature) and \
+                func_signature.is_prototype and \
+                func_signature.param_list_types == param_types and \
+                func_signature.param_sizes == param_sizes and \
+                func_signature.return_type == return_type:
+            entry = FunctionCache.lookup(function["key"], Parser.s_table)
+
+        if entry is not None:
+            summary = entry["summary"]
+            func_signature.is_prototype = False
+            func_signature.modified_params = set(summary["modified_params"])
+            func_signature.uses_address_registers = \
+                summary["uses_address_registers"]
+            func_signature.is_pure = summary["is_pure"]
+            func_signature.callees = set(summary["callees"])
+            CG.splice(entry["code"])
+
+            Parser.file_reader.skip_to(*function["end"])
+            token.assignTo(Scanner.get_token(Parser.file_reader))
+            FunctionCache.hits += 1
+            return
+
+        CG.recording = []
+        try:
+            Parser.function_decl(token)
+            code = CG.recording
+        finally:
+            CG.recording = None
+        FunctionCache.misses += 1
+
+        func_signature = Parser.s_table.find(function_id)
+        if CG.is_code_ok and isinstance(func_signature, FunctionSignature) \
+                and not func_signature.is_prototype:
+            FunctionCache.store(function["key"], func_signature,
+                                Parser.s_table, code)
+
+
+
     @staticmethod
     def function_prototype(token):
         """
@@ -381,7 +790,7 @@ class Parser:
                 <return_datatype> TokenType.Semicolon
         """
         if token.t_type == TokenType.KeywordProto:
-            print(4, end=" ")
+            Parser.trace(4)
             Parser.match(token, TokenType.KeywordProto)
 
             # add the function identifier to the symbol table
@@ -396,19 +805,37 @@ class Parser:
 
             param_list = Parser.param_list(token)
             param_types = [x[1] for x in param_list]
+            param_sizes = [x[2] for x in param_list]
 
             Parser.match(token, TokenType.CloseParen)
 
             Parser.return_identifier(token)
             return_val_type = Parser.return_datatype(token)
 
-            func_signature = FunctionSignature(
-                identifier=function_id,
-                label=CG.gen_function_label(function_id),
-                param_list_types=param_types,
-                return_type=return_val_type,
-                is_prototype=True)
-            Parser.s_table.insert(function_id, func_signature)
+            old_signature = Parser.s_table.find(function_id)
+            if old_signature is None:
+                func_signature = FunctionSignature(
+                    identifier=function_id,
+                    label=CG.gen_function_label(function_id),
+                    param_list_types=param_types,
+                    param_sizes=param_sizes,
+                    return_type=return_val_type,
+                    is_prototype=True)
+                Parser.s_table.insert(function_id, func_signature)
+            elif old_signature.param_list_types != param_types or \
+                    old_signature.param_sizes != param_sizes or \
+                    old_signature.return_type != return_val_type:
+                # The function was already found by the SignatureIndex; the
+                # prototype is no longer needed, but it must agree
+                raise SemanticError(
+                    "Prototype of function %s is %s, but the function is "
+                    "defined as %s" % (
+                        function_id,
+                        FunctionSignature(function_id,
+                                          param_list_types=param_types,
+                                          return_type=return_val_type),
+                        old_signature),
+                    Parser.file_reader.get_position(), length=token.length())
             Parser.match(token, TokenType.Semicolon)
 
 
@@ -424,7 +851,7 @@ class Parser:
                 TokenType.OpenCurly <statement_list> TokenType.CloseCurly
         """
         if token.t_type == TokenType.KeywordFunc:
-            print(5, end=" ")
+            Parser.trace(5)
             Parser.match(token, TokenType.KeywordFunc)
 
             # add the function identifier to the symbol table
@@ -441,9 +868,9 @@ class Parser:
                 Parser.s_table.insert(function_id, func_signature)
             elif not isinstance(old_signature, FunctionSignature):
                 raise SemanticError("Tried to redeclare %s as a function, "
-                                    "but it was already a variable" %
-                                    function_id,
-                                    Parser.file_reader.get_line_data())
+                                    "but it was already a variable",
+                                    Parser.file_reader.get_position(),
+                                    function_id, length=token.length())
 
             # open a new scope
             Parser.s_table.open_scope()
@@ -453,9 +880,11 @@ class Parser:
 
             param_list = Parser.param_list(token)
             param_types = [x[1] for x in param_list]
+            param_sizes = [x[2] for x in param_list]
 
             if not old_signature:
                 func_signature.param_list_types = param_types
+                func_signature.param_sizes = param_sizes
             else:
                 # verify that param types match
                 for i in range(len(param_types)):
@@ -463,9 +892,20 @@ class Parser:
                         raise SemanticError(
                             "In declaration of function %s, parameter #%d is "
                             "of type %r, but previous forward declaration was "
-                            "of type %r" % (function_id, i, param_types[i],
-                                            old_signature.param_list_types[i]),
-                            Parser.file_reader.get_line_data())
+                            "of type %r",
+                            Parser.file_reader.get_position(),
+                            function_id, i, param_types[i],
+                            old_signature.param_list_types[i],
+                            length=token.length())
+                    if param_sizes[i] != old_signature.param_sizes[i]:
+                        raise SemanticError(
+                            "In declaration of function %s, parameter #%d "
+                            "has %d elements, but previous forward "
+                            "declaration had %d",
+                            Parser.file_reader.get_position(),
+                            function_id, i, param_sizes[i],
+                            old_signature.param_sizes[i],
+                            length=token.length())
 
             Parser.match(token, TokenType.CloseParen)
 
@@ -486,9 +926,10 @@ class Parser:
                     raise SemanticError(
                         "In declaration of function %s, return datatype is "
                         "of type %r, but previous forward declaration was "
-                        "of type %r" % (function_id, return_val_type,
-                                        old_signature.return_type),
-                        Parser.file_reader.get_line_data())
+                        "of type %r",
+                        Parser.file_reader.get_position(),
+                        function_id, return_val_type,
+                        old_signature.return_type, length=token.length())
 
                 # at this point, we are guaranteed that the return types,
                 # param types, and identifier are equal to that of the old
@@ -499,6 +940,7 @@ class Parser:
                 old_signature.is_prototype = False
 
             CG.code_gen_label(func_signature.label, comment=str(func_signature))
+            CG.begin_function(func_signature)
 
             offset = (4*len(param_list))
 
@@ -507,7 +949,8 @@ class Parser:
             for identifier, data_type, size in param_list:
 
                 er_param = ExpressionRecord(data_type, offset,
-                                            is_temp=False, is_reference=True)
+                                            is_temp=False, is_reference=True,
+                                            size=size)
                 Parser.s_table.insert(identifier, er_param)
 
                 offset -= 4
@@ -523,6 +966,7 @@ class Parser:
             CG.next_offset = -8
 
             CG.code_gen("jr", "$ra")
+            CG.end_function()
         else:
             Parser.raise_production_not_found_error(token, 'function_decl')
 
@@ -538,7 +982,7 @@ class Parser:
         :return:    a list of (name, type, size) tuples that define the params
         """
         params = []
-        print(6, end=" ")
+        Parser.trace(6)
 
         if token.t_type == TokenType.Identifier:
 
@@ -585,19 +1029,19 @@ class Parser:
                     always 1.
         """
         if token.t_type == TokenType.KeywordInt:
-            print(8, end=" ")
+            Parser.trace(8)
             Parser.match(token, TokenType.KeywordInt)
             return DataTypes.INT, 1
         elif token.t_type == TokenType.KeywordFloat:
-            print(9, end=" ")
+            Parser.trace(9)
             Parser.match(token, TokenType.KeywordFloat)
             return DataTypes.FLOAT, 1
         elif token.t_type == TokenType.KeywordChar:
-            print(10, end=" ")
+            Parser.trace(10)
             Parser.match(token, TokenType.KeywordChar)
             return DataTypes.CHAR, 1
         elif token.t_type == TokenType.OpenBracket:
-            print(11, end=" ")
+            Parser.trace(11)
             Parser.match(token, TokenType.OpenBracket)
             size_str = token.lexeme
             Parser.match(token, TokenType.Integer)
@@ -619,15 +1063,15 @@ class Parser:
         :return:    The datatype, as a DataTypes enum
         """
         if token.t_type == TokenType.KeywordInt:
-            print(12, end=" ")
+            Parser.trace(12)
             Parser.match(token, TokenType.KeywordInt)
             return DataTypes.ARRAY_INT
         elif token.t_type == TokenType.KeywordFloat:
-            print(13, end=" ")
+            Parser.trace(13)
             Parser.match(token, TokenType.KeywordFloat)
             return  DataTypes.ARRAY_FLOAT
         elif token.t_type == TokenType.KeywordChar:
-            print(14, end=" ")
+            Parser.trace(14)
             Parser.match(token, TokenType.KeywordChar)
             return DataTypes.ARRAY_CHAR
         else:
@@ -643,7 +1087,7 @@ class Parser:
             TokenType.Identifier
         """
         if token.t_type == TokenType.Identifier:
-            print(15, end=" ")
+            Parser.trace(15)
             Parser.match(token, TokenType.Identifier)
         else:
             Parser.raise_production_not_found_error(token, 'return_identifier')
@@ -660,13 +1104,14 @@ class Parser:
         """
         if token.t_type in (TokenType.KeywordInt, TokenType.KeywordFloat,
                       TokenType.KeywordChar, TokenType.OpenBracket):
-            print(16, end=" ")
+            Parser.trace(16)
             data_type, size = Parser.datatype(token)
             if size == 1:
                 return data_type
             else:
                 raise SemanticError("Function cannot return an array",
-                                    Parser.file_reader)
+                                    Parser.file_reader.get_position(),
+                                    length=token.length())
         else:
             Parser.raise_production_not_found_error(token, 'return_datatype')
 
@@ -686,22 +1131,22 @@ class Parser:
             while token.t_type in (TokenType.KeywordReturn, TokenType.KeywordIf,
                             TokenType.KeywordWhile, TokenType.KeywordVar,
                             TokenType.Identifier):
-                print("")           # Newline, for readability of output
-                print(17, end=" ")
+                Parser.trace("", end="\n")  # Newline, for readability
+                Parser.trace(17)
 
                 # Parse <basic_statement>, but recover if any errors occur,
-                # and advance past the next semicolon
+                # and advance to the end of the statement
+                scope_depth = len(Parser.s_table.open_scopes)
+                start = Parser.token_position()
                 try:
                     Parser.basic_statement(token)
                 except ParseError as ex:
-                    CG.is_code_ok = False
-                    # print(traceback.format_exc())
-                    print("\nException occurred: \n" + ex)
-                    Parser.skip_tokens_if_not(TokenType.Semicolon, token)
-                    Parser.match(token, TokenType.Semicolon)
+                    Parser.report_error(ex)
+                    Parser.recover_from_statement_error(token, start,
+                                                        scope_depth)
 
         else:
-            print(18, end=" ")
+            Parser.trace(18)
 
 
 
@@ -720,19 +1165,19 @@ class Parser:
         CG.code_gen_comment(Parser.file_reader.current_line.strip())
 
         if token.t_type == TokenType.KeywordReturn:
-            print(19, end=" ")
+            Parser.trace(19)
             Parser.return_statement(token)
         elif token.t_type == TokenType.KeywordIf:
-            print(20, end=" ")
+            Parser.trace(20)
             Parser.if_statement(token)
         elif token.t_type == TokenType.KeywordWhile:
-            print(21, end=" ")
+            Parser.trace(21)
             Parser.while_statement(token)
         elif token.t_type == TokenType.KeywordVar:
-            print(22, end=" ")
+            Parser.trace(22)
             Parser.declaration_statement(token)
         elif token.t_type == TokenType.Identifier:
-            print(23, end=" ")
+            Parser.trace(23)
             Parser.assignment_or_function_call(token)
         else:
             Parser.raise_production_not_found_error(token, 'basic_statement')
@@ -751,13 +1196,13 @@ class Parser:
         if token.t_type in \
                 (TokenType.OpenParen, TokenType.Identifier, TokenType.Float,
                  TokenType.Integer, TokenType.String, TokenType.Char):
-            print(27, end=" ")
+            Parser.trace(27)
             return_list.append(Parser.expression(token))
             while token.t_type == TokenType.Comma:
                 Parser.match(token, TokenType.Comma)
                 return_list.append(Parser.expression(token))
         else:
-            print(28, end=" ")
+            Parser.trace(28)
         return return_list
 
 
@@ -773,7 +1218,7 @@ class Parser:
         it reaches a CloseCurly, and then resumes normally.
         """
         if token.t_type == TokenType.OpenCurly:
-            print(29, end=" ")
+            Parser.trace(29)
             Parser.match(token, TokenType.OpenCurly)
 
             Parser.s_table.open_scope()
@@ -802,7 +1247,7 @@ class Parser:
             30 TokenType.KeywordReturn TokenType.Semicolon
         """
         if token.t_type == TokenType.KeywordReturn:
-            print(30, end="")
+            Parser.trace(30, end="")
             Parser.match(token, TokenType.KeywordReturn)
             Parser.match(token, TokenType.Semicolon)
             CG.code_gen("jr", "$ra")
@@ -820,14 +1265,15 @@ class Parser:
                 TokenType.CloseParen <code_block> [ <else_clause> ]
         """
         if token.t_type == TokenType.KeywordIf:
-            print(31, end=" ")
+            Parser.trace(31)
             Parser.match(token, TokenType.KeywordIf)
             Parser.match(token, TokenType.OpenParen)
             er_condition = Parser.expression(token)
             if er_condition.data_type != DataTypes.BOOL:
                 raise SemanticError("If statement requires boolean expression "
                                     "as an argument",
-                                    Parser.file_reader.get_line_data())
+                                    Parser.file_reader.get_position(),
+                                    length=token.length())
             Parser.match(token, TokenType.CloseParen)
 
             else_label, after_else_label = CG.gen_label("else")
@@ -869,16 +1315,18 @@ class Parser:
                 TokenType.Semicolon
         """
         if token.t_type == TokenType.KeywordVar:
-            print(33, end=" ")
+            Parser.trace(33)
             Parser.match(token, TokenType.KeywordVar)
 
             # get the param's identifier and datatype
             identifier = token.lexeme
+            position = Parser.file_reader.get_position()
             Parser.match(token, TokenType.Identifier)
             datatype, size = Parser.datatype(token)
 
             # check that the identifier hasn't already been declared
-            Parser.error_on_variable_usage(identifier, True)
+            Parser.error_on_variable_usage(identifier, True,
+                                           position=position)
 
             # reserve space on the stack for the variable
             var_er = CG.declare_variable(datatype, identifier, size)
@@ -902,25 +1350,31 @@ class Parser:
                 TokenType.CloseParen <code_block>
         """
         if token.t_type == TokenType.KeywordWhile:
-            print(34, end=" ")
+            Parser.trace(34)
             before_while_lbl, after_while_lbl = CG.gen_label("while")
 
-            # Write label for beginning of while loop
-            CG.code_gen_label(before_while_lbl)
+            # Hold back the loop's code, so that array addresses can be
+            # hoisted in front of it
+            CG.begin_loop()
+            try:
+                # Write label for beginning of while loop
+                CG.code_gen_label(before_while_lbl)
 
-            Parser.match(token, TokenType.KeywordWhile)
-            Parser.match(token, TokenType.OpenParen)
-            er_condition = Parser.expression(token)
-            Parser.match(token, TokenType.CloseParen)
+                Parser.match(token, TokenType.KeywordWhile)
+                Parser.match(token, TokenType.OpenParen)
+                er_condition = Parser.expression(token)
+                Parser.match(token, TokenType.CloseParen)
 
-            # Perform the test
-            CG.code_gen_if(er_condition, after_while_lbl)
+                # Perform the test
+                CG.code_gen_if(er_condition, after_while_lbl)
 
-            # Write the contents of the loop
-            Parser.code_block(token)
+                # Write the contents of the loop
+                Parser.code_block(token)
 
-            # Branch back to the test again
-            CG.code_gen("b", before_while_lbl)
+                # Branch back to the test again
+                CG.code_gen("b", before_while_lbl)
+            finally:
+                CG.end_loop()
 
             # Write label for end of while loop, to pick up when the test fails
             CG.code_gen_label(after_while_lbl)
@@ -949,21 +1403,27 @@ class Parser:
 
             # get the param's identifier and look it up
             identifier = token.lexeme
+            position = Parser.file_reader.get_position()
             Parser.error_on_variable_usage(identifier)
             er_lhs = Parser.s_table.find_in_all_scopes(identifier)
 
             Parser.match(token, TokenType.Identifier)
 
             if token.t_type == TokenType.AssignmentOperator:
-                print(24, end=" ")
+                Parser.trace(24)
                 Parser.match(token, TokenType.AssignmentOperator)
                 er_rhs = Parser.expression(token)
                 Parser.match(token, TokenType.Semicolon)
                 CG.code_gen_assign(er_lhs, er_rhs)
             elif token.t_type == TokenType.OpenBracket:
-                print(25, end=" ")
+                Parser.trace(25)
                 Parser.match(token, TokenType.OpenBracket)
+                subscript_position = Parser.file_reader.get_position()
+                subscript_length = token.length()
                 er_subscript = Parser.expression(token)
+                CG.check_literal_subscript(er_lhs, er_subscript,
+                                           subscript_position,
+                                           length=subscript_length)
                 Parser.match(token, TokenType.CloseBracket)
 
 
@@ -973,7 +1433,7 @@ class Parser:
                 CG.code_gen_assign(er_lhs, er_rhs, dest_subscript=er_subscript)
 
             elif token.t_type == TokenType.OpenParen:
-                print(26, end=" ")
+                Parser.trace(26)
                 Parser.match(token, TokenType.OpenParen)
                 param_list = Parser.expression_list(token)
                 Parser.match(token, TokenType.CloseParen)
@@ -985,7 +1445,8 @@ class Parser:
                     function(data_type, param_list)
 
                 else:
-                    Parser.call_function(identifier, er_lhs, param_list)
+                    Parser.call_function(identifier, er_lhs, param_list,
+                                         position)
 
             else:
                 Parser.raise_production_not_found_error(
@@ -1008,7 +1469,7 @@ class Parser:
         if token.t_type in (TokenType.OpenParen, TokenType.Identifier,
                             TokenType.Float, TokenType.Integer,
                             TokenType.String, TokenType.Char):
-            print(35, end=" ")
+            Parser.trace(35)
 
             er_lhs = Parser.term(token)
             while token.t_type == TokenType.AddSubOperator:
@@ -1035,7 +1496,7 @@ class Parser:
         if token.t_type in (TokenType.OpenParen, TokenType.Identifier,
                             TokenType.Float, TokenType.Integer,
                             TokenType.String, TokenType.Char):
-            print(39, end=" ")
+            Parser.trace(39)
             er_lhs = Parser.relfactor(token)
             while token.t_type == TokenType.MulDivModOperator:
                 operator = token.lexeme
@@ -1060,7 +1521,7 @@ class Parser:
         if token.t_type in (TokenType.OpenParen, TokenType.Identifier,
                             TokenType.Float, TokenType.Integer,
                             TokenType.String, TokenType.Char):
-            print(40, end=" ")
+            Parser.trace(40)
             er_lhs = Parser.factor(token)
             if token.t_type == TokenType.RelationalOperator:
                 operator = token.lexeme
@@ -1084,13 +1545,13 @@ class Parser:
         :return:    an ExpressionRecord that holds the result of the factor
         """
         if token.t_type == TokenType.OpenParen:
-            print(44, end=" ")
+            Parser.trace(44)
             Parser.match(token, TokenType.OpenParen)
             exp_rec = Parser.expression(token)
             Parser.match(token, TokenType.CloseParen)
             return exp_rec
         elif token.t_type == TokenType.Identifier:
-            print(45, end=" ")
+            Parser.trace(45)
 
             # Check to be sure that it has been declared in an open scope
             Parser.error_on_variable_usage(token.lexeme)
@@ -1118,19 +1579,19 @@ class Parser:
         """
         er_literal = None
         if token.t_type == TokenType.Float:
-            print(57, end=" ")
+            Parser.trace(57)
             er_literal = CG.create_literal(DataTypes.FLOAT, float(token.lexeme))
             Parser.match(token, TokenType.Float)
         elif token.t_type == TokenType.Integer:
-            print(58, end=" ")
+            Parser.trace(58)
             er_literal = CG.create_literal(DataTypes.INT, int(token.lexeme))
             Parser.match(token, TokenType.Integer)
         elif token.t_type == TokenType.String:
-            print(59, end=" ")
+            Parser.trace(59)
             er_literal = CG.create_literal(DataTypes.STRING, token.lexeme)
             Parser.match(token, TokenType.String)
         elif token.t_type == TokenType.Char:
-            print(60, end=" ")
+            Parser.trace(60)
             er_literal = CG.create_literal(DataTypes.CHAR, token.lexeme)
             Parser.match(token, TokenType.Char)
         return er_literal
@@ -1153,24 +1614,33 @@ class Parser:
         """
         if token.t_type == TokenType.Identifier:
             identifier = token.lexeme
+            position = Parser.file_reader.get_position()
             exp_rec = Parser.s_table.find_in_all_scopes(identifier)
 
             Parser.match(token, TokenType.Identifier)
 
             if token.t_type == TokenType.OpenBracket:
-                print(49, end=" ")
+                Parser.trace(49)
                 Parser.match(token, TokenType.OpenBracket)
+                # Where the subscript is, for errors that are only found
+                # once it has been parsed
+                subscript_position = Parser.file_reader.get_position()
+                subscript_length = token.length()
                 er_subscript = Parser.expression(token)
 
                 # Input validation: verify that the subscript is an integer,
                 # and that exp_rec contains an array
                 if er_subscript.data_type != DataTypes.INT:
                     raise SemanticError("Subscript is not an integer",
-                                        Parser.file_reader.get_line_data())
+                                        subscript_position,
+                                        length=subscript_length)
                 if not DataTypes.is_array(exp_rec.data_type):
                     raise SemanticError("Subscript applied to variable %s, "
-                                        "which is not an array" % identifier,
-                                        Parser.file_reader.get_line_data())
+                                        "which is not an array", position,
+                                        identifier, length=len(identifier))
+                CG.check_literal_subscript(exp_rec, er_subscript,
+                                           subscript_position,
+                                           length=subscript_length)
 
                 # Match ]: wait until after potential error messages to do this
                 Parser.match(token, TokenType.CloseBracket)
@@ -1187,13 +1657,13 @@ class Parser:
                 return result_exp_rec
 
             elif token.t_type == TokenType.OpenParen:
-                print(50, end=" ")
+                Parser.trace(50)
                 if not isinstance(exp_rec, FunctionSignature) and \
                         not identifier in CG.BUILT_IN_FUNCTIONS.keys():
                     raise SemanticError("Tried to call %s as a function, "
-                                        "but it was not a function." %
-                                        identifier,
-                                        Parser.file_reader.get_line_data())
+                                        "but it was not a function.",
+                                        position, identifier,
+                                        length=len(identifier))
 
                 # exp_rec is actually a function signature, so call it that
                 func_signature = exp_rec
@@ -1202,10 +1672,10 @@ class Parser:
                 Parser.match(token, TokenType.CloseParen)
 
                 return Parser.call_function(identifier, func_signature,
-                                            er_params)
+                                            er_params, position)
 
             else:
-                print(51, end=" ")
+                Parser.trace(51)
                 return exp_rec
         else:
             raise Parser.raise_production_not_found_error(
@@ -1214,7 +1684,7 @@ class Parser:
 
 
     @staticmethod
-    def call_function(func_identifier, func_signature, er_params):
+    def call_function(func_identifier, func_signature, er_params, position):
         """
         Handles built-in and user-defined function calls: checks that the
         callee is a function, checks that the parameters are of the right types,
@@ -1223,6 +1693,8 @@ class Parser:
         :param func_signature:      The FunctionSignature associated with the id
         :param er_params:           A list of ExpressionRecords that hold the
                                     parameters
+        :param position:            Where the id is, from
+                                    FileReader.get_position(), for errors
         :return:                    An ExpressionRecord that holds the
                                     function's return value
         """
@@ -1236,16 +1708,31 @@ class Parser:
         # function
         if not isinstance(func_signature, FunctionSignature):
             raise SemanticError("Tried to call %s(), but it wasn't a "
-                                "function" % func_identifier,
-                                Parser.file_reader.get_line_data())
+                                "function", position, func_identifier,
+                                length=len(func_identifier))
+        if not func_signature.is_complete():
+            raise SemanticError("Tried to call %s(), but its declaration "
+                                "had an error in it", position,
+                                func_identifier, length=len(func_identifier))
 
         for i in range(len(func_signature.param_list_types)):
             expect_type = func_signature.param_list_types[i]
             if expect_type != er_params[i].data_type:
                 raise SemanticError("Parameter for %s in position %d "
-                                    "has the wrong type: expected %s" %
-                                    (func_identifier, i, expect_type),
-                                    Parser.file_reader)
+                                    "has the wrong type: expected %s",
+                                    position, func_identifier, i,
+                                    expect_type, length=len(func_identifier))
+            # The function trusts the size of an array parameter, when it
+            # checks subscripts, so the array passed must have that size
+            expect_size = func_signature.param_sizes[i]
+            if DataTypes.is_array(expect_type) and \
+                    expect_size != er_params[i].size:
+                raise SemanticError("Parameter for %s in position %d "
+                                    "has the wrong size: expected an array "
+                                    "of %d elements, but it has %d",
+                                    position, func_identifier, i,
+                                    expect_size, er_params[i].size,
+                                    length=len(func_identifier))
 
         return CG.call_function(func_signature, er_params)
 
@@ -1256,29 +1743,35 @@ class Parser:
 # puts all the output in the asmOutput directory
 
 if __name__ == "__main__":
-    test_file_dir = "/home/dave/PycharmProjects/Compiler/testCodeGen/"
-    # "C:/Users/Dave/PycharmProjects/compiler/unusedTestPrograms/" #
-    output_file_dir = "/home/dave/PycharmProjects/Compiler/asmOutput/"
-    # "C:/Users/Dave/PycharmProjects/compiler/asmOutput/" #
+    import os
+    import sys
+    import traceback
+    from BatchCompiler import find_sources, asm_filename
+
+    # Compiles the directories, patterns and files named on the command
+    # line (or the test programs), one at a time, showing the symbol table
+    # after each one; BatchCompiler.py compiles them in parallel
+    project_dir = os.path.dirname(os.path.abspath(__file__))
+    test_file_dir = os.path.join(project_dir, "testCodeGen")
+    output_file_dir = os.path.join(project_dir, "asmOutput")
+    arguments = sys.argv[1:] or [test_file_dir]
 
     list_of_failed_compilations = []
-    # For every file in the test file directory,
-    for f in os.listdir(test_file_dir):
+    # For every source file found,
+    for input_filename, root in find_sources(arguments):
         success = False
 
-        # Prepend the path of the test file directory
-        input_filename = test_file_dir + f
-
-        # Output filename: add extension .asm and put in output dir
-        asm_out = output_file_dir + f + ".asm"
-        # If there was an extension, replace it instead
-        if '.' in f:
-            asm_out = output_file_dir + '.'.join(f.split('.')[:-1]) + ".asm"
+        # Output filename: replace the extension with .asm, and put it in
+        # the output dir
+        asm_out = asm_filename(input_filename, root, output_file_dir)
+        os.makedirs(os.path.dirname(asm_out), exist_ok=True)
 
-        print("\nParsing file " + f)
+        print("\nParsing file " + input_filename)
 
         try:
-            success = Parser.parse(input_filename, asm_out)
+            success = Parser.parse(
+                input_filename, asm_out,
+                ParseOptions(keep_closed_scopes=True))
         except Exception as ex:
             print('\n' + traceback.format_exc())
             # print("\nException occurred while parsing file %s:\n%s" % (f, ex))
@@ -1286,12 +1779,11 @@ if __name__ == "__main__":
         Parser.display_symbol_table()
 
         if not success:
-            list_of_failed_compilations.append(f)
-            os.remove(asm_out)
+            list_of_failed_compilations.append(input_filename)
+            OutputFile.remove(asm_out)
     if len(list_of_failed_compilations) > 0:
         print("The following files failed to compile:")
         for f in list_of_failed_compilations:
             print(f)
     else:
         print("All files compiled successfully!")
-
@@ -0,0 +1,299 @@
+"""
+Filename: Profiler.py
+Tested using Python 3.5.1
+
+David Dalcino
+CS 6110
+Prof. Reiter
+Winter 2017
+CSU East Bay
+
+This file implements the Profiler, which measures where the compiler spends
+its time while it compiles a file: reading the file, scanning tokens,
+looking up symbols, parsing, generating code, or writing it out.
+
+The compiler does all of these in one pass, so the Profiler keeps a stack
+of phases. While it is running, the functions in HOOKS are replaced by
+wrappers that push their phase when they are called, and pop it when they
+return; time is charged to whichever phase is on top of the stack. Parsing
+is at the bottom, so it is charged with everything that no other phase
+claims. The wrappers are only installed while the Profiler runs, so the
+compiler runs at full speed the rest of the time. They do add some time of
+their own to each call, mostly to the phases whose functions are called
+most often, like reading characters.
+
+The Profiler also counts tokens scanned, lines read, productions expanded,
+symbols looked up, and instructions emitted or left out by the peephole
+optimization. It can also run cProfile, to find the functions that take
+the most time, and tracemalloc, to find the lines that allocate the most
+memory.
+"""
+
+import time
+from CodeGenerator import CG
+from FileReader import FileReader
+from FunctionCache import FunctionCache
+from ParserWithST import Parser
+from Scanner import Scanner
+from SignatureIndex import SignatureIndex
+from SymbolTable import SymbolTable
+
+
+class Profiler:
+    """
+    A static class that measures how long each phase of compiling takes.
+    """
+
+    #################################################################
+    # STATIC DATA MEMBERS
+
+    phase_stack = None      # The phases that are running, innermost last
+    phase_times = None      # A dict that pairs each phase with its time, in
+                            # seconds
+    last_switch = 0         # When time was last charged to a phase
+    started = 0             # When the Profiler was started
+    counters = None         # A dict that pairs each counter with its count
+    originals = None        # A list of (class, name, original) tuples for
+                            # the functions replaced by wrappers
+    call_profile = None     # A cProfile.Profile, if it is running
+    tracing_memory = False  # True if tracemalloc was started by the Profiler
+
+    #################################################################
+    # STATIC CONSTANT DATA
+
+    BASE_PHASE = "parser"   # Charged with all time not in another phase
+
+    # The functions that are wrapped: (class, function name, phase,
+    # counter). A phase of None means the calls are counted, not timed.
+    HOOKS = (
+        [(FileReader, "get_char", "file_reader", None),
+         (FileReader, "fill_buffer", "file_reader", "lines_read"),
+         (Scanner, "get_token", "scanner", "tokens_scanned"),
+         (SymbolTable, "find", "symbol_table", "symbol_lookups"),
+         (SymbolTable, "find_in_all_scopes", "symbol_table",
+          "symbol_lookups"),
+         (SymbolTable, "insert", "symbol_table", None),
+         (SymbolTable, "open_scope", "symbol_table", None),
+         (SymbolTable, "close_scope", "symbol_table", None),
+         (SignatureIndex, "for_file", "signature_index", None),
+         (FunctionCache, "find_functions", "function_cache", None),
+         (FunctionCache, "lookup", "function_cache", None),
+         (FunctionCache, "store", "function_cache", None),
+         (CG, "output", "code_output", None)] +
+        # Everything else the Code Generator does
+        [(CG, name, "code_generator", None)
+         for name in sorted(CG.__dict__)
+         if isinstance(CG.__dict__[name], staticmethod) and
+         name not in ("output", "init")] +
+        # The recursive descent functions, one for each non-terminal
+        [(Parser, name, None, "productions_expanded")
+         for name in ("program", "func_decl_or_proto", "function_prototype",
+                      "function_decl", "param_list", "datatype",
+                      "array_of_datatype", "return_identifier",
+                      "return_datatype", "statement_list", "basic_statement",
+                      "expression_list", "code_block", "return_statement",
+                      "if_statement", "declaration_statement",
+                      "while_statement", "assignment_or_function_call",
+                      "expression", "term", "relfactor", "factor",
+                      "literal", "variable_or_function_call",
+                      "call_function")]
+    )
+
+    PHASES = ("file_reader", "scanner", "parser", "symbol_table",
+              "signature_index", "function_cache", "code_generator",
+              "code_output")
+    COUNTERS = ("lines_read", "tokens_scanned", "productions_expanded",
+                "symbol_lookups")
+
+    TOP_FUNCTIONS = 20      # How many functions cProfile reports
+    TOP_ALLOCATIONS = 10    # How many lines tracemalloc reports
+
+
+
+    #################################################################
+    # STATIC MEMBER FUNCTIONS
+
+    @staticmethod
+    def start(call_profile=False, trace_memory=False):
+        """
+        Starts measuring, by replacing each function in HOOKS with a
+        wrapper.
+        :param call_profile:    If True, cProfile runs too
+        :param trace_memory:    If True, tracemalloc runs too
+        """
+        Profiler.phase_stack = [Profiler.BASE_PHASE]
+        Profiler.phase_times = dict.fromkeys(Profiler.PHASES, 0.0)
+        Profiler.counters = dict.fromkeys(Profiler.COUNTERS, 0)
+        Profiler.originals = []
+        for cls, name, phase, counter in Profiler.HOOKS:
+            original = cls.__dict__[name]
+            Profiler.originals.append((cls, name, original))
+            if isinstance(original, staticmethod):
+                setattr(cls, name, staticmethod(
+                    Profiler.wrap(original.__func__, phase, counter)))
+            else:
+                setattr(cls, name, Profiler.wrap(original, phase, counter))
+
+        Profiler.call_profile = None
+        if call_profile:
+            import cProfile
+            Profiler.call_profile = cProfile.Profile()
+        Profiler.tracing_memory = False
+        if trace_memory:
+            import tracemalloc
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                Profiler.tracing_memory = True
+
+        Profiler.started = Profiler.last_switch = time.perf_counter()
+        if Profiler.call_profile is not None:
+            Profiler.call_profile.enable()
+
+
+
+    @staticmethod
+    def wrap(function, phase, counter):
+        """
+        :param function:    A function to measure
+        :param phase:       The phase to charge with its time, or None to
+                            only count its calls
+        :param counter:     The counter to add one to each time it is
+                            called, or None
+        :return:            A function that does the same thing, and
+                            measures it
+        """
+        if phase is None:
+            def count(*args, **kwargs):
+                Profiler.counters[counter] += 1
+                return function(*args, **kwargs)
+            return count
+
+        def measure(*args, **kwargs):
+            if counter is not None:
+                Profiler.counters[counter] += 1
+            stack = Profiler.phase_stack
+            now = time.perf_counter()
+            Profiler.phase_times[stack[-1]] += now - Profiler.last_switch
+            Profiler.last_switch = now
+            stack.append(phase)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                now = time.perf_counter()
+                Profiler.phase_times[stack.pop()] += \
+                    now - Profiler.last_switch
+                Profiler.last_switch = now
+        return measure
+
+
+
+    @staticmethod
+    def stop(name):
+        """
+        Stops measuring, and puts back every function in HOOKS.
+        :param name:    What was compiled, for the report
+        :return:        A report of what was measured, as a dict that can be
+                        written as JSON
+        """
+        now = time.perf_counter()
+        if Profiler.call_profile is not None:
+            Profiler.call_profile.disable()
+        Profiler.phase_times[Profiler.phase_stack[-1]] += \
+            now - Profiler.last_switch
+        for cls, function_name, original in reversed(Profiler.originals):
+            setattr(cls, function_name, original)
+        Profiler.originals = []
+
+        counters = dict(Profiler.counters)
+        counters["instructions_emitted"] = CG.instructions_emitted
+        counters["instructions_eliminated"] = CG.instructions_eliminated
+        report = {
+            "name": name,
+            "total_ms": round((now - Profiler.started) * 1000, 3),
+            "phases_ms": {phase: round(seconds * 1000, 3)
+                          for phase, seconds in Profiler.phase_times.items()},
+            "counters": counters,
+        }
+        if Profiler.call_profile is not None:
+            report["functions"] = Profiler.top_functions()
+            Profiler.call_profile = None
+        if Profiler.tracing_memory:
+            report["memory"] = Profiler.top_allocations()
+        return report
+
+
+
+    @staticmethod
+    def top_functions():
+        """
+        :return:    The functions that cProfile found took the most time,
+                    not counting the functions they called, as a list of
+                    dicts
+        """
+        import pstats
+        stats = pstats.Stats(Profiler.call_profile).stats
+        # Leave out the Profiler's own wrappers
+        rows = sorted([item for item in stats.items()
+                       if item[0][0] != __file__],
+                      key=lambda item: item[1][2],
+                      reverse=True)[:Profiler.TOP_FUNCTIONS]
+        return [{"function": "%s:%d(%s)" % key,
+                 "calls": calls,
+                 "own_ms": round(own_time * 1000, 3),
+                 "cumulative_ms": round(cumulative_time * 1000, 3)}
+                for key, (unused, calls, own_time, cumulative_time,
+                          unused_callers) in rows]
+
+
+
+    @staticmethod
+    def top_allocations():
+        """
+        Stops tracemalloc.
+        :return:    The peak memory use, and the lines that allocated the
+                    most memory that is still in use, as a dict
+        """
+        import tracemalloc
+        current, peak = tracemalloc.get_traced_memory()
+        statistics = tracemalloc.take_snapshot().statistics("lineno")
+        tracemalloc.stop()
+        Profiler.tracing_memory = False
+        return {
+            "current_kb": round(current / 1024, 1),
+            "peak_kb": round(peak / 1024, 1),
+            "lines": [{"line": str(stat.traceback),
+                       "size_kb": round(stat.size / 1024, 1),
+                       "count": stat.count}
+                      for stat in statistics[:Profiler.TOP_ALLOCATIONS]],
+        }
+
+
+
+    @staticmethod
+    def format_report(report):
+        """
+        :param report:  A report from Profiler.stop()
+        :return:        The report, as text
+        """
+        total = max(report["total_ms"], 1e-9)
+        lines = ["Profile of %s: %.1f ms" % (report["name"], total)]
+        for phase in sorted(report["phases_ms"],
+                            key=lambda p: -report["phases_ms"][p]):
+            ms = report["phases_ms"][phase]
+            lines.append("  %-24s %10.1f ms %5.1f%%" %
+                         (phase, ms, 100 * ms / total))
+        for counter in sorted(report["counters"]):
+            lines.append("  %-24s %10d" % (counter,
+                                            report["counters"][counter]))
+        if "functions" in report:
+            lines.append("  Functions that took the most time:")
+            for row in report["functions"]:
+                lines.append("    %9.1f ms %8d calls  %s" %
+                             (row["own_ms"], row["calls"], row["function"]))
+        if "memory" in report:
+            lines.append("  Memory: %.1f KB at peak" %
+                         report["memory"]["peak_kb"])
+            for row in report["memory"]["lines"]:
+                lines.append("    %9.1f KB %8d blocks  %s" %
+                             (row["size_kb"], row["count"], row["line"]))
+        return "\n".join(lines)
@@ -0,0 +1,450 @@
+"""
+Filename: ProgramGenerator.py
+Tested using Python 3.5.1
+
+David Dalcino
+CS 6110
+Prof. Reiter
+Winter 2017
+CSU East Bay
+
+This file implements ProgramGenerator, which writes random, valid Go--
+programs of any size, for measuring how fast the compiler is on programs
+much larger than the samples in testPrograms and testCodeGen. The programs
+follow Documentation/LanguageDesign.md, and use every kind of statement.
+The same seed and settings always give the same program.
+
+The programs can also be run, and always print the same thing: every
+variable is set before it is read, every loop counts up to a small limit,
+functions only call functions that were generated before them, so there is
+no recursion, array subscripts are always in range, and nothing is divided
+by a literal 0. A large program may still take a long time to run, since
+the number of calls grows quickly with the number of functions.
+
+Usage: python3 ProgramGenerator.py [--seed=N] [--functions=N] [--depth=N]
+           [--statements=N] [--arrays=P] [--floats=P] [--strings=P]
+           [--protos=P] [output_file]
+
+The counts and probabilities are described in ProgramGenerator.__init__.
+The program is written to output_file, or printed if there is none.
+"""
+
+import random
+import sys
+
+
+class ProgramGenerator:
+    """
+    Writes a random Go-- program. Each ProgramGenerator has its own random
+    number generator, so that programs can be generated side by side.
+    """
+
+    #################################################################
+    # STATIC CONSTANT DATA
+
+    INDENT = "    "
+
+    INT_OPERATORS = ("+", "-", "*")     # / and % need a divisor that is
+    FLOAT_OPERATORS = ("+", "-", "*")   # not 0; see expression()
+    RELATIONAL_OPERATORS = ("<", "<=", ">", ">=", "==", "!=")
+
+    # Characters used in char and string literals
+    LITERAL_CHARS = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ" \
+                    "0123456789 "
+
+    ARRAY_SIZES = (2, 3, 5, 8, 10)      # The sizes of generated arrays
+    MAX_LOOP_COUNT = 4                  # Loops run 1 to this many times
+
+
+
+    def __init__(self, seed=0, functions=20, depth=3, statements=8,
+                 arrays=0.3, floats=0.3, strings=0.3, protos=0.2):
+        """
+        Constructs a ProgramGenerator.
+        :param seed:        Seeds the random number generator
+        :param functions:   How many functions to generate, besides main
+        :param depth:       How deeply if and while statements may be nested
+        :param statements:  About how many statements to put in each block
+        :param arrays:      The probability that a declared variable is an
+                            array, from 0 to 1
+        :param floats:      The probability that a variable, parameter or
+                            function is a float, rather than an int
+        :param strings:     The probability that a statement prints string
+                            and char literals
+        :param protos:      The probability that a function is forward
+                            declared with a prototype
+        """
+        self.random = random.Random(seed)
+        self.functions = functions
+        self.depth = depth
+        self.statements = statements
+        self.arrays = arrays
+        self.floats = floats
+        self.strings = strings
+        self.protos = protos
+
+        # Each function as a dict with its "name", "params" (a list of
+        # (name, type) tuples) and "return_type"
+        self.signatures = []
+        self.lines = []         # The lines of the program so far
+        self.scopes = []        # A list of dicts, one for each open scope,
+                                # that pair each variable's name with its
+                                # type: "int", "float", or (type, size) for
+                                # an array
+        self.callable = []      # The functions the current one may call
+        self.counters = set()   # Loop counters, which must not be changed
+                                # by anything but their loops
+        self.names_made = 0     # Makes every variable name different
+
+
+
+    #################################################################
+    # PROGRAM STRUCTURE
+
+    def generate(self):
+        """
+        :return:    A new Go-- program, as a string
+        """
+        self.lines = []
+        self.signatures = [self.signature("f%d" % i)
+                           for i in range(self.functions)]
+
+        protos = [sig for sig in self.signatures
+                  if self.random.random() < self.protos]
+        for sig in protos:
+            self.lines.append("proto %s;" % self.header(sig))
+        if protos:
+            self.lines.append("")
+
+        for i, sig in enumerate(self.signatures):
+            self.callable = self.signatures[:i]
+            self.function(sig)
+
+        self.callable = self.signatures
+        self.function({"name": "main", "params": [], "return_type": "int"})
+        return "\n".join(self.lines) + "\n"
+
+
+
+    def signature(self, name):
+        """
+        :param name:    The name of the function
+        :return:        A random signature for a function
+        """
+        params = [("p%d" % i, self.scalar_type())
+                  for i in range(self.random.randint(0, 3))]
+        return {"name": name, "params": params,
+                "return_type": self.scalar_type()}
+
+
+
+    def header(self, sig):
+        """
+        :param sig:     A function's signature
+        :return:        The part of its declaration after 'func' or 'proto'
+        """
+        return "%s(%s) result %s" % (
+            sig["name"],
+            ", ".join("%s %s" % param for param in sig["params"]),
+            sig["return_type"])
+
+
+
+    def function(self, sig):
+        """
+        Writes a function definition.
+        :param sig:     The function's signature
+        """
+        self.lines.append("func %s {" % self.header(sig))
+        # result is left out of scope, since it is not set until the end
+        self.scopes = [dict(sig["params"])]
+        self.block(1)
+        self.emit(1, "result = %s;" % self.expression(sig["return_type"], 2))
+        self.emit(1, "return;")
+        self.lines.append("}")
+        self.lines.append("")
+
+
+
+    def block(self, level):
+        """
+        Writes the statements in a block.
+        :param level:   How deeply the block is nested; 1 for a function body
+        """
+        for i in range(self.random.randint(1, self.statements)):
+            self.statement(level)
+
+
+
+    def emit(self, level, line):
+        """
+        Adds a line to the program.
+        :param level:   How deeply the line is indented
+        :param line:    The line
+        """
+        self.lines.append(ProgramGenerator.INDENT * level + line)
+
+
+
+    #################################################################
+    # STATEMENTS
+
+    def statement(self, level):
+        """
+        Writes a random statement.
+        :param level:   How deeply the statement is nested
+        """
+        choices = [self.declaration, self.declaration, self.assignment,
+                   self.assignment, self.assignment, self.call_statement]
+        if level <= self.depth:
+            choices += [self.if_statement, self.while_statement]
+        if self.random.random() < self.strings:
+            choices = [self.print_statement]
+        self.random.choice(choices)(level)
+
+
+
+    def declaration(self, level):
+        """
+        Writes a variable or array declaration, and initializes it. The
+        variable is only put in scope once it is initialized, so that
+        nothing reads it before it is set.
+        """
+        name = self.new_name()
+        if self.random.random() < self.arrays:
+            var_type = (self.scalar_type(),
+                        self.random.choice(ProgramGenerator.ARRAY_SIZES))
+            self.emit(level, "var %s [%d]%s;" % (name, var_type[1],
+                                                 var_type[0]))
+            for i in range(var_type[1]):
+                self.emit(level, "%s[%d] = %s;" % (
+                    name, i, self.expression(var_type[0], 1)))
+        else:
+            var_type = self.scalar_type()
+            self.emit(level, "var %s %s;" % (name, var_type))
+            self.emit(level, "%s = %s;" % (name,
+                                           self.expression(var_type, 2)))
+        self.scopes[-1][name] = var_type
+
+
+
+    def assignment(self, level):
+        """ Writes an assignment to a variable or an array element """
+        var_type = self.scalar_type()
+        names = self.variables(var_type, writable=True)
+        if not names:
+            self.declaration(level)
+            return
+        self.emit(level, "%s = %s;" % (self.random.choice(names),
+                                       self.expression(var_type, 2)))
+
+
+
+    def call_statement(self, level):
+        """ Writes a function call on its own """
+        if not self.callable:
+            self.assignment(level)
+            return
+        self.emit(level, "%s;" % self.call(self.random.choice(self.callable)))
+
+
+
+    def print_statement(self, level):
+        """ Writes a call to print() with string, char and number values """
+        values = []
+        for i in range(self.random.randint(1, 4)):
+            kind = self.random.random()
+            if kind < 0.4:
+                values.append('"%s"' % self.literal_text(12))
+            elif kind < 0.6:
+                values.append("'%s'" % self.random.choice(
+                    ProgramGenerator.LITERAL_CHARS.strip()))
+            else:
+                values.append(self.expression(self.scalar_type(), 1))
+        values.append("'\\n'")
+        self.emit(level, "print(%s);" % ", ".join(values))
+
+
+
+    def if_statement(self, level):
+        """ Writes an if statement, with or without an else clause """
+        self.emit(level, "if (%s) {" % self.condition())
+        self.nested_block(level + 1)
+        if self.random.random() < 0.5:
+            self.emit(level, "} else {")
+            self.nested_block(level + 1)
+        self.emit(level, "}")
+
+
+
+    def while_statement(self, level):
+        """ Writes a while statement that counts up to a small limit """
+        counter = self.new_name()
+        self.counters.add(counter)
+        self.scopes[-1][counter] = "int"
+        self.emit(level, "var %s int;" % counter)
+        self.emit(level, "%s = 0;" % counter)
+        self.emit(level, "while (%s < %d) {" % (
+            counter, self.random.randint(1, ProgramGenerator.MAX_LOOP_COUNT)))
+        self.nested_block(level + 1)
+        self.emit(level + 1, "%s = %s + 1;" % (counter, counter))
+        self.emit(level, "}")
+
+
+
+    def nested_block(self, level):
+        """ Writes a block, in a new scope """
+        self.scopes.append({})
+        self.block(level)
+        self.scopes.pop()
+
+
+
+    #################################################################
+    # EXPRESSIONS
+
+    def expression(self, var_type, depth):
+        """
+        :param var_type:    The type of the expression: "int" or "float"
+        :param depth:       How deeply subexpressions may be nested
+        :return:            A random expression
+        """
+        if depth <= 0 or self.random.random() < 0.3:
+            return self.operand(var_type)
+
+        left = self.expression(var_type, depth - 1)
+        kind = self.random.random()
+        if kind < 0.15:
+            # Divide by a literal, so that the divisor is never 0
+            operator = "/" if var_type == "float" else \
+                self.random.choice(("/", "%"))
+            return "(%s) %s %s" % (left, operator,
+                                   self.literal(var_type, nonzero=True))
+        if kind < 0.25 and self.callable:
+            callee = self.random.choice(self.callable)
+            if callee["return_type"] == var_type:
+                return "%s + %s" % (left, self.call(callee))
+        operators = ProgramGenerator.FLOAT_OPERATORS if var_type == "float" \
+            else ProgramGenerator.INT_OPERATORS
+        right = self.expression(var_type, depth - 1)
+        return "(%s) %s (%s)" % (left, self.random.choice(operators), right)
+
+
+
+    def operand(self, var_type, writable=False):
+        """
+        :param var_type:    The type of the operand: "int" or "float"
+        :param writable:    If True, the operand is never a loop counter,
+                            since it may be changed
+        :return:            A literal, a variable or an array element
+        """
+        names = self.variables(var_type, writable)
+        if names and self.random.random() < 0.7:
+            return self.random.choice(names)
+        return self.literal(var_type)
+
+
+
+    def condition(self):
+        """ :return: A random comparison, for an if statement """
+        var_type = self.scalar_type()
+        return "(%s) %s (%s)" % (
+            self.expression(var_type, 1),
+            self.random.choice(ProgramGenerator.RELATIONAL_OPERATORS),
+            self.expression(var_type, 1))
+
+
+
+    def call(self, sig):
+        """
+        :param sig:     The signature of the function to call
+        :return:        A call to the function. Parameters are passed by
+                        reference, so the arguments are variables when
+                        there are any of the right type.
+        """
+        return "%s(%s)" % (sig["name"], ", ".join(
+            self.operand(param_type, writable=True)
+            for unused, param_type in sig["params"]))
+
+
+
+    def variables(self, var_type, writable=False):
+        """
+        :param var_type:    A type: "int" or "float"
+        :param writable:    If True, loop counters are left out
+        :return:            The variables and array elements of that type
+                            that are in scope
+        """
+        names = []
+        for scope in self.scopes:
+            for name, name_type in scope.items():
+                if name_type == var_type:
+                    if not (writable and name in self.counters):
+                        names.append(name)
+                elif isinstance(name_type, tuple) and \
+                        name_type[0] == var_type:
+                    names.append("%s[%d]" % (
+                        name, self.random.randrange(name_type[1])))
+        names.sort()
+        return names
+
+
+
+    def literal(self, var_type, nonzero=False):
+        """
+        :param var_type:    The type of the literal: "int" or "float"
+        :param nonzero:     If True, the literal is never 0
+        :return:            A random literal
+        """
+        low = 1 if nonzero else 0
+        if var_type == "float":
+            return "%d.%d" % (self.random.randint(low, 99),
+                              self.random.randint(0, 99))
+        return str(self.random.randint(low, 999))
+
+
+
+    def literal_text(self, length):
+        """
+        :param length:  The most characters to return
+        :return:        Random characters for a char or string literal
+        """
+        return "".join(self.random.choice(ProgramGenerator.LITERAL_CHARS)
+                       for i in range(self.random.randint(1, length)))
+
+
+
+    def scalar_type(self):
+        """ :return: "float" or "int", at random """
+        return "float" if self.random.random() < self.floats else "int"
+
+
+
+    def new_name(self):
+        """ :return: A variable name that has not been used before """
+        self.names_made += 1
+        return "v%d" % self.names_made
+
+
+
+if __name__ == "__main__":
+    options = [arg for arg in sys.argv[1:] if arg.startswith("--")]
+    arg_list = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+
+    settings = {}
+    for option in options:
+        key, unused, value = option[2:].partition("=")
+        if key in ("seed", "functions", "depth", "statements"):
+            settings[key] = int(value)
+        elif key in ("arrays", "floats", "strings", "protos"):
+            settings[key] = float(value)
+        else:
+            print("Unknown option: " + option)
+            sys.exit(1)
+
+    program = ProgramGenerator(**settings).generate()
+    if len(arg_list) == 0:
+        print(program, end="")
+    else:
+        with open(arg_list[0], 'w') as f:
+            f.write(program)
@@ -316,11 +316,14 @@ class Scanner:
         """
         Retrieves the next token in a file opened by a FileReader. Filters out
         Comment tokens, which should be ignored.
-        :param fr:  a FileReader object
+        :param fr:  a FileReader object, or a TokenReader over tokens that
+                    were already scanned (see TokenCache.py)
         :return:    a Token object corresponding to the next token the
                     scanner should encounter.
         """
-        assert isinstance(fr, FileReader)
+        if not isinstance(fr, FileReader):
+            # The file was scanned before; skip the DFA
+            return fr.next_token()
 
         state = "Start"         # The state of the DFA
         token_string = ""       # A string that will hold the contents of the
@@ -360,10 +363,12 @@ class Scanner:
                         token_string = ""
                         # Skip any whitespace
                         if ch and ch.isspace():
-                            while ch.isspace():
+                            while ch and ch.isspace():
                                 ch = fr.get_char()
-                            # Put back the non-space character
-                            fr.put_back()
+                            # Put back the non-space character, unless
+                            # the file ended first
+                            if ch:
+                                fr.put_back()
                     else:
                         # determine token type from accept state
                         token_type = token_type_for_accept_state[state]
@@ -0,0 +1,259 @@
+"""
+Filename: SignatureIndex.py
+Tested using Python 3.5.1
+
+David Dalcino
+CS 6110
+Prof. Reiter
+Winter 2017
+CSU East Bay
+
+This file implements SignatureIndex, a quick first pass over a Go-- source
+file that finds the signature of every function defined in it. The Parser
+puts these signatures in the global scope of the SymbolTable before it
+starts parsing, so a function can be called before it is defined, without
+a prototype.
+
+The first pass does not use the Scanner or the Parser. It only needs to
+recognize function headers, of the form
+    func <identifier> ( <param_list> ) <return_identifier> <return_datatype>
+and to skip over function bodies by matching braces; a handful of regular
+expressions over the whole file does this much faster than scanning it one
+character at a time. Anything it cannot make sense of is simply left out of
+the index, so that the Parser can report the error when it gets there.
+
+Signature indexes are cached by the contents of the file. If
+SignatureIndex.cache_dir is set, they are also saved there, so that they
+survive from one run of the compiler to the next. They are saved with
+marshal, which is built into Python, so loading them costs no imports.
+"""
+
+import hashlib
+import marshal
+import os
+import re
+from ExpressionRecord import DataTypes
+from OutputFile import OutputFile
+from Token import Token
+
+
+class SignatureIndex:
+    """
+    A static class that finds the signatures of the functions defined in a
+    source file.
+    """
+
+    #################################################################
+    # STATIC DATA MEMBERS
+
+    cache = {}              # A dict that pairs the hash of a file's contents
+                            # with the signature index for that file
+    cache_dir = None        # If not None, a directory where signature
+                            # indexes are saved between runs
+
+    #################################################################
+    # STATIC CONSTANT DATA
+
+    # Matches the pieces of a file that matter when matching braces: any
+    # comment, string or char literal that could contain a brace, the
+    # braces themselves, and the 'func' keyword
+    STRUCTURE_RE = re.compile(r"""
+        \#[^\n]*                    # comment
+        | "(?:\\.|[^"\\\n])*"       # string literal
+        | '(?:\\.|[^'\\\n])'        # char literal
+        | [{}]
+        | \bfunc\b
+    """, re.VERBOSE)
+
+    # Whitespace and comments between tokens in a function header
+    _SEP = r"(?:\s|\#[^\n]*\n)*"
+
+    # A datatype, as in <datatype>
+    _TYPE = r"(?:(?:int|float|char)\b|\[" + _SEP + r"[0-9]+" + _SEP + \
+            r"\]" + _SEP + r"(?:int|float|char)\b)"
+
+    _ID = r"[A-Za-z_][A-Za-z0-9_]*\b"
+
+    # A parameter, as in <param_list>
+    _PARAM = _ID + _SEP + _TYPE
+
+    # A whole function header, up to the brace that opens the function body
+    HEADER_RE = re.compile(
+        r"func" + _SEP + r"(?P<id>" + _ID + r")" + _SEP + r"\(" + _SEP +
+        r"(?P<params>(?:" + _PARAM + r"(?:" + _SEP + r"," + _SEP + _PARAM +
+        r")*)?)" + _SEP + r"\)" + _SEP + _ID + _SEP +
+        r"(?P<return>" + _TYPE + r")" + _SEP + r"\{")
+
+    # Picks the datatype out of each parameter in a parameter list
+    PARAM_TYPE_RE = re.compile(_ID + _SEP + r"(?P<type>" + _TYPE + r")")
+
+    BASIC_TYPES = {
+        "int":      DataTypes.INT,
+        "float":    DataTypes.FLOAT,
+        "char":     DataTypes.CHAR,
+    }
+
+
+
+    #################################################################
+    # STATIC MEMBER FUNCTIONS
+
+    @staticmethod
+    def for_file(filename):
+        """
+        Finds the signatures of the functions defined in a source file, using
+        the cache if the file has been indexed before.
+        :param filename:    The name of the source file
+        :return:            A list of (identifier, param_list_types,
+                            param_sizes, return_type) tuples, in the order
+                            that the functions are defined
+        """
+        with open(filename, 'r') as f:
+            text = f.read()
+        return SignatureIndex.for_text(text)
+
+
+
+    @staticmethod
+    def for_text(text):
+        """
+        Finds the signatures of the functions defined in Go-- source code,
+        using the cache if the same source code has been indexed before.
+        :param text:    The source code, as a string
+        :return:        A list of (identifier, param_list_types, param_sizes,
+                        return_type) tuples; see SignatureIndex.for_file()
+        """
+        key = hashlib.sha1(text.encode("utf-8")).hexdigest()
+        if key in SignatureIndex.cache:
+            return SignatureIndex.cache[key]
+
+        index = SignatureIndex.load(key)
+        if index is None:
+            index = SignatureIndex.build(text)
+            SignatureIndex.save(key, index)
+        SignatureIndex.cache[key] = index
+        return index
+
+
+
+    @staticmethod
+    def build(text):
+        """
+        Makes a signature index for Go-- source code, without using the cache.
+        :param text:    The source code, as a string
+        :return:        A list of (identifier, param_list_types, param_sizes,
+                        return_type) tuples; see SignatureIndex.for_file()
+        """
+        index = []
+        depth = 0           # How many braces deep we are
+        for match in SignatureIndex.STRUCTURE_RE.finditer(text):
+            piece = match.group()
+            if piece == "{":
+                depth += 1
+            elif piece == "}":
+                depth = max(depth - 1, 0)
+            elif piece == "func" and depth == 0:
+                signature = SignatureIndex.read_header(text, match.start())
+                if signature is not None:
+                    index.append(signature)
+        return index
+
+
+
+    @staticmethod
+    def read_header(text, pos):
+        """
+        Reads the function header that starts at text[pos].
+        :param text:    The source code, as a string
+        :param pos:     The position of the 'func' keyword
+        :return:        An (identifier, param_list_types, param_sizes,
+                        return_type) tuple, or None if the header is
+                        malformed or uses a keyword as an identifier
+        """
+        match = SignatureIndex.HEADER_RE.match(text, pos)
+        if match is None or match.group("id") in Token.keywords:
+            return None
+
+        return_type = SignatureIndex.to_datatype(match.group("return"))
+        if DataTypes.is_array(return_type):
+            # Functions cannot return arrays; let the Parser say so
+            return None
+
+        type_strs = [param.group("type")
+                     for param in SignatureIndex.PARAM_TYPE_RE.finditer(
+                         match.group("params"))]
+        param_types = [SignatureIndex.to_datatype(type_str)
+                       for type_str in type_strs]
+        param_sizes = [SignatureIndex.to_size(type_str)
+                       for type_str in type_strs]
+        return match.group("id"), param_types, param_sizes, return_type
+
+
+
+    @staticmethod
+    def to_datatype(type_str):
+        """
+        Turns the text of a <datatype> into a DataTypes enum
+        :param type_str:    The text of a datatype, like 'int' or '[10]char'
+        :return:            The datatype, as a DataTypes enum
+        """
+        basic_type = SignatureIndex.BASIC_TYPES[
+            re.search(r"int|float|char", type_str).group()]
+        if type_str.startswith("["):
+            return DataTypes.basic_to_array(basic_type)
+        return basic_type
+
+
+
+    @staticmethod
+    def to_size(type_str):
+        """
+        Finds the number of elements in a <datatype>
+        :param type_str:    The text of a datatype, like 'int' or '[10]char'
+        :return:            The number of elements, if it is an array; else 1
+        """
+        if type_str.startswith("["):
+            return int(re.search(r"[0-9]+", type_str).group())
+        return 1
+
+
+
+    @staticmethod
+    def load(key):
+        """
+        Loads a signature index from SignatureIndex.cache_dir.
+        :param key:     The hash of the source code that was indexed
+        :return:        The signature index, or None if it was not saved
+        """
+        if SignatureIndex.cache_dir is None:
+            return None
+        path = os.path.join(SignatureIndex.cache_dir, key + ".sig")
+        try:
+            with open(path, 'rb') as f:
+                saved = marshal.load(f)
+            return [(identifier, [DataTypes[t] for t in param_types],
+                     param_sizes, DataTypes[return_type])
+                    for identifier, param_types, param_sizes, return_type
+                    in saved]
+        except (OSError, EOFError, ValueError, KeyError, TypeError):
+            # A missing or damaged file, or one saved by another version of
+            # Python, just means indexing again
+            return None
+
+
+
+    @staticmethod
+    def save(key, index):
+        """
+        Saves a signature index in SignatureIndex.cache_dir, if it is set.
+        :param key:     The hash of the source code that was indexed
+        :param index:   The signature index
+        """
+        if SignatureIndex.cache_dir is None:
+            return
+        saved = [(identifier, [t.name for t in param_types], param_sizes,
+                  return_type.name)
+                 for identifier, param_types, param_sizes, return_type
+                 in index]
+        OutputFile.write_cache_file(SignatureIndex.cache_dir, key + ".sig",
+                                    marshal.dumps(saved))
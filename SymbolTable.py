@@ -25,6 +25,17 @@ Because functions can only be declared in the global scope, FunctionSignatures
 are only found in the global scope. Also, variables cannot be declared in the
 global scope, so the only key-value pairs in the global scope are
 function_identifier-FunctionSignature pairs.
+
+Besides the list of open scopes, the SymbolTable keeps a dict that pairs each
+identifier with a stack of the values it is bound to in the open scopes,
+innermost last. Opening and closing scopes keeps these stacks up to date, so
+looking up an identifier never has to walk through the open scopes.
+
+Closed scopes are only needed by display(), so by default they are thrown
+away, and the memory held by the SymbolTable depends only on how deeply the
+open scopes are nested. A SymbolTable can instead be asked to keep closed
+scopes in a compact form, as the text that display() prints, or to write
+them to a symbol dump file as soon as they are closed.
 """
 
 from ExpressionRecord import FunctionSignature
@@ -91,15 +102,42 @@ class SymbolTable:
         "cast_char": {},
     }
 
+    # Policies for what happens to a scope when it is closed
+    DISCARD = "discard"     # forget it; only the count of closed scopes
+                            # is kept
+    COMPACT = "compact"     # keep the text that display() prints for it
+    DUMP = "dump"           # write that text to a symbol dump file
 
 
-    def __init__(self):
+
+    def __init__(self, closed_scope_policy=DISCARD, dump_file=None):
+        """
+        Constructor; makes a new SymbolTable with an open global scope
+        :param closed_scope_policy: SymbolTable.DISCARD, SymbolTable.COMPACT,
+                                    or SymbolTable.DUMP
+        :param dump_file:   A file object, opened for writing, that closed
+                            scopes are written to. Required by
+                            SymbolTable.DUMP; ignored otherwise.
+        """
+        assert closed_scope_policy in (SymbolTable.DISCARD,
+                                       SymbolTable.COMPACT, SymbolTable.DUMP)
+        assert closed_scope_policy != SymbolTable.DUMP or \
+            dump_file is not None
+        self.closed_scope_policy = closed_scope_policy
+        self.dump_file = dump_file
+
         # an array of Scopes; each Scope represents an open scope
         self.open_scopes = []
-        # an array of Scopes; each Scope represents an open scope
+        # an array of strings; each one describes a closed scope, if the
+        # closed scope policy is SymbolTable.COMPACT
         self.closed_scopes = []
+        # the number of scopes that have been closed
+        self.closed_scope_count = 0
         # the total number of scopes that have been opened
         self.scope_count = 0
+        # a dict that pairs each identifier with a list of the values bound
+        # to it in the open scopes; the innermost binding is last
+        self.bindings = {}
 
         # Get the symbol table ready to accept new values: open a new scope.
         # This is the global scope; closing it is an error
@@ -119,11 +157,13 @@ class SymbolTable:
         # Disallow insertion to a scope that already has the key,
         # or if it's a built in function
         if self.open_scopes[-1].contains(key) or \
-                        key in SymbolTable.builtin_functions.keys():
+                        key in SymbolTable.builtin_functions:
             return False
 
         # Perform the insertion
         self.open_scopes[-1].insert(key, value)
+        self.bindings.setdefault(key, []).append(value)
+        return True
 
 
 
@@ -135,13 +175,10 @@ class SymbolTable:
                         the key doesn't exist in the current scope
         """
         # if it's a built-in function,
-        if key in SymbolTable.builtin_functions.keys():
+        if key in SymbolTable.builtin_functions:
             return SymbolTable.builtin_functions[key]
-        if self.open_scopes[-1].contains(key):
-            # Return the associated value, if the key exists in the scope
-            return self.open_scopes[-1].find(key)
-        # If the key isn't found, return None
-        return None
+        # Return the associated value, or None if the key isn't in the scope
+        return self.open_scopes[-1].data.get(key)
 
 
 
@@ -155,13 +192,12 @@ class SymbolTable:
                         the key doesn't exist in any open scope
         """
         # if it's a built-in function,
-        if key in SymbolTable.builtin_functions.keys():
+        if key in SymbolTable.builtin_functions:
             return SymbolTable.builtin_functions[key]
-        # Traverse the open scopes in reverse order
-        for i in range(len(self.open_scopes)-1, -1, -1):
-            if self.open_scopes[i].contains(key):
-                # Return the associated value, if the key exists in the scope
-                return self.open_scopes[i].find(key)
+        # The innermost binding is at the top of the key's stack
+        stack = self.bindings.get(key)
+        if stack:
+            return stack[-1]
         # If the key isn't found, return None
         return None
 
@@ -174,11 +210,23 @@ class SymbolTable:
             # print each open scope
             print("============================================")
             print(str(scope))
-        print("Closed Scopes: %d exist\n" % len(self.closed_scopes))
-        for scope in self.closed_scopes:
-            # print each closed scope
+        print("Closed Scopes: %d exist\n" % self.closed_scope_count)
+        for scope_str in self.closed_scopes:
+            # print each closed scope that was kept
             print("============================================")
-            print(str(scope))
+            print(scope_str)
+
+
+
+    def dump_open_scopes(self):
+        """
+        Writes the open scopes to the symbol dump file, if there is one. Call
+        this when parsing is done, so that the dump file also describes the
+        global scope.
+        """
+        if self.closed_scope_policy == SymbolTable.DUMP:
+            for scope in self.open_scopes:
+                self.dump_file.write(str(scope) + '\n')
 
 
 
@@ -199,10 +247,23 @@ class SymbolTable:
         if len(self.open_scopes) == 1:
             raise SymbolTable.CloseGlobalScopeException()
 
-        # Keep the closed scope in the list of closed scopes
-        self.closed_scopes.append(self.open_scopes[-1])
         # Remove the closed scope from the list of open scopes
-        self.open_scopes.pop()
+        scope = self.open_scopes.pop()
+        self.closed_scope_count += 1
+
+        # Keep what the closed scope policy asks for
+        if self.closed_scope_policy == SymbolTable.COMPACT:
+            self.closed_scopes.append(str(scope))
+        elif self.closed_scope_policy == SymbolTable.DUMP:
+            self.dump_file.write(str(scope) + '\n')
+
+        # Its identifiers are now bound to whatever they were bound to
+        # before it was opened
+        for key in scope.data:
+            stack = self.bindings[key]
+            stack.pop()
+            if not stack:
+                del self.bindings[key]
 
 
 
@@ -233,6 +294,25 @@ class SymbolTable:
         return undef_func_ids
 
 
+
+    def get_call_graph(self):
+        """
+        Builds a call graph from the FunctionSignatures in the symbol table.
+        Only functions that have been defined know which functions they call.
+        :return:    a dict that pairs each function identifier with a sorted
+                    list of the identifiers of the functions it calls
+        """
+        call_graph = {}
+
+        # Only the global scope can hold FunctionSignatures
+        scope = self.open_scopes[0]
+        for func_id in scope.data.keys():
+            func_signature = scope.data[func_id]
+            if isinstance(func_signature, FunctionSignature):
+                call_graph[func_id] = sorted(func_signature.callees)
+        return call_graph
+
+
     class CloseGlobalScopeException(Exception):
         """
         An empty class used to denote that a user attempted to close the global
@@ -0,0 +1,128 @@
+"""
+Filename: TestBatchCompiler.py
+Tested using Python 3.5.1
+
+David Dalcino
+CS 6110
+Prof. Reiter
+Winter 2017
+CSU East Bay
+
+This file tests BatchCompiler, which compiles every source file in a
+directory, and reports what happened to each one.
+
+Usage: python3 -m pytest TestBatchCompiler.py
+       python3 TestBatchCompiler.py
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from BatchCompiler import compile_batch, find_sources
+
+
+PROGRAM = """
+    func main() _ int {
+        print("Hello\\n");
+    }
+"""
+
+BAD_PROGRAM = """
+    func main() _ int {
+        print(x);
+    }
+"""
+
+
+
+class TestBatchCompiler(unittest.TestCase):
+    """
+    Compiles small directories of programs, in this process.
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+
+
+    def write(self, name, text=PROGRAM):
+        """
+        Writes a source file in the temporary directory.
+        :param name:    Its name, relative to the directory
+        :param text:    What it holds
+        """
+        filename = os.path.join(self.temp_dir, name)
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        with open(filename, 'w') as f:
+            f.write(text)
+
+
+
+    def compile(self, output_dir=None):
+        """
+        :param output_dir:  If not None, where to put the asm files
+        :return:            The results, by the names of their sources,
+                            relative to the temporary directory
+        """
+        summary = compile_batch(find_sources([self.temp_dir]), workers=1,
+                                output_dir=output_dir)
+        self.assertEqual(summary["files"], len(summary["results"]))
+        return {os.path.relpath(result["source"], self.temp_dir): result
+                for result in summary["results"]}
+
+
+
+    def test_every_file_is_compiled(self):
+        self.write("a.gomm")
+        self.write("sub/b.txt")
+        self.write("bad.gomm", BAD_PROGRAM)
+        self.write(".gommcache/c.gomm")
+        results = self.compile()
+        self.assertEqual(sorted(results), ["a.gomm", "bad.gomm",
+                                           os.path.join("sub", "b.txt")])
+        self.assertTrue(results["a.gomm"]["ok"])
+        self.assertTrue(os.path.isfile(results["a.gomm"]["asm"]))
+        self.assertFalse(results["bad.gomm"]["ok"])
+        self.assertEqual(results["bad.gomm"]["error_count"], 1)
+        # Its messages are the error, not lines of the Parser's trace
+        for message in results["bad.gomm"]["messages"]:
+            self.assertNotRegex(message, r"^[\d ]+$")
+        self.assertFalse(os.path.exists(results["bad.gomm"]["asm"]))
+
+
+
+    def test_same_asm_file(self):
+        # a.gomm and a.txt would both be compiled to a.asm
+        self.write("a.gomm")
+        self.write("a.txt")
+        self.write("b.gomm")
+        results = self.compile()
+        self.assertTrue(results["b.gomm"]["ok"])
+        for name, other in (("a.gomm", "a.txt"), ("a.txt", "a.gomm")):
+            self.assertFalse(results[name]["ok"])
+            self.assertIn(os.path.join(self.temp_dir, other),
+                          results[name]["messages"][0])
+        self.assertFalse(os.path.exists(os.path.join(self.temp_dir,
+                                                     "a.asm")))
+
+
+
+    def test_output_dir(self):
+        self.write("sub/a.gomm")
+        output_dir = os.path.join(self.temp_dir, "out")
+        results = self.compile(output_dir)
+        asm_out = os.path.join(output_dir, "sub", "a.asm")
+        self.assertEqual(results[os.path.join("sub", "a.gomm")]["asm"],
+                         asm_out)
+        self.assertTrue(os.path.isfile(asm_out))
+
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,456 @@
+"""
+Filename: TestCodeGen.py
+Tested using Python 3.5.1
+
+David Dalcino
+CS 6110
+Prof. Reiter
+Winter 2017
+CSU East Bay
+
+This file tests the code that the compiler generates, by compiling the
+programs in testCodeGen and running them on the MipsSimulator.
+
+The code for each program, compiled with the default options, must be the
+same as the code in testCodeGen/expected, so that a change that should not
+touch the generated code cannot do so without being noticed. And whatever
+options each program is compiled with, it must print the same thing that it
+printed when it was compiled by the first version of the compiler, which is
+also kept in testCodeGen/expected.
+
+What each program does when it runs is also counted, and the counts must
+match the baseline that BenchmarkGeneratedCode compares changes with; after
+a change that is meant to improve them, save it again with
+"python3 BenchmarkGeneratedCode.py --save".
+
+Usage: python3 -m pytest TestCodeGen.py
+       python3 TestCodeGen.py [--save]
+
+With --save, the code of each program is written to testCodeGen/expected
+instead, after a change that is meant to improve it. What the programs
+print is never saved, since it must not change.
+"""
+
+import contextlib
+import io
+import json
+import os
+import re
+import sys
+import tempfile
+import unittest
+from BenchmarkGeneratedCode import KERNEL_DIR, KERNELS, CONFIGURATIONS, \
+    BASELINE_FILENAME, measure
+from CodeGenerator import CG
+from MipsSimulator import MipsSimulator
+from ParseOptions import ParseOptions
+from ParserWithST import Parser
+
+
+EXPECTED_DIR = os.path.join(KERNEL_DIR, "expected")
+
+# Programs that print memory they never set: the line printed just before
+# it, and how many lines of it there are. What they print there depends on
+# what was left on the stack, so those lines are not compared.
+UNSET_OUTPUT = {
+    "testPassByRef": ("Uninitialized array:", 5),
+}
+
+
+
+def compile_source(source, filename="<source>", **options):
+    """
+    Compiles a program, without printing anything.
+    :param source:      The source code, as a str
+    :param filename:    The name to give the source code in messages
+    :param options:     Keyword arguments for ParseOptions
+    :return:            The code, as a str, or None if it did not compile
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        return Parser.compile_source(
+            source, filename=filename,
+            options=ParseOptions(print_trace=False, print_diagnostics=False,
+                                 **options))
+
+
+
+def compile_kernel(kernel, **options):
+    """
+    Compiles one of the programs in testCodeGen.
+    :param kernel:      The name of the program, from KERNELS
+    :param options:     Keyword arguments for ParseOptions
+    :return:            The code, as a str, or None if it did not compile
+    """
+    filename = os.path.join(KERNEL_DIR, kernel + ".txt")
+    with open(filename, 'r') as f:
+        return compile_source(f.read(), filename=filename, **options)
+
+
+
+def comparable_output(kernel, output):
+    """
+    :param kernel:  The name of a program, from KERNELS
+    :param output:  What it printed
+    :return:        The output, with the lines that print memory that the
+                    program never set replaced by "?"
+    """
+    if kernel not in UNSET_OUTPUT:
+        return output
+    before, count = UNSET_OUTPUT[kernel]
+    lines = output.split("\n")
+    start = lines.index(before) + 1
+    lines[start:start + count] = ["?"] * count
+    return "\n".join(lines)
+
+
+
+def read_expected(name):
+    """
+    :param name:    The name of a file in EXPECTED_DIR
+    :return:        Its contents
+    """
+    with open(os.path.join(EXPECTED_DIR, name), 'r') as f:
+        return f.read()
+
+
+
+class TestGeneratedCode(unittest.TestCase):
+    """
+    Compares the code for the programs in testCodeGen, and what they print,
+    with what is expected.
+    """
+
+    def test_code_is_unchanged(self):
+        for kernel in sorted(KERNELS):
+            with self.subTest(kernel=kernel):
+                self.assertEqual(compile_kernel(kernel),
+                                 read_expected(kernel + ".asm"))
+
+
+
+    def test_output_matches_first_compiler(self):
+        for kernel in sorted(KERNELS):
+            expected = read_expected(kernel + ".out")
+            for name, options in sorted(CONFIGURATIONS.items()):
+                with self.subTest(kernel=kernel, configuration=name):
+                    code = compile_kernel(kernel, **options)
+                    self.assertIsNotNone(code)
+                    output = MipsSimulator(code, KERNELS[kernel]).run()
+                    self.assertEqual(comparable_output(kernel, output),
+                                     expected)
+
+
+
+    def test_counts_match_benchmark_baseline(self):
+        # BenchmarkGeneratedCode lists the changes from its baseline, so
+        # the baseline must be saved again whenever the code changes
+        with open(BASELINE_FILENAME, 'r') as f:
+            baseline = json.load(f)
+        names = []
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for configuration, options in sorted(CONFIGURATIONS.items()):
+                for kernel in sorted(KERNELS):
+                    name = "%s/%s" % (kernel, configuration)
+                    names.append(name)
+                    with self.subTest(name=name):
+                        self.assertEqual(measure(kernel, options, temp_dir),
+                                         baseline.get(name))
+        self.assertEqual(sorted(baseline), sorted(names))
+
+
+
+class TestBoundsCheck(unittest.TestCase):
+    """
+    Compiles programs that use subscripts, with and without --bounds-check,
+    and runs them with subscripts outside their arrays.
+    """
+
+    BRANCH = "," + CG.BOUNDS_ERROR_LABEL
+    START = "Program Start\n"
+    END = "Program End\n"
+    BOUNDS_ERROR = "\nArray subscript out of range\n"
+
+    READ_SUBSCRIPT = """
+        func main() _ int {
+            var a [5]int;
+            var i int;
+            i = read_int();
+            a[i] = 7;
+            print("stored ", a[i], "\\n");
+        }
+    """
+
+    COUNT_DOWN = """
+        func main() _ int {
+            var a [5]int;
+            var i int;
+            i = 4;
+            while (i < 5) {
+                a[i] = i;
+                print(i, " ");
+                i = i - 1;
+            }
+        }
+    """
+
+    COUNT_UP = """
+        func main() _ int {
+            var a [5]int;
+            var i int;
+            i = 0;
+            while (i < 5) {
+                a[i] = i;
+                i = i + 1;
+            }
+            print(a[4]);
+        }
+    """
+
+    def test_no_checks_without_option(self):
+        code = compile_source(self.READ_SUBSCRIPT)
+        self.assertNotIn(self.BRANCH, code)
+        self.assertNotIn(CG.BOUNDS_ERROR_LABEL + ":", code)
+
+
+
+    def test_subscript_is_checked(self):
+        code = compile_source(self.READ_SUBSCRIPT, bounds_check=True)
+        self.assertIn(self.BRANCH, code)
+        self.assertIn(CG.BOUNDS_ERROR_LABEL + ":", code)
+
+
+
+    def run_program(self, source, input_text=""):
+        """
+        :return:    What the program prints, compiled with --bounds-check
+        """
+        code = compile_source(source, bounds_check=True)
+        self.assertIsNotNone(code)
+        return MipsSimulator(code, input_text).run()
+
+
+
+    def test_subscript_in_range(self):
+        self.assertEqual(self.run_program(self.READ_SUBSCRIPT, "4\n"),
+                         self.START + "stored 7\n" + self.END)
+
+
+
+    def test_subscript_too_large(self):
+        self.assertEqual(self.run_program(self.READ_SUBSCRIPT, "5\n"),
+                         self.START + self.BOUNDS_ERROR)
+
+
+
+    def test_negative_subscript(self):
+        self.assertEqual(self.run_program(self.READ_SUBSCRIPT, "-1\n"),
+                         self.START + self.BOUNDS_ERROR)
+
+
+
+    def test_loop_counter_that_goes_negative(self):
+        self.assertEqual(self.run_program(self.COUNT_DOWN),
+                         self.START + "4 3 2 1 0 " + self.BOUNDS_ERROR)
+
+
+
+    def test_loop_counter_is_not_checked(self):
+        # i starts at 0, is only incremented, and is less than 5 wherever
+        # it is used, so it never needs to be checked
+        code = compile_source(self.COUNT_UP, bounds_check=True)
+        self.assertNotIn(self.BRANCH, code)
+        self.assertEqual(MipsSimulator(code).run(),
+                         self.START + "4" + self.END)
+
+
+
+    def test_literal_subscript_out_of_range(self):
+        source = """func main() _ int {
+            var a [5]int;
+            var x int;
+            x = a[5];
+            x = 1;
+        }
+        """
+        self.assertIsNone(compile_source(source, bounds_check=True))
+        self.assertEqual(len(Parser.diagnostics), 1)
+        error = Parser.diagnostics[0].to_dict()
+        self.assertEqual(error["message"],
+                         "Subscript 5 is out of range for an array of size 5")
+        self.assertEqual((error["line"], error["length"]), (4, 1))
+        self.assertIsNotNone(compile_source(source))
+
+
+
+    def test_array_parameter_of_another_size(self):
+        # setall() only checks its subscripts against 10, so it must not be
+        # passed a smaller array, whether it is defined before or after the
+        # call
+        set_all = """
+        func setall(arr [10]int) _ int {
+            var i int;
+            i = 0;
+            while (i < 10) {
+                arr[i] = i;
+                i = i + 1;
+            }
+        }
+        """
+        main = """
+        func main() _ int {
+            var a [%d]int;
+            setall(a);
+            print(a[9]);
+        }
+        """
+        for size in (3, 10, 11):
+            for source in (set_all + main % size, main % size + set_all):
+                with self.subTest(size=size, source=source):
+                    code = compile_source(source, bounds_check=True)
+                    if size == 10:
+                        self.assertEqual(MipsSimulator(code).run(),
+                                         self.START + "9" + self.END)
+                        continue
+                    self.assertIsNone(code)
+                    self.assertEqual(len(Parser.diagnostics), 1)
+                    self.assertIn("expected an array of 10 elements, but "
+                                  "it has %d" % size,
+                                  Parser.diagnostics[0].to_dict()["message"])
+
+
+
+class TestMemoize(unittest.TestCase):
+    """
+    Compiles recursive functions with and without --memoize, and runs them
+    with parameters inside the memo tables, outside them, and negative.
+    """
+
+    # The memo table of a function, in .data
+    MEMO_TABLE = re.compile(r"^\w*memo\w*:\s*\.space\s", re.MULTILINE)
+
+    FIBONACCI = """
+        func fibonacci_r(n int) result int {
+            if (n < 1) {
+                result = 0;
+                return;
+            }
+            if (n < 3) {
+                result = 1;
+                return;
+            }
+            result = fibonacci_r(n - 1) + fibonacci_r(n - 2);
+            return;
+        }
+
+        func main() _ int {
+            var n int;
+            n = read_int();
+            while (n != 999) {
+                print(fibonacci_r(n), " ");
+                n = read_int();
+            }
+        }
+    """
+
+    CHOOSE = """
+        func choose(n int, k int) result int {
+            if (k < 1) {
+                result = 1;
+                return;
+            }
+            if (k > (n - 1)) {
+                result = 1;
+                return;
+            }
+            result = choose(n - 1, k - 1) + choose(n - 1, k);
+            return;
+        }
+
+        func main() _ int {
+            var n int;
+            var k int;
+            n = read_int();
+            while (n != 999) {
+                k = read_int();
+                print(choose(n, k), " ");
+                n = read_int();
+            }
+        }
+    """
+
+    def test_no_table_without_option(self):
+        self.assertIsNone(
+            self.MEMO_TABLE.search(compile_source(self.FIBONACCI)))
+
+
+
+    def test_pure_recursive_functions(self):
+        for source in (self.FIBONACCI, self.CHOOSE):
+            code = compile_source(source, memoize=True)
+            self.assertEqual(len(self.MEMO_TABLE.findall(code)), 1)
+
+
+
+    def test_impure_function(self):
+        # Printing makes fibonacci_r() impure
+        source = self.FIBONACCI.replace("result = 0;",
+                                        "result = 0;\n print(n);")
+        self.assertIsNone(
+            self.MEMO_TABLE.search(compile_source(source, memoize=True)))
+
+
+
+    def test_function_that_does_not_recurse(self):
+        source = self.FIBONACCI.replace(
+            "fibonacci_r(n - 1) + fibonacci_r(n - 2)", "n + n")
+        self.assertIsNone(
+            self.MEMO_TABLE.search(compile_source(source, memoize=True)))
+
+
+
+    def run_both(self, source, input_text):
+        """
+        Runs a program compiled without and with --memoize.
+        :return:    The two simulators, after they have run
+        """
+        simulators = []
+        for memoize in (False, True):
+            code = compile_source(source, memoize=memoize)
+            self.assertIsNotNone(code)
+            simulator = MipsSimulator(code, input_text)
+            simulator.output = simulator.run()
+            simulators.append(simulator)
+        return simulators
+
+
+
+    def test_fibonacci(self):
+        plain, memoized = self.run_both(self.FIBONACCI,
+                                        "-2\n0\n1\n2\n10\n18\n999\n")
+        self.assertIn("0 0 1 1 55 2584 ", plain.output)
+        self.assertEqual(memoized.output, plain.output)
+        self.assertLess(memoized.instruction_count,
+                        plain.instruction_count / 10)
+
+
+
+    def test_two_parameters(self):
+        # (40, 2) is outside the memo table, and so are the negative ones
+        plain, memoized = self.run_both(
+            self.CHOOSE, "16\n8\n40\n2\n-3\n1\n5\n-2\n-4\n-6\n999\n")
+        self.assertIn("12870 780 1 1 1 ", plain.output)
+        self.assertEqual(memoized.output, plain.output)
+        self.assertLess(memoized.instruction_count, plain.instruction_count)
+
+
+
+if __name__ == "__main__":
+    if "--save" in sys.argv[1:]:
+        os.makedirs(EXPECTED_DIR, exist_ok=True)
+        for kernel in sorted(KERNELS):
+            with open(os.path.join(EXPECTED_DIR, kernel + ".asm"), 'w') as f:
+                f.write(compile_kernel(kernel))
+        print("Saved the code for %d programs in %s" %
+              (len(KERNELS), EXPECTED_DIR))
+    else:
+        unittest.main()
@@ -0,0 +1,125 @@
+"""
+Filename: TestCompileServer.py
+Tested using Python 3.5.1
+
+David Dalcino
+CS 6110
+Prof. Reiter
+Winter 2017
+CSU East Bay
+
+This file tests CompileServer, by starting a server with one worker process
+on a Unix socket in a temporary directory, and sending it requests.
+
+Usage: python3 -m pytest TestCompileServer.py
+       python3 TestCompileServer.py
+"""
+
+import json
+import os
+import re
+import shutil
+import socket
+import tempfile
+import threading
+import unittest
+from CompileServer import CompileServer, send_request
+
+
+PROGRAM = """
+    func main() _ int {
+        var i int;
+        i = 0;
+        while (i < 3) {
+            print(i);
+            i = i + 1;
+        }
+    }
+"""
+
+# A line of the Parser's trace: nothing but production numbers
+TRACE_LINE = re.compile(r"^[\d ]+$", re.MULTILINE)
+
+
+
+class TestCompileServer(unittest.TestCase):
+    """
+    Sends requests to a server, and checks its responses.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.socket_path = os.path.join(cls.temp_dir, "gomm.sock")
+        cls.server = CompileServer(cls.socket_path, workers=1)
+        cls.thread = threading.Thread(target=cls.server.serve_forever)
+        cls.thread.start()
+
+
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.thread.join()
+        cls.server.server_close()
+        shutil.rmtree(cls.temp_dir)
+
+
+
+    def send_line(self, line):
+        """
+        Sends one line to the server, which need not be a valid request.
+        :param line:    The line, as bytes, without its newline
+        :return:        The response, as a dict
+        """
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(self.socket_path)
+            sock.sendall(line + b'\n')
+            with sock.makefile('rb') as f:
+                return json.loads(f.readline().decode("utf-8"))
+
+
+
+    def test_compile(self):
+        response = send_request(self.socket_path, {"source": PROGRAM})
+        self.assertTrue(response["ok"])
+        self.assertIn("main:", response["asm"])
+        self.assertEqual(response["errors"], [])
+        self.assertIsNone(TRACE_LINE.search(response["diagnostics"]))
+
+
+
+    def test_errors(self):
+        source = PROGRAM.replace("print(i);", "print(j);")
+        for json_diagnostics in (False, True):
+            with self.subTest(json_diagnostics=json_diagnostics):
+                response = send_request(self.socket_path, {
+                    "source": source,
+                    "options": {"json_diagnostics": json_diagnostics}})
+                self.assertFalse(response["ok"])
+                self.assertIsNone(response["asm"])
+                self.assertEqual(response["error_count"], 1)
+                error = response["errors"][0]
+                self.assertEqual((error["line"], error["length"]), (6, 1))
+                self.assertIsNone(TRACE_LINE.search(response["diagnostics"]))
+                self.assertEqual(error["message"] in response["diagnostics"],
+                                 not json_diagnostics)
+
+
+
+    def test_bad_requests(self):
+        for line in (b"not json", b"[]", b'"x"', b"3", b"null",
+                     b'{"source": "", "options": []}'):
+            with self.subTest(line=line):
+                response = self.send_line(line)
+                self.assertFalse(response["ok"])
+                self.assertTrue(
+                    response["diagnostics"].startswith("Bad request"))
+        # The server still answers
+        self.assertTrue(send_request(self.socket_path,
+                                     {"source": PROGRAM})["ok"])
+
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,204 @@
+"""
+Filename: TestDiagnostics.py
+Tested using Python 3.5.1
+
+David Dalcino
+CS 6110
+Prof. Reiter
+Winter 2017
+CSU East Bay
+
+This file tests where the compiler says each kind of error is. Every error
+has a line, a column, and a length; the token where the error was found
+ends at the column, and is length characters long, so an editor can
+underline exactly that token. It also tests that the compiler goes on past
+each error, and reports the errors after it.
+
+Usage: python3 -m pytest TestDiagnostics.py
+       python3 TestDiagnostics.py
+"""
+
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from ParseOptions import ParseOptions
+from ParserWithST import Parser
+
+
+# Programs with one error each, by the kind of error: the source, and the
+# line and the token the error must be reported at. A line of None is past
+# the last line.
+PROGRAMS = {
+    "undeclared variable": ("""func main() _ int {
+        var i int;
+        i = count + 1;
+    }
+    """, 3, "count"),
+    "redeclared variable": ("""func main() _ int {
+        var i int;
+        var i float;
+    }
+    """, 3, "i"),
+    "missing semicolon": ("""func main() _ int {
+        var i int;
+        i = 1
+        i = 2;
+    }
+    """, 4, "i"),
+    "no production": ("""func main() _ int {
+        var i int;
+        i = * 2;
+    }
+    """, 3, "*"),
+    "relational types": ("""func main() _ int {
+        var i int;
+        if (i < 2.0) { i = 1; }
+    }
+    """, 3, ")"),
+    "not a boolean": ("""func main() _ int {
+        var i int;
+        if (i) { i = 1; }
+    }
+    """, 3, ")"),
+    "not a function": ("""func main() _ int {
+        var i int;
+        i = i(2);
+    }
+    """, 3, "i"),
+    "wrong parameter": ("""func f(a int) b int {
+        b = a;
+    }
+    func main() _ int {
+        var i int;
+        i = f(1.5);
+    }
+    """, 6, "f"),
+    "end of file": ("""func main() _ int {
+        var i int;
+""", None, ""),
+}
+
+
+
+class TestDiagnostics(unittest.TestCase):
+    """
+    Compiles programs with errors in them, and checks where each error is
+    said to be.
+    """
+
+    def test_error_positions(self):
+        for kind, (source, line_number, token) in sorted(PROGRAMS.items()):
+            with self.subTest(kind=kind):
+                with contextlib.redirect_stdout(io.StringIO()):
+                    self.assertIsNone(Parser.compile_source(
+                        source, options=ParseOptions(
+                            print_trace=False, print_diagnostics=False)))
+                self.assertEqual(len(Parser.diagnostics), 1)
+                error = Parser.diagnostics[0].to_dict()
+                self.assertEqual(error["length"], len(token))
+                if line_number is None:
+                    self.assertGreater(error["line"], source.count("\n"))
+                    continue
+                self.assertEqual(error["line"], line_number)
+                line = source.split("\n")[line_number - 1]
+                self.assertEqual(line[error["column"] - error["length"]:
+                                      error["column"]], token)
+
+
+
+class TestRecovery(unittest.TestCase):
+    """
+    Compiles programs with more than one error in them.
+    """
+
+    def compile_errors(self, source):
+        """
+        Compiles a program that must not compile.
+        :param source:  The source code, as a str
+        :return:        The lines of the errors that were kept
+        """
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertIsNone(Parser.compile_source(
+                source, options=ParseOptions(print_trace=False,
+                                             print_diagnostics=False)))
+        return [error.to_dict()["line"] for error in Parser.diagnostics]
+
+
+
+    def test_every_error_is_reported(self):
+        source = """func f(a int) b int {
+            b = c;
+            b = a +;
+        }
+        func main() _ int {
+            var i int;
+            i = f(1.5);
+            if (i) { i = 1; }
+            i = j;
+        }
+        """
+        self.assertEqual(self.compile_errors(source), [2, 3, 7, 8, 9])
+
+
+
+    def test_call_to_function_with_bad_header(self):
+        # Neither function can be called, since its header has an error in
+        # it, but both calls are reported
+        source = """func f(n ( int) result int {
+            result = n;
+        }
+        func g(n int) int {
+            n = 1;
+        }
+        func main() _ int {
+            var x int;
+            x = f(1);
+            x = g(1);
+        }
+        """
+        self.assertEqual(self.compile_errors(source), [1, 4, 9, 10])
+        message = Parser.diagnostics[2].to_dict()["message"]
+        self.assertEqual(message, "Tried to call f(), but its declaration "
+                                  "had an error in it")
+
+
+
+    def test_errors_past_the_limit_are_counted(self):
+        extra = 5
+        source = "func main() _ int {\n    var i int;\n%s}\n" % (
+            "    i = j;\n" * (Parser.MAX_DIAGNOSTICS + extra))
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            self.assertIsNone(Parser.compile_source(
+                source, options=ParseOptions(print_trace=False)))
+        self.assertEqual(len(Parser.diagnostics), Parser.MAX_DIAGNOSTICS)
+        self.assertEqual(Parser.error_count, Parser.MAX_DIAGNOSTICS + extra)
+        self.assertEqual(output.getvalue().count("Exception occurred"),
+                         Parser.MAX_DIAGNOSTICS)
+        self.assertIn("\n%d more errors were found, but not shown" % extra,
+                      output.getvalue())
+
+
+
+    def test_no_code_after_an_error(self):
+        temp_dir = tempfile.mkdtemp()
+        try:
+            source_filename = os.path.join(temp_dir, "source.txt")
+            asm_filename = os.path.join(temp_dir, "source.asm")
+            with open(source_filename, 'w') as f:
+                f.write(PROGRAMS["undeclared variable"][0])
+            with contextlib.redirect_stdout(io.StringIO()):
+                self.assertFalse(Parser.parse(
+                    source_filename, asm_filename,
+                    ParseOptions(print_trace=False)))
+            self.assertEqual(os.listdir(temp_dir), ["source.txt"])
+        finally:
+            shutil.rmtree(temp_dir)
+
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,382 @@
+"""
+Filename: TestIncremental.py
+Tested using Python 3.5.1
+
+David Dalcino
+CS 6110
+Prof. Reiter
+Winter 2017
+CSU East Bay
+
+This file tests --incremental, which keeps the tokens of each file and the
+code generated for each function in a cache directory, and reuses them in
+the next compile. Whatever is taken from the cache, the code must be the
+same, byte for byte, as the code from a compile that starts with nothing.
+The same goes for an IncrementalParser, which parses only the functions
+that each edit touched. And the SignatureIndex, the quick first pass that
+finds each function's signature, must find the same signatures as the
+Parser.
+
+Usage: python3 -m pytest TestIncremental.py
+       python3 TestIncremental.py
+"""
+
+import collections
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from BenchmarkGeneratedCode import KERNEL_DIR, KERNELS, CONFIGURATIONS
+from ExpressionRecord import FunctionSignature
+from FunctionCache import FunctionCache
+from IncrementalParser import IncrementalParser
+from OutputFile import OutputFile
+from ParseOptions import ParseOptions
+from ParserWithST import Parser
+from SignatureIndex import SignatureIndex
+from TokenCache import TokenCache
+
+
+def forget_caches():
+    """
+    Empties the caches that are kept in memory, as if the compiler had just
+    been started, and resets their counts.
+    """
+    FunctionCache.entries = {}
+    FunctionCache.hits = FunctionCache.misses = 0
+    TokenCache.entries = collections.OrderedDict()
+    TokenCache.memory_used = 0
+    TokenCache.hits = TokenCache.misses = 0
+    SignatureIndex.cache = {}
+
+
+
+def compile_file(source_filename, incremental, **options):
+    """
+    Compiles a file, without printing anything.
+    :param source_filename: The name of the source file
+    :param incremental:     If True, the caches are used
+    :param options:         Keyword arguments for ParseOptions
+    :return:                The code, as a str, or None if it did not
+                            compile
+    """
+    asm_filename = os.path.splitext(source_filename)[0] + ".asm"
+    with contextlib.redirect_stdout(io.StringIO()):
+        success = Parser.parse(source_filename, asm_filename,
+                               ParseOptions(use_function_cache=incremental,
+                                            use_token_cache=incremental,
+                                            print_trace=False,
+                                            print_diagnostics=False,
+                                            **options))
+    if not success:
+        return None
+    with open(asm_filename, 'r') as f:
+        return f.read()
+
+
+
+class TestIncremental(unittest.TestCase):
+    """
+    Compiles the programs in testCodeGen with and without --incremental.
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.saved_dirs = (FunctionCache.cache_dir, SignatureIndex.cache_dir,
+                           TokenCache.cache_dir)
+        cache_dir = os.path.join(self.temp_dir, ".gommcache")
+        FunctionCache.cache_dir = cache_dir
+        SignatureIndex.cache_dir = cache_dir
+        TokenCache.cache_dir = cache_dir
+        forget_caches()
+
+
+
+    def tearDown(self):
+        FunctionCache.cache_dir, SignatureIndex.cache_dir, \
+            TokenCache.cache_dir = self.saved_dirs
+        forget_caches()
+        shutil.rmtree(self.temp_dir)
+
+
+
+    def copy_kernel(self, kernel):
+        """
+        :param kernel:  The name of a program, from KERNELS
+        :return:        The name of a copy of it, in the temporary directory
+        """
+        filename = os.path.join(self.temp_dir, kernel + ".txt")
+        shutil.copyfile(os.path.join(KERNEL_DIR, kernel + ".txt"), filename)
+        return filename
+
+
+
+    def test_warm_rebuild_is_identical(self):
+        for kernel in sorted(KERNELS):
+            filename = self.copy_kernel(kernel)
+            for name, options in sorted(CONFIGURATIONS.items()):
+                with self.subTest(kernel=kernel, configuration=name):
+                    cold = compile_file(filename, False, **options)
+                    self.assertIsNotNone(cold)
+                    # The first compile fills the cache directory, and the
+                    # second, in a "new process", reads it
+                    self.assertEqual(compile_file(filename, True, **options),
+                                     cold)
+                    forget_caches()
+                    self.assertEqual(compile_file(filename, True, **options),
+                                     cold)
+                    self.assertEqual(FunctionCache.misses, 0)
+                    self.assertGreater(FunctionCache.hits, 0)
+                    self.assertEqual(TokenCache.misses, 0)
+                    self.assertEqual(TokenCache.hits, 1)
+
+
+
+    def test_rebuild_after_edit_is_identical(self):
+        filename = self.copy_kernel("testRecurse")
+        self.assertIsNotNone(compile_file(filename, True))
+        with open(filename, 'r') as f:
+            source = f.read()
+        # Change a result in fibonacci_r(), whose signature stays the same,
+        # and then the parameters of factorial_r(), which main() calls
+        edits = [[("result = 1;", "result = 2;")],
+                 [("factorial_r(n int)", "factorial_r(n int, m int)"),
+                  ("factorial_r(n-1)", "factorial_r(n-1, m)"),
+                  ("factorial_r(n);", "factorial_r(n, 0);")]]
+        for edit in edits:
+            with self.subTest(edit=edit[0][1]):
+                for old, new in edit:
+                    self.assertIn(old, source)
+                    source = source.replace(old, new, 1)
+                with open(filename, 'w') as f:
+                    f.write(source)
+                forget_caches()
+                warm = compile_file(filename, True)
+                self.assertGreater(FunctionCache.hits, 0)
+                self.assertGreater(FunctionCache.misses, 0)
+                forget_caches()
+                self.assertEqual(warm, compile_file(filename, False))
+
+
+
+    def test_edit_that_breaks_a_header(self):
+        # main() calls fibonacci_r(), which can no longer be declared, so
+        # main() must be compiled again, and its call reported
+        filename = self.copy_kernel("testRecurse")
+        self.assertIsNotNone(compile_file(filename, True))
+        with open(filename, 'r') as f:
+            source = f.read()
+        with open(filename, 'w') as f:
+            f.write(source.replace("fibonacci_r(n int)",
+                                   "fibonacci_r(n ( int)"))
+        forget_caches()
+        self.assertIsNone(compile_file(filename, True))
+        errors = [ex.to_dict() for ex in Parser.diagnostics]
+        self.assertEqual(len(errors), 2)
+        self.assertIsNone(compile_file(filename, False))
+        self.assertEqual(errors, [ex.to_dict() for ex in Parser.diagnostics])
+
+
+
+    def test_cache_files(self):
+        filename = self.copy_kernel("testRecurse")
+        cold = compile_file(filename, False)
+        self.assertEqual(compile_file(filename, True), cold)
+        cache_dir = TokenCache.cache_dir
+        names = os.listdir(cache_dir)
+        self.assertEqual(sorted({os.path.splitext(name)[1]
+                                 for name in names}),
+                         [".func", ".sig", ".tokbin"])
+        # Files that were cut short, as a reader would have found them
+        # before they were written atomically, are compiled again
+        for name in names:
+            path = os.path.join(cache_dir, name)
+            with open(path, 'r+b') as f:
+                f.truncate(os.path.getsize(path) // 2)
+        forget_caches()
+        self.assertEqual(compile_file(filename, True), cold)
+        self.assertEqual(FunctionCache.hits, 0)
+        self.assertEqual(TokenCache.hits, 0)
+        # and saved again, whole, in place of the damaged ones
+        self.assertEqual(sorted(os.listdir(cache_dir)), sorted(names))
+        forget_caches()
+        self.assertEqual(compile_file(filename, True), cold)
+        self.assertEqual(FunctionCache.misses, 0)
+        self.assertEqual(TokenCache.misses, 0)
+
+
+
+class TestIncrementalParser(unittest.TestCase):
+    """
+    Edits a program through an IncrementalParser, and compiles it after each
+    edit, which must give the same code and errors as compiling the edited
+    program from the start.
+    """
+
+    # Each edit replaces the first copy of some text with another. Some of
+    # them break the program, and the next ones mend it.
+    EDITS = [
+        ("result = 0;", "result = 0;\n"),
+        ("result = 1;", "result = 3;"),
+        ("func factorial_r", "func double(n int) m int {\n"
+                             "    m = n + n;\n}\n\nfunc factorial_r"),
+        ("result = recurse(n);", "result = double(recurse(n));"),
+        ("m = n + n;", "m = n + n"),
+        ("m = n + n", "m = n + n;"),
+        ("n - 2", "k - 2"),
+        ("k - 2", "n - 2"),
+        ("func double", "func double_it"),
+        ("func double_it", "func double"),
+        ("}\n\n\nfunc main", "\n\n\nfunc main"),
+        ("\n\n\nfunc main", "}\n\n\nfunc main"),
+        ("fibonacci_r(n int)", "fibonacci_r(n ( int)"),
+        ("fibonacci_r(n ( int)", "fibonacci_r(n int)"),
+    ]
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        forget_caches()
+
+
+
+    def tearDown(self):
+        forget_caches()
+        shutil.rmtree(self.temp_dir)
+
+
+
+    def test_edits_match_full_compile(self):
+        filename = os.path.join(KERNEL_DIR, "testRecurse.txt")
+        asm_filename = os.path.join(self.temp_dir, "testRecurse.asm")
+        with open(filename, 'r') as f:
+            text = f.read()
+        session = IncrementalParser(filename)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertTrue(session.compile(asm_filename,
+                                            print_diagnostics=False))
+
+        for old, new in self.EDITS:
+            with self.subTest(edit=new):
+                self.assertIn(old, text)
+                start = len(text[:text.index(old)].encode("utf-8"))
+                session.edit(start, start + len(old.encode("utf-8")),
+                             new.encode("utf-8"))
+                text = text.replace(old, new, 1)
+
+                OutputFile.remove(asm_filename)
+                with contextlib.redirect_stdout(io.StringIO()):
+                    success = session.compile(asm_filename,
+                                              print_diagnostics=False)
+                    errors = [ex.to_dict() for ex in Parser.diagnostics]
+                    cold = Parser.compile_source(
+                        text, filename=filename,
+                        options=ParseOptions(print_trace=False,
+                                             print_diagnostics=False))
+                self.assertEqual(errors,
+                                 [ex.to_dict() for ex in Parser.diagnostics])
+                self.assertEqual(success, cold is not None)
+                if success:
+                    with open(asm_filename, 'r') as f:
+                        self.assertEqual(f.read(), cold)
+                self.assertLessEqual(session.reparsed, 2)
+
+
+
+class TestSignatureIndex(unittest.TestCase):
+    """
+    Compares the signatures that the SignatureIndex finds in a program with
+    the ones that the Parser finds, when it parses the program without the
+    index. Such a program must declare a function before it calls it.
+    """
+
+    # Prototypes, and headers broken over lines and interrupted by comments
+    SOURCE = """
+        proto total(values [10]int, count int) sum int;
+        proto scale
+            (x float,    # the value
+             factor float)
+            # the result
+            y float;
+        proto letter() c char;
+
+        func main() _ int {
+            var a [10]int;
+            print(total(a, 3), " ", scale(1.5, 2.0), " ", letter());
+        }
+
+        func total(values [10]int,   # only the first count are used
+                   count int) sum int {
+            sum = count;
+        }
+
+        func scale(x float, factor float) y float {
+            y = x * factor;
+        }
+
+        func letter
+        (
+        )
+        c
+        char {
+            c = 'a';
+        }
+    """
+
+    def setUp(self):
+        forget_caches()
+
+
+
+    def tearDown(self):
+        forget_caches()
+
+
+
+    def parsed_signatures(self, text):
+        """
+        Parses a program without the SignatureIndex.
+        :param text:    The source code, as a string
+        :return:        The signatures of the functions it defines, as
+                        sorted (identifier, param_list_types, param_sizes,
+                        return_type) tuples
+        """
+        with mock.patch.object(SignatureIndex, "for_text", return_value=[]):
+            with contextlib.redirect_stdout(io.StringIO()):
+                code = Parser.compile_source(
+                    text, options=ParseOptions(print_trace=False,
+                                               print_diagnostics=False))
+        self.assertIsNotNone(code)
+        return sorted((sig.identifier, sig.param_list_types,
+                       sig.param_sizes, sig.return_type)
+                      for sig in Parser.s_table.open_scopes[0].data.values()
+                      if isinstance(sig, FunctionSignature) and
+                      not sig.is_prototype)
+
+
+
+    def test_same_signatures_as_parser(self):
+        for kernel in sorted(KERNELS):
+            with open(os.path.join(KERNEL_DIR, kernel + ".txt"), 'r') as f:
+                text = f.read()
+            with self.subTest(kernel=kernel):
+                self.assertEqual(sorted(SignatureIndex.build(text)),
+                                 self.parsed_signatures(text))
+
+
+
+    def test_prototypes_and_split_headers(self):
+        signatures = self.parsed_signatures(self.SOURCE)
+        self.assertEqual([sig[0] for sig in signatures],
+                         ["letter", "main", "scale", "total"])
+        # Prototypes are not definitions, so each function is found
+        # once
+        self.assertEqual(sorted(SignatureIndex.build(self.SOURCE)),
+                         signatures)
+
+
+
+if __name__ == "__main__":
+    unittest.main()
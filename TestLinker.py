@@ -0,0 +1,182 @@
+"""
+Filename: TestLinker.py
+Tested using Python 3.5.1
+
+David Dalcino
+CS 6110
+Prof. Reiter
+Winter 2017
+CSU East Bay
+
+This file tests the Linker, by building programs split over several modules
+in a temporary directory. A module must only be compiled again when its
+source has changed, or when a function it calls no longer has the summary
+its code was made for; and modules that do not fit together must not be
+linked.
+
+Usage: python3 -m pytest TestLinker.py
+       python3 TestLinker.py
+"""
+
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from Errors import LinkError
+from Linker import Linker
+from MipsSimulator import MipsSimulator
+
+
+MAIN = """
+func main() _ int {
+    var n int;
+    n = 4;
+    print(square(n), " ");
+    print(n, "\\n");
+}
+"""
+
+# square() does not change its parameter, and then it does
+SQUARE = """
+func square(n int) result int {
+    result = n * n;
+}
+"""
+
+SQUARE_CHANGES_N = """
+func square(n int) result int {
+    result = n * n;
+    n = 0;
+}
+"""
+
+
+
+class TestLinker(unittest.TestCase):
+    """
+    Builds programs from modules, and runs them.
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.asm_filename = os.path.join(self.temp_dir, "program.asm")
+
+
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+
+
+    def write(self, name, text):
+        """
+        Writes a module in the temporary directory.
+        :param name:    The name of its source file
+        :param text:    Its source code
+        :return:        The full name of the source file
+        """
+        filename = os.path.join(self.temp_dir, name)
+        with open(filename, 'w') as f:
+            f.write(text)
+        return filename
+
+
+
+    def build(self, filenames):
+        """
+        Builds a program, without printing anything.
+        :param filenames:   The names of its modules' source files
+        :return:            The names of the modules that were compiled,
+                            sorted
+        """
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            self.assertTrue(Linker.build(filenames, self.asm_filename))
+        return sorted(os.path.basename(line.split()[-1])
+                      for line in output.getvalue().split("\n")
+                      if line.startswith("Parsing module "))
+
+
+
+    def run_program(self):
+        """ :return: What the program that was built prints """
+        with open(self.asm_filename, 'r') as f:
+            return MipsSimulator(f.read()).run()
+
+
+
+    def test_build(self):
+        filenames = [self.write("main.gomm", MAIN),
+                     self.write("square.gomm", SQUARE)]
+        self.assertEqual(self.build(filenames), ["main.gomm", "square.gomm"])
+        self.assertIn("16 4\n", self.run_program())
+        for filename in filenames:
+            base = Linker.base_filename(filename)
+            self.assertTrue(os.path.isfile(base + Linker.FRAGMENT_EXTENSION))
+            self.assertTrue(os.path.isfile(base +
+                                           Linker.INTERFACE_EXTENSION))
+
+
+
+    def test_relink(self):
+        filenames = [self.write("main.gomm", MAIN),
+                     self.write("square.gomm", SQUARE)]
+        self.build(filenames)
+        with open(self.asm_filename, 'r') as f:
+            code = f.read()
+        self.assertEqual(self.build(filenames), [])
+        with open(self.asm_filename, 'r') as f:
+            self.assertEqual(f.read(), code)
+
+
+
+    def test_changed_summary(self):
+        # square.gomm comes first, so that main() is compiled knowing
+        # square()'s summary, rather than assuming the worst about it
+        filenames = [self.write("square.gomm", SQUARE),
+                     self.write("main.gomm", MAIN)]
+        self.build(filenames)
+        self.assertIn("16 4\n", self.run_program())
+
+        # main() passed n to a function that left it alone; now it does
+        # not, so main() must be compiled again
+        self.write("square.gomm", SQUARE_CHANGES_N)
+        self.assertEqual(self.build(filenames), ["main.gomm", "square.gomm"])
+        self.assertIn("16 0\n", self.run_program())
+
+        # Only the body changes, and the summary stays the same
+        self.write("square.gomm", SQUARE_CHANGES_N.replace("n * n",
+                                                           "n * n + 1"))
+        self.assertEqual(self.build(filenames), ["square.gomm"])
+        self.assertIn("17 0\n", self.run_program())
+
+
+
+    def test_function_defined_twice(self):
+        filenames = [self.write("main.gomm", MAIN),
+                     self.write("square.gomm", SQUARE),
+                     self.write("square2.gomm", SQUARE)]
+        with self.assertRaises(LinkError) as context:
+            with contextlib.redirect_stdout(io.StringIO()):
+                Linker.build(filenames, self.asm_filename)
+        self.assertEqual(str(context.exception),
+                         "Function square is defined in modules square and "
+                         "square2")
+        self.assertFalse(os.path.exists(self.asm_filename))
+
+
+
+    def test_no_main(self):
+        filenames = [self.write("square.gomm", SQUARE)]
+        with self.assertRaises(LinkError) as context:
+            with contextlib.redirect_stdout(io.StringIO()):
+                Linker.build(filenames, self.asm_filename)
+        self.assertIn("No main function", str(context.exception))
+        self.assertFalse(os.path.exists(self.asm_filename))
+
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,177 @@
+"""
+Filename: TestOutputFile.py
+Tested using Python 3.5.1
+
+David Dalcino
+CS 6110
+Prof. Reiter
+Winter 2017
+CSU East Bay
+
+This file tests OutputFile, which writes a file through a temporary file,
+so that the real one is replaced in one step, or not at all.
+
+Usage: python3 -m pytest TestOutputFile.py
+       python3 TestOutputFile.py
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from OutputFile import OutputFile
+
+
+# A modification time well in the past, so that a file that is replaced
+# cannot keep it by chance
+OLD_TIME = 1000000000
+
+
+
+class TestOutputFile(unittest.TestCase):
+    """
+    Writes files with OutputFile, in a temporary directory.
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.temp_dir, "out.asm")
+
+
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+
+
+    def write_old(self, text):
+        """
+        Writes the file directly, and dates it OLD_TIME.
+        :param text:    What to write
+        """
+        with open(self.filename, 'w') as f:
+            f.write(text)
+        os.utime(self.filename, (OLD_TIME, OLD_TIME))
+
+
+
+    def read(self):
+        """ :return: What the file holds """
+        with open(self.filename, 'r') as f:
+            return f.read()
+
+
+
+    def assert_no_temporary_files(self):
+        self.assertEqual(os.listdir(self.temp_dir), ["out.asm"])
+
+
+
+    def test_new_file(self):
+        with OutputFile(self.filename) as f:
+            f.write("main:\n")
+        self.assertEqual(self.read(), "main:\n")
+        # The same permissions as a file made by open()
+        plain_filename = os.path.join(self.temp_dir, "plain.asm")
+        open(plain_filename, 'w').close()
+        self.assertEqual(os.stat(self.filename).st_mode & 0o777,
+                         os.stat(plain_filename).st_mode & 0o777)
+        os.remove(plain_filename)
+        self.assert_no_temporary_files()
+
+
+
+    def test_unchanged_file_keeps_its_time(self):
+        self.write_old("main:\n")
+        inode = os.stat(self.filename).st_ino
+        with OutputFile(self.filename) as f:
+            f.write("main:\n")
+        self.assertEqual(os.stat(self.filename).st_mtime, OLD_TIME)
+        self.assertEqual(os.stat(self.filename).st_ino, inode)
+        self.assert_no_temporary_files()
+
+
+
+    def test_changed_file_is_replaced(self):
+        # Same length, so the contents have to be compared
+        self.write_old("main:\n")
+        os.chmod(self.filename, 0o640)
+        with OutputFile(self.filename) as f:
+            f.write("exit:\n")
+        self.assertEqual(self.read(), "exit:\n")
+        self.assertNotEqual(os.stat(self.filename).st_mtime, OLD_TIME)
+        self.assertEqual(os.stat(self.filename).st_mode & 0o777, 0o640)
+        self.assert_no_temporary_files()
+
+
+
+    def test_binary_file(self):
+        with OutputFile(self.filename, binary=True) as f:
+            f.write(b"\x00\xff")
+        with open(self.filename, 'rb') as f:
+            self.assertEqual(f.read(), b"\x00\xff")
+        self.assert_no_temporary_files()
+
+
+
+    def test_exception_leaves_file(self):
+        self.write_old("main:\n")
+        with self.assertRaises(ValueError):
+            with OutputFile(self.filename) as f:
+                f.write("half")
+                raise ValueError("stopped")
+        self.assertEqual(self.read(), "main:\n")
+        self.assertEqual(os.stat(self.filename).st_mtime, OLD_TIME)
+        self.assert_no_temporary_files()
+
+
+
+    def test_discard_leaves_file(self):
+        self.write_old("main:\n")
+        with OutputFile(self.filename) as f:
+            f.write("exit:\n")
+            f.discard()
+        self.assertEqual(self.read(), "main:\n")
+        self.assert_no_temporary_files()
+
+
+
+    def test_discard_makes_no_file(self):
+        with OutputFile(self.filename) as f:
+            f.discard()
+        self.assertEqual(os.listdir(self.temp_dir), [])
+
+
+
+    def test_device_is_written_directly(self):
+        with OutputFile(os.devnull) as f:
+            f.write("main:\n")
+        self.assertIsNone(f.temp_filename)
+        self.assertEqual(os.listdir(self.temp_dir), [])
+
+
+
+    def test_remove(self):
+        self.write_old("main:\n")
+        OutputFile.remove(self.filename)
+        OutputFile.remove(self.filename)
+        self.assertEqual(os.listdir(self.temp_dir), [])
+
+
+
+    def test_write_cache_file(self):
+        cache_dir = os.path.join(self.temp_dir, "cache", "more")
+        OutputFile.write_cache_file(cache_dir, "entry.bin", b"\x00\xff")
+        self.assertEqual(os.listdir(cache_dir), ["entry.bin"])
+        with open(os.path.join(cache_dir, "entry.bin"), 'rb') as f:
+            self.assertEqual(f.read(), b"\x00\xff")
+
+        # A cache directory that cannot be made is not an error
+        self.write_old("main:\n")
+        OutputFile.write_cache_file(self.filename, "entry.bin", b"\x00")
+        self.assertEqual(self.read(), "main:\n")
+
+
+
+if __name__ == "__main__":
+    unittest.main()
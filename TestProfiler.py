@@ -0,0 +1,141 @@
+"""
+Filename: TestProfiler.py
+Tested using Python 3.5.1
+
+David Dalcino
+CS 6110
+Prof. Reiter
+Winter 2017
+CSU East Bay
+
+This file tests the Profiler, by compiling one of the programs in
+testCodeGen with GommCompiler.py --profile=json, and checking the report it
+writes: every phase must have a time, the times must add up to the total,
+and the counters must agree with the program that was compiled.
+
+Usage: python3 -m pytest TestProfiler.py
+       python3 TestProfiler.py
+"""
+
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from BenchmarkGeneratedCode import KERNEL_DIR
+from FileReader import FileReader
+from Profiler import Profiler
+from Scanner import Scanner
+from Token import TokenType
+
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# A program with several functions, whose code the peephole optimization
+# makes shorter
+KERNEL = "testRecursiveFib"
+
+
+
+def count_tokens(filename):
+    """
+    :param filename:    The name of a source file
+    :return:            How many tokens are in it, counting the end of file
+    """
+    count = 0
+    with FileReader(filename) as fr:
+        while True:
+            count += 1
+            if Scanner.get_token(fr).t_type is TokenType.EndOfFile:
+                return count
+
+
+
+class TestProfiler(unittest.TestCase):
+    """
+    Compiles a program with the Profiler on, and reads its report.
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.source_filename = os.path.join(self.temp_dir, KERNEL + ".txt")
+        shutil.copy(os.path.join(KERNEL_DIR, KERNEL + ".txt"),
+                    self.source_filename)
+
+
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+
+
+    def compile(self, *options):
+        """
+        Compiles the program with GommCompiler.py.
+        :param options:     Options for GommCompiler.py
+        :return:            The code, as a str
+        """
+        subprocess.check_call(
+            [sys.executable, os.path.join(SCRIPT_DIR, "GommCompiler.py")] +
+            list(options) + [self.source_filename],
+            cwd=SCRIPT_DIR, stdout=subprocess.DEVNULL)
+        with open(os.path.join(self.temp_dir, KERNEL + ".asm"), 'r') as f:
+            return f.read()
+
+
+
+    def test_json_report(self):
+        code = self.compile("--profile=json")
+        with open(os.path.join(self.temp_dir, KERNEL + ".profile.json"),
+                  'r') as f:
+            report = json.load(f)
+
+        self.assertEqual(report["name"], self.source_filename)
+        self.assertEqual(sorted(report["phases_ms"]),
+                         sorted(Profiler.PHASES))
+        for phase, ms in report["phases_ms"].items():
+            with self.subTest(phase=phase):
+                self.assertGreaterEqual(ms, 0)
+        for phase in ("file_reader", "scanner", "parser", "symbol_table",
+                      "code_generator", "code_output"):
+            with self.subTest(phase=phase):
+                self.assertGreater(report["phases_ms"][phase], 0)
+        # Each phase's time is rounded on its own
+        self.assertAlmostEqual(sum(report["phases_ms"].values()),
+                               report["total_ms"],
+                               delta=0.001 * len(Profiler.PHASES))
+
+        counters = report["counters"]
+        self.assertEqual(sorted(counters),
+                         sorted(Profiler.COUNTERS +
+                                ("instructions_emitted",
+                                 "instructions_eliminated")))
+        # Matching the end of file asks the Scanner for one more token
+        self.assertEqual(counters["tokens_scanned"],
+                         count_tokens(self.source_filename) + 1)
+        with open(self.source_filename, 'r') as f:
+            lines = f.read().count("\n")
+        self.assertGreaterEqual(counters["lines_read"], lines)
+        self.assertGreater(counters["productions_expanded"],
+                           counters["tokens_scanned"])
+        self.assertGreater(counters["symbol_lookups"], 0)
+        # Some instructions, like the ones that start the program, are not
+        # made by the Code Generator's code_gen()
+        instructions = len(re.findall(r"^\t[a-z]", code, re.MULTILINE))
+        self.assertGreater(counters["instructions_emitted"],
+                           instructions * 0.9)
+        self.assertLessEqual(counters["instructions_emitted"], instructions)
+        self.assertGreater(counters["instructions_eliminated"], 0)
+
+
+
+    def test_same_code_without_profiler(self):
+        self.assertEqual(self.compile("--profile=json"), self.compile())
+
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+"""
+Filename: TestProgramGenerator.py
+Tested using Python 3.5.1
+
+David Dalcino
+CS 6110
+Prof. Reiter
+Winter 2017
+CSU East Bay
+
+This file tests ProgramGenerator, whose programs must compile, and must
+always print the same thing. A program that reads a variable before setting
+it prints whatever was left in memory, so each program is run twice, with
+different garbage in the stack words it never wrote, and must print the
+same thing both times.
+
+Usage: python3 -m pytest TestProgramGenerator.py
+       python3 TestProgramGenerator.py
+"""
+
+import contextlib
+import io
+import unittest
+from MipsSimulator import MipsSimulator
+from ParseOptions import ParseOptions
+from ParserWithST import Parser
+from ProgramGenerator import ProgramGenerator
+
+
+SEEDS = range(20)       # The programs to generate
+SETTINGS = {"functions": 8, "depth": 3, "statements": 6}
+
+
+
+class GarbageStack(dict):
+    """
+    The MipsSimulator's stack, which holds a different value in each word
+    that was never written, instead of 0.
+    """
+
+    def __init__(self, salt):
+        """
+        :param salt:    Chooses the garbage
+        """
+        dict.__init__(self)
+        self.salt = salt
+
+
+
+    def get(self, address, default=None):
+        if address in self:
+            return self[address]
+        return (hash((address, self.salt)) & 0xffffffff) - 0x80000000
+
+
+
+class TestProgramGenerator(unittest.TestCase):
+    """
+    Generates programs, compiles them, and runs them.
+    """
+
+    def test_same_seed_same_program(self):
+        self.assertEqual(ProgramGenerator(seed=1, **SETTINGS).generate(),
+                         ProgramGenerator(seed=1, **SETTINGS).generate())
+
+
+
+    def test_programs_never_read_unset_memory(self):
+        for seed in SEEDS:
+            with self.subTest(seed=seed):
+                source = ProgramGenerator(seed=seed, **SETTINGS).generate()
+                with contextlib.redirect_stdout(io.StringIO()):
+                    code = Parser.compile_source(
+                        source, options=ParseOptions(
+                            print_trace=False, print_diagnostics=False))
+                self.assertIsNotNone(code)
+                outputs = []
+                for salt in (1, 2):
+                    simulator = MipsSimulator(code)
+                    simulator.stack = GarbageStack(salt)
+                    outputs.append(simulator.run())
+                self.assertEqual(outputs[0], outputs[1])
+
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,12 +1,165 @@
 __author__ = 'dave'
 
+import contextlib
+import io
 import os
+import tempfile
+import unittest
 import FileReader
 import SymbolTable
+from ParseOptions import ParseOptions
+from ParserWithST import Parser
 
 test_file_dir = "/home/dave/PycharmProjects/Compiler/testCode/"
 BUFFER_SIZE = 200
 
+
+
+class TestBindings(unittest.TestCase):
+    """
+    Tests that each identifier is bound to the value from the innermost open
+    scope that has it, and to the one outside it again once that scope
+    closes.
+    """
+
+    def setUp(self):
+        self.s_table = SymbolTable.SymbolTable()
+        self.s_table.insert("x", "global x")
+        self.s_table.insert("y", "global y")
+
+
+
+    def test_inner_binding_shadows_outer(self):
+        self.s_table.open_scope()
+        self.assertTrue(self.s_table.insert("x", "inner x"))
+        self.assertEqual(self.s_table.find_in_all_scopes("x"), "inner x")
+        self.assertEqual(self.s_table.find_in_all_scopes("y"), "global y")
+        self.assertEqual(self.s_table.find("x"), "inner x")
+        self.assertIsNone(self.s_table.find("y"))
+
+
+
+    def test_closing_scope_restores_binding(self):
+        self.s_table.open_scope()
+        self.s_table.insert("x", "inner x")
+        self.s_table.insert("z", "inner z")
+        self.s_table.open_scope()
+        self.s_table.insert("x", "innermost x")
+        self.assertEqual(self.s_table.bindings["x"],
+                         ["global x", "inner x", "innermost x"])
+
+        self.s_table.close_scope()
+        self.assertEqual(self.s_table.find_in_all_scopes("x"), "inner x")
+        self.s_table.close_scope()
+        self.assertEqual(self.s_table.find_in_all_scopes("x"), "global x")
+        self.assertIsNone(self.s_table.find_in_all_scopes("z"))
+        self.assertNotIn("z", self.s_table.bindings)
+
+
+
+    def test_insert_twice_in_one_scope(self):
+        self.assertFalse(self.s_table.insert("x", "another x"))
+        self.assertEqual(self.s_table.bindings["x"], ["global x"])
+        self.assertFalse(self.s_table.insert("print", "a variable"))
+        self.assertNotIn("print", self.s_table.bindings)
+
+
+
+    def test_global_scope_cannot_close(self):
+        with self.assertRaises(SymbolTable.SymbolTable.
+                               CloseGlobalScopeException):
+            self.s_table.close_scope()
+        self.assertEqual(self.s_table.find_in_all_scopes("x"), "global x")
+
+
+
+class TestClosedScopePolicy(unittest.TestCase):
+    """
+    Tests what each closed scope policy keeps of a scope once it is closed.
+    Under every policy, the scope's identifiers can no longer be found.
+    """
+
+    def fill(self, s_table):
+        """
+        Opens and closes two scopes inside the global scope.
+        :param s_table: A new SymbolTable
+        """
+        s_table.insert("main", "global main")
+        for name in ("a", "b"):
+            s_table.open_scope()
+            s_table.insert(name, "local " + name)
+            s_table.insert("main", "local main")
+            s_table.close_scope()
+        self.assertEqual(s_table.closed_scope_count, 2)
+        self.assertEqual(len(s_table.open_scopes), 1)
+        for name in ("a", "b"):
+            self.assertIsNone(s_table.find_in_all_scopes(name))
+        self.assertEqual(s_table.find_in_all_scopes("main"), "global main")
+
+
+
+    def test_discard(self):
+        s_table = SymbolTable.SymbolTable(SymbolTable.SymbolTable.DISCARD)
+        self.fill(s_table)
+        self.assertEqual(s_table.closed_scopes, [])
+
+
+
+    def test_compact(self):
+        s_table = SymbolTable.SymbolTable(SymbolTable.SymbolTable.COMPACT)
+        self.fill(s_table)
+        self.assertEqual(s_table.closed_scopes,
+                         ["Scope 1:\n[a]=local a, [main]=local main\n",
+                          "Scope 2:\n[b]=local b, [main]=local main\n"])
+
+
+
+    def test_dump(self):
+        dump_file = io.StringIO()
+        s_table = SymbolTable.SymbolTable(SymbolTable.SymbolTable.DUMP,
+                                          dump_file)
+        self.fill(s_table)
+        self.assertEqual(s_table.closed_scopes, [])
+        s_table.dump_open_scopes()
+        self.assertEqual(dump_file.getvalue(),
+                         "Scope 1:\n[a]=local a, [main]=local main\n\n"
+                         "Scope 2:\n[b]=local b, [main]=local main\n\n"
+                         "Scope 0:\n[main]=global main\n\n")
+
+
+
+    def test_symbol_dump_file(self):
+        source = """func square(n int) result int {
+            result = n * n;
+        }
+
+        func main() _ int {
+            var x int;
+            x = square(3);
+            if (x > 1) {
+                var y int;
+                y = x;
+            }
+        }
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            dump_filename = os.path.join(temp_dir, "program.sym")
+            with contextlib.redirect_stdout(io.StringIO()):
+                code = Parser.compile_source(
+                    source, options=ParseOptions(
+                        print_trace=False, print_diagnostics=False,
+                        symbol_dump_filename=dump_filename))
+            self.assertIsNotNone(code)
+            with open(dump_filename, 'r') as f:
+                scopes = f.read().split("\n\n")
+        # Each scope is written when it closes, and the global scope last
+        self.assertEqual(scopes, [
+            "Scope 1:\n[n]=INT @4, [result]=INT @8",
+            "Scope 3:\n[y]=INT @-16",
+            "Scope 2:\n[_]=INT @4, [x]=INT @-8",
+            "Scope 0:\n[main]=main() INT, [square]=square(INT) INT",
+            ""])
+
 if __name__ == "__main__":
     for f in os.listdir(test_file_dir):
         filename = test_file_dir + f
@@ -0,0 +1,170 @@
+"""
+Filename: TestTokenDump.py
+Tested using Python 3.5.1
+
+David Dalcino
+CS 6110
+Prof. Reiter
+Winter 2017
+CSU East Bay
+
+This file tests TokenStream.rescan(), which scans only the part of a source
+file that an edit could have changed. After any edit, the tokens must be the
+same as the tokens from scanning the whole edited file, so it makes edits to
+the programs in testCodeGen, some chosen and some random, one after another,
+and compares them after each one.
+
+Usage: python3 -m pytest TestTokenDump.py
+       python3 TestTokenDump.py
+"""
+
+import os
+import random
+import unittest
+from BenchmarkGeneratedCode import KERNEL_DIR, KERNELS
+from Scanner import Scanner
+from TokenDump import TokenDump, TokenStream
+
+
+RANDOM_EDITS = 200      # How many random edits to make to each program
+SEED = 6110             # So that a failure can be made to happen again
+
+# Text that the edits insert: pieces of tokens, and text that starts or ends
+# comments, strings and char literals, so that an edit can join two tokens,
+# split one, or change how much of the file is a comment or a string
+FRAGMENTS = ["", " ", "\n", "x", "_1", "42", "3.5", "=", "!", "<", "(",
+             "}", "{", "#", "# x\n", '"', '" "', "'", "'a'", "func", "if",
+             "é"]
+
+
+
+# Each edit replaces the first copy of some text with another: it joins two
+# tokens, splits one, or changes how much of the file is a comment or a
+# string. The last one adds a character the Scanner does not accept.
+EDITS = [
+    ("result = 1;", "result = 12;"),
+    ("result = 12;", "result=12 ;"),
+    ("func main", "func_main"),
+    ("func_main", "func main"),
+    ("result=12 ;", "# result=12 ;"),
+    ("# result=12 ;", "result = 1;"),
+    ("result = 1;", 'result = "1;"'),
+    ('result = "1;"', "result = 1;"),
+    ("result = 1;", "result = 1; é"),
+]
+
+
+
+def scan(name, text):
+    """
+    :param name:    The name of the source, for error messages
+    :param text:    The source, as a str
+    :return:        A TokenStream of its tokens, scanned from the start, or
+                    None if it has a character the Scanner does not accept
+    """
+    source = text.encode("utf-8")
+    try:
+        return TokenStream(TokenDump.dumps(name, source), source)
+    except Scanner.IllegalCharacterError:
+        return None
+
+
+
+class TestRescan(unittest.TestCase):
+    """
+    Compares TokenStream.rescan() with scanning the whole file.
+    """
+
+    def assert_same_tokens(self, stream, expected, first, old_stop,
+                           new_stop, old_count):
+        """
+        :param stream:      The TokenStream from rescan()
+        :param expected:    The TokenStream from scanning the whole file
+        :param first:       What rescan() said; see TokenStream.rescan()
+        :param old_stop:
+        :param new_stop:
+        :param old_count:   The number of tokens before the edit
+        """
+        self.assertEqual(bytes(stream.source), bytes(expected.source))
+        self.assertEqual(stream.count, expected.count)
+        self.assertEqual(list(stream.records), list(expected.records))
+        self.assertLessEqual(first, new_stop)
+        self.assertEqual(stream.count - new_stop, old_count - old_stop)
+
+
+
+    def test_edits(self):
+        with open(os.path.join(KERNEL_DIR, "testRecurse.txt"), 'r') as f:
+            text = f.read()
+        stream = scan("testRecurse", text)
+        self.assertIsNotNone(stream)
+        for old, new in EDITS:
+            with self.subTest(edit=new):
+                self.assertIn(old, text)
+                start = text.index(old)
+                new_text = text.replace(old, new, 1)
+                expected = scan("testRecurse", new_text)
+                byte_start = len(text[:start].encode("utf-8"))
+                byte_end = byte_start + len(old.encode("utf-8"))
+                if expected is None:
+                    with self.assertRaises(Scanner.IllegalCharacterError):
+                        stream.rescan(byte_start, byte_end,
+                                      new.encode("utf-8"))
+                    continue
+                new_stream, first, old_stop, new_stop = stream.rescan(
+                    byte_start, byte_end, new.encode("utf-8"))
+                self.assert_same_tokens(new_stream, expected, first,
+                                        old_stop, new_stop, stream.count)
+                text, stream = new_text, new_stream
+
+
+
+    def test_random_edits(self):
+        rand = random.Random(SEED)
+        for kernel in sorted(KERNELS):
+            with open(os.path.join(KERNEL_DIR, kernel + ".txt"), 'r') as f:
+                text = f.read()
+            stream = scan(kernel, text)
+            self.assertIsNotNone(stream)
+            for n in range(RANDOM_EDITS):
+                # Offsets are chosen in characters, so that an edit never
+                # splits one; the file keeps its last newline
+                start = rand.randrange(len(text))
+                end = min(start + rand.choice((0, 0, 1, 2, 5)),
+                          len(text) - 1)
+                replacement = rand.choice(FRAGMENTS)
+                new_text = text[:start] + replacement + text[end:]
+
+                with self.subTest(kernel=kernel, edit=n, start=start,
+                                  end=end, replacement=replacement):
+                    expected = scan(kernel, new_text)
+                    byte_start = len(text[:start].encode("utf-8"))
+                    byte_end = len(text[:end].encode("utf-8"))
+                    if expected is None:
+                        with self.assertRaises(Scanner.IllegalCharacterError):
+                            stream.rescan(byte_start, byte_end,
+                                          replacement.encode("utf-8"))
+                        continue
+                    new_stream, first, old_stop, new_stop = stream.rescan(
+                        byte_start, byte_end, replacement.encode("utf-8"))
+                    self.assert_same_tokens(new_stream, expected, first,
+                                            old_stop, new_stop, stream.count)
+                    text, stream = new_text, new_stream
+
+
+
+    def test_comment_at_end_of_file(self):
+        # The whitespace after the last comment used to be read past the
+        # end of the file
+        text = "func main() _ int {\n}\n# The end\n\n  \n"
+        stream = scan("comment", text)
+        self.assertIsNotNone(stream)
+        expected = scan("comment", text.rstrip() + "\n")
+        # The same tokens, but for where the end of the file is
+        self.assertEqual(list(stream.records)[:-2],
+                         list(expected.records)[:-2])
+
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -136,6 +136,17 @@ class Token:
 
 
 
+    def length(self):
+        """
+        :return:    How many characters of the source the token was scanned
+                    from, or 0 for the end of the file
+        """
+        if self.t_type == TokenType.EndOfFile:
+            return 0
+        return len(self.lexeme)
+
+
+
     def assignTo(self, other_token):
         """
         Copies the data in other_token into this token
@@ -0,0 +1,346 @@
+"""
+Filename: TokenCache.py
+Tested using Python 3.5.1
+
+David Dalcino
+CS 6110
+Prof. Reiter
+Winter 2017
+CSU East Bay
+
+This file implements TokenCache, which remembers the tokens the Scanner
+found in each file, so that a file that has not changed since it was last
+scanned does not need to be scanned again; and TokenReader, which hands
+those tokens to the Parser in place of a FileReader.
+
+The tokens are kept as token dumps (see TokenDump.py), keyed by the hash of
+the file's contents. Dumps are kept in memory, in a least recently used
+list that holds at most TokenCache.max_memory bytes; this helps a process
+that compiles the same files again and again, like a CompileServer worker.
+If TokenCache.cache_dir is set, they are also saved there, so that they
+survive from one run of the compiler to the next.
+
+A TokenReader answers the same questions a FileReader does (where the last
+token ended, and what line it was on), so the Parser's error messages, and
+the source lines it copies into the generated code as comments, are the
+same whether or not the tokens came from the cache.
+"""
+
+import bisect
+import hashlib
+import os
+import re
+from collections import OrderedDict
+from FileReader import FileReader, StringLines
+from OutputFile import OutputFile
+from Scanner import Scanner
+from Token import Token, TokenType
+from TokenDump import TokenDump, TokenStream
+
+
+class TokenCache:
+    """
+    A static class that remembers the tokens in each file it has scanned.
+    """
+
+    #################################################################
+    # STATIC DATA MEMBERS
+
+    entries = OrderedDict() # Pairs the hash of a file's contents with its
+                            # token dump, least recently used first
+    memory_used = 0         # The total size of the dumps in entries, in bytes
+    max_memory = 16 * 1024 * 1024   # The most bytes that entries may hold
+    cache_dir = None        # If not None, a directory where dumps are saved
+                            # between runs
+    hits = 0                # How many files were read from the cache, and
+    misses = 0              # how many were scanned
+
+    #################################################################
+    # STATIC CONSTANT DATA
+
+    # Part of every key. Change it whenever the Scanner or the dump format
+    # changes, so that dumps saved by an older compiler are not used.
+    VERSION = "1"
+
+
+
+    #################################################################
+    # STATIC MEMBER FUNCTIONS
+
+    @staticmethod
+    def reader(filename, text=None):
+        """
+        :param filename:    The name of a Go-- source file
+        :param text:        The file's contents, as a str, if they are not
+                            to be read from the file
+        :return:            A TokenReader over the file's tokens, taken from
+                            the cache or scanned and saved in it; or a
+                            FileReader, if the file cannot be scanned, so
+                            that the Parser reports the error where it is
+        """
+        if text is None:
+            source = TokenDump.read_source(filename)
+        else:
+            source = text.encode("utf-8")
+        digest = hashlib.sha1(source).digest()
+        key = TokenCache.VERSION + "-" + digest.hex()
+
+        data = TokenCache.entries.get(key)
+        if data is not None:
+            TokenCache.entries.move_to_end(key)
+        else:
+            data = TokenCache.load(key)
+            if data is not None:
+                TokenCache.remember(key, data)
+        if data is not None:
+            try:
+                stream = TokenStream(data, source, digest)
+                TokenCache.hits += 1
+                return TokenReader(stream)
+            except TokenDump.FormatError:
+                # A damaged dump; scan the file again
+                TokenCache.forget(key)
+
+        try:
+            data = TokenDump.dumps(filename, source)
+        except Scanner.IllegalCharacterError:
+            if text is None:
+                return FileReader(filename)
+            return FileReader(filename, StringLines(text))
+        TokenCache.misses += 1
+        TokenCache.remember(key, data)
+        TokenCache.save(key, data)
+        return TokenReader(TokenStream(data, source, digest))
+
+
+
+    @staticmethod
+    def remember(key, data):
+        """
+        Keeps a dump in memory, and forgets the least recently used dumps
+        until the rest fit in max_memory.
+        :param key:     The key of the dump
+        :param data:    The dump
+        """
+        TokenCache.entries[key] = data
+        TokenCache.memory_used += len(data)
+        while TokenCache.memory_used > TokenCache.max_memory and \
+                TokenCache.entries:
+            unused, oldest = TokenCache.entries.popitem(last=False)
+            TokenCache.memory_used -= len(oldest)
+
+
+
+    @staticmethod
+    def forget(key):
+        """
+        Forgets a dump, if it is kept in memory.
+        :param key:     The key of the dump
+        """
+        data = TokenCache.entries.pop(key, None)
+        if data is not None:
+            TokenCache.memory_used -= len(data)
+
+
+
+    @staticmethod
+    def load(key):
+        """
+        Loads a dump from TokenCache.cache_dir.
+        :param key:     The key of the dump
+        :return:        The dump, or None if it was not saved
+        """
+        if TokenCache.cache_dir is None:
+            return None
+        path = os.path.join(TokenCache.cache_dir, key + TokenDump.EXTENSION)
+        try:
+            with open(path, 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+
+
+    @staticmethod
+    def save(key, data):
+        """
+        Saves a dump in TokenCache.cache_dir, if it is set.
+        :param key:     The key of the dump
+        :param data:    The dump
+        """
+        if TokenCache.cache_dir is None:
+            return
+        OutputFile.write_cache_file(TokenCache.cache_dir,
+                                    key + TokenDump.EXTENSION, data)
+
+
+
+class TokenReader:
+    """
+    Hands the tokens in a TokenStream to the Scanner, one at a time, in place
+    of a FileReader. Scanner.get_token() calls next_token() instead of
+    running its DFA when it is given a TokenReader.
+    """
+
+    # The TokenType for each type id in a dump
+    TOKEN_TYPES = {token_type.value: token_type for token_type in TokenType}
+
+    def __init__(self, stream):
+        """
+        Constructor for a TokenReader.
+        :param stream:  A TokenStream of the tokens in a file
+        """
+        self.stream = stream
+        self.source = stream.source.obj     # The file's contents, as bytes
+        self.text = self.source.decode("utf-8")
+        # If the file is plain ASCII, byte offsets are character offsets
+        self.is_ascii = len(self.text) == len(self.source)
+        self.index = 0          # The index of the next token to return
+        self.end = 0            # The byte offset just after the last token
+        self.line_starts = None # The byte offset of each line, when needed
+
+
+
+    def __enter__(self):
+        """ Allows 'with ... as ...' syntax, like a FileReader """
+        return self
+
+
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """ There is no file to close """
+        pass
+
+
+
+    def next_token(self):
+        """
+        :return:    The next token in the file, as a Token object. After the
+                    last one, EndOfFile is returned again.
+        """
+        records = self.stream.records
+        i = self.index * TokenDump.FIELDS
+        token_type = TokenReader.TOKEN_TYPES[records[i]]
+        start = records[i + 1]
+        self.end = start + records[i + 2]
+        if token_type is TokenType.EndOfFile:
+            return Token(token_type, "End Of File")
+        self.index += 1
+        if self.is_ascii:
+            return Token(token_type, self.text[start:self.end])
+        return Token(token_type, self.source[start:self.end].decode("utf-8"))
+
+
+
+    def skip_to(self, line_number, column):
+        """
+        Skips ahead, so that the next token returned is the first one at or
+        after the given position.
+        :param line_number: The line number of the position
+        :param column:      The column of the position
+        """
+        offset = self.get_line_starts()[line_number - 1] + column
+        if not self.is_ascii:
+            offset = self.get_line_starts()[line_number - 1] + len(
+                self.line_text(line_number - 1)[:column].encode("utf-8"))
+        self.index = bisect.bisect_left(
+            self.stream.records[1::TokenDump.FIELDS], offset,
+            self.index, len(self.stream) - 1)
+
+
+
+    def get_line_starts(self):
+        """
+        :return:    A list of the byte offset where each line starts. If the
+                    file does not end with a newline, there is an empty line
+                    at the end of the list, as the FileReader sees it.
+        """
+        if self.line_starts is None:
+            self.line_starts = [0] + [match.end() for match in
+                                      re.finditer(b"\n", self.source)]
+            if self.source and not self.source.endswith(b"\n"):
+                self.line_starts.append(len(self.source))
+        return self.line_starts
+
+
+
+    def line_text(self, line):
+        """
+        :param line:    The index of a line in get_line_starts()
+        :return:        The text of the line, with its newline
+        """
+        line_starts = self.get_line_starts()
+        if line + 1 < len(line_starts):
+            return self.source[line_starts[line]:line_starts[line + 1]] \
+                .decode("utf-8")
+        return self.source[line_starts[line]:].decode("utf-8")
+
+
+
+    def get_position(self):
+        """
+        :return:    A (line number, column, line) tuple for the position just
+                    after the last token, like FileReader.get_position()
+        """
+        line_number, column, line = self.position_of(self.end)
+        if self.end == len(self.source) and self.reads_last_newline_twice():
+            # So the FileReader counts one more line at the end of the file
+            line_number += 1
+        return line_number, column, line
+
+
+
+    def reads_last_newline_twice(self):
+        """
+        :return:    True if the FileReader reads the newline at the end of
+                    the file twice. After a token or a comment, the Scanner
+                    reads one more character and puts it back; if that is
+                    the last newline, or the end of the file, the FileReader
+                    has already moved past the last line, and moves on again
+                    after reading the newline the second time.
+        """
+        if not self.source.endswith(b"\n"):
+            return False
+        records = self.stream.records
+        last = (len(self.stream) - 2) * TokenDump.FIELDS
+        end = -1        # The end of the last token or comment, if any
+        if last >= 0:
+            end = records[last + 1] + records[last + 2]
+        # Only whitespace and comments follow the last token
+        comment = self.source.rfind(b"#", max(end, 0))
+        if comment >= 0:
+            end = self.source.find(b"\n", comment) + 1
+        return end >= len(self.source) - 1
+
+
+
+    def position_of(self, offset):
+        """
+        :param offset:  A byte offset in the file
+        :return:        A (line number, column, line) tuple for the offset,
+                        like FileReader.get_position()
+        """
+        line_starts = self.get_line_starts()
+        line = bisect.bisect_right(line_starts, offset) - 1
+        text = self.line_text(line)
+        column = offset - line_starts[line]
+        if not self.is_ascii:
+            column = len(self.source[line_starts[line]:offset]
+                         .decode("utf-8"))
+        return line + 1, column, text
+
+
+
+    @property
+    def current_line(self):
+        """
+        :return:    The line the FileReader would be on after the last token.
+                    The Scanner always reads one character past a token, and
+                    puts it back; if that character ends a line, the
+                    FileReader has already moved on to the next line.
+        """
+        end = self.end
+        if end < len(self.source) and self.source[end] == ord("\n"):
+            end += 1
+        return self.line_text(bisect.bisect_right(self.get_line_starts(),
+                                                  end) - 1)
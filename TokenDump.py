@@ -0,0 +1,472 @@
+"""
+Filename: TokenDump.py
+Tested using Python 3.5.1
+
+David Dalcino
+CS 6110
+Prof. Reiter
+Winter 2017
+CSU East Bay
+
+This file implements TokenDump, which scans a Go-- source file and saves
+its tokens in a compact binary format, and TokenStream, which loads them
+again. Tools that only need the tokens in a file, like formatters and
+indexers, can scan it once and then read the dump, without running the
+Scanner's DFA again.
+
+Scanner.scan_file() prints every token, and writes it to a text file; that
+is fine for reading, but slow, and hard for another program to use. A dump
+is a header, followed by one record for each token:
+    header:     MAGIC (8 bytes), the SHA-1 hash of the source (20 bytes),
+                and the number of tokens (4 bytes)
+    record:     the token's type, the offset of its first byte in the
+                source, and its length in bytes, as three 4-byte integers
+All integers are little-endian. Offsets and lengths are counted in the
+source as UTF-8 bytes, after its newlines are translated the way the
+FileReader reads them. The last token is always EndOfFile, with a length
+of 0. Comments are not in the dump, since the Scanner filters them out.
+
+A TokenStream keeps the source as bytes, and views the records in place,
+so the lexemes it returns are memoryviews over the source; nothing is
+copied until a lexeme is turned into a str.
+
+After an edit, TokenStream.rescan() runs the Scanner only over the part of
+the source the edit could have changed. No token depends on anything
+before it, and the Scanner looks only one character past the end of a
+token, so every token that ends before the edit stays the same; scanning
+starts again where the last of those ends. Between tokens, the DFA is
+always in its Start state, so once a new token starts after the edit at
+the same place (relative to the end of the edit) as an old one did, the
+rest of the tokens are the same as before, only moved, and scanning stops.
+Comments, strings and char literals need no special care this way: even
+one that the edit opens or closes is scanned again, up to the first token
+after it that lines up.
+
+Usage: python3 TokenDump.py [--print] source_file [dump_file]
+"""
+
+import bisect
+import hashlib
+import struct
+import sys
+from array import array
+from FileReader import FileReader, StringLines
+from Scanner import Scanner
+from Token import TokenType
+
+
+class TokenDump:
+    """
+    A static class that scans source files into token dumps.
+    """
+
+    #################################################################
+    # STATIC CONSTANT DATA
+
+    MAGIC = b"GOMMTOK\x01"  # The first bytes of every dump
+    HEADER = struct.Struct("<8s20sI")   # MAGIC, source hash, token count
+    HEADER_SIZE = HEADER.size
+    FIELDS = 3              # Integers in each record: type, offset, length
+    EXTENSION = ".tokbin"   # Added to a source filename to name its dump
+
+
+
+    #################################################################
+    # STATIC MEMBER FUNCTIONS
+
+    @staticmethod
+    def read_source(source_filename):
+        """
+        :param source_filename: The name of a Go-- source file
+        :return:                The file's contents as UTF-8 bytes, with its
+                                newlines translated the way the FileReader
+                                reads them
+        """
+        with open(source_filename, 'r') as f:
+            return f.read().encode("utf-8")
+
+
+
+    @staticmethod
+    def scan(source_filename, file=None):
+        """
+        Scans a file, without printing anything.
+        :param source_filename: The name of a Go-- source file
+        :param file:            If not None, an open file with the source
+                                code, to read instead of source_filename
+        :return:                An array of ints, with three for each token
+                                in the file: its type, the offset of its
+                                first character, and its length, both
+                                counted in characters
+        """
+        records = array('i')
+        end_of_file = TokenType.EndOfFile
+        with FileReader(source_filename, file) as fr:
+            while True:
+                token = Scanner.get_token(fr)
+                if token.t_type is end_of_file:
+                    records.extend((end_of_file.value, fr.get_offset(), 0))
+                    return records
+                # The lexeme is exactly what the Scanner read, so it ends
+                # where the FileReader is now
+                length = len(token.lexeme)
+                records.extend((token.t_type.value,
+                                fr.get_offset() - length, length))
+
+
+
+    @staticmethod
+    def dumps(source_filename, source=None):
+        """
+        Scans a file, and makes a dump of its tokens.
+        :param source_filename: The name of a Go-- source file
+        :param source:          The file's contents, from read_source(), if
+                                they have already been read. They are
+                                scanned instead of the file, so they may
+                                also be an edited version of it that has
+                                not been saved.
+        :return:                The dump, as bytes
+        :raises Scanner.IllegalCharacterError: If the file has a character
+                                that the Scanner does not accept
+        """
+        if source is None:
+            source = TokenDump.read_source(source_filename)
+        text = source.decode("utf-8")
+        records = TokenDump.scan(source_filename, StringLines(text))
+        if len(source) != len(text):
+            TokenDump.to_byte_offsets(records, text)
+        return TokenDump.pack(records, source)
+
+
+
+    @staticmethod
+    def pack(records, source):
+        """
+        :param records: An array of records, with offsets and lengths
+                        counted in bytes. On a big-endian machine, its
+                        bytes are swapped.
+        :param source:  The source the records were scanned from, as UTF-8
+                        bytes
+        :return:        A dump of the records, as bytes
+        """
+        if sys.byteorder != "little":
+            records.byteswap()
+        header = TokenDump.HEADER.pack(
+            TokenDump.MAGIC, hashlib.sha1(source).digest(),
+            len(records) // TokenDump.FIELDS)
+        return header + records.tobytes()
+
+
+
+    @staticmethod
+    def dump(source_filename, dump_filename=None):
+        """
+        Scans a file, and writes a dump of its tokens.
+        :param source_filename: The name of a Go-- source file
+        :param dump_filename:   The name of the file to write the dump to. If
+                                unassigned, this will be the source filename
+                                with EXTENSION appended
+        :return:                The name of the dump file
+        """
+        if not dump_filename:
+            dump_filename = source_filename + TokenDump.EXTENSION
+        data = TokenDump.dumps(source_filename)
+        with open(dump_filename, 'wb') as f:
+            f.write(data)
+        return dump_filename
+
+
+
+    @staticmethod
+    def to_byte_offsets(records, text):
+        """
+        Changes the offsets and lengths in a list of records from characters
+        to UTF-8 bytes. Only needed when the source is not plain ASCII.
+        :param records: An array of records, as made by scan()
+        :param text:    The source the records were scanned from, as a str
+        :return:        None
+        """
+        # byte_offset[i] is where the i-th character starts
+        byte_offset = array('i', [0])
+        for ch in text:
+            byte_offset.append(byte_offset[-1] + len(ch.encode("utf-8")))
+        for i in range(0, len(records), TokenDump.FIELDS):
+            start = records[i + 1]
+            end = start + records[i + 2]
+            records[i + 1] = byte_offset[start]
+            records[i + 2] = byte_offset[end] - byte_offset[start]
+
+
+
+    class FormatError(Exception):
+        """
+        Raised when a dump is not a token dump, or was made from a different
+        version of the source.
+        """
+        pass
+
+
+
+class SourceLines:
+    """
+    Reads lines of UTF-8 source code from bytes, starting at any offset, for
+    a FileReader to read instead of a file. It remembers where each line
+    started, so that the FileReader's offsets, which are counted in
+    characters, can be turned into byte offsets.
+    """
+
+    def __init__(self, source, start):
+        """
+        Constructor for SourceLines.
+        :param source:  The source code, as UTF-8 bytes
+        :param start:   The offset of the first byte to read
+        """
+        self.source = source
+        self.next_line_start = start    # The offset of the next line
+        self.char_starts = []   # Where each line read starts, in characters
+                                # from start
+        self.byte_starts = []   # Where each line read starts, in bytes
+        self.lines = []         # Each line read, as a str
+        self.chars_read = 0     # How many characters have been read
+
+
+
+    def readline(self):
+        """
+        :return:    The next line, with its newline, as a str; or "" at the
+                    end of the source
+        """
+        start = self.next_line_start
+        if start >= len(self.source):
+            return ""
+        end = self.source.find(b"\n", start) + 1 or len(self.source)
+        line = self.source[start:end].decode("utf-8")
+        self.char_starts.append(self.chars_read)
+        self.byte_starts.append(start)
+        self.lines.append(line)
+        self.chars_read += len(line)
+        self.next_line_start = end
+        return line
+
+
+
+    def byte_offset(self, char_offset):
+        """
+        :param char_offset: An offset from FileReader.get_offset()
+        :return:            The same offset, in bytes from the start of the
+                            source
+        """
+        i = bisect.bisect_right(self.char_starts, char_offset) - 1
+        if i < 0:
+            return self.next_line_start
+        column = char_offset - self.char_starts[i]
+        return self.byte_starts[i] + \
+            len(self.lines[i][:column].encode("utf-8"))
+
+
+
+class TokenStream:
+    """
+    The tokens in a token dump, with their lexemes viewed in the source.
+    """
+
+    def __init__(self, data, source, digest=None):
+        """
+        Constructor for a TokenStream.
+        :param data:    A token dump, as bytes
+        :param source:  The source the dump was made from, as UTF-8 bytes
+        :param digest:  The SHA-1 hash of source, if it is already known
+        :raises TokenDump.FormatError: If data is not a token dump of source
+        """
+        if digest is None:
+            digest = hashlib.sha1(source).digest()
+        if len(data) < TokenDump.HEADER_SIZE:
+            raise TokenDump.FormatError("Not a token dump: too short")
+        magic, dump_digest, count = TokenDump.HEADER.unpack_from(data)
+        if magic != TokenDump.MAGIC:
+            raise TokenDump.FormatError("Not a token dump: bad magic number")
+        if dump_digest != digest:
+            raise TokenDump.FormatError("The source has changed since the "
+                                        "token dump was made")
+        if len(data) != TokenDump.HEADER_SIZE + \
+                count * TokenDump.FIELDS * 4:
+            raise TokenDump.FormatError("Not a token dump: wrong length")
+
+        self.source = memoryview(source)    # The source, as bytes
+        self.count = count                  # How many tokens there are
+        body = memoryview(data)[TokenDump.HEADER_SIZE:]
+        if sys.byteorder == "little":
+            # View the records in place
+            self.records = body.cast('i')
+        else:
+            self.records = array('i', body.tobytes())
+            self.records.byteswap()
+
+
+
+    @staticmethod
+    def load(source_filename, dump_filename=None):
+        """
+        :param source_filename: The name of a Go-- source file
+        :param dump_filename:   The name of its dump. If unassigned, this
+                                will be the source filename with EXTENSION
+                                appended
+        :return:                A TokenStream of the tokens in the dump
+        :raises TokenDump.FormatError: If the dump is not a token dump of the
+                                source file as it is now
+        """
+        if not dump_filename:
+            dump_filename = source_filename + TokenDump.EXTENSION
+        with open(dump_filename, 'rb') as f:
+            data = f.read()
+        return TokenStream(data, TokenDump.read_source(source_filename))
+
+
+
+    def __len__(self):
+        """
+        :return:    The number of tokens, counting EndOfFile
+        """
+        return self.count
+
+
+
+    def t_type(self, i):
+        """
+        :param i:   The index of a token
+        :return:    The TokenType of the token
+        """
+        return TokenType(self.records[i * TokenDump.FIELDS])
+
+
+
+    def offset(self, i):
+        """
+        :param i:   The index of a token
+        :return:    The offset of the token's first byte in the source
+        """
+        return self.records[i * TokenDump.FIELDS + 1]
+
+
+
+    def lexeme(self, i):
+        """
+        :param i:   The index of a token
+        :return:    The token's lexeme, as a memoryview over the source; an
+                    empty one for EndOfFile
+        """
+        start = self.records[i * TokenDump.FIELDS + 1]
+        return self.source[start:start + self.records[
+            i * TokenDump.FIELDS + 2]]
+
+
+
+    def __iter__(self):
+        """
+        :return:    An iterator over (TokenType, lexeme) tuples, one for each
+                    token, where each lexeme is a memoryview over the source
+        """
+        records = self.records
+        source = self.source
+        for i in range(0, self.count * TokenDump.FIELDS, TokenDump.FIELDS):
+            start = records[i + 1]
+            yield (TokenType(records[i]),
+                   source[start:start + records[i + 2]])
+
+
+
+
+    def rescan(self, start, end, replacement):
+        """
+        Scans the source again after an edit, reusing every token that the
+        edit cannot have changed. The time it takes depends on the size of
+        the edit, and of the tokens around it, not on the size of the file,
+        except for copying the tokens and hashing the new source.
+        :param start:       The offset of the first byte that was edited
+        :param end:         The offset just after the last byte that was
+                            edited; start, for an insertion
+        :param replacement: The text that replaced source[start:end], as
+                            UTF-8 bytes
+        :return:            A tuple (stream, first, old_stop, new_stop):
+                            a TokenStream of the edited source, in which
+                            tokens [first:new_stop] replace tokens
+                            [first:old_stop] of this one. The tokens before
+                            them are the same; the tokens after them are
+                            the same, but moved by len(replacement) -
+                            (end - start) bytes.
+        :raises Scanner.IllegalCharacterError: If the edited source has a
+                            character that the Scanner does not accept
+        """
+        # Like the FileReader, this expects the source to end with a
+        # newline; otherwise the last token may be out of place.
+        fields = TokenDump.FIELDS
+        records = self.records
+        starts = records[1::fields]
+        new_source = b"".join((self.source[:start], replacement,
+                               self.source[end:]))
+        delta = len(replacement) - (end - start)
+        edit_end = start + len(replacement)     # In the new source
+
+        # Find the first token that the edit could change: the first one
+        # that does not end before the edit. EndOfFile always could.
+        first = bisect.bisect_left(starts, start, 0, self.count - 1)
+        if first > 0 and starts[first - 1] + \
+                records[(first - 1) * fields + 2] >= start:
+            first -= 1
+        resume = 0
+        if first > 0:
+            resume = starts[first - 1] + records[(first - 1) * fields + 2]
+
+        scanned = array('i')
+        old_stop = self.count
+        lines = SourceLines(new_source, resume)
+        with FileReader(None, lines) as fr:
+            while True:
+                token = Scanner.get_token(fr)
+                if token.t_type is TokenType.EndOfFile:
+                    scanned.extend((TokenType.EndOfFile.value,
+                                    lines.byte_offset(fr.get_offset()), 0))
+                    break
+                char_end = fr.get_offset()
+                token_start = lines.byte_offset(char_end - len(token.lexeme))
+                if token_start >= edit_end:
+                    # Stop at the first token that lines up with an old one
+                    j = bisect.bisect_left(starts, token_start - delta,
+                                           first, self.count)
+                    if j < self.count and starts[j] == token_start - delta:
+                        old_stop = j
+                        break
+                scanned.extend((token.t_type.value, token_start,
+                                lines.byte_offset(char_end) - token_start))
+
+        new_records = array('i')
+        new_records.frombytes(memoryview(records[:first * fields]).cast('B'))
+        new_records.extend(scanned)
+        rest = array('i')
+        rest.frombytes(memoryview(records[old_stop * fields:]).cast('B'))
+        if delta:
+            rest[1::fields] = array('i', [offset + delta
+                                          for offset in rest[1::fields]])
+        new_records.extend(rest)
+        stream = TokenStream(TokenDump.pack(new_records, new_source),
+                             new_source)
+        return stream, first, old_stop, first + len(scanned) // fields
+
+
+if __name__ == "__main__":
+    show = "--print" in sys.argv[1:]
+    filenames = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    if not 1 <= len(filenames) <= 2:
+        print("Usage: python3 TokenDump.py [--print] source_file "
+              "[dump_file]")
+        sys.exit(1)
+    try:
+        dump_filename = TokenDump.dump(*filenames)
+    except Scanner.IllegalCharacterError as e:
+        print(e)
+        sys.exit(1)
+    if show:
+        for token_type, lexeme in TokenStream.load(filenames[0],
+                                                   dump_filename):
+            print("%s %r" % (token_type.name,
+                             bytes(lexeme).decode("utf-8")))
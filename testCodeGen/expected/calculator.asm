@@ -0,0 +1,985 @@
+	.text
+	.globl main
+main:
+	move	$fp,$sp
+	la	$a0,ProgStart
+	li	$v0,4                   # Print Syscall
+	syscall
+	jal	main_func
+
+	la $a0,ProgEnd
+	li $v0,4                    # Print Syscall
+	syscall
+	li $v0,10                   # Exit Syscall
+	syscall
+	.data
+ProgStart:	.asciiz	"Program Start\n"
+ProgEnd:	.asciiz	"Program End\n"
+	.text
+
+func_match_add_sub:			# match_add_sub(CHAR) INT
+				# if ((next_char == '+') || (next_char == '-')) {
+				# Reserved one word on stack for temp var -8($fp)
+	lw	$t2,4($fp)	
+	lw	$t0,($t2)	
+	li	$t1,43	
+	bne	$t0,$t1,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-8($fp)	# Store directly on the stack
+				# Reserved one word on stack for temp var -12($fp)
+	lw	$t2,4($fp)	
+	lw	$t0,($t2)	
+	li	$t1,45	
+	bne	$t0,$t1,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-12($fp)	# Store directly on the stack
+	lw	$t0,-8($fp)	
+	lw	$t1,-12($fp)	
+	bne	$t0,$0,1f	
+	bne	$t1,$0,1f	
+	li	$t0,0	# Test was false
+	b	2f	
+1:			# Passed test
+	li	$t0,1	# Test was true
+2:			
+	sw	$t0,-8($fp)	# Store directly on the stack
+	beq	$t0,$0,L_func_match_add_sub_else_0	
+				# next_char = read_char();
+				# Reserved one word on stack for temp var -16($fp)
+	li	$v0,12	# Syscall for read_char
+	syscall			
+	sw	$v0,-16($fp)	
+	lw	$t0,-16($fp)	
+	lw	$t1,4($fp)	
+	sw	$t0,($t1)	# Store data by reference
+				# print(next_char);
+				# print(char)
+	lw	$t1,4($fp)	
+	lw	$a0,($t1)	
+	li	$v0,11	# Syscall for print_char
+	syscall			
+				# ok = 1;     # true
+				# Reserved one word on stack for temp var -16($fp)
+	li	$t0,1	
+	sw	$t0,8($fp)	# Store directly on the stack
+	b	L_func_match_add_sub_endelse_0	
+L_func_match_add_sub_else_0:			
+				# ok = 0;     # false
+				# Reserved one word on stack for temp var -16($fp)
+	li	$t0,0	
+	sw	$t0,8($fp)	# Store directly on the stack
+L_func_match_add_sub_endelse_0:			
+	jr	$ra	
+func_match_mul_div:			# match_mul_div(CHAR) INT
+				# if ((next_char == '*') || (next_char == '/')) {
+				# Reserved one word on stack for temp var -8($fp)
+	lw	$t2,4($fp)	
+	lw	$t0,($t2)	
+	li	$t1,42	
+	bne	$t0,$t1,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-8($fp)	# Store directly on the stack
+				# Reserved one word on stack for temp var -12($fp)
+	lw	$t2,4($fp)	
+	lw	$t0,($t2)	
+	li	$t1,47	
+	bne	$t0,$t1,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-12($fp)	# Store directly on the stack
+	lw	$t0,-8($fp)	
+	lw	$t1,-12($fp)	
+	bne	$t0,$0,1f	
+	bne	$t1,$0,1f	
+	li	$t0,0	# Test was false
+	b	2f	
+1:			# Passed test
+	li	$t0,1	# Test was true
+2:			
+	sw	$t0,-8($fp)	# Store directly on the stack
+	beq	$t0,$0,L_func_match_mul_div_else_0	
+				# next_char = read_char();
+				# Reserved one word on stack for temp var -16($fp)
+	li	$v0,12	# Syscall for read_char
+	syscall			
+	sw	$v0,-16($fp)	
+	lw	$t0,-16($fp)	
+	lw	$t1,4($fp)	
+	sw	$t0,($t1)	# Store data by reference
+				# print(next_char);
+				# print(char)
+	lw	$t1,4($fp)	
+	lw	$a0,($t1)	
+	li	$v0,11	# Syscall for print_char
+	syscall			
+				# ok = 1;     # true
+				# Reserved one word on stack for temp var -16($fp)
+	li	$t0,1	
+	sw	$t0,8($fp)	# Store directly on the stack
+	b	L_func_match_mul_div_endelse_0	
+L_func_match_mul_div_else_0:			
+				# ok = 0;     # false
+				# Reserved one word on stack for temp var -16($fp)
+	li	$t0,0	
+	sw	$t0,8($fp)	# Store directly on the stack
+L_func_match_mul_div_endelse_0:			
+	jr	$ra	
+func_match_open_p:			# match_open_p(CHAR) INT
+				# if (next_char == '(') {
+				# Reserved one word on stack for temp var -8($fp)
+	lw	$t2,4($fp)	
+	lw	$t0,($t2)	
+	li	$t1,40	
+	bne	$t0,$t1,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-8($fp)	# Store directly on the stack
+	beq	$t0,$0,L_func_match_open_p_else_0	
+				# next_char = read_char();
+				# Reserved one word on stack for temp var -12($fp)
+	li	$v0,12	# Syscall for read_char
+	syscall			
+	sw	$v0,-12($fp)	
+	lw	$t0,-12($fp)	
+	lw	$t1,4($fp)	
+	sw	$t0,($t1)	# Store data by reference
+				# print(next_char);
+				# print(char)
+	lw	$t1,4($fp)	
+	lw	$a0,($t1)	
+	li	$v0,11	# Syscall for print_char
+	syscall			
+				# ok = 1;     # true
+				# Reserved one word on stack for temp var -12($fp)
+	li	$t0,1	
+	sw	$t0,8($fp)	# Store directly on the stack
+	b	L_func_match_open_p_endelse_0	
+L_func_match_open_p_else_0:			
+				# ok = 0;     # false
+				# Reserved one word on stack for temp var -12($fp)
+	li	$t0,0	
+	sw	$t0,8($fp)	# Store directly on the stack
+L_func_match_open_p_endelse_0:			
+	jr	$ra	
+func_match_close_p:			# match_close_p(CHAR) INT
+				# if (next_char == ')') {
+				# Reserved one word on stack for temp var -8($fp)
+	lw	$t2,4($fp)	
+	lw	$t0,($t2)	
+	li	$t1,41	
+	bne	$t0,$t1,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-8($fp)	# Store directly on the stack
+	beq	$t0,$0,L_func_match_close_p_else_0	
+				# next_char = read_char();
+				# Reserved one word on stack for temp var -12($fp)
+	li	$v0,12	# Syscall for read_char
+	syscall			
+	sw	$v0,-12($fp)	
+	lw	$t0,-12($fp)	
+	lw	$t1,4($fp)	
+	sw	$t0,($t1)	# Store data by reference
+				# print(next_char);
+				# print(char)
+	lw	$t1,4($fp)	
+	lw	$a0,($t1)	
+	li	$v0,11	# Syscall for print_char
+	syscall			
+				# ok = 1;     # true
+				# Reserved one word on stack for temp var -12($fp)
+	li	$t0,1	
+	sw	$t0,8($fp)	# Store directly on the stack
+	b	L_func_match_close_p_endelse_0	
+L_func_match_close_p_else_0:			
+				# ok = 0;     # false
+				# Reserved one word on stack for temp var -12($fp)
+	li	$t0,0	
+	sw	$t0,8($fp)	# Store directly on the stack
+L_func_match_close_p_endelse_0:			
+	jr	$ra	
+func_literal:			# literal(CHAR, INT) INT
+				# lit = 0;
+				# Reserved one word on stack for temp var -8($fp)
+	li	$t0,0	
+	sw	$t0,12($fp)	# Store directly on the stack
+				# ok = 0;
+				# Reserved one word on stack for temp var -8($fp)
+	li	$t0,0	
+	lw	$t1,4($fp)	
+	sw	$t0,($t1)	# Store data by reference
+				# while ( ('0' <= next_char) && (next_char <= '9') ) {
+L_func_literal_while_0:			
+				# Reserved one word on stack for temp var -8($fp)
+	li	$t0,48	
+	lw	$t2,8($fp)	
+	lw	$t1,($t2)	
+	sub	$t0,$t0,$t1	# t0=t0-t1
+	bgtz	$t0,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-8($fp)	# Store directly on the stack
+				# Reserved one word on stack for temp var -12($fp)
+	lw	$t2,8($fp)	
+	lw	$t0,($t2)	
+	li	$t1,57	
+	sub	$t0,$t0,$t1	# t0=t0-t1
+	bgtz	$t0,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-12($fp)	# Store directly on the stack
+	lw	$t0,-8($fp)	
+	lw	$t1,-12($fp)	
+	beq	$t0,$0,1f	
+	beq	$t1,$0,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			
+	sw	$t0,-8($fp)	# Store directly on the stack
+	beq	$t0,$0,L_func_literal_endwhile_0	
+				# ok = 1;
+				# Reserved one word on stack for temp var -16($fp)
+	li	$t0,1	
+	lw	$t1,4($fp)	
+	sw	$t0,($t1)	# Store data by reference
+				# lit = cast_int(next_char) - cast_int('0') + lit * 10;
+				# Reserved one word on stack for temp var -16($fp)
+	lw	$t1,8($fp)	
+	lw	$t0,($t1)	
+	sw	$t0,-16($fp)	# Store directly on the stack
+				# Reserved one word on stack for temp var -20($fp)
+				# Reserved one word on stack for temp var -24($fp)
+	li	$t0,48	
+	sw	$t0,-24($fp)	# Store directly on the stack
+	lw	$t0,-16($fp)	
+	lw	$t1,-24($fp)	
+	sub	$t0,$t0,$t1	
+	sw	$t0,-16($fp)	# Store directly on the stack
+				# Reserved one word on stack for temp var -28($fp)
+	lw	$t0,12($fp)	
+	li	$t1,10	
+	mul	$t0,$t0,$t1	
+	sw	$t0,-28($fp)	# Store directly on the stack
+	lw	$t0,-16($fp)	
+	lw	$t1,-28($fp)	
+	add	$t0,$t0,$t1	
+	sw	$t0,-16($fp)	# Store directly on the stack
+	sw	$t0,12($fp)	# Store directly on the stack
+				# next_char = read_char();
+				# Reserved one word on stack for temp var -16($fp)
+	li	$v0,12	# Syscall for read_char
+	syscall			
+	sw	$v0,-16($fp)	
+	lw	$t0,-16($fp)	
+	lw	$t1,8($fp)	
+	sw	$t0,($t1)	# Store data by reference
+				# print(next_char);
+				# print(char)
+	lw	$t1,8($fp)	
+	lw	$a0,($t1)	
+	li	$v0,11	# Syscall for print_char
+	syscall			
+	b	L_func_literal_while_0	
+L_func_literal_endwhile_0:			
+	jr	$ra	
+func_factor:			# factor(CHAR, INT) INT
+				# if (next_char == '(') {
+				# Reserved one word on stack for temp var -8($fp)
+	lw	$t2,8($fp)	
+	lw	$t0,($t2)	
+	li	$t1,40	
+	bne	$t0,$t1,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-8($fp)	# Store directly on the stack
+	beq	$t0,$0,L_func_factor_else_0	
+				# ok = match_open_p(next_char);
+				# Reserve 1 words on stack for var return_var at -12($fp)
+	lw	$t0,8($fp)	# Copy existing pointer
+	sw	$t0,-16($fp)	# Add param to stack for param at -16($fp)
+	addi	$sp,$fp,-20	
+	sw	$fp,($sp)	# store old control link
+	move	$fp,$sp	# make new control link
+	addi	$sp,$sp,-4	
+	sw	$ra,($sp)	# store return address
+	jal	func_match_open_p	
+	lw	$ra,-4($fp)	# restore old ra
+	move	$sp,$fp	# restore old sp
+	addi	$sp,$sp,8	# remove params and control link from stack
+	lw	$fp,($fp)	# restore old fp
+	lw	$t0,-12($fp)	
+	lw	$t1,4($fp)	
+	sw	$t0,($t1)	# Store data by reference
+				# if (ok == 0) { return; }
+				# Reserved one word on stack for temp var -12($fp)
+	lw	$t2,4($fp)	
+	lw	$t0,($t2)	
+	li	$t1,0	
+	bne	$t0,$t1,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-12($fp)	# Store directly on the stack
+	beq	$t0,$0,L_func_factor_else_1	
+				# if (ok == 0) { return; }
+	jr	$ra	
+L_func_factor_else_1:			
+				# fac = expression(next_char, ok);
+				# Reserve 1 words on stack for var return_var at -16($fp)
+	lw	$t0,8($fp)	# Copy existing pointer
+	sw	$t0,-20($fp)	# Add param to stack for param at -20($fp)
+	lw	$t0,4($fp)	# Copy existing pointer
+	sw	$t0,-24($fp)	# Add param to stack for param at -24($fp)
+	addi	$sp,$fp,-28	
+	sw	$fp,($sp)	# store old control link
+	move	$fp,$sp	# make new control link
+	addi	$sp,$sp,-4	
+	sw	$ra,($sp)	# store return address
+	jal	func_expression	
+	lw	$ra,-4($fp)	# restore old ra
+	move	$sp,$fp	# restore old sp
+	addi	$sp,$sp,12	# remove params and control link from stack
+	lw	$fp,($fp)	# restore old fp
+	lw	$t0,-16($fp)	
+	sw	$t0,12($fp)	# Store directly on the stack
+				# if (ok == 0) { return; }
+				# Reserved one word on stack for temp var -16($fp)
+	lw	$t2,4($fp)	
+	lw	$t0,($t2)	
+	li	$t1,0	
+	bne	$t0,$t1,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-16($fp)	# Store directly on the stack
+	beq	$t0,$0,L_func_factor_else_2	
+				# if (ok == 0) { return; }
+	jr	$ra	
+L_func_factor_else_2:			
+				# ok = match_close_p(next_char);
+				# Reserve 1 words on stack for var return_var at -20($fp)
+	lw	$t0,8($fp)	# Copy existing pointer
+	sw	$t0,-24($fp)	# Add param to stack for param at -24($fp)
+	addi	$sp,$fp,-28	
+	sw	$fp,($sp)	# store old control link
+	move	$fp,$sp	# make new control link
+	addi	$sp,$sp,-4	
+	sw	$ra,($sp)	# store return address
+	jal	func_match_close_p	
+	lw	$ra,-4($fp)	# restore old ra
+	move	$sp,$fp	# restore old sp
+	addi	$sp,$sp,8	# remove params and control link from stack
+	lw	$fp,($fp)	# restore old fp
+	lw	$t0,-20($fp)	
+	lw	$t1,4($fp)	
+	sw	$t0,($t1)	# Store data by reference
+				# return;
+	jr	$ra	
+L_func_factor_else_0:			
+				# if (('0' <= next_char) && (next_char <= '9')) {
+				# Reserved one word on stack for temp var -12($fp)
+	li	$t0,48	
+	lw	$t2,8($fp)	
+	lw	$t1,($t2)	
+	sub	$t0,$t0,$t1	# t0=t0-t1
+	bgtz	$t0,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-12($fp)	# Store directly on the stack
+				# Reserved one word on stack for temp var -16($fp)
+	lw	$t2,8($fp)	
+	lw	$t0,($t2)	
+	li	$t1,57	
+	sub	$t0,$t0,$t1	# t0=t0-t1
+	bgtz	$t0,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-16($fp)	# Store directly on the stack
+	lw	$t0,-12($fp)	
+	lw	$t1,-16($fp)	
+	beq	$t0,$0,1f	
+	beq	$t1,$0,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			
+	sw	$t0,-12($fp)	# Store directly on the stack
+	beq	$t0,$0,L_func_factor_else_3	
+				# fac = literal(next_char, ok);
+				# Reserve 1 words on stack for var return_var at -20($fp)
+	lw	$t0,8($fp)	# Copy existing pointer
+	sw	$t0,-24($fp)	# Add param to stack for param at -24($fp)
+	lw	$t0,4($fp)	# Copy existing pointer
+	sw	$t0,-28($fp)	# Add param to stack for param at -28($fp)
+	addi	$sp,$fp,-32	
+	sw	$fp,($sp)	# store old control link
+	move	$fp,$sp	# make new control link
+	addi	$sp,$sp,-4	
+	sw	$ra,($sp)	# store return address
+	jal	func_literal	
+	lw	$ra,-4($fp)	# restore old ra
+	move	$sp,$fp	# restore old sp
+	addi	$sp,$sp,12	# remove params and control link from stack
+	lw	$fp,($fp)	# restore old fp
+	lw	$t0,-20($fp)	
+	sw	$t0,12($fp)	# Store directly on the stack
+				# return;
+	jr	$ra	
+L_func_factor_else_3:			
+				# ok = 0;
+				# Reserved one word on stack for temp var -20($fp)
+	li	$t0,0	
+	lw	$t1,4($fp)	
+	sw	$t0,($t1)	# Store data by reference
+	jr	$ra	
+func_term:			# term(CHAR, INT) INT
+				# var temp int;
+				# Reserve 1 words on stack for var temp at -8($fp)
+				# var matched_mul_div int;
+				# Reserve 1 words on stack for var matched_mul_div at -12($fp)
+				# var operator char;
+				# Reserve 1 words on stack for var operator at -16($fp)
+				# t = 0;
+				# Reserved one word on stack for temp var -20($fp)
+	li	$t0,0	
+	sw	$t0,12($fp)	# Store directly on the stack
+				# matched_mul_div = 0;
+				# Reserved one word on stack for temp var -20($fp)
+	li	$t0,0	
+	sw	$t0,-12($fp)	# Store directly on the stack
+				# temp = factor(next_char, ok);
+				# Reserve 1 words on stack for var return_var at -20($fp)
+	lw	$t0,8($fp)	# Copy existing pointer
+	sw	$t0,-24($fp)	# Add param to stack for param at -24($fp)
+	lw	$t0,4($fp)	# Copy existing pointer
+	sw	$t0,-28($fp)	# Add param to stack for param at -28($fp)
+	addi	$sp,$fp,-32	
+	sw	$fp,($sp)	# store old control link
+	move	$fp,$sp	# make new control link
+	addi	$sp,$sp,-4	
+	sw	$ra,($sp)	# store return address
+	jal	func_factor	
+	lw	$ra,-4($fp)	# restore old ra
+	move	$sp,$fp	# restore old sp
+	addi	$sp,$sp,12	# remove params and control link from stack
+	lw	$fp,($fp)	# restore old fp
+	lw	$t0,-20($fp)	
+	sw	$t0,-8($fp)	# Store directly on the stack
+				# if (ok == 0) {      # we didn't read a valid factor
+				# Reserved one word on stack for temp var -20($fp)
+	lw	$t2,4($fp)	
+	lw	$t0,($t2)	
+	li	$t1,0	
+	bne	$t0,$t1,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-20($fp)	# Store directly on the stack
+	beq	$t0,$0,L_func_term_else_0	
+				# return;
+	jr	$ra	
+L_func_term_else_0:			
+				# t = temp;
+	lw	$t0,-8($fp)	
+	sw	$t0,12($fp)	# Store directly on the stack
+				# operator = next_char;
+	lw	$t1,8($fp)	
+	lw	$t0,($t1)	
+	sw	$t0,-16($fp)	# Store directly on the stack
+				# matched_mul_div = match_mul_div(next_char);
+				# Reserve 1 words on stack for var return_var at -24($fp)
+	lw	$t0,8($fp)	# Copy existing pointer
+	sw	$t0,-28($fp)	# Add param to stack for param at -28($fp)
+	addi	$sp,$fp,-32	
+	sw	$fp,($sp)	# store old control link
+	move	$fp,$sp	# make new control link
+	addi	$sp,$sp,-4	
+	sw	$ra,($sp)	# store return address
+	jal	func_match_mul_div	
+	lw	$ra,-4($fp)	# restore old ra
+	move	$sp,$fp	# restore old sp
+	addi	$sp,$sp,8	# remove params and control link from stack
+	lw	$fp,($fp)	# restore old fp
+	lw	$t0,-24($fp)	
+	sw	$t0,-12($fp)	# Store directly on the stack
+				# while (matched_mul_div != 0) {      # we have seen a * or /
+L_func_term_while_0:			
+				# Reserved one word on stack for temp var -24($fp)
+	lw	$t0,-12($fp)	
+	li	$t1,0	
+	beq	$t0,$t1,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-24($fp)	# Store directly on the stack
+	beq	$t0,$0,L_func_term_endwhile_0	
+				# temp = factor(next_char, ok);
+				# Reserve 1 words on stack for var return_var at -28($fp)
+	lw	$t0,8($fp)	# Copy existing pointer
+	sw	$t0,-32($fp)	# Add param to stack for param at -32($fp)
+	lw	$t0,4($fp)	# Copy existing pointer
+	sw	$t0,-36($fp)	# Add param to stack for param at -36($fp)
+	addi	$sp,$fp,-40	
+	sw	$fp,($sp)	# store old control link
+	move	$fp,$sp	# make new control link
+	addi	$sp,$sp,-4	
+	sw	$ra,($sp)	# store return address
+	jal	func_factor	
+	lw	$ra,-4($fp)	# restore old ra
+	move	$sp,$fp	# restore old sp
+	addi	$sp,$sp,12	# remove params and control link from stack
+	lw	$fp,($fp)	# restore old fp
+	lw	$t0,-28($fp)	
+	sw	$t0,-8($fp)	# Store directly on the stack
+				# if (ok == 0) {      # we didn't read a valid factor
+				# Reserved one word on stack for temp var -28($fp)
+	lw	$t2,4($fp)	
+	lw	$t0,($t2)	
+	li	$t1,0	
+	bne	$t0,$t1,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-28($fp)	# Store directly on the stack
+	beq	$t0,$0,L_func_term_else_1	
+				# return;
+	jr	$ra	
+L_func_term_else_1:			
+				# if (operator == '*') {
+				# Reserved one word on stack for temp var -32($fp)
+	lw	$t0,-16($fp)	
+	li	$t1,42	
+	bne	$t0,$t1,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-32($fp)	# Store directly on the stack
+	beq	$t0,$0,L_func_term_else_2	
+				# t = t * temp;
+				# Reserved one word on stack for temp var -36($fp)
+	lw	$t0,12($fp)	
+	lw	$t1,-8($fp)	
+	mul	$t0,$t0,$t1	
+	sw	$t0,-36($fp)	# Store directly on the stack
+	sw	$t0,12($fp)	# Store directly on the stack
+L_func_term_else_2:			
+				# if (operator == '/') {
+				# Reserved one word on stack for temp var -36($fp)
+	lw	$t0,-16($fp)	
+	li	$t1,47	
+	bne	$t0,$t1,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-36($fp)	# Store directly on the stack
+	beq	$t0,$0,L_func_term_else_3	
+				# t = t / temp;
+				# Reserved one word on stack for temp var -40($fp)
+	lw	$t0,12($fp)	
+	lw	$t1,-8($fp)	
+	div	$t0,$t0,$t1	
+	sw	$t0,-40($fp)	# Store directly on the stack
+	sw	$t0,12($fp)	# Store directly on the stack
+L_func_term_else_3:			
+				# operator = next_char;
+	lw	$t1,8($fp)	
+	lw	$t0,($t1)	
+	sw	$t0,-16($fp)	# Store directly on the stack
+				# matched_mul_div = match_mul_div(next_char);
+				# Reserve 1 words on stack for var return_var at -40($fp)
+	lw	$t0,8($fp)	# Copy existing pointer
+	sw	$t0,-44($fp)	# Add param to stack for param at -44($fp)
+	addi	$sp,$fp,-48	
+	sw	$fp,($sp)	# store old control link
+	move	$fp,$sp	# make new control link
+	addi	$sp,$sp,-4	
+	sw	$ra,($sp)	# store return address
+	jal	func_match_mul_div	
+	lw	$ra,-4($fp)	# restore old ra
+	move	$sp,$fp	# restore old sp
+	addi	$sp,$sp,8	# remove params and control link from stack
+	lw	$fp,($fp)	# restore old fp
+	lw	$t0,-40($fp)	
+	sw	$t0,-12($fp)	# Store directly on the stack
+	b	L_func_term_while_0	
+L_func_term_endwhile_0:			
+	jr	$ra	
+func_expression:			# expression(CHAR, INT) INT
+				# var temp int;
+				# Reserve 1 words on stack for var temp at -8($fp)
+				# var matched_add_sub int;
+				# Reserve 1 words on stack for var matched_add_sub at -12($fp)
+				# var operator char;
+				# Reserve 1 words on stack for var operator at -16($fp)
+				# e = 0;
+				# Reserved one word on stack for temp var -20($fp)
+	li	$t0,0	
+	sw	$t0,12($fp)	# Store directly on the stack
+				# matched_add_sub = 0;
+				# Reserved one word on stack for temp var -20($fp)
+	li	$t0,0	
+	sw	$t0,-12($fp)	# Store directly on the stack
+				# temp = term(next_char, ok);
+				# Reserve 1 words on stack for var return_var at -20($fp)
+	lw	$t0,8($fp)	# Copy existing pointer
+	sw	$t0,-24($fp)	# Add param to stack for param at -24($fp)
+	lw	$t0,4($fp)	# Copy existing pointer
+	sw	$t0,-28($fp)	# Add param to stack for param at -28($fp)
+	addi	$sp,$fp,-32	
+	sw	$fp,($sp)	# store old control link
+	move	$fp,$sp	# make new control link
+	addi	$sp,$sp,-4	
+	sw	$ra,($sp)	# store return address
+	jal	func_term	
+	lw	$ra,-4($fp)	# restore old ra
+	move	$sp,$fp	# restore old sp
+	addi	$sp,$sp,12	# remove params and control link from stack
+	lw	$fp,($fp)	# restore old fp
+	lw	$t0,-20($fp)	
+	sw	$t0,-8($fp)	# Store directly on the stack
+				# if (ok == 0) {      # we didn't read a valid factor
+				# Reserved one word on stack for temp var -20($fp)
+	lw	$t2,4($fp)	
+	lw	$t0,($t2)	
+	li	$t1,0	
+	bne	$t0,$t1,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-20($fp)	# Store directly on the stack
+	beq	$t0,$0,L_func_expression_else_0	
+				# return;
+	jr	$ra	
+L_func_expression_else_0:			
+				# e = temp;
+	lw	$t0,-8($fp)	
+	sw	$t0,12($fp)	# Store directly on the stack
+				# operator = next_char;
+	lw	$t1,8($fp)	
+	lw	$t0,($t1)	
+	sw	$t0,-16($fp)	# Store directly on the stack
+				# matched_add_sub = match_add_sub(next_char);
+				# Reserve 1 words on stack for var return_var at -24($fp)
+	lw	$t0,8($fp)	# Copy existing pointer
+	sw	$t0,-28($fp)	# Add param to stack for param at -28($fp)
+	addi	$sp,$fp,-32	
+	sw	$fp,($sp)	# store old control link
+	move	$fp,$sp	# make new control link
+	addi	$sp,$sp,-4	
+	sw	$ra,($sp)	# store return address
+	jal	func_match_add_sub	
+	lw	$ra,-4($fp)	# restore old ra
+	move	$sp,$fp	# restore old sp
+	addi	$sp,$sp,8	# remove params and control link from stack
+	lw	$fp,($fp)	# restore old fp
+	lw	$t0,-24($fp)	
+	sw	$t0,-12($fp)	# Store directly on the stack
+				# while(matched_add_sub != 0) {       # we have seen a + or -
+L_func_expression_while_0:			
+				# Reserved one word on stack for temp var -24($fp)
+	lw	$t0,-12($fp)	
+	li	$t1,0	
+	beq	$t0,$t1,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-24($fp)	# Store directly on the stack
+	beq	$t0,$0,L_func_expression_endwhile_0	
+				# temp = term(next_char, ok);
+				# Reserve 1 words on stack for var return_var at -28($fp)
+	lw	$t0,8($fp)	# Copy existing pointer
+	sw	$t0,-32($fp)	# Add param to stack for param at -32($fp)
+	lw	$t0,4($fp)	# Copy existing pointer
+	sw	$t0,-36($fp)	# Add param to stack for param at -36($fp)
+	addi	$sp,$fp,-40	
+	sw	$fp,($sp)	# store old control link
+	move	$fp,$sp	# make new control link
+	addi	$sp,$sp,-4	
+	sw	$ra,($sp)	# store return address
+	jal	func_term	
+	lw	$ra,-4($fp)	# restore old ra
+	move	$sp,$fp	# restore old sp
+	addi	$sp,$sp,12	# remove params and control link from stack
+	lw	$fp,($fp)	# restore old fp
+	lw	$t0,-28($fp)	
+	sw	$t0,-8($fp)	# Store directly on the stack
+				# if (ok == 0) {                  # we didn't read a valid term
+				# Reserved one word on stack for temp var -28($fp)
+	lw	$t2,4($fp)	
+	lw	$t0,($t2)	
+	li	$t1,0	
+	bne	$t0,$t1,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-28($fp)	# Store directly on the stack
+	beq	$t0,$0,L_func_expression_else_1	
+				# return;
+	jr	$ra	
+L_func_expression_else_1:			
+				# if (operator == '+') {
+				# Reserved one word on stack for temp var -32($fp)
+	lw	$t0,-16($fp)	
+	li	$t1,43	
+	bne	$t0,$t1,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-32($fp)	# Store directly on the stack
+	beq	$t0,$0,L_func_expression_else_2	
+				# e = e + temp;
+				# Reserved one word on stack for temp var -36($fp)
+	lw	$t0,12($fp)	
+	lw	$t1,-8($fp)	
+	add	$t0,$t0,$t1	
+	sw	$t0,-36($fp)	# Store directly on the stack
+	sw	$t0,12($fp)	# Store directly on the stack
+L_func_expression_else_2:			
+				# if (operator == '-') {
+				# Reserved one word on stack for temp var -36($fp)
+	lw	$t0,-16($fp)	
+	li	$t1,45	
+	bne	$t0,$t1,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-36($fp)	# Store directly on the stack
+	beq	$t0,$0,L_func_expression_else_3	
+				# e = e - temp;
+				# Reserved one word on stack for temp var -40($fp)
+	lw	$t0,12($fp)	
+	lw	$t1,-8($fp)	
+	sub	$t0,$t0,$t1	
+	sw	$t0,-40($fp)	# Store directly on the stack
+	sw	$t0,12($fp)	# Store directly on the stack
+L_func_expression_else_3:			
+				# operator = next_char;
+	lw	$t1,8($fp)	
+	lw	$t0,($t1)	
+	sw	$t0,-16($fp)	# Store directly on the stack
+				# matched_add_sub = match_add_sub(next_char);
+				# Reserve 1 words on stack for var return_var at -40($fp)
+	lw	$t0,8($fp)	# Copy existing pointer
+	sw	$t0,-44($fp)	# Add param to stack for param at -44($fp)
+	addi	$sp,$fp,-48	
+	sw	$fp,($sp)	# store old control link
+	move	$fp,$sp	# make new control link
+	addi	$sp,$sp,-4	
+	sw	$ra,($sp)	# store return address
+	jal	func_match_add_sub	
+	lw	$ra,-4($fp)	# restore old ra
+	move	$sp,$fp	# restore old sp
+	addi	$sp,$sp,8	# remove params and control link from stack
+	lw	$fp,($fp)	# restore old fp
+	lw	$t0,-40($fp)	
+	sw	$t0,-12($fp)	# Store directly on the stack
+	b	L_func_expression_while_0	
+L_func_expression_endwhile_0:			
+	jr	$ra	
+main_func:			# main() INT
+				# print("go-- calculator: it barely works!\n");
+				# Reserved one word on stack for temp var -8($fp)
+
+	.data
+L_main_func_string_0:	.asciiz	"go-- calculator: it barely works!\n"
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_0	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print("At the prompt, enter a mathematical expression, consisting of\n",
+				# Reserved one word on stack for temp var -8($fp)
+				# Reserved one word on stack for temp var -12($fp)
+				# Reserved one word on stack for temp var -16($fp)
+				# Reserved one word on stack for temp var -20($fp)
+				# Reserved one word on stack for temp var -24($fp)
+				# Reserved one word on stack for temp var -28($fp)
+				# Reserved one word on stack for temp var -32($fp)
+				# Reserved one word on stack for temp var -36($fp)
+
+	.data
+L_main_func_string_1:	.asciiz	"At the prompt, enter a mathematical expression, consisting of\npositive integers, +, -, *, / and parentheses. When you're done,\npress = and the calculator will print the answer. If you use non-\nsupported characters, or if you don't match up your parentheses,\nyou will get an error message instead of an answer.\nHint: The calculator doesn't accept negative numbers. Type '0-n'\nwhere n is some positive integer to get a negative number.\nHave loads of fun!\n\n"
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_1	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# var next_char char;
+				# Reserve 1 words on stack for var next_char at -8($fp)
+				# var result int;
+				# Reserve 1 words on stack for var result at -12($fp)
+				# var ok int;
+				# Reserve 1 words on stack for var ok at -16($fp)
+				# result = 0;
+				# Reserved one word on stack for temp var -20($fp)
+	li	$t0,0	
+	sw	$t0,-12($fp)	# Store directly on the stack
+				# ok = 1;
+				# Reserved one word on stack for temp var -20($fp)
+	li	$t0,1	
+	sw	$t0,-16($fp)	# Store directly on the stack
+				# while (0==0) {
+L_main_func_while_0:			
+				# Reserved one word on stack for temp var -20($fp)
+				# Reserved one word on stack for temp var -24($fp)
+	li	$t0,0	
+	li	$t1,0	
+	bne	$t0,$t1,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-20($fp)	# Store directly on the stack
+	beq	$t0,$0,L_main_func_endwhile_0	
+				# print('>');
+				# Reserved one word on stack for temp var -28($fp)
+				# print(char)
+	li	$a0,62	
+	li	$v0,11	# Syscall for print_char
+	syscall			
+				# next_char = read_char();
+				# Reserved one word on stack for temp var -28($fp)
+	li	$v0,12	# Syscall for read_char
+	syscall			
+	sw	$v0,-28($fp)	
+	lw	$t0,-28($fp)	
+	sw	$t0,-8($fp)	# Store directly on the stack
+				# print(next_char);
+				# print(char)
+	lw	$a0,-8($fp)	
+	li	$v0,11	# Syscall for print_char
+	syscall			
+				# result = expression(next_char, ok);
+				# Reserve 1 words on stack for var return_var at -28($fp)
+	addi	$t0,$fp,-8	# Make pointer
+	sw	$t0,-32($fp)	# Add param to stack for param at -32($fp)
+	addi	$t0,$fp,-16	# Make pointer
+	sw	$t0,-36($fp)	# Add param to stack for param at -36($fp)
+	addi	$sp,$fp,-40	
+	sw	$fp,($sp)	# store old control link
+	move	$fp,$sp	# make new control link
+	addi	$sp,$sp,-4	
+	sw	$ra,($sp)	# store return address
+	jal	func_expression	
+	lw	$ra,-4($fp)	# restore old ra
+	move	$sp,$fp	# restore old sp
+	addi	$sp,$sp,12	# remove params and control link from stack
+	lw	$fp,($fp)	# restore old fp
+	lw	$t0,-28($fp)	
+	sw	$t0,-12($fp)	# Store directly on the stack
+				# if (next_char == '=') {
+				# Reserved one word on stack for temp var -28($fp)
+	lw	$t0,-8($fp)	
+	li	$t1,61	
+	bne	$t0,$t1,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-28($fp)	# Store directly on the stack
+	beq	$t0,$0,L_main_func_else_0	
+				# print('\n', '\t', result, '\n');
+				# Reserved one word on stack for temp var -32($fp)
+				# Reserved one word on stack for temp var -36($fp)
+				# Reserved one word on stack for temp var -40($fp)
+
+	.data
+L_main_func_string_2:	.asciiz	"\n\t"
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_2	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print(int)
+	lw	$a0,-12($fp)	
+	li	$v0,1	# Syscall for print_int
+	syscall			
+				# print(char)
+	li	$a0,10	
+	li	$v0,11	# Syscall for print_char
+	syscall			
+	b	L_main_func_endelse_0	
+L_main_func_else_0:			
+				# print("\nSyntax error; try again!\n");
+				# Reserved one word on stack for temp var -32($fp)
+
+	.data
+L_main_func_string_3:	.asciiz	"\nSyntax error; try again!\n"
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_3	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+L_main_func_endelse_0:			
+	b	L_main_func_while_0	
+L_main_func_endwhile_0:			
+	jr	$ra	
@@ -0,0 +1,234 @@
+	.text
+	.globl main
+main:
+	move	$fp,$sp
+	la	$a0,ProgStart
+	li	$v0,4                   # Print Syscall
+	syscall
+	jal	main_func
+
+	la $a0,ProgEnd
+	li $v0,4                    # Print Syscall
+	syscall
+	li $v0,10                   # Exit Syscall
+	syscall
+	.data
+ProgStart:	.asciiz	"Program Start\n"
+ProgEnd:	.asciiz	"Program End\n"
+	.text
+
+main_func:			# main() INT
+				# var a [30]int;
+				# Reserve 30 words on stack for var a at -8($fp)
+				# var MAX int;
+				# Reserve 1 words on stack for var MAX at -128($fp)
+				# MAX = 30;
+				# Reserved one word on stack for temp var -132($fp)
+	li	$t0,30	
+	sw	$t0,-128($fp)	# Store directly on the stack
+				# var n int;
+				# Reserve 1 words on stack for var n at -132($fp)
+				# n = 0;
+				# Reserved one word on stack for temp var -136($fp)
+	li	$t0,0	
+	sw	$t0,-132($fp)	# Store directly on the stack
+				# while (n < MAX) {
+				# Array addresses hoisted out of while loop
+	lw	$s0,-132($fp)	# put subscript in $s0
+	sll	$s0,$s0,2	# multiply subscript by 4
+	sub	$s0,$fp,$s0	
+	addi	$s0,$s0,-8	# $s0 points to array[subscript]
+L_main_func_while_0:			
+				# Reserved one word on stack for temp var -136($fp)
+	lw	$t0,-132($fp)	
+	lw	$t1,-128($fp)	
+	sub	$t0,$t0,$t1	# t0=t0-t1
+	bgez	$t0,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-136($fp)	# Store directly on the stack
+	beq	$t0,$0,L_main_func_endwhile_0	
+				# if (n < 1) {
+				# Reserved one word on stack for temp var -140($fp)
+	lw	$t0,-132($fp)	
+	li	$t1,1	
+	sub	$t0,$t0,$t1	# t0=t0-t1
+	bgez	$t0,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-140($fp)	# Store directly on the stack
+	beq	$t0,$0,L_main_func_else_0	
+				# a[n] = 0;
+				# Reserved one word on stack for temp var -144($fp)
+	li	$t0,0	
+	sw	$t0,($s0)	# Store data at array[subscript]
+	b	L_main_func_endelse_0	
+L_main_func_else_0:			
+				# a[n] = 1;
+				# Reserved one word on stack for temp var -144($fp)
+	li	$t0,1	
+	sw	$t0,($s0)	# Store data at array[subscript]
+				# var last int;
+				# Reserve 1 words on stack for var last at -144($fp)
+				# last = 0;
+				# Reserved one word on stack for temp var -148($fp)
+	li	$t0,0	
+	sw	$t0,-144($fp)	# Store directly on the stack
+				# var temp int;
+				# Reserve 1 words on stack for var temp at -148($fp)
+				# var i int;
+				# Reserve 1 words on stack for var i at -152($fp)
+				# i = 1;
+				# Reserved one word on stack for temp var -156($fp)
+	li	$t0,1	
+	sw	$t0,-152($fp)	# Store directly on the stack
+				# while (i < n) {
+				# Array addresses hoisted out of while loop
+	lw	$s1,-132($fp)	# put subscript in $s1
+	sll	$s1,$s1,2	# multiply subscript by 4
+	sub	$s1,$fp,$s1	
+	addi	$s1,$s1,-8	# $s1 points to array[subscript]
+L_main_func_while_1:			
+				# Reserved one word on stack for temp var -156($fp)
+	lw	$t0,-152($fp)	
+	lw	$t1,-132($fp)	
+	sub	$t0,$t0,$t1	# t0=t0-t1
+	bgez	$t0,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-156($fp)	# Store directly on the stack
+	beq	$t0,$0,L_main_func_endwhile_1	
+				# temp = last + a[n];
+	lw	$t0,($s1)	
+	sw	$t0,-160($fp)	# Store directly on the stack
+	lw	$t0,-144($fp)	
+	lw	$t1,-160($fp)	
+	add	$t0,$t0,$t1	
+	sw	$t0,-160($fp)	# Store directly on the stack
+	sw	$t0,-148($fp)	# Store directly on the stack
+				# last = a[n];
+	lw	$t0,($s1)	
+	sw	$t0,-160($fp)	# Store directly on the stack
+	sw	$t0,-144($fp)	# Store directly on the stack
+				# a[n] = temp;
+	lw	$t0,-148($fp)	
+	sw	$t0,($s1)	# Store data at array[subscript]
+				# i = i + 1;
+				# Reserved one word on stack for temp var -160($fp)
+	lw	$t0,-152($fp)	
+	li	$t1,1	
+	add	$t0,$t0,$t1	
+	sw	$t0,-160($fp)	# Store directly on the stack
+	sw	$t0,-152($fp)	# Store directly on the stack
+	b	L_main_func_while_1	
+L_main_func_endwhile_1:			
+L_main_func_endelse_0:			
+				# n = n+1;
+				# Reserved one word on stack for temp var -144($fp)
+	lw	$t0,-132($fp)	
+	li	$t1,1	
+	add	$t0,$t0,$t1	
+	sw	$t0,-144($fp)	# Store directly on the stack
+	sw	$t0,-132($fp)	# Store directly on the stack
+	addi	$s0,$s0,-4	# subscript changed by 1
+	b	L_main_func_while_0	
+L_main_func_endwhile_0:			
+				# print("The first ");
+				# Reserved one word on stack for temp var -140($fp)
+
+	.data
+L_main_func_string_0:	.asciiz	"The first "
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_0	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print(MAX);
+				# print(int)
+	lw	$a0,-128($fp)	
+	li	$v0,1	# Syscall for print_int
+	syscall			
+				# print(" numbers in the Fibonacci Sequence are: \n");
+				# Reserved one word on stack for temp var -140($fp)
+
+	.data
+L_main_func_string_1:	.asciiz	" numbers in the Fibonacci Sequence are: \n"
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_1	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# n = 0;
+				# Reserved one word on stack for temp var -140($fp)
+	li	$t0,0	
+	sw	$t0,-132($fp)	# Store directly on the stack
+				# while (n < MAX) {
+				# Array addresses hoisted out of while loop
+	lw	$s0,-132($fp)	# put subscript in $s0
+	sll	$s0,$s0,2	# multiply subscript by 4
+	sub	$s0,$fp,$s0	
+	addi	$s0,$s0,-8	# $s0 points to array[subscript]
+L_main_func_while_2:			
+				# Reserved one word on stack for temp var -140($fp)
+	lw	$t0,-132($fp)	
+	lw	$t1,-128($fp)	
+	sub	$t0,$t0,$t1	# t0=t0-t1
+	bgez	$t0,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-140($fp)	# Store directly on the stack
+	beq	$t0,$0,L_main_func_endwhile_2	
+				# print(a[n]);
+	lw	$t0,($s0)	
+	sw	$t0,-144($fp)	# Store directly on the stack
+				# print(int)
+	lw	$a0,-144($fp)	
+	li	$v0,1	# Syscall for print_int
+	syscall			
+				# print(" ");
+				# Reserved one word on stack for temp var -144($fp)
+
+	.data
+L_main_func_string_2:	.asciiz	" "
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_2	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# n = n+1;
+				# Reserved one word on stack for temp var -144($fp)
+	lw	$t0,-132($fp)	
+	li	$t1,1	
+	add	$t0,$t0,$t1	
+	sw	$t0,-144($fp)	# Store directly on the stack
+	sw	$t0,-132($fp)	# Store directly on the stack
+	addi	$s0,$s0,-4	# subscript changed by 1
+	b	L_main_func_while_2	
+L_main_func_endwhile_2:			
+				# print("\nGoodbye!!!\n");
+				# Reserved one word on stack for temp var -144($fp)
+
+	.data
+L_main_func_string_3:	.asciiz	"\nGoodbye!!!\n"
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_3	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+	jr	$ra	
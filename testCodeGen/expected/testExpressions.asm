@@ -0,0 +1,303 @@
+	.text
+	.globl main
+main:
+	move	$fp,$sp
+	la	$a0,ProgStart
+	li	$v0,4                   # Print Syscall
+	syscall
+	jal	main_func
+
+	la $a0,ProgEnd
+	li $v0,4                    # Print Syscall
+	syscall
+	li $v0,10                   # Exit Syscall
+	syscall
+	.data
+ProgStart:	.asciiz	"Program Start\n"
+ProgEnd:	.asciiz	"Program End\n"
+	.text
+
+main_func:			# main() INT
+				# var n int;
+				# Reserve 1 words on stack for var n at -8($fp)
+				# var a int;
+				# Reserve 1 words on stack for var a at -12($fp)
+				# a = 8;
+				# Reserved one word on stack for temp var -16($fp)
+	li	$t0,8	
+	sw	$t0,-12($fp)	# Store directly on the stack
+				# n = 5;
+				# Reserved one word on stack for temp var -16($fp)
+	li	$t0,5	
+	sw	$t0,-8($fp)	# Store directly on the stack
+				# print("Expect 1: 8 / 5 =", 8/5, '\n');
+				# Reserved one word on stack for temp var -16($fp)
+				# Reserved one word on stack for temp var -20($fp)
+				# Reserved one word on stack for temp var -24($fp)
+	li	$t0,8	
+	li	$t1,5	
+	div	$t0,$t0,$t1	
+	sw	$t0,-20($fp)	# Store directly on the stack
+				# Reserved one word on stack for temp var -28($fp)
+
+	.data
+L_main_func_string_0:	.asciiz	"Expect 1: 8 / 5 ="
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_0	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print(int)
+	lw	$a0,-20($fp)	
+	li	$v0,1	# Syscall for print_int
+	syscall			
+				# print(char)
+	li	$a0,10	
+	li	$v0,11	# Syscall for print_char
+	syscall			
+				# print("Expect 3: 8 % 5 =", 8%5, '\n');
+				# Reserved one word on stack for temp var -16($fp)
+				# Reserved one word on stack for temp var -20($fp)
+				# Reserved one word on stack for temp var -24($fp)
+	li	$t0,8	
+	li	$t1,5	
+	div	$t0,$t0,$t1	
+	mfhi	$t0	# Modulus: remainder is in HI register
+	sw	$t0,-20($fp)	# Store directly on the stack
+				# Reserved one word on stack for temp var -28($fp)
+
+	.data
+L_main_func_string_1:	.asciiz	"Expect 3: 8 % 5 ="
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_1	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print(int)
+	lw	$a0,-20($fp)	
+	li	$v0,1	# Syscall for print_int
+	syscall			
+				# print(char)
+	li	$a0,10	
+	li	$v0,11	# Syscall for print_char
+	syscall			
+				# if (a > n) {
+				# Reserved one word on stack for temp var -16($fp)
+	lw	$t0,-12($fp)	
+	lw	$t1,-8($fp)	
+	sub	$t0,$t1,$t0	# t0=t1-t0
+	bgez	$t0,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-16($fp)	# Store directly on the stack
+	beq	$t0,$0,L_main_func_else_0	
+				# var a int;
+				# Reserve 1 words on stack for var a at -20($fp)
+				# a = 3;
+				# Reserved one word on stack for temp var -24($fp)
+	li	$t0,3	
+	sw	$t0,-20($fp)	# Store directly on the stack
+				# while (a < n) {
+L_main_func_while_0:			
+				# Reserved one word on stack for temp var -24($fp)
+	lw	$t0,-20($fp)	
+	lw	$t1,-8($fp)	
+	sub	$t0,$t0,$t1	# t0=t0-t1
+	bgez	$t0,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-24($fp)	# Store directly on the stack
+	beq	$t0,$0,L_main_func_endwhile_0	
+				# print("Inner a is ", a, " and less than n (expect print 2x)\n");
+				# Reserved one word on stack for temp var -28($fp)
+				# Reserved one word on stack for temp var -32($fp)
+
+	.data
+L_main_func_string_2:	.asciiz	"Inner a is "
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_2	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print(int)
+	lw	$a0,-20($fp)	
+	li	$v0,1	# Syscall for print_int
+	syscall			
+
+	.data
+L_main_func_string_3:	.asciiz	" and less than n (expect print 2x)\n"
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_3	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# a = a+1;
+				# Reserved one word on stack for temp var -28($fp)
+	lw	$t0,-20($fp)	
+	li	$t1,1	
+	add	$t0,$t0,$t1	
+	sw	$t0,-28($fp)	# Store directly on the stack
+	sw	$t0,-20($fp)	# Store directly on the stack
+				# if (a == 4) {
+				# Reserved one word on stack for temp var -28($fp)
+	lw	$t0,-20($fp)	
+	li	$t1,4	
+	bne	$t0,$t1,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-28($fp)	# Store directly on the stack
+	beq	$t0,$0,L_main_func_else_1	
+				# var a int;
+				# Reserve 1 words on stack for var a at -32($fp)
+				# a = 99;
+				# Reserved one word on stack for temp var -36($fp)
+	li	$t0,99	
+	sw	$t0,-32($fp)	# Store directly on the stack
+				# print("Inner inner a is ", a, " and outer n is ", n,
+				# Reserved one word on stack for temp var -36($fp)
+				# Reserved one word on stack for temp var -40($fp)
+				# Reserved one word on stack for temp var -44($fp)
+
+	.data
+L_main_func_string_4:	.asciiz	"Inner inner a is "
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_4	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print(int)
+	lw	$a0,-32($fp)	
+	li	$v0,1	# Syscall for print_int
+	syscall			
+
+	.data
+L_main_func_string_5:	.asciiz	" and outer n is "
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_5	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print(int)
+	lw	$a0,-8($fp)	
+	li	$v0,1	# Syscall for print_int
+	syscall			
+
+	.data
+L_main_func_string_6:	.asciiz	" (expect print once)\n"
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_6	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# if (a < 4) {
+				# Reserved one word on stack for temp var -36($fp)
+	lw	$t0,-32($fp)	
+	li	$t1,4	
+	sub	$t0,$t0,$t1	# t0=t0-t1
+	bgez	$t0,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-36($fp)	# Store directly on the stack
+	beq	$t0,$0,L_main_func_else_2	
+				# print("Potential dangling else can't happen because of ",
+				# Reserved one word on stack for temp var -40($fp)
+				# Reserved one word on stack for temp var -44($fp)
+				# Reserved one word on stack for temp var -48($fp)
+				# Reserved one word on stack for temp var -52($fp)
+
+	.data
+L_main_func_string_7:	.asciiz	"Potential dangling else can't happen because of curly braces and unique labels\n(expect not to print; but next line prints twice if dangling else occurs)\n"
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_7	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+L_main_func_else_2:			
+	b	L_main_func_endelse_1	
+L_main_func_else_1:			
+				# print("Inner a is not 4 (expect print once)\n");
+				# Reserved one word on stack for temp var -32($fp)
+
+	.data
+L_main_func_string_8:	.asciiz	"Inner a is not 4 (expect print once)\n"
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_8	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+L_main_func_endelse_1:			
+	b	L_main_func_while_0	
+L_main_func_endwhile_0:			
+				# print("Inner a is back to ", a, " (expect 5)\n");
+				# Reserved one word on stack for temp var -28($fp)
+				# Reserved one word on stack for temp var -32($fp)
+
+	.data
+L_main_func_string_9:	.asciiz	"Inner a is back to "
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_9	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print(int)
+	lw	$a0,-20($fp)	
+	li	$v0,1	# Syscall for print_int
+	syscall			
+
+	.data
+L_main_func_string_10:	.asciiz	" (expect 5)\n"
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_10	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+L_main_func_else_0:			
+				# print("Outer a is back to ", a, " (expect 8)\n");
+				# Reserved one word on stack for temp var -20($fp)
+				# Reserved one word on stack for temp var -24($fp)
+
+	.data
+L_main_func_string_11:	.asciiz	"Outer a is back to "
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_11	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print(int)
+	lw	$a0,-12($fp)	
+	li	$v0,1	# Syscall for print_int
+	syscall			
+
+	.data
+L_main_func_string_12:	.asciiz	" (expect 8)\n"
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_12	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+	jr	$ra	
@@ -0,0 +1,500 @@
+	.text
+	.globl main
+main:
+	move	$fp,$sp
+	la	$a0,ProgStart
+	li	$v0,4                   # Print Syscall
+	syscall
+	jal	main_func
+
+	la $a0,ProgEnd
+	li $v0,4                    # Print Syscall
+	syscall
+	li $v0,10                   # Exit Syscall
+	syscall
+	.data
+ProgStart:	.asciiz	"Program Start\n"
+ProgEnd:	.asciiz	"Program End\n"
+	.text
+
+func_check_conditions:			# check_conditions(FLOAT, FLOAT) INT
+				# if (a < b) {
+				# Reserved one word on stack for temp var -8($fp)
+	lw	$t0,8($fp)	
+	lwc1	$f0,($t0)	
+	lw	$t0,4($fp)	
+	lwc1	$f1,($t0)	
+	c.lt.s	$f0,$f1	
+	bc1f	1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			
+	sw	$t0,-8($fp)	# Store directly on the stack
+	beq	$t0,$0,L_func_check_conditions_else_0	
+				# print(a, " is less than ", b, '\n');
+				# Reserved one word on stack for temp var -12($fp)
+				# Reserved one word on stack for temp var -16($fp)
+				# print(float)
+	lw	$t1,8($fp)	
+	lwc1	$f12,($t1)	
+	li	$v0,2	# Syscall for print_float
+	syscall			
+
+	.data
+L_func_check_conditions_string_0:	.asciiz	" is less than "
+
+	.text
+				# print(string)
+	la	$a0,L_func_check_conditions_string_0	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print(float)
+	lw	$t1,4($fp)	
+	lwc1	$f12,($t1)	
+	li	$v0,2	# Syscall for print_float
+	syscall			
+				# print(char)
+	li	$a0,10	
+	li	$v0,11	# Syscall for print_char
+	syscall			
+L_func_check_conditions_else_0:			
+				# if (a <= b) {
+				# Reserved one word on stack for temp var -12($fp)
+	lw	$t0,8($fp)	
+	lwc1	$f0,($t0)	
+	lw	$t0,4($fp)	
+	lwc1	$f1,($t0)	
+	c.le.s	$f0,$f1	
+	bc1f	1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			
+	sw	$t0,-12($fp)	# Store directly on the stack
+	beq	$t0,$0,L_func_check_conditions_else_1	
+				# print(a, " is less than or equal to ", b, '\n');
+				# Reserved one word on stack for temp var -16($fp)
+				# Reserved one word on stack for temp var -20($fp)
+				# print(float)
+	lw	$t1,8($fp)	
+	lwc1	$f12,($t1)	
+	li	$v0,2	# Syscall for print_float
+	syscall			
+
+	.data
+L_func_check_conditions_string_1:	.asciiz	" is less than or equal to "
+
+	.text
+				# print(string)
+	la	$a0,L_func_check_conditions_string_1	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print(float)
+	lw	$t1,4($fp)	
+	lwc1	$f12,($t1)	
+	li	$v0,2	# Syscall for print_float
+	syscall			
+				# print(char)
+	li	$a0,10	
+	li	$v0,11	# Syscall for print_char
+	syscall			
+L_func_check_conditions_else_1:			
+				# if (a == b) {
+				# Reserved one word on stack for temp var -16($fp)
+	lw	$t0,8($fp)	
+	lwc1	$f0,($t0)	
+	lw	$t0,4($fp)	
+	lwc1	$f1,($t0)	
+	c.eq.s	$f0,$f1	# Check if equal
+	bc1f	1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			
+	sw	$t0,-16($fp)	# Store directly on the stack
+	beq	$t0,$0,L_func_check_conditions_else_2	
+				# print(a, " is equal to ", b, '\n');
+				# Reserved one word on stack for temp var -20($fp)
+				# Reserved one word on stack for temp var -24($fp)
+				# print(float)
+	lw	$t1,8($fp)	
+	lwc1	$f12,($t1)	
+	li	$v0,2	# Syscall for print_float
+	syscall			
+
+	.data
+L_func_check_conditions_string_2:	.asciiz	" is equal to "
+
+	.text
+				# print(string)
+	la	$a0,L_func_check_conditions_string_2	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print(float)
+	lw	$t1,4($fp)	
+	lwc1	$f12,($t1)	
+	li	$v0,2	# Syscall for print_float
+	syscall			
+				# print(char)
+	li	$a0,10	
+	li	$v0,11	# Syscall for print_char
+	syscall			
+L_func_check_conditions_else_2:			
+				# if (a >= b) {
+				# Reserved one word on stack for temp var -20($fp)
+	lw	$t0,8($fp)	
+	lwc1	$f0,($t0)	
+	lw	$t0,4($fp)	
+	lwc1	$f1,($t0)	
+	c.le.s	$f1,$f0	
+	bc1f	1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			
+	sw	$t0,-20($fp)	# Store directly on the stack
+	beq	$t0,$0,L_func_check_conditions_else_3	
+				# print(a, " is greater than or equal to ", b, '\n');
+				# Reserved one word on stack for temp var -24($fp)
+				# Reserved one word on stack for temp var -28($fp)
+				# print(float)
+	lw	$t1,8($fp)	
+	lwc1	$f12,($t1)	
+	li	$v0,2	# Syscall for print_float
+	syscall			
+
+	.data
+L_func_check_conditions_string_3:	.asciiz	" is greater than or equal to "
+
+	.text
+				# print(string)
+	la	$a0,L_func_check_conditions_string_3	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print(float)
+	lw	$t1,4($fp)	
+	lwc1	$f12,($t1)	
+	li	$v0,2	# Syscall for print_float
+	syscall			
+				# print(char)
+	li	$a0,10	
+	li	$v0,11	# Syscall for print_char
+	syscall			
+L_func_check_conditions_else_3:			
+				# if (a > b) {
+				# Reserved one word on stack for temp var -24($fp)
+	lw	$t0,8($fp)	
+	lwc1	$f0,($t0)	
+	lw	$t0,4($fp)	
+	lwc1	$f1,($t0)	
+	c.lt.s	$f1,$f0	
+	bc1f	1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			
+	sw	$t0,-24($fp)	# Store directly on the stack
+	beq	$t0,$0,L_func_check_conditions_else_4	
+				# print(a, " is greater than  ", b, '\n');
+				# Reserved one word on stack for temp var -28($fp)
+				# Reserved one word on stack for temp var -32($fp)
+				# print(float)
+	lw	$t1,8($fp)	
+	lwc1	$f12,($t1)	
+	li	$v0,2	# Syscall for print_float
+	syscall			
+
+	.data
+L_func_check_conditions_string_4:	.asciiz	" is greater than  "
+
+	.text
+				# print(string)
+	la	$a0,L_func_check_conditions_string_4	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print(float)
+	lw	$t1,4($fp)	
+	lwc1	$f12,($t1)	
+	li	$v0,2	# Syscall for print_float
+	syscall			
+				# print(char)
+	li	$a0,10	
+	li	$v0,11	# Syscall for print_char
+	syscall			
+L_func_check_conditions_else_4:			
+				# if (a != b) {
+				# Reserved one word on stack for temp var -28($fp)
+	lw	$t0,8($fp)	
+	lwc1	$f0,($t0)	
+	lw	$t0,4($fp)	
+	lwc1	$f1,($t0)	
+	c.eq.s	$f0,$f1	# Check if not equal
+	bc1t	1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			
+	sw	$t0,-28($fp)	# Store directly on the stack
+	beq	$t0,$0,L_func_check_conditions_else_5	
+				# print(a, " is not equal to ", b, '\n');
+				# Reserved one word on stack for temp var -32($fp)
+				# Reserved one word on stack for temp var -36($fp)
+				# print(float)
+	lw	$t1,8($fp)	
+	lwc1	$f12,($t1)	
+	li	$v0,2	# Syscall for print_float
+	syscall			
+
+	.data
+L_func_check_conditions_string_5:	.asciiz	" is not equal to "
+
+	.text
+				# print(string)
+	la	$a0,L_func_check_conditions_string_5	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print(float)
+	lw	$t1,4($fp)	
+	lwc1	$f12,($t1)	
+	li	$v0,2	# Syscall for print_float
+	syscall			
+				# print(char)
+	li	$a0,10	
+	li	$v0,11	# Syscall for print_char
+	syscall			
+L_func_check_conditions_else_5:			
+	jr	$ra	
+main_func:			# main() INT
+				# var f float;
+				# Reserve 1 words on stack for var f at -8($fp)
+				# f = 2.125;
+				# Reserved one word on stack for temp var -12($fp)
+
+	.data
+L_main_func_float_0:	.float	2.125000
+
+	.text
+	la	$t0,L_main_func_float_0	
+	lw	$t0,($t0)	
+	sw	$t0,-8($fp)	# Store directly on the stack
+				# var f_array [3] float;
+				# Reserve 3 words on stack for var f_array at -12($fp)
+				# f_array[0] = 1.25;
+				# Reserved one word on stack for temp var -24($fp)
+				# Reserved one word on stack for temp var -28($fp)
+
+	.data
+L_main_func_float_1:	.float	1.250000
+
+	.text
+	la	$t0,L_main_func_float_1	
+	lw	$t0,($t0)	
+	addi	$s0,$fp,-12	# $s0 points to array[0]
+	sw	$t0,($s0)	# Store data at array[subscript]
+				# f_array[1] = f;
+				# Reserved one word on stack for temp var -24($fp)
+	lw	$t0,-8($fp)	
+	addi	$s1,$fp,-16	# $s1 points to array[1]
+	sw	$t0,($s1)	# Store data at array[subscript]
+				# f_array[2] = 2.25;
+				# Reserved one word on stack for temp var -24($fp)
+				# Reserved one word on stack for temp var -28($fp)
+
+	.data
+L_main_func_float_2:	.float	2.250000
+
+	.text
+	la	$t0,L_main_func_float_2	
+	lw	$t0,($t0)	
+	addi	$s2,$fp,-20	# $s2 points to array[2]
+	sw	$t0,($s2)	# Store data at array[subscript]
+				# var i int;
+				# Reserve 1 words on stack for var i at -24($fp)
+				# i = 0;
+				# Reserved one word on stack for temp var -28($fp)
+	li	$t0,0	
+	sw	$t0,-24($fp)	# Store directly on the stack
+				# while(i < 3){
+				# Array addresses hoisted out of while loop
+	lw	$s0,-24($fp)	# put subscript in $s0
+	sll	$s0,$s0,2	# multiply subscript by 4
+	sub	$s0,$fp,$s0	
+	addi	$s0,$s0,-12	# $s0 points to array[subscript]
+L_main_func_while_0:			
+				# Reserved one word on stack for temp var -28($fp)
+	lw	$t0,-24($fp)	
+	li	$t1,3	
+	sub	$t0,$t0,$t1	# t0=t0-t1
+	bgez	$t0,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-28($fp)	# Store directly on the stack
+	beq	$t0,$0,L_main_func_endwhile_0	
+				# check_conditions(f, f_array[i]);
+	lw	$t0,($s0)	
+	sw	$t0,-32($fp)	# Store directly on the stack
+				# Reserve 1 words on stack for var return_var at -36($fp)
+	addi	$t0,$fp,-8	# Make pointer
+	sw	$t0,-40($fp)	# Add param to stack for param at -40($fp)
+	addi	$t0,$fp,-32	# Make pointer
+	sw	$t0,-44($fp)	# Add param to stack for param at -44($fp)
+	addi	$sp,$fp,-48	
+	sw	$fp,($sp)	# store old control link
+	move	$fp,$sp	# make new control link
+	addi	$sp,$sp,-4	
+	sw	$ra,($sp)	# store return address
+	jal	func_check_conditions	
+	lw	$ra,-4($fp)	# restore old ra
+	move	$sp,$fp	# restore old sp
+	addi	$sp,$sp,12	# remove params and control link from stack
+	lw	$fp,($fp)	# restore old fp
+				# print(f, " * ", f_array[i], " = ", (f*f_array[i]), '\n');
+				# Reserved one word on stack for temp var -32($fp)
+	lw	$t0,($s0)	
+	sw	$t0,-36($fp)	# Store directly on the stack
+				# Reserved one word on stack for temp var -40($fp)
+	lw	$t0,($s0)	
+	sw	$t0,-44($fp)	# Store directly on the stack
+	lwc1	$f0,-8($fp)	
+	lwc1	$f1,-44($fp)	
+	mul.s	$f0,$f0,$f1	
+	swc1	$f0,-44($fp)	# Store directly on the stack
+				# Reserved one word on stack for temp var -48($fp)
+				# print(float)
+	lwc1	$f12,-8($fp)	
+	li	$v0,2	# Syscall for print_float
+	syscall			
+
+	.data
+L_main_func_string_0:	.asciiz	" * "
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_0	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print(float)
+	lwc1	$f12,-36($fp)	
+	li	$v0,2	# Syscall for print_float
+	syscall			
+
+	.data
+L_main_func_string_1:	.asciiz	" = "
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_1	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print(float)
+	lwc1	$f12,-44($fp)	
+	li	$v0,2	# Syscall for print_float
+	syscall			
+				# print(char)
+	li	$a0,10	
+	li	$v0,11	# Syscall for print_char
+	syscall			
+				# print(f, " / ", f_array[i], " = ", (f/f_array[i]), '\n');
+				# Reserved one word on stack for temp var -32($fp)
+	lw	$t0,($s0)	
+	sw	$t0,-36($fp)	# Store directly on the stack
+				# Reserved one word on stack for temp var -40($fp)
+	lw	$t0,($s0)	
+	sw	$t0,-44($fp)	# Store directly on the stack
+	lwc1	$f0,-8($fp)	
+	lwc1	$f1,-44($fp)	
+	div.s	$f0,$f0,$f1	
+	swc1	$f0,-44($fp)	# Store directly on the stack
+				# Reserved one word on stack for temp var -48($fp)
+				# print(float)
+	lwc1	$f12,-8($fp)	
+	li	$v0,2	# Syscall for print_float
+	syscall			
+
+	.data
+L_main_func_string_2:	.asciiz	" / "
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_2	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print(float)
+	lwc1	$f12,-36($fp)	
+	li	$v0,2	# Syscall for print_float
+	syscall			
+				# print(string)
+	la	$a0,L_main_func_string_1	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print(float)
+	lwc1	$f12,-44($fp)	
+	li	$v0,2	# Syscall for print_float
+	syscall			
+				# print(char)
+	li	$a0,10	
+	li	$v0,11	# Syscall for print_char
+	syscall			
+				# print("cast_int(", f_array[i], ") == ", cast_int(f_array[i]), '\n');
+				# Reserved one word on stack for temp var -32($fp)
+	lw	$t0,($s0)	
+	sw	$t0,-36($fp)	# Store directly on the stack
+				# Reserved one word on stack for temp var -40($fp)
+	lw	$t0,($s0)	
+	sw	$t0,-44($fp)	# Store directly on the stack
+				# Reserved one word on stack for temp var -48($fp)
+	lwc1	$f0,-44($fp)	
+	cvt.w.s	$f0,$f0	
+	swc1	$f0,-48($fp)	# Store directly on the stack
+				# Reserved one word on stack for temp var -52($fp)
+
+	.data
+L_main_func_string_3:	.asciiz	"cast_int("
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_3	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print(float)
+	lwc1	$f12,-36($fp)	
+	li	$v0,2	# Syscall for print_float
+	syscall			
+
+	.data
+L_main_func_string_4:	.asciiz	") == "
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_4	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print(int)
+	lw	$a0,-48($fp)	
+	li	$v0,1	# Syscall for print_int
+	syscall			
+				# print(char)
+	li	$a0,10	
+	li	$v0,11	# Syscall for print_char
+	syscall			
+				# i = i + 1;
+				# Reserved one word on stack for temp var -32($fp)
+	lw	$t0,-24($fp)	
+	li	$t1,1	
+	add	$t0,$t0,$t1	
+	sw	$t0,-32($fp)	# Store directly on the stack
+	sw	$t0,-24($fp)	# Store directly on the stack
+	addi	$s0,$s0,-4	# subscript changed by 1
+	b	L_main_func_while_0	
+L_main_func_endwhile_0:			
+	jr	$ra	
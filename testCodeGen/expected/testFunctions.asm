@@ -0,0 +1,343 @@
+	.text
+	.globl main
+main:
+	move	$fp,$sp
+	la	$a0,ProgStart
+	li	$v0,4                   # Print Syscall
+	syscall
+	jal	main_func
+
+	la $a0,ProgEnd
+	li $v0,4                    # Print Syscall
+	syscall
+	li $v0,10                   # Exit Syscall
+	syscall
+	.data
+ProgStart:	.asciiz	"Program Start\n"
+ProgEnd:	.asciiz	"Program End\n"
+	.text
+
+func_bar:			# bar(INT, INT) INT
+				# print("\nIn function bar()");
+				# Reserved one word on stack for temp var -8($fp)
+
+	.data
+L_func_bar_string_0:	.asciiz	"\nIn function bar()"
+
+	.text
+				# print(string)
+	la	$a0,L_func_bar_string_0	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print("\nArg c was ");
+				# Reserved one word on stack for temp var -8($fp)
+
+	.data
+L_func_bar_string_1:	.asciiz	"\nArg c was "
+
+	.text
+				# print(string)
+	la	$a0,L_func_bar_string_1	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print(c);
+				# print(int)
+	lw	$t1,8($fp)	
+	lw	$a0,($t1)	
+	li	$v0,1	# Syscall for print_int
+	syscall			
+				# print(" and arg d was ");
+				# Reserved one word on stack for temp var -8($fp)
+
+	.data
+L_func_bar_string_2:	.asciiz	" and arg d was "
+
+	.text
+				# print(string)
+	la	$a0,L_func_bar_string_2	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print(d);
+				# print(int)
+	lw	$t1,4($fp)	
+	lw	$a0,($t1)	
+	li	$v0,1	# Syscall for print_int
+	syscall			
+				# e = c * d;
+				# Reserved one word on stack for temp var -8($fp)
+	lw	$t1,8($fp)	
+	lw	$t0,($t1)	
+	lw	$t2,4($fp)	
+	lw	$t1,($t2)	
+	mul	$t0,$t0,$t1	
+	sw	$t0,-8($fp)	# Store directly on the stack
+	sw	$t0,12($fp)	# Store directly on the stack
+				# print("\nResult of c*d was ");
+				# Reserved one word on stack for temp var -8($fp)
+
+	.data
+L_func_bar_string_3:	.asciiz	"\nResult of c*d was "
+
+	.text
+				# print(string)
+	la	$a0,L_func_bar_string_3	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print(e);
+				# print(int)
+	lw	$a0,12($fp)	
+	li	$v0,1	# Syscall for print_int
+	syscall			
+				# print("\n");
+				# Reserved one word on stack for temp var -8($fp)
+
+	.data
+L_func_bar_string_4:	.asciiz	"\n"
+
+	.text
+				# print(string)
+	la	$a0,L_func_bar_string_4	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+	jr	$ra	
+func_foo:			# foo(INT, INT) INT
+				# print("\nIn function foo()");
+				# Reserved one word on stack for temp var -8($fp)
+
+	.data
+L_func_foo_string_0:	.asciiz	"\nIn function foo()"
+
+	.text
+				# print(string)
+	la	$a0,L_func_foo_string_0	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print("\nArg a was ");
+				# Reserved one word on stack for temp var -8($fp)
+
+	.data
+L_func_foo_string_1:	.asciiz	"\nArg a was "
+
+	.text
+				# print(string)
+	la	$a0,L_func_foo_string_1	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print(a);
+				# print(int)
+	lw	$t1,8($fp)	
+	lw	$a0,($t1)	
+	li	$v0,1	# Syscall for print_int
+	syscall			
+				# print(" and arg b was ");
+				# Reserved one word on stack for temp var -8($fp)
+
+	.data
+L_func_foo_string_2:	.asciiz	" and arg b was "
+
+	.text
+				# print(string)
+	la	$a0,L_func_foo_string_2	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print(b);
+				# print(int)
+	lw	$t1,4($fp)	
+	lw	$a0,($t1)	
+	li	$v0,1	# Syscall for print_int
+	syscall			
+				# c = a * bar(b, a);
+				# Reserve 1 words on stack for var return_var at -8($fp)
+	lw	$t0,4($fp)	# Copy existing pointer
+	sw	$t0,-12($fp)	# Add param to stack for param at -12($fp)
+	lw	$t0,8($fp)	# Copy existing pointer
+	sw	$t0,-16($fp)	# Add param to stack for param at -16($fp)
+	addi	$sp,$fp,-20	
+	sw	$fp,($sp)	# store old control link
+	move	$fp,$sp	# make new control link
+	addi	$sp,$sp,-4	
+	sw	$ra,($sp)	# store return address
+	jal	func_bar	
+	lw	$ra,-4($fp)	# restore old ra
+	move	$sp,$fp	# restore old sp
+	addi	$sp,$sp,12	# remove params and control link from stack
+	lw	$fp,($fp)	# restore old fp
+				# Reserved one word on stack for temp var -20($fp)
+	lw	$t1,8($fp)	
+	lw	$t0,($t1)	
+	lw	$t1,-8($fp)	
+	mul	$t0,$t0,$t1	
+	sw	$t0,-20($fp)	# Store directly on the stack
+	sw	$t0,12($fp)	# Store directly on the stack
+				# print("\nResult of a * bar(a,b) was ");
+				# Reserved one word on stack for temp var -8($fp)
+
+	.data
+L_func_foo_string_3:	.asciiz	"\nResult of a * bar(a,b) was "
+
+	.text
+				# print(string)
+	la	$a0,L_func_foo_string_3	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print(c);
+				# print(int)
+	lw	$a0,12($fp)	
+	li	$v0,1	# Syscall for print_int
+	syscall			
+				# print("\n");
+				# Reserved one word on stack for temp var -8($fp)
+
+	.data
+L_func_foo_string_4:	.asciiz	"\n"
+
+	.text
+				# print(string)
+	la	$a0,L_func_foo_string_4	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+	jr	$ra	
+main_func:			# main() INT
+				# var a int;
+				# Reserve 1 words on stack for var a at -8($fp)
+				# var b int;
+				# Reserve 1 words on stack for var b at -12($fp)
+				# a = 3;
+				# Reserved one word on stack for temp var -16($fp)
+	li	$t0,3	
+	sw	$t0,-8($fp)	# Store directly on the stack
+				# b = 7;
+				# Reserved one word on stack for temp var -16($fp)
+	li	$t0,7	
+	sw	$t0,-12($fp)	# Store directly on the stack
+				# print("\nIn function main()");
+				# Reserved one word on stack for temp var -16($fp)
+
+	.data
+L_main_func_string_0:	.asciiz	"\nIn function main()"
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_0	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print("\nVar a was ");
+				# Reserved one word on stack for temp var -16($fp)
+
+	.data
+L_main_func_string_1:	.asciiz	"\nVar a was "
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_1	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print(a);
+				# print(int)
+	lw	$a0,-8($fp)	
+	li	$v0,1	# Syscall for print_int
+	syscall			
+				# print(" and arg b was ");
+				# Reserved one word on stack for temp var -16($fp)
+
+	.data
+L_main_func_string_2:	.asciiz	" and arg b was "
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_2	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print(b);
+				# print(int)
+	lw	$a0,-12($fp)	
+	li	$v0,1	# Syscall for print_int
+	syscall			
+				# var c int;
+				# Reserve 1 words on stack for var c at -16($fp)
+				# c = bar(a,b);
+				# Reserve 1 words on stack for var return_var at -20($fp)
+	addi	$t0,$fp,-8	# Make pointer
+	sw	$t0,-24($fp)	# Add param to stack for param at -24($fp)
+	addi	$t0,$fp,-12	# Make pointer
+	sw	$t0,-28($fp)	# Add param to stack for param at -28($fp)
+	addi	$sp,$fp,-32	
+	sw	$fp,($sp)	# store old control link
+	move	$fp,$sp	# make new control link
+	addi	$sp,$sp,-4	
+	sw	$ra,($sp)	# store return address
+	jal	func_bar	
+	lw	$ra,-4($fp)	# restore old ra
+	move	$sp,$fp	# restore old sp
+	addi	$sp,$sp,12	# remove params and control link from stack
+	lw	$fp,($fp)	# restore old fp
+	lw	$t0,-20($fp)	
+	sw	$t0,-16($fp)	# Store directly on the stack
+				# print("\nResult of bar(a,b) was ");
+				# Reserved one word on stack for temp var -20($fp)
+
+	.data
+L_main_func_string_3:	.asciiz	"\nResult of bar(a,b) was "
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_3	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print(c);
+				# print(int)
+	lw	$a0,-16($fp)	
+	li	$v0,1	# Syscall for print_int
+	syscall			
+				# print("\n");
+				# Reserved one word on stack for temp var -20($fp)
+
+	.data
+L_main_func_string_4:	.asciiz	"\n"
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_4	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# c = foo(a,b);
+				# Reserve 1 words on stack for var return_var at -20($fp)
+	addi	$t0,$fp,-8	# Make pointer
+	sw	$t0,-24($fp)	# Add param to stack for param at -24($fp)
+	addi	$t0,$fp,-12	# Make pointer
+	sw	$t0,-28($fp)	# Add param to stack for param at -28($fp)
+	addi	$sp,$fp,-32	
+	sw	$fp,($sp)	# store old control link
+	move	$fp,$sp	# make new control link
+	addi	$sp,$sp,-4	
+	sw	$ra,($sp)	# store return address
+	jal	func_foo	
+	lw	$ra,-4($fp)	# restore old ra
+	move	$sp,$fp	# restore old sp
+	addi	$sp,$sp,12	# remove params and control link from stack
+	lw	$fp,($fp)	# restore old fp
+	lw	$t0,-20($fp)	
+	sw	$t0,-16($fp)	# Store directly on the stack
+				# print("\nResult of foo(a,b) was ");
+				# Reserved one word on stack for temp var -20($fp)
+
+	.data
+L_main_func_string_5:	.asciiz	"\nResult of foo(a,b) was "
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_5	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print(c);
+				# print(int)
+	lw	$a0,-16($fp)	
+	li	$v0,1	# Syscall for print_int
+	syscall			
+				# print("\n");
+				# Reserved one word on stack for temp var -20($fp)
+				# print(string)
+	la	$a0,L_main_func_string_4	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+	jr	$ra	
@@ -0,0 +1,459 @@
+	.text
+	.globl main
+main:
+	move	$fp,$sp
+	la	$a0,ProgStart
+	li	$v0,4                   # Print Syscall
+	syscall
+	jal	main_func
+
+	la $a0,ProgEnd
+	li $v0,4                    # Print Syscall
+	syscall
+	li $v0,10                   # Exit Syscall
+	syscall
+	.data
+ProgStart:	.asciiz	"Program Start\n"
+ProgEnd:	.asciiz	"Program End\n"
+	.text
+
+main_func:			# main() INT
+				# var a int;
+				# Reserve 1 words on stack for var a at -8($fp)
+				# var n int;
+				# Reserve 1 words on stack for var n at -12($fp)
+				# print("Enter an int (n): ");
+				# Reserved one word on stack for temp var -16($fp)
+
+	.data
+L_main_func_string_0:	.asciiz	"Enter an int (n): "
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_0	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# n = read_int();
+				# Reserved one word on stack for temp var -16($fp)
+	li	$v0,5	# Syscall for read_int
+	syscall			
+	sw	$v0,-16($fp)	
+	lw	$t0,-16($fp)	
+	sw	$t0,-12($fp)	# Store directly on the stack
+				# print("Enter an int (a): ");
+				# Reserved one word on stack for temp var -16($fp)
+
+	.data
+L_main_func_string_1:	.asciiz	"Enter an int (a): "
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_1	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# a = read_int();
+				# Reserved one word on stack for temp var -16($fp)
+	li	$v0,5	# Syscall for read_int
+	syscall			
+	sw	$v0,-16($fp)	
+	lw	$t0,-16($fp)	
+	sw	$t0,-8($fp)	# Store directly on the stack
+				# if (n < 0) {
+				# Reserved one word on stack for temp var -16($fp)
+	lw	$t0,-12($fp)	
+	li	$t1,0	
+	sub	$t0,$t0,$t1	# t0=t0-t1
+	bgez	$t0,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-16($fp)	# Store directly on the stack
+	beq	$t0,$0,L_main_func_else_0	
+				# print("n is less than 0\n");
+				# Reserved one word on stack for temp var -20($fp)
+
+	.data
+L_main_func_string_2:	.asciiz	"n is less than 0\n"
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_2	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+L_main_func_else_0:			
+				# if (n <= 0) {
+				# Reserved one word on stack for temp var -20($fp)
+	lw	$t0,-12($fp)	
+	li	$t1,0	
+	sub	$t0,$t0,$t1	# t0=t0-t1
+	bgtz	$t0,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-20($fp)	# Store directly on the stack
+	beq	$t0,$0,L_main_func_else_1	
+				# print("n is less than or equal to 0\n");
+				# Reserved one word on stack for temp var -24($fp)
+
+	.data
+L_main_func_string_3:	.asciiz	"n is less than or equal to 0\n"
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_3	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+L_main_func_else_1:			
+				# if (n < 0) {
+				# Reserved one word on stack for temp var -24($fp)
+	lw	$t0,-12($fp)	
+	li	$t1,0	
+	sub	$t0,$t0,$t1	# t0=t0-t1
+	bgez	$t0,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-24($fp)	# Store directly on the stack
+	beq	$t0,$0,L_main_func_else_2	
+				# if (a < 0) {
+				# Reserved one word on stack for temp var -28($fp)
+	lw	$t0,-8($fp)	
+	li	$t1,0	
+	sub	$t0,$t0,$t1	# t0=t0-t1
+	bgez	$t0,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-28($fp)	# Store directly on the stack
+	beq	$t0,$0,L_main_func_else_3	
+				# print("n < 0 and a < 0\n");
+				# Reserved one word on stack for temp var -32($fp)
+
+	.data
+L_main_func_string_4:	.asciiz	"n < 0 and a < 0\n"
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_4	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+L_main_func_else_3:			
+L_main_func_else_2:			
+				# if (n < 0) {
+				# Reserved one word on stack for temp var -28($fp)
+	lw	$t0,-12($fp)	
+	li	$t1,0	
+	sub	$t0,$t0,$t1	# t0=t0-t1
+	bgez	$t0,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-28($fp)	# Store directly on the stack
+	beq	$t0,$0,L_main_func_else_4	
+				# if (a < 0) {
+				# Reserved one word on stack for temp var -32($fp)
+	lw	$t0,-8($fp)	
+	li	$t1,0	
+	sub	$t0,$t0,$t1	# t0=t0-t1
+	bgez	$t0,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-32($fp)	# Store directly on the stack
+	beq	$t0,$0,L_main_func_else_5	
+				# print("n < 0 and a < 0\n");
+				# Reserved one word on stack for temp var -36($fp)
+				# print(string)
+	la	$a0,L_main_func_string_4	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+	b	L_main_func_endelse_5	
+L_main_func_else_5:			
+				# print("n < 0 and a >= 0\n");
+				# Reserved one word on stack for temp var -36($fp)
+
+	.data
+L_main_func_string_5:	.asciiz	"n < 0 and a >= 0\n"
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_5	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+L_main_func_endelse_5:			
+L_main_func_else_4:			
+				# if (n < 0) {
+				# Reserved one word on stack for temp var -32($fp)
+	lw	$t0,-12($fp)	
+	li	$t1,0	
+	sub	$t0,$t0,$t1	# t0=t0-t1
+	bgez	$t0,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-32($fp)	# Store directly on the stack
+	beq	$t0,$0,L_main_func_else_6	
+				# if (a < 0) {
+				# Reserved one word on stack for temp var -36($fp)
+	lw	$t0,-8($fp)	
+	li	$t1,0	
+	sub	$t0,$t0,$t1	# t0=t0-t1
+	bgez	$t0,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-36($fp)	# Store directly on the stack
+	beq	$t0,$0,L_main_func_else_7	
+				# print("n < 0 and a < 0\n");
+				# Reserved one word on stack for temp var -40($fp)
+				# print(string)
+	la	$a0,L_main_func_string_4	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+L_main_func_else_7:			
+	b	L_main_func_endelse_6	
+L_main_func_else_6:			
+				# print("n >= 0\n");
+				# Reserved one word on stack for temp var -36($fp)
+
+	.data
+L_main_func_string_6:	.asciiz	"n >= 0\n"
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_6	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+L_main_func_endelse_6:			
+				# n = 10;
+				# Reserved one word on stack for temp var -36($fp)
+	li	$t0,10	
+	sw	$t0,-12($fp)	# Store directly on the stack
+				# while (0 < n) {
+L_main_func_while_0:			
+				# Reserved one word on stack for temp var -36($fp)
+	li	$t0,0	
+	lw	$t1,-12($fp)	
+	sub	$t0,$t0,$t1	# t0=t0-t1
+	bgez	$t0,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-36($fp)	# Store directly on the stack
+	beq	$t0,$0,L_main_func_endwhile_0	
+				# print(n);
+				# print(int)
+	lw	$a0,-12($fp)	
+	li	$v0,1	# Syscall for print_int
+	syscall			
+				# print("\n");
+				# Reserved one word on stack for temp var -40($fp)
+
+	.data
+L_main_func_string_7:	.asciiz	"\n"
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_7	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# n = n - 1;
+				# Reserved one word on stack for temp var -40($fp)
+	lw	$t0,-12($fp)	
+	li	$t1,1	
+	sub	$t0,$t0,$t1	
+	sw	$t0,-40($fp)	# Store directly on the stack
+	sw	$t0,-12($fp)	# Store directly on the stack
+	b	L_main_func_while_0	
+L_main_func_endwhile_0:			
+				# n = 0;
+				# Reserved one word on stack for temp var -40($fp)
+	li	$t0,0	
+	sw	$t0,-12($fp)	# Store directly on the stack
+				# while (0 <= n) {
+L_main_func_while_1:			
+				# Reserved one word on stack for temp var -40($fp)
+	li	$t0,0	
+	lw	$t1,-12($fp)	
+	sub	$t0,$t0,$t1	# t0=t0-t1
+	bgtz	$t0,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-40($fp)	# Store directly on the stack
+	beq	$t0,$0,L_main_func_endwhile_1	
+				# print("Fibonacci Sequence:\n");
+				# Reserved one word on stack for temp var -44($fp)
+
+	.data
+L_main_func_string_8:	.asciiz	"Fibonacci Sequence:\n"
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_8	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print("Enter int n, and I'll tell you the nth Fibonacci number.\n");
+				# Reserved one word on stack for temp var -44($fp)
+
+	.data
+L_main_func_string_9:	.asciiz	"Enter int n, and I'll tell you the nth Fibonacci number.\n"
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_9	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print("[or a negative number to quit]: ");
+				# Reserved one word on stack for temp var -44($fp)
+
+	.data
+L_main_func_string_10:	.asciiz	"[or a negative number to quit]: "
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_10	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# n = read_int();
+				# Reserved one word on stack for temp var -44($fp)
+	li	$v0,5	# Syscall for read_int
+	syscall			
+	sw	$v0,-44($fp)	
+	lw	$t0,-44($fp)	
+	sw	$t0,-12($fp)	# Store directly on the stack
+				# if (n < 1) {
+				# Reserved one word on stack for temp var -44($fp)
+	lw	$t0,-12($fp)	
+	li	$t1,1	
+	sub	$t0,$t0,$t1	# t0=t0-t1
+	bgez	$t0,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-44($fp)	# Store directly on the stack
+	beq	$t0,$0,L_main_func_else_8	
+				# result = 0;
+				# Reserved one word on stack for temp var -48($fp)
+	li	$t0,0	
+	sw	$t0,4($fp)	# Store directly on the stack
+				# return;
+	jr	$ra	
+L_main_func_else_8:			
+				# result = 1;
+				# Reserved one word on stack for temp var -48($fp)
+	li	$t0,1	
+	sw	$t0,4($fp)	# Store directly on the stack
+				# var last int;
+				# Reserve 1 words on stack for var last at -48($fp)
+				# last = 0;
+				# Reserved one word on stack for temp var -52($fp)
+	li	$t0,0	
+	sw	$t0,-48($fp)	# Store directly on the stack
+				# var temp int;
+				# Reserve 1 words on stack for var temp at -52($fp)
+				# var i int;
+				# Reserve 1 words on stack for var i at -56($fp)
+				# i = 1;
+				# Reserved one word on stack for temp var -60($fp)
+	li	$t0,1	
+	sw	$t0,-56($fp)	# Store directly on the stack
+				# while (i < n) {
+L_main_func_while_2:			
+				# Reserved one word on stack for temp var -60($fp)
+	lw	$t0,-56($fp)	
+	lw	$t1,-12($fp)	
+	sub	$t0,$t0,$t1	# t0=t0-t1
+	bgez	$t0,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-60($fp)	# Store directly on the stack
+	beq	$t0,$0,L_main_func_endwhile_2	
+				# temp = last + result;
+				# Reserved one word on stack for temp var -64($fp)
+	lw	$t0,-48($fp)	
+	lw	$t1,4($fp)	
+	add	$t0,$t0,$t1	
+	sw	$t0,-64($fp)	# Store directly on the stack
+	sw	$t0,-52($fp)	# Store directly on the stack
+				# last = result;
+	lw	$t0,4($fp)	
+	sw	$t0,-48($fp)	# Store directly on the stack
+				# result = temp;
+	lw	$t0,-52($fp)	
+	sw	$t0,4($fp)	# Store directly on the stack
+				# i = i + 1;
+				# Reserved one word on stack for temp var -64($fp)
+	lw	$t0,-56($fp)	
+	li	$t1,1	
+	add	$t0,$t0,$t1	
+	sw	$t0,-64($fp)	# Store directly on the stack
+	sw	$t0,-56($fp)	# Store directly on the stack
+	b	L_main_func_while_2	
+L_main_func_endwhile_2:			
+				# print("Fibonacci Sequence element #");
+				# Reserved one word on stack for temp var -64($fp)
+
+	.data
+L_main_func_string_11:	.asciiz	"Fibonacci Sequence element #"
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_11	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print(n);
+				# print(int)
+	lw	$a0,-12($fp)	
+	li	$v0,1	# Syscall for print_int
+	syscall			
+				# print(" is: ");
+				# Reserved one word on stack for temp var -64($fp)
+
+	.data
+L_main_func_string_12:	.asciiz	" is: "
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_12	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print(result);
+				# print(int)
+	lw	$a0,4($fp)	
+	li	$v0,1	# Syscall for print_int
+	syscall			
+				# print("\n");
+				# Reserved one word on stack for temp var -64($fp)
+				# print(string)
+	la	$a0,L_main_func_string_7	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+	b	L_main_func_while_1	
+L_main_func_endwhile_1:			
+	jr	$ra	
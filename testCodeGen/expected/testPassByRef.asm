@@ -0,0 +1,332 @@
+	.text
+	.globl main
+main:
+	move	$fp,$sp
+	la	$a0,ProgStart
+	li	$v0,4                   # Print Syscall
+	syscall
+	jal	main_func
+
+	la $a0,ProgEnd
+	li $v0,4                    # Print Syscall
+	syscall
+	li $v0,10                   # Exit Syscall
+	syscall
+	.data
+ProgStart:	.asciiz	"Program Start\n"
+ProgEnd:	.asciiz	"Program End\n"
+	.text
+
+func_foo:			# foo(INT) INT
+				# print("In foo()\n");
+				# Reserved one word on stack for temp var -8($fp)
+
+	.data
+L_func_foo_string_0:	.asciiz	"In foo()\n"
+
+	.text
+				# print(string)
+	la	$a0,L_func_foo_string_0	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# n = 5 * n;
+				# Reserved one word on stack for temp var -8($fp)
+	li	$t0,5	
+	lw	$t2,4($fp)	
+	lw	$t1,($t2)	
+	mul	$t0,$t0,$t1	
+	sw	$t0,-8($fp)	# Store directly on the stack
+	lw	$t1,4($fp)	
+	sw	$t0,($t1)	# Store data by reference
+				# print("n is now ", n, '\n');
+				# Reserved one word on stack for temp var -8($fp)
+				# Reserved one word on stack for temp var -12($fp)
+
+	.data
+L_func_foo_string_1:	.asciiz	"n is now "
+
+	.text
+				# print(string)
+	la	$a0,L_func_foo_string_1	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print(int)
+	lw	$t1,4($fp)	
+	lw	$a0,($t1)	
+	li	$v0,1	# Syscall for print_int
+	syscall			
+				# print(char)
+	li	$a0,10	
+	li	$v0,11	# Syscall for print_char
+	syscall			
+	jr	$ra	
+func_bar:			# bar(ARRAY_INT) INT
+				# var i int;
+				# Reserve 1 words on stack for var i at -8($fp)
+				# i = 0;
+				# Reserved one word on stack for temp var -12($fp)
+	li	$t0,0	
+	sw	$t0,-8($fp)	# Store directly on the stack
+				# print("\nIn bar()\nUninitialized array:\n");
+				# Reserved one word on stack for temp var -12($fp)
+
+	.data
+L_func_bar_string_0:	.asciiz	"\nIn bar()\nUninitialized array:\n"
+
+	.text
+				# print(string)
+	la	$a0,L_func_bar_string_0	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# while (i < 5){
+				# Array addresses hoisted out of while loop
+	lw	$s0,4($fp)	# load pointer to array into $s0
+	lw	$s1,-8($fp)	# put subscript in $s1
+	sll	$s1,$s1,2	# multiply subscript by 4
+	sub	$s1,$s0,$s1	# $s1 points to array[subscript]
+L_func_bar_while_0:			
+				# Reserved one word on stack for temp var -12($fp)
+	lw	$t0,-8($fp)	
+	li	$t1,5	
+	sub	$t0,$t0,$t1	# t0=t0-t1
+	bgez	$t0,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-12($fp)	# Store directly on the stack
+	beq	$t0,$0,L_func_bar_endwhile_0	
+				# print(a[i], '\n');
+	lw	$t0,($s1)	
+	sw	$t0,-16($fp)	# Store directly on the stack
+				# Reserved one word on stack for temp var -20($fp)
+				# print(int)
+	lw	$a0,-16($fp)	
+	li	$v0,1	# Syscall for print_int
+	syscall			
+				# print(char)
+	li	$a0,10	
+	li	$v0,11	# Syscall for print_char
+	syscall			
+				# i = i + 1;
+				# Reserved one word on stack for temp var -16($fp)
+	lw	$t0,-8($fp)	
+	li	$t1,1	
+	add	$t0,$t0,$t1	
+	sw	$t0,-16($fp)	# Store directly on the stack
+	sw	$t0,-8($fp)	# Store directly on the stack
+	addi	$s1,$s1,-4	# subscript changed by 1
+	b	L_func_bar_while_0	
+L_func_bar_endwhile_0:			
+				# i = 0;
+				# Reserved one word on stack for temp var -16($fp)
+	li	$t0,0	
+	sw	$t0,-8($fp)	# Store directly on the stack
+				# print("\nInitialize array: enter 5 ints\n");
+				# Reserved one word on stack for temp var -16($fp)
+
+	.data
+L_func_bar_string_1:	.asciiz	"\nInitialize array: enter 5 ints\n"
+
+	.text
+				# print(string)
+	la	$a0,L_func_bar_string_1	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# while (i < 5){
+				# Array addresses hoisted out of while loop
+	lw	$s0,4($fp)	# load pointer to array into $s0
+	lw	$s1,-8($fp)	# put subscript in $s1
+	sll	$s1,$s1,2	# multiply subscript by 4
+	sub	$s1,$s0,$s1	# $s1 points to array[subscript]
+L_func_bar_while_1:			
+				# Reserved one word on stack for temp var -16($fp)
+	lw	$t0,-8($fp)	
+	li	$t1,5	
+	sub	$t0,$t0,$t1	# t0=t0-t1
+	bgez	$t0,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-16($fp)	# Store directly on the stack
+	beq	$t0,$0,L_func_bar_endwhile_1	
+				# a[i] = read_int();
+				# Reserved one word on stack for temp var -20($fp)
+	li	$v0,5	# Syscall for read_int
+	syscall			
+	sw	$v0,-20($fp)	
+	lw	$t0,-20($fp)	
+	sw	$t0,($s1)	# Store data at array[subscript]
+				# i = i + 1;
+				# Reserved one word on stack for temp var -20($fp)
+	lw	$t0,-8($fp)	
+	li	$t1,1	
+	add	$t0,$t0,$t1	
+	sw	$t0,-20($fp)	# Store directly on the stack
+	sw	$t0,-8($fp)	# Store directly on the stack
+	addi	$s1,$s1,-4	# subscript changed by 1
+	b	L_func_bar_while_1	
+L_func_bar_endwhile_1:			
+	jr	$ra	
+main_func:			# main() INT
+				# var n int;
+				# Reserve 1 words on stack for var n at -8($fp)
+				# n = 6;
+				# Reserved one word on stack for temp var -12($fp)
+	li	$t0,6	
+	sw	$t0,-8($fp)	# Store directly on the stack
+				# print("In main()\n");
+				# Reserved one word on stack for temp var -12($fp)
+
+	.data
+L_main_func_string_0:	.asciiz	"In main()\n"
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_0	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print("n is now ", n, '\n');
+				# Reserved one word on stack for temp var -12($fp)
+				# Reserved one word on stack for temp var -16($fp)
+
+	.data
+L_main_func_string_1:	.asciiz	"n is now "
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_1	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print(int)
+	lw	$a0,-8($fp)	
+	li	$v0,1	# Syscall for print_int
+	syscall			
+				# print(char)
+	li	$a0,10	
+	li	$v0,11	# Syscall for print_char
+	syscall			
+				# foo(n);
+				# Reserve 1 words on stack for var return_var at -12($fp)
+	addi	$t0,$fp,-8	# Make pointer
+	sw	$t0,-16($fp)	# Add param to stack for param at -16($fp)
+	addi	$sp,$fp,-20	
+	sw	$fp,($sp)	# store old control link
+	move	$fp,$sp	# make new control link
+	addi	$sp,$sp,-4	
+	sw	$ra,($sp)	# store return address
+	jal	func_foo	
+	lw	$ra,-4($fp)	# restore old ra
+	move	$sp,$fp	# restore old sp
+	addi	$sp,$sp,8	# remove params and control link from stack
+	lw	$fp,($fp)	# restore old fp
+				# print("Back in main(). If we have passed by value, n is 5.\n");
+				# Reserved one word on stack for temp var -12($fp)
+
+	.data
+L_main_func_string_2:	.asciiz	"Back in main(). If we have passed by value, n is 5.\n"
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_2	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print("If we have passed by reference, n is 30\n");
+				# Reserved one word on stack for temp var -12($fp)
+
+	.data
+L_main_func_string_3:	.asciiz	"If we have passed by reference, n is 30\n"
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_3	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print("n is now ", n, '\n');
+				# Reserved one word on stack for temp var -12($fp)
+				# Reserved one word on stack for temp var -16($fp)
+				# print(string)
+	la	$a0,L_main_func_string_1	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print(int)
+	lw	$a0,-8($fp)	
+	li	$v0,1	# Syscall for print_int
+	syscall			
+				# print(char)
+	li	$a0,10	
+	li	$v0,11	# Syscall for print_char
+	syscall			
+				# var a [5]int;
+				# Reserve 5 words on stack for var a at -12($fp)
+				# bar(a);
+				# Reserve 1 words on stack for var return_var at -32($fp)
+	addi	$t0,$fp,-12	# Make pointer
+	sw	$t0,-36($fp)	# Add param to stack for param at -36($fp)
+	addi	$sp,$fp,-40	
+	sw	$fp,($sp)	# store old control link
+	move	$fp,$sp	# make new control link
+	addi	$sp,$sp,-4	
+	sw	$ra,($sp)	# store return address
+	jal	func_bar	
+	lw	$ra,-4($fp)	# restore old ra
+	move	$sp,$fp	# restore old sp
+	addi	$sp,$sp,8	# remove params and control link from stack
+	lw	$fp,($fp)	# restore old fp
+				# print("In main()\n");
+				# Reserved one word on stack for temp var -32($fp)
+				# print(string)
+	la	$a0,L_main_func_string_0	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# var i int;
+				# Reserve 1 words on stack for var i at -32($fp)
+				# i = 0;
+				# Reserved one word on stack for temp var -36($fp)
+	li	$t0,0	
+	sw	$t0,-32($fp)	# Store directly on the stack
+				# while (i < 5){
+				# Array addresses hoisted out of while loop
+	lw	$s0,-32($fp)	# put subscript in $s0
+	sll	$s0,$s0,2	# multiply subscript by 4
+	sub	$s0,$fp,$s0	
+	addi	$s0,$s0,-12	# $s0 points to array[subscript]
+L_main_func_while_0:			
+				# Reserved one word on stack for temp var -36($fp)
+	lw	$t0,-32($fp)	
+	li	$t1,5	
+	sub	$t0,$t0,$t1	# t0=t0-t1
+	bgez	$t0,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-36($fp)	# Store directly on the stack
+	beq	$t0,$0,L_main_func_endwhile_0	
+				# print(a[i], '\n');
+	lw	$t0,($s0)	
+	sw	$t0,-40($fp)	# Store directly on the stack
+				# Reserved one word on stack for temp var -44($fp)
+				# print(int)
+	lw	$a0,-40($fp)	
+	li	$v0,1	# Syscall for print_int
+	syscall			
+				# print(char)
+	li	$a0,10	
+	li	$v0,11	# Syscall for print_char
+	syscall			
+				# i = i + 1;
+				# Reserved one word on stack for temp var -40($fp)
+	lw	$t0,-32($fp)	
+	li	$t1,1	
+	add	$t0,$t0,$t1	
+	sw	$t0,-40($fp)	# Store directly on the stack
+	sw	$t0,-32($fp)	# Store directly on the stack
+	addi	$s0,$s0,-4	# subscript changed by 1
+	b	L_main_func_while_0	
+L_main_func_endwhile_0:			
+	jr	$ra	
@@ -0,0 +1,436 @@
+	.text
+	.globl main
+main:
+	move	$fp,$sp
+	la	$a0,ProgStart
+	li	$v0,4                   # Print Syscall
+	syscall
+	jal	main_func
+
+	la $a0,ProgEnd
+	li $v0,4                    # Print Syscall
+	syscall
+	li $v0,10                   # Exit Syscall
+	syscall
+	.data
+ProgStart:	.asciiz	"Program Start\n"
+ProgEnd:	.asciiz	"Program End\n"
+	.text
+
+func_recurse:			# recurse(INT) INT
+				# print("\nDepth is ", n, " from the bottom.");
+				# Reserved one word on stack for temp var -8($fp)
+				# Reserved one word on stack for temp var -12($fp)
+
+	.data
+L_func_recurse_string_0:	.asciiz	"\nDepth is "
+
+	.text
+				# print(string)
+	la	$a0,L_func_recurse_string_0	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print(int)
+	lw	$t1,4($fp)	
+	lw	$a0,($t1)	
+	li	$v0,1	# Syscall for print_int
+	syscall			
+
+	.data
+L_func_recurse_string_1:	.asciiz	" from the bottom."
+
+	.text
+				# print(string)
+	la	$a0,L_func_recurse_string_1	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# if(0<n){
+				# Reserved one word on stack for temp var -8($fp)
+	li	$t0,0	
+	lw	$t2,4($fp)	
+	lw	$t1,($t2)	
+	sub	$t0,$t0,$t1	# t0=t0-t1
+	bgez	$t0,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-8($fp)	# Store directly on the stack
+	beq	$t0,$0,L_func_recurse_else_0	
+				# result = 1 + recurse(n-1);
+				# Reserved one word on stack for temp var -12($fp)
+				# Reserved one word on stack for temp var -16($fp)
+	lw	$t1,4($fp)	
+	lw	$t0,($t1)	
+	li	$t1,1	
+	sub	$t0,$t0,$t1	
+	sw	$t0,-16($fp)	# Store directly on the stack
+				# Reserve 1 words on stack for var return_var at -20($fp)
+	addi	$t0,$fp,-16	# Make pointer
+	sw	$t0,-24($fp)	# Add param to stack for param at -24($fp)
+	addi	$sp,$fp,-28	
+	sw	$fp,($sp)	# store old control link
+	move	$fp,$sp	# make new control link
+	addi	$sp,$sp,-4	
+	sw	$ra,($sp)	# store return address
+	jal	func_recurse	
+	lw	$ra,-4($fp)	# restore old ra
+	move	$sp,$fp	# restore old sp
+	addi	$sp,$sp,8	# remove params and control link from stack
+	lw	$fp,($fp)	# restore old fp
+	li	$t0,1	
+	lw	$t1,-20($fp)	
+	add	$t0,$t0,$t1	
+	sw	$t0,-12($fp)	# Store directly on the stack
+	sw	$t0,8($fp)	# Store directly on the stack
+	b	L_func_recurse_endelse_0	
+L_func_recurse_else_0:			
+				# result = 0;
+				# Reserved one word on stack for temp var -12($fp)
+	li	$t0,0	
+	sw	$t0,8($fp)	# Store directly on the stack
+L_func_recurse_endelse_0:			
+	jr	$ra	
+func_fibonacci_r:			# fibonacci_r(INT) INT
+				# if (n < 1) {
+				# Reserved one word on stack for temp var -8($fp)
+	lw	$t2,4($fp)	
+	lw	$t0,($t2)	
+	li	$t1,1	
+	sub	$t0,$t0,$t1	# t0=t0-t1
+	bgez	$t0,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-8($fp)	# Store directly on the stack
+	beq	$t0,$0,L_func_fibonacci_r_else_0	
+				# result = 0;
+				# Reserved one word on stack for temp var -12($fp)
+	li	$t0,0	
+	sw	$t0,8($fp)	# Store directly on the stack
+				# return;
+	jr	$ra	
+L_func_fibonacci_r_else_0:			
+				# if (n < 3) {
+				# Reserved one word on stack for temp var -12($fp)
+	lw	$t2,4($fp)	
+	lw	$t0,($t2)	
+	li	$t1,3	
+	sub	$t0,$t0,$t1	# t0=t0-t1
+	bgez	$t0,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-12($fp)	# Store directly on the stack
+	beq	$t0,$0,L_func_fibonacci_r_else_1	
+				# result = 1;
+				# Reserved one word on stack for temp var -16($fp)
+	li	$t0,1	
+	sw	$t0,8($fp)	# Store directly on the stack
+				# return;
+	jr	$ra	
+L_func_fibonacci_r_else_1:			
+				# result =  fibonacci_r(n - 1) + fibonacci_r(n - 2);
+				# Reserved one word on stack for temp var -16($fp)
+	lw	$t1,4($fp)	
+	lw	$t0,($t1)	
+	li	$t1,1	
+	sub	$t0,$t0,$t1	
+	sw	$t0,-16($fp)	# Store directly on the stack
+				# Reserve 1 words on stack for var return_var at -20($fp)
+	addi	$t0,$fp,-16	# Make pointer
+	sw	$t0,-24($fp)	# Add param to stack for param at -24($fp)
+	addi	$sp,$fp,-28	
+	sw	$fp,($sp)	# store old control link
+	move	$fp,$sp	# make new control link
+	addi	$sp,$sp,-4	
+	sw	$ra,($sp)	# store return address
+	jal	func_fibonacci_r	
+	lw	$ra,-4($fp)	# restore old ra
+	move	$sp,$fp	# restore old sp
+	addi	$sp,$sp,8	# remove params and control link from stack
+	lw	$fp,($fp)	# restore old fp
+				# Reserved one word on stack for temp var -28($fp)
+	lw	$t1,4($fp)	
+	lw	$t0,($t1)	
+	li	$t1,2	
+	sub	$t0,$t0,$t1	
+	sw	$t0,-28($fp)	# Store directly on the stack
+				# Reserve 1 words on stack for var return_var at -32($fp)
+	addi	$t0,$fp,-28	# Make pointer
+	sw	$t0,-36($fp)	# Add param to stack for param at -36($fp)
+	addi	$sp,$fp,-40	
+	sw	$fp,($sp)	# store old control link
+	move	$fp,$sp	# make new control link
+	addi	$sp,$sp,-4	
+	sw	$ra,($sp)	# store return address
+	jal	func_fibonacci_r	
+	lw	$ra,-4($fp)	# restore old ra
+	move	$sp,$fp	# restore old sp
+	addi	$sp,$sp,8	# remove params and control link from stack
+	lw	$fp,($fp)	# restore old fp
+				# Reserved one word on stack for temp var -40($fp)
+	lw	$t0,-20($fp)	
+	lw	$t1,-32($fp)	
+	add	$t0,$t0,$t1	
+	sw	$t0,-40($fp)	# Store directly on the stack
+	sw	$t0,8($fp)	# Store directly on the stack
+				# return;
+	jr	$ra	
+	jr	$ra	
+func_factorial_r:			# factorial_r(INT) INT
+				# if (2 < n) {
+				# Reserved one word on stack for temp var -8($fp)
+	li	$t0,2	
+	lw	$t2,4($fp)	
+	lw	$t1,($t2)	
+	sub	$t0,$t0,$t1	# t0=t0-t1
+	bgez	$t0,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-8($fp)	# Store directly on the stack
+	beq	$t0,$0,L_func_factorial_r_else_0	
+				# result= n * factorial_r(n-1);
+				# Reserved one word on stack for temp var -12($fp)
+	lw	$t1,4($fp)	
+	lw	$t0,($t1)	
+	li	$t1,1	
+	sub	$t0,$t0,$t1	
+	sw	$t0,-12($fp)	# Store directly on the stack
+				# Reserve 1 words on stack for var return_var at -16($fp)
+	addi	$t0,$fp,-12	# Make pointer
+	sw	$t0,-20($fp)	# Add param to stack for param at -20($fp)
+	addi	$sp,$fp,-24	
+	sw	$fp,($sp)	# store old control link
+	move	$fp,$sp	# make new control link
+	addi	$sp,$sp,-4	
+	sw	$ra,($sp)	# store return address
+	jal	func_factorial_r	
+	lw	$ra,-4($fp)	# restore old ra
+	move	$sp,$fp	# restore old sp
+	addi	$sp,$sp,8	# remove params and control link from stack
+	lw	$fp,($fp)	# restore old fp
+				# Reserved one word on stack for temp var -24($fp)
+	lw	$t1,4($fp)	
+	lw	$t0,($t1)	
+	lw	$t1,-16($fp)	
+	mul	$t0,$t0,$t1	
+	sw	$t0,-24($fp)	# Store directly on the stack
+	sw	$t0,8($fp)	# Store directly on the stack
+	b	L_func_factorial_r_endelse_0	
+L_func_factorial_r_else_0:			
+				# result = n;
+	lw	$t1,4($fp)	
+	lw	$t0,($t1)	
+	sw	$t0,8($fp)	# Store directly on the stack
+L_func_factorial_r_endelse_0:			
+	jr	$ra	
+main_func:			# main() INT
+				# var n int;
+				# Reserve 1 words on stack for var n at -8($fp)
+				# n = 10;
+				# Reserved one word on stack for temp var -12($fp)
+	li	$t0,10	
+	sw	$t0,-8($fp)	# Store directly on the stack
+				# var result int;
+				# Reserve 1 words on stack for var result at -12($fp)
+				# result = recurse(n);
+				# Reserve 1 words on stack for var return_var at -16($fp)
+	addi	$t0,$fp,-8	# Make pointer
+	sw	$t0,-20($fp)	# Add param to stack for param at -20($fp)
+	addi	$sp,$fp,-24	
+	sw	$fp,($sp)	# store old control link
+	move	$fp,$sp	# make new control link
+	addi	$sp,$sp,-4	
+	sw	$ra,($sp)	# store return address
+	jal	func_recurse	
+	lw	$ra,-4($fp)	# restore old ra
+	move	$sp,$fp	# restore old sp
+	addi	$sp,$sp,8	# remove params and control link from stack
+	lw	$fp,($fp)	# restore old fp
+	lw	$t0,-16($fp)	
+	sw	$t0,-12($fp)	# Store directly on the stack
+				# print("\nRecursive call ", n, " times, result was: ", result,
+				# Reserved one word on stack for temp var -16($fp)
+				# Reserved one word on stack for temp var -20($fp)
+				# Reserved one word on stack for temp var -24($fp)
+
+	.data
+L_main_func_string_0:	.asciiz	"\nRecursive call "
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_0	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print(int)
+	lw	$a0,-8($fp)	
+	li	$v0,1	# Syscall for print_int
+	syscall			
+
+	.data
+L_main_func_string_1:	.asciiz	" times, result was: "
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_1	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print(int)
+	lw	$a0,-12($fp)	
+	li	$v0,1	# Syscall for print_int
+	syscall			
+
+	.data
+L_main_func_string_2:	.asciiz	"; Expect 10\n"
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_2	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# while (0 <= n) {
+L_main_func_while_0:			
+				# Reserved one word on stack for temp var -16($fp)
+	li	$t0,0	
+	lw	$t1,-8($fp)	
+	sub	$t0,$t0,$t1	# t0=t0-t1
+	bgtz	$t0,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-16($fp)	# Store directly on the stack
+	beq	$t0,$0,L_main_func_endwhile_0	
+				# print("\nEnter an int: [negative to quit]: ");
+				# Reserved one word on stack for temp var -20($fp)
+
+	.data
+L_main_func_string_3:	.asciiz	"\nEnter an int: [negative to quit]: "
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_3	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# n = read_int();
+				# Reserved one word on stack for temp var -20($fp)
+	li	$v0,5	# Syscall for read_int
+	syscall			
+	sw	$v0,-20($fp)	
+	lw	$t0,-20($fp)	
+	sw	$t0,-8($fp)	# Store directly on the stack
+				# result = fibonacci_r(n);
+				# Reserve 1 words on stack for var return_var at -20($fp)
+	addi	$t0,$fp,-8	# Make pointer
+	sw	$t0,-24($fp)	# Add param to stack for param at -24($fp)
+	addi	$sp,$fp,-28	
+	sw	$fp,($sp)	# store old control link
+	move	$fp,$sp	# make new control link
+	addi	$sp,$sp,-4	
+	sw	$ra,($sp)	# store return address
+	jal	func_fibonacci_r	
+	lw	$ra,-4($fp)	# restore old ra
+	move	$sp,$fp	# restore old sp
+	addi	$sp,$sp,8	# remove params and control link from stack
+	lw	$fp,($fp)	# restore old fp
+	lw	$t0,-20($fp)	
+	sw	$t0,-12($fp)	# Store directly on the stack
+				# print("Fibonacci Sequence element #");
+				# Reserved one word on stack for temp var -20($fp)
+
+	.data
+L_main_func_string_4:	.asciiz	"Fibonacci Sequence element #"
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_4	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print(n);
+				# print(int)
+	lw	$a0,-8($fp)	
+	li	$v0,1	# Syscall for print_int
+	syscall			
+				# print(" is: ");
+				# Reserved one word on stack for temp var -20($fp)
+
+	.data
+L_main_func_string_5:	.asciiz	" is: "
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_5	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print(result);
+				# print(int)
+	lw	$a0,-12($fp)	
+	li	$v0,1	# Syscall for print_int
+	syscall			
+				# print("\n");
+				# Reserved one word on stack for temp var -20($fp)
+
+	.data
+L_main_func_string_6:	.asciiz	"\n"
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_6	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# result = factorial_r(n);
+				# Reserve 1 words on stack for var return_var at -20($fp)
+	addi	$t0,$fp,-8	# Make pointer
+	sw	$t0,-24($fp)	# Add param to stack for param at -24($fp)
+	addi	$sp,$fp,-28	
+	sw	$fp,($sp)	# store old control link
+	move	$fp,$sp	# make new control link
+	addi	$sp,$sp,-4	
+	sw	$ra,($sp)	# store return address
+	jal	func_factorial_r	
+	lw	$ra,-4($fp)	# restore old ra
+	move	$sp,$fp	# restore old sp
+	addi	$sp,$sp,8	# remove params and control link from stack
+	lw	$fp,($fp)	# restore old fp
+	lw	$t0,-20($fp)	
+	sw	$t0,-12($fp)	# Store directly on the stack
+				# print(n);
+				# print(int)
+	lw	$a0,-8($fp)	
+	li	$v0,1	# Syscall for print_int
+	syscall			
+				# print(" factorial is: ");
+				# Reserved one word on stack for temp var -20($fp)
+
+	.data
+L_main_func_string_7:	.asciiz	" factorial is: "
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_7	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print(result);
+				# print(int)
+	lw	$a0,-12($fp)	
+	li	$v0,1	# Syscall for print_int
+	syscall			
+				# print("\n");
+				# Reserved one word on stack for temp var -20($fp)
+				# print(string)
+	la	$a0,L_main_func_string_6	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+	b	L_main_func_while_0	
+L_main_func_endwhile_0:			
+	jr	$ra	
@@ -0,0 +1,305 @@
+	.text
+	.globl main
+main:
+	move	$fp,$sp
+	la	$a0,ProgStart
+	li	$v0,4                   # Print Syscall
+	syscall
+	jal	main_func
+
+	la $a0,ProgEnd
+	li $v0,4                    # Print Syscall
+	syscall
+	li $v0,10                   # Exit Syscall
+	syscall
+	.data
+ProgStart:	.asciiz	"Program Start\n"
+ProgEnd:	.asciiz	"Program End\n"
+	.text
+
+func_fibonacci_r:			# fibonacci_r(INT) INT
+				# if (n < 1) {
+				# Reserved one word on stack for temp var -8($fp)
+	lw	$t2,4($fp)	
+	lw	$t0,($t2)	
+	li	$t1,1	
+	sub	$t0,$t0,$t1	# t0=t0-t1
+	bgez	$t0,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-8($fp)	# Store directly on the stack
+	beq	$t0,$0,L_func_fibonacci_r_else_0	
+				# result = 0;
+				# Reserved one word on stack for temp var -12($fp)
+	li	$t0,0	
+	sw	$t0,8($fp)	# Store directly on the stack
+				# return;
+	jr	$ra	
+L_func_fibonacci_r_else_0:			
+				# if (n < 3) {
+				# Reserved one word on stack for temp var -12($fp)
+	lw	$t2,4($fp)	
+	lw	$t0,($t2)	
+	li	$t1,3	
+	sub	$t0,$t0,$t1	# t0=t0-t1
+	bgez	$t0,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-12($fp)	# Store directly on the stack
+	beq	$t0,$0,L_func_fibonacci_r_else_1	
+				# result = 1;
+				# Reserved one word on stack for temp var -16($fp)
+	li	$t0,1	
+	sw	$t0,8($fp)	# Store directly on the stack
+				# return;
+	jr	$ra	
+L_func_fibonacci_r_else_1:			
+				# result =  fibonacci_r(n - 1) + fibonacci_r(n - 2);
+				# Reserved one word on stack for temp var -16($fp)
+	lw	$t1,4($fp)	
+	lw	$t0,($t1)	
+	li	$t1,1	
+	sub	$t0,$t0,$t1	
+	sw	$t0,-16($fp)	# Store directly on the stack
+				# Reserve 1 words on stack for var return_var at -20($fp)
+	addi	$t0,$fp,-16	# Make pointer
+	sw	$t0,-24($fp)	# Add param to stack for param at -24($fp)
+	addi	$sp,$fp,-28	
+	sw	$fp,($sp)	# store old control link
+	move	$fp,$sp	# make new control link
+	addi	$sp,$sp,-4	
+	sw	$ra,($sp)	# store return address
+	jal	func_fibonacci_r	
+	lw	$ra,-4($fp)	# restore old ra
+	move	$sp,$fp	# restore old sp
+	addi	$sp,$sp,8	# remove params and control link from stack
+	lw	$fp,($fp)	# restore old fp
+				# Reserved one word on stack for temp var -28($fp)
+	lw	$t1,4($fp)	
+	lw	$t0,($t1)	
+	li	$t1,2	
+	sub	$t0,$t0,$t1	
+	sw	$t0,-28($fp)	# Store directly on the stack
+				# Reserve 1 words on stack for var return_var at -32($fp)
+	addi	$t0,$fp,-28	# Make pointer
+	sw	$t0,-36($fp)	# Add param to stack for param at -36($fp)
+	addi	$sp,$fp,-40	
+	sw	$fp,($sp)	# store old control link
+	move	$fp,$sp	# make new control link
+	addi	$sp,$sp,-4	
+	sw	$ra,($sp)	# store return address
+	jal	func_fibonacci_r	
+	lw	$ra,-4($fp)	# restore old ra
+	move	$sp,$fp	# restore old sp
+	addi	$sp,$sp,8	# remove params and control link from stack
+	lw	$fp,($fp)	# restore old fp
+				# Reserved one word on stack for temp var -40($fp)
+	lw	$t0,-20($fp)	
+	lw	$t1,-32($fp)	
+	add	$t0,$t0,$t1	
+	sw	$t0,-40($fp)	# Store directly on the stack
+	sw	$t0,8($fp)	# Store directly on the stack
+				# return;
+	jr	$ra	
+	jr	$ra	
+main_func:			# main() INT
+				# var a [20]int;
+				# Reserve 20 words on stack for var a at -8($fp)
+				# var MAX int;
+				# Reserve 1 words on stack for var MAX at -88($fp)
+				# MAX = 20;
+				# Reserved one word on stack for temp var -92($fp)
+	li	$t0,20	
+	sw	$t0,-88($fp)	# Store directly on the stack
+				# var n int;
+				# Reserve 1 words on stack for var n at -92($fp)
+				# n = 0;
+				# Reserved one word on stack for temp var -96($fp)
+	li	$t0,0	
+	sw	$t0,-92($fp)	# Store directly on the stack
+				# while (n < MAX) {
+				# Array addresses hoisted out of while loop
+	lw	$s0,-92($fp)	# put subscript in $s0
+	sll	$s0,$s0,2	# multiply subscript by 4
+	sub	$s0,$fp,$s0	
+	addi	$s0,$s0,-8	# $s0 points to array[subscript]
+L_main_func_while_0:			
+				# Reserved one word on stack for temp var -96($fp)
+	lw	$t0,-92($fp)	
+	lw	$t1,-88($fp)	
+	sub	$t0,$t0,$t1	# t0=t0-t1
+	bgez	$t0,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-96($fp)	# Store directly on the stack
+	beq	$t0,$0,L_main_func_endwhile_0	
+				# a[n] = fibonacci_r(n);
+				# Reserve 1 words on stack for var return_var at -100($fp)
+	addi	$t0,$fp,-92	# Make pointer
+	sw	$t0,-104($fp)	# Add param to stack for param at -104($fp)
+	addi	$sp,$fp,-108	
+	sw	$fp,($sp)	# store old control link
+	move	$fp,$sp	# make new control link
+	addi	$sp,$sp,-4	
+	sw	$ra,($sp)	# store return address
+	jal	func_fibonacci_r	
+	lw	$ra,-4($fp)	# restore old ra
+	move	$sp,$fp	# restore old sp
+	addi	$sp,$sp,8	# remove params and control link from stack
+	lw	$fp,($fp)	# restore old fp
+	lw	$t0,-100($fp)	
+	sw	$t0,($s0)	# Store data at array[subscript]
+				# print("Fibonacci Sequence element #");
+				# Reserved one word on stack for temp var -100($fp)
+
+	.data
+L_main_func_string_0:	.asciiz	"Fibonacci Sequence element #"
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_0	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print(n);
+				# print(int)
+	lw	$a0,-92($fp)	
+	li	$v0,1	# Syscall for print_int
+	syscall			
+				# print(" is: ");
+				# Reserved one word on stack for temp var -100($fp)
+
+	.data
+L_main_func_string_1:	.asciiz	" is: "
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_1	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print(a[n]);
+	lw	$t0,($s0)	
+	sw	$t0,-100($fp)	# Store directly on the stack
+				# print(int)
+	lw	$a0,-100($fp)	
+	li	$v0,1	# Syscall for print_int
+	syscall			
+				# print("\n");
+				# Reserved one word on stack for temp var -100($fp)
+
+	.data
+L_main_func_string_2:	.asciiz	"\n"
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_2	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# n = n+1;
+				# Reserved one word on stack for temp var -100($fp)
+	lw	$t0,-92($fp)	
+	li	$t1,1	
+	add	$t0,$t0,$t1	
+	sw	$t0,-100($fp)	# Store directly on the stack
+	sw	$t0,-92($fp)	# Store directly on the stack
+	addi	$s0,$s0,-4	# subscript changed by 1
+	b	L_main_func_while_0	
+L_main_func_endwhile_0:			
+				# print("The first ");
+				# Reserved one word on stack for temp var -100($fp)
+
+	.data
+L_main_func_string_3:	.asciiz	"The first "
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_3	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print(MAX);
+				# print(int)
+	lw	$a0,-88($fp)	
+	li	$v0,1	# Syscall for print_int
+	syscall			
+				# print(" numbers in the Fibonacci Sequence are: \n");
+				# Reserved one word on stack for temp var -100($fp)
+
+	.data
+L_main_func_string_4:	.asciiz	" numbers in the Fibonacci Sequence are: \n"
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_4	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# n = 0;
+				# Reserved one word on stack for temp var -100($fp)
+	li	$t0,0	
+	sw	$t0,-92($fp)	# Store directly on the stack
+				# while (n < MAX) {
+				# Array addresses hoisted out of while loop
+	lw	$s0,-92($fp)	# put subscript in $s0
+	sll	$s0,$s0,2	# multiply subscript by 4
+	sub	$s0,$fp,$s0	
+	addi	$s0,$s0,-8	# $s0 points to array[subscript]
+L_main_func_while_1:			
+				# Reserved one word on stack for temp var -100($fp)
+	lw	$t0,-92($fp)	
+	lw	$t1,-88($fp)	
+	sub	$t0,$t0,$t1	# t0=t0-t1
+	bgez	$t0,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-100($fp)	# Store directly on the stack
+	beq	$t0,$0,L_main_func_endwhile_1	
+				# print(a[n]);
+	lw	$t0,($s0)	
+	sw	$t0,-104($fp)	# Store directly on the stack
+				# print(int)
+	lw	$a0,-104($fp)	
+	li	$v0,1	# Syscall for print_int
+	syscall			
+				# print(" ");
+				# Reserved one word on stack for temp var -104($fp)
+
+	.data
+L_main_func_string_5:	.asciiz	" "
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_5	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# n = n+1;
+				# Reserved one word on stack for temp var -104($fp)
+	lw	$t0,-92($fp)	
+	li	$t1,1	
+	add	$t0,$t0,$t1	
+	sw	$t0,-104($fp)	# Store directly on the stack
+	sw	$t0,-92($fp)	# Store directly on the stack
+	addi	$s0,$s0,-4	# subscript changed by 1
+	b	L_main_func_while_1	
+L_main_func_endwhile_1:			
+				# print("\nGoodbye!!!\n");
+				# Reserved one word on stack for temp var -104($fp)
+
+	.data
+L_main_func_string_6:	.asciiz	"\nGoodbye!!!\n"
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_6	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+	jr	$ra	
@@ -0,0 +1,705 @@
+	.text
+	.globl main
+main:
+	move	$fp,$sp
+	la	$a0,ProgStart
+	li	$v0,4                   # Print Syscall
+	syscall
+	jal	main_func
+
+	la $a0,ProgEnd
+	li $v0,4                    # Print Syscall
+	syscall
+	li $v0,10                   # Exit Syscall
+	syscall
+	.data
+ProgStart:	.asciiz	"Program Start\n"
+ProgEnd:	.asciiz	"Program End\n"
+	.text
+
+func_fibonacci:			# fibonacci(INT) INT
+				# if (n < 1) {
+				# Reserved one word on stack for temp var -8($fp)
+	lw	$t2,4($fp)	
+	lw	$t0,($t2)	
+	li	$t1,1	
+	sub	$t0,$t0,$t1	# t0=t0-t1
+	bgez	$t0,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-8($fp)	# Store directly on the stack
+	beq	$t0,$0,L_func_fibonacci_else_0	
+				# result = 0;
+				# Reserved one word on stack for temp var -12($fp)
+	li	$t0,0	
+	sw	$t0,8($fp)	# Store directly on the stack
+				# return;
+	jr	$ra	
+L_func_fibonacci_else_0:			
+				# result = 1;
+				# Reserved one word on stack for temp var -12($fp)
+	li	$t0,1	
+	sw	$t0,8($fp)	# Store directly on the stack
+				# var last int;
+				# Reserve 1 words on stack for var last at -12($fp)
+				# last = 0;
+				# Reserved one word on stack for temp var -16($fp)
+	li	$t0,0	
+	sw	$t0,-12($fp)	# Store directly on the stack
+				# var temp int;
+				# Reserve 1 words on stack for var temp at -16($fp)
+				# var i int;
+				# Reserve 1 words on stack for var i at -20($fp)
+				# i = 1;
+				# Reserved one word on stack for temp var -24($fp)
+	li	$t0,1	
+	sw	$t0,-20($fp)	# Store directly on the stack
+				# while (i < n) {
+L_func_fibonacci_while_0:			
+				# Reserved one word on stack for temp var -24($fp)
+	lw	$t0,-20($fp)	
+	lw	$t2,4($fp)	
+	lw	$t1,($t2)	
+	sub	$t0,$t0,$t1	# t0=t0-t1
+	bgez	$t0,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-24($fp)	# Store directly on the stack
+	beq	$t0,$0,L_func_fibonacci_endwhile_0	
+				# temp = last + result;
+				# Reserved one word on stack for temp var -28($fp)
+	lw	$t0,-12($fp)	
+	lw	$t1,8($fp)	
+	add	$t0,$t0,$t1	
+	sw	$t0,-28($fp)	# Store directly on the stack
+	sw	$t0,-16($fp)	# Store directly on the stack
+				# last = result;
+	lw	$t0,8($fp)	
+	sw	$t0,-12($fp)	# Store directly on the stack
+				# result = temp;
+	lw	$t0,-16($fp)	
+	sw	$t0,8($fp)	# Store directly on the stack
+				# i = i + 1;
+				# Reserved one word on stack for temp var -28($fp)
+	lw	$t0,-20($fp)	
+	li	$t1,1	
+	add	$t0,$t0,$t1	
+	sw	$t0,-28($fp)	# Store directly on the stack
+	sw	$t0,-20($fp)	# Store directly on the stack
+	b	L_func_fibonacci_while_0	
+L_func_fibonacci_endwhile_0:			
+	jr	$ra	
+func_fibonacci_r:			# fibonacci_r(INT) INT
+				# if (n < 1) {
+				# Reserved one word on stack for temp var -8($fp)
+	lw	$t2,4($fp)	
+	lw	$t0,($t2)	
+	li	$t1,1	
+	sub	$t0,$t0,$t1	# t0=t0-t1
+	bgez	$t0,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-8($fp)	# Store directly on the stack
+	beq	$t0,$0,L_func_fibonacci_r_else_0	
+				# result = 0;
+				# Reserved one word on stack for temp var -12($fp)
+	li	$t0,0	
+	sw	$t0,8($fp)	# Store directly on the stack
+				# return;
+	jr	$ra	
+L_func_fibonacci_r_else_0:			
+				# if (n < 3) {
+				# Reserved one word on stack for temp var -12($fp)
+	lw	$t2,4($fp)	
+	lw	$t0,($t2)	
+	li	$t1,3	
+	sub	$t0,$t0,$t1	# t0=t0-t1
+	bgez	$t0,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-12($fp)	# Store directly on the stack
+	beq	$t0,$0,L_func_fibonacci_r_else_1	
+				# result = 1;
+				# Reserved one word on stack for temp var -16($fp)
+	li	$t0,1	
+	sw	$t0,8($fp)	# Store directly on the stack
+				# return;
+	jr	$ra	
+L_func_fibonacci_r_else_1:			
+				# result =  fibonacci_r(n - 1) + fibonacci_r(n - 2);
+				# Reserved one word on stack for temp var -16($fp)
+	lw	$t1,4($fp)	
+	lw	$t0,($t1)	
+	li	$t1,1	
+	sub	$t0,$t0,$t1	
+	sw	$t0,-16($fp)	# Store directly on the stack
+				# Reserve 1 words on stack for var return_var at -20($fp)
+	addi	$t0,$fp,-16	# Make pointer
+	sw	$t0,-24($fp)	# Add param to stack for param at -24($fp)
+	addi	$sp,$fp,-28	
+	sw	$fp,($sp)	# store old control link
+	move	$fp,$sp	# make new control link
+	addi	$sp,$sp,-4	
+	sw	$ra,($sp)	# store return address
+	jal	func_fibonacci_r	
+	lw	$ra,-4($fp)	# restore old ra
+	move	$sp,$fp	# restore old sp
+	addi	$sp,$sp,8	# remove params and control link from stack
+	lw	$fp,($fp)	# restore old fp
+				# Reserved one word on stack for temp var -28($fp)
+	lw	$t1,4($fp)	
+	lw	$t0,($t1)	
+	li	$t1,2	
+	sub	$t0,$t0,$t1	
+	sw	$t0,-28($fp)	# Store directly on the stack
+				# Reserve 1 words on stack for var return_var at -32($fp)
+	addi	$t0,$fp,-28	# Make pointer
+	sw	$t0,-36($fp)	# Add param to stack for param at -36($fp)
+	addi	$sp,$fp,-40	
+	sw	$fp,($sp)	# store old control link
+	move	$fp,$sp	# make new control link
+	addi	$sp,$sp,-4	
+	sw	$ra,($sp)	# store return address
+	jal	func_fibonacci_r	
+	lw	$ra,-4($fp)	# restore old ra
+	move	$sp,$fp	# restore old sp
+	addi	$sp,$sp,8	# remove params and control link from stack
+	lw	$fp,($fp)	# restore old fp
+				# Reserved one word on stack for temp var -40($fp)
+	lw	$t0,-20($fp)	
+	lw	$t1,-32($fp)	
+	add	$t0,$t0,$t1	
+	sw	$t0,-40($fp)	# Store directly on the stack
+	sw	$t0,8($fp)	# Store directly on the stack
+				# return;
+	jr	$ra	
+	jr	$ra	
+func_gcd:			# gcd(INT, INT) INT
+				# var j int;    # a and b were passed by reference, so they should not be changed
+				# Reserve 1 words on stack for var j at -8($fp)
+				# j = a;
+	lw	$t1,8($fp)	
+	lw	$t0,($t1)	
+	sw	$t0,-8($fp)	# Store directly on the stack
+				# k = b;
+	lw	$t1,4($fp)	
+	lw	$t0,($t1)	
+	sw	$t0,12($fp)	# Store directly on the stack
+				# while (j != k) {
+L_func_gcd_while_0:			
+				# Reserved one word on stack for temp var -12($fp)
+	lw	$t0,-8($fp)	
+	lw	$t1,12($fp)	
+	beq	$t0,$t1,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-12($fp)	# Store directly on the stack
+	beq	$t0,$0,L_func_gcd_endwhile_0	
+				# if (k < j) {
+				# Reserved one word on stack for temp var -16($fp)
+	lw	$t0,12($fp)	
+	lw	$t1,-8($fp)	
+	sub	$t0,$t0,$t1	# t0=t0-t1
+	bgez	$t0,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-16($fp)	# Store directly on the stack
+	beq	$t0,$0,L_func_gcd_else_0	
+				# j = j - k;
+				# Reserved one word on stack for temp var -20($fp)
+	lw	$t0,-8($fp)	
+	lw	$t1,12($fp)	
+	sub	$t0,$t0,$t1	
+	sw	$t0,-20($fp)	# Store directly on the stack
+	sw	$t0,-8($fp)	# Store directly on the stack
+	b	L_func_gcd_endelse_0	
+L_func_gcd_else_0:			
+				# k = k - j;
+				# Reserved one word on stack for temp var -20($fp)
+	lw	$t0,12($fp)	
+	lw	$t1,-8($fp)	
+	sub	$t0,$t0,$t1	
+	sw	$t0,-20($fp)	# Store directly on the stack
+	sw	$t0,12($fp)	# Store directly on the stack
+L_func_gcd_endelse_0:			
+	b	L_func_gcd_while_0	
+L_func_gcd_endwhile_0:			
+				# return;
+	jr	$ra	
+	jr	$ra	
+func_bubble_sort:			# bubble_sort(ARRAY_INT, INT) INT
+				# var swapped int;
+				# Reserve 1 words on stack for var swapped at -8($fp)
+				# swapped = 1;
+				# Reserved one word on stack for temp var -12($fp)
+	li	$t0,1	
+	sw	$t0,-8($fp)	# Store directly on the stack
+				# var j int;
+				# Reserve 1 words on stack for var j at -12($fp)
+				# var temp int;
+				# Reserve 1 words on stack for var temp at -16($fp)
+				# var i int;
+				# Reserve 1 words on stack for var i at -20($fp)
+				# i = 0;
+				# Reserved one word on stack for temp var -24($fp)
+	li	$t0,0	
+	sw	$t0,-20($fp)	# Store directly on the stack
+				# while (0 < swapped) {                   # while swapped == true
+L_func_bubble_sort_while_0:			
+				# Reserved one word on stack for temp var -24($fp)
+	li	$t0,0	
+	lw	$t1,-8($fp)	
+	sub	$t0,$t0,$t1	# t0=t0-t1
+	bgez	$t0,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-24($fp)	# Store directly on the stack
+	beq	$t0,$0,L_func_bubble_sort_endwhile_0	
+				# swapped = 0;                        # false
+				# Reserved one word on stack for temp var -28($fp)
+	li	$t0,0	
+	sw	$t0,-8($fp)	# Store directly on the stack
+				# j = 1;
+				# Reserved one word on stack for temp var -28($fp)
+	li	$t0,1	
+	sw	$t0,-12($fp)	# Store directly on the stack
+				# while (j < (size-i)) {
+				# Array addresses hoisted out of while loop
+	lw	$s0,8($fp)	# load pointer to array into $s0
+	lw	$s1,-12($fp)	# put subscript in $s1
+	sll	$s1,$s1,2	# multiply subscript by 4
+	sub	$s1,$s0,$s1	# $s1 points to array[subscript]
+L_func_bubble_sort_while_1:			
+				# Reserved one word on stack for temp var -28($fp)
+	lw	$t1,4($fp)	
+	lw	$t0,($t1)	
+	lw	$t1,-20($fp)	
+	sub	$t0,$t0,$t1	
+	sw	$t0,-28($fp)	# Store directly on the stack
+	lw	$t0,-12($fp)	
+	lw	$t1,-28($fp)	
+	sub	$t0,$t0,$t1	# t0=t0-t1
+	bgez	$t0,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-28($fp)	# Store directly on the stack
+	beq	$t0,$0,L_func_bubble_sort_endwhile_1	
+				# if (array[j] < array[j-1]) {    # swap
+	lw	$t0,($s1)	
+	sw	$t0,-32($fp)	# Store directly on the stack
+				# Reserved one word on stack for temp var -36($fp)
+	lw	$t0,-12($fp)	
+	li	$t1,1	
+	sub	$t0,$t0,$t1	
+	sw	$t0,-36($fp)	# Store directly on the stack
+	lw	$t1,-36($fp)	
+	sll	$t1,$t1,2	# multiply subscript by 4
+	sub	$t0,$s0,$t1	# $t0 points to value at array[subscript]
+	lw	$t0,($t0)	
+	sw	$t0,-40($fp)	# Store directly on the stack
+	lw	$t0,-32($fp)	
+	lw	$t1,-40($fp)	
+	sub	$t0,$t0,$t1	# t0=t0-t1
+	bgez	$t0,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-32($fp)	# Store directly on the stack
+	beq	$t0,$0,L_func_bubble_sort_else_0	
+				# temp = array[j-1];
+				# Reserved one word on stack for temp var -44($fp)
+	lw	$t0,-12($fp)	
+	li	$t1,1	
+	sub	$t0,$t0,$t1	
+	sw	$t0,-44($fp)	# Store directly on the stack
+	lw	$t1,-44($fp)	
+	sll	$t1,$t1,2	# multiply subscript by 4
+	sub	$t0,$s0,$t1	# $t0 points to value at array[subscript]
+	lw	$t0,($t0)	
+	sw	$t0,-48($fp)	# Store directly on the stack
+	sw	$t0,-16($fp)	# Store directly on the stack
+				# array[j-1] = array[j];
+				# Reserved one word on stack for temp var -44($fp)
+	lw	$t0,-12($fp)	
+	li	$t1,1	
+	sub	$t0,$t0,$t1	
+	sw	$t0,-44($fp)	# Store directly on the stack
+	lw	$t0,($s1)	
+	sw	$t0,-48($fp)	# Store directly on the stack
+	lw	$t2,-44($fp)	
+	sll	$t2,$t2,2	# multiply subscript by 4
+	sub	$t1,$s0,$t2	# $t1 points to value at array[subscript]
+	sw	$t0,($t1)	# Store data at array[subscript]
+				# array[j] = temp;
+	lw	$t0,-16($fp)	
+	sw	$t0,($s1)	# Store data at array[subscript]
+				# swapped = 1;                # true
+				# Reserved one word on stack for temp var -44($fp)
+	li	$t0,1	
+	sw	$t0,-8($fp)	# Store directly on the stack
+L_func_bubble_sort_else_0:			
+				# j = j+1;
+				# Reserved one word on stack for temp var -44($fp)
+	lw	$t0,-12($fp)	
+	li	$t1,1	
+	add	$t0,$t0,$t1	
+	sw	$t0,-44($fp)	# Store directly on the stack
+	sw	$t0,-12($fp)	# Store directly on the stack
+	addi	$s1,$s1,-4	# subscript changed by 1
+	b	L_func_bubble_sort_while_1	
+L_func_bubble_sort_endwhile_1:			
+				# i = i+1;
+				# Reserved one word on stack for temp var -32($fp)
+	lw	$t0,-20($fp)	
+	li	$t1,1	
+	add	$t0,$t0,$t1	
+	sw	$t0,-32($fp)	# Store directly on the stack
+	sw	$t0,-20($fp)	# Store directly on the stack
+	b	L_func_bubble_sort_while_0	
+L_func_bubble_sort_endwhile_0:			
+				# return;
+	jr	$ra	
+	jr	$ra	
+func_sort10:			# sort10() INT
+				# print("BubbleSort for 10 values: Please input 10 integers.\n");
+				# Reserved one word on stack for temp var -8($fp)
+
+	.data
+L_func_sort10_string_0:	.asciiz	"BubbleSort for 10 values: Please input 10 integers.\n"
+
+	.text
+				# print(string)
+	la	$a0,L_func_sort10_string_0	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# var array [10]int;
+				# Reserve 10 words on stack for var array at -8($fp)
+				# var j int;
+				# Reserve 1 words on stack for var j at -48($fp)
+				# j = 0;
+				# Reserved one word on stack for temp var -52($fp)
+	li	$t0,0	
+	sw	$t0,-48($fp)	# Store directly on the stack
+				# while (j < 10) {
+				# Array addresses hoisted out of while loop
+	lw	$s0,-48($fp)	# put subscript in $s0
+	sll	$s0,$s0,2	# multiply subscript by 4
+	sub	$s0,$fp,$s0	
+	addi	$s0,$s0,-8	# $s0 points to array[subscript]
+L_func_sort10_while_0:			
+				# Reserved one word on stack for temp var -52($fp)
+	lw	$t0,-48($fp)	
+	li	$t1,10	
+	sub	$t0,$t0,$t1	# t0=t0-t1
+	bgez	$t0,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-52($fp)	# Store directly on the stack
+	beq	$t0,$0,L_func_sort10_endwhile_0	
+				# array[j] = read_int();
+				# Reserved one word on stack for temp var -56($fp)
+	li	$v0,5	# Syscall for read_int
+	syscall			
+	sw	$v0,-56($fp)	
+	lw	$t0,-56($fp)	
+	sw	$t0,($s0)	# Store data at array[subscript]
+				# j = j+1;
+				# Reserved one word on stack for temp var -56($fp)
+	lw	$t0,-48($fp)	
+	li	$t1,1	
+	add	$t0,$t0,$t1	
+	sw	$t0,-56($fp)	# Store directly on the stack
+	sw	$t0,-48($fp)	# Store directly on the stack
+	addi	$s0,$s0,-4	# subscript changed by 1
+	b	L_func_sort10_while_0	
+L_func_sort10_endwhile_0:			
+				# bubble_sort(array, 10);
+				# Reserved one word on stack for temp var -56($fp)
+				# Reserve 1 words on stack for var return_var at -60($fp)
+	addi	$t0,$fp,-8	# Make pointer
+	sw	$t0,-64($fp)	# Add param to stack for param at -64($fp)
+	li	$t0,10	
+	sw	$t0,-56($fp)	
+	addi	$t0,$fp,-56	# Make pointer
+	sw	$t0,-68($fp)	# Add param to stack for param at -68($fp)
+	addi	$sp,$fp,-72	
+	sw	$fp,($sp)	# store old control link
+	move	$fp,$sp	# make new control link
+	addi	$sp,$sp,-4	
+	sw	$ra,($sp)	# store return address
+	jal	func_bubble_sort	
+	lw	$ra,-4($fp)	# restore old ra
+	move	$sp,$fp	# restore old sp
+	addi	$sp,$sp,12	# remove params and control link from stack
+	lw	$fp,($fp)	# restore old fp
+				# print("Sorted list:\n");
+				# Reserved one word on stack for temp var -56($fp)
+
+	.data
+L_func_sort10_string_1:	.asciiz	"Sorted list:\n"
+
+	.text
+				# print(string)
+	la	$a0,L_func_sort10_string_1	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# j = 0;
+				# Reserved one word on stack for temp var -56($fp)
+	li	$t0,0	
+	sw	$t0,-48($fp)	# Store directly on the stack
+				# while (j < 10) {
+				# Array addresses hoisted out of while loop
+	lw	$s0,-48($fp)	# put subscript in $s0
+	sll	$s0,$s0,2	# multiply subscript by 4
+	sub	$s0,$fp,$s0	
+	addi	$s0,$s0,-8	# $s0 points to array[subscript]
+L_func_sort10_while_1:			
+				# Reserved one word on stack for temp var -56($fp)
+	lw	$t0,-48($fp)	
+	li	$t1,10	
+	sub	$t0,$t0,$t1	# t0=t0-t1
+	bgez	$t0,1f	
+	li	$t0,1	# Test was true
+	b	2f	
+1:			# Failed test
+	li	$t0,0	# Test was false
+2:			# After test result saved to t0
+	sw	$t0,-56($fp)	# Store directly on the stack
+	beq	$t0,$0,L_func_sort10_endwhile_1	
+				# print(array[j], '\n');
+	lw	$t0,($s0)	
+	sw	$t0,-60($fp)	# Store directly on the stack
+				# Reserved one word on stack for temp var -64($fp)
+				# print(int)
+	lw	$a0,-60($fp)	
+	li	$v0,1	# Syscall for print_int
+	syscall			
+				# print(char)
+	li	$a0,10	
+	li	$v0,11	# Syscall for print_char
+	syscall			
+				# j = j+1;
+				# Reserved one word on stack for temp var -60($fp)
+	lw	$t0,-48($fp)	
+	li	$t1,1	
+	add	$t0,$t0,$t1	
+	sw	$t0,-60($fp)	# Store directly on the stack
+	sw	$t0,-48($fp)	# Store directly on the stack
+	addi	$s0,$s0,-4	# subscript changed by 1
+	b	L_func_sort10_while_1	
+L_func_sort10_endwhile_1:			
+				# return;
+	jr	$ra	
+	jr	$ra	
+main_func:			# main() INT
+				# print("GCD of 2 values: Please input 2 integers.\n");
+				# Reserved one word on stack for temp var -8($fp)
+
+	.data
+L_main_func_string_0:	.asciiz	"GCD of 2 values: Please input 2 integers.\n"
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_0	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# var a int;
+				# Reserve 1 words on stack for var a at -8($fp)
+				# var b int;
+				# Reserve 1 words on stack for var b at -12($fp)
+				# var d int;
+				# Reserve 1 words on stack for var d at -16($fp)
+				# a = read_int();
+				# Reserved one word on stack for temp var -20($fp)
+	li	$v0,5	# Syscall for read_int
+	syscall			
+	sw	$v0,-20($fp)	
+	lw	$t0,-20($fp)	
+	sw	$t0,-8($fp)	# Store directly on the stack
+				# b = read_int();
+				# Reserved one word on stack for temp var -20($fp)
+	li	$v0,5	# Syscall for read_int
+	syscall			
+	sw	$v0,-20($fp)	
+	lw	$t0,-20($fp)	
+	sw	$t0,-12($fp)	# Store directly on the stack
+				# d = gcd(a, b);
+				# Reserve 1 words on stack for var return_var at -20($fp)
+	addi	$t0,$fp,-8	# Make pointer
+	sw	$t0,-24($fp)	# Add param to stack for param at -24($fp)
+	addi	$t0,$fp,-12	# Make pointer
+	sw	$t0,-28($fp)	# Add param to stack for param at -28($fp)
+	addi	$sp,$fp,-32	
+	sw	$fp,($sp)	# store old control link
+	move	$fp,$sp	# make new control link
+	addi	$sp,$sp,-4	
+	sw	$ra,($sp)	# store return address
+	jal	func_gcd	
+	lw	$ra,-4($fp)	# restore old ra
+	move	$sp,$fp	# restore old sp
+	addi	$sp,$sp,12	# remove params and control link from stack
+	lw	$fp,($fp)	# restore old fp
+	lw	$t0,-20($fp)	
+	sw	$t0,-16($fp)	# Store directly on the stack
+				# print("GCD of ", a, " and ", b, " is: ", d, ".\n\n");
+				# Reserved one word on stack for temp var -20($fp)
+				# Reserved one word on stack for temp var -24($fp)
+				# Reserved one word on stack for temp var -28($fp)
+				# Reserved one word on stack for temp var -32($fp)
+
+	.data
+L_main_func_string_1:	.asciiz	"GCD of "
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_1	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print(int)
+	lw	$a0,-8($fp)	
+	li	$v0,1	# Syscall for print_int
+	syscall			
+
+	.data
+L_main_func_string_2:	.asciiz	" and "
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_2	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print(int)
+	lw	$a0,-12($fp)	
+	li	$v0,1	# Syscall for print_int
+	syscall			
+
+	.data
+L_main_func_string_3:	.asciiz	" is: "
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_3	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print(int)
+	lw	$a0,-16($fp)	
+	li	$v0,1	# Syscall for print_int
+	syscall			
+
+	.data
+L_main_func_string_4:	.asciiz	".\n\n"
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_4	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# sort10();
+				# Reserve 1 words on stack for var return_var at -20($fp)
+	addi	$sp,$fp,-24	
+	sw	$fp,($sp)	# store old control link
+	move	$fp,$sp	# make new control link
+	addi	$sp,$sp,-4	
+	sw	$ra,($sp)	# store return address
+	jal	func_sort10	
+	lw	$ra,-4($fp)	# restore old ra
+	move	$sp,$fp	# restore old sp
+	addi	$sp,$sp,4	# remove params and control link from stack
+	lw	$fp,($fp)	# restore old fp
+				# print("Fibonacci sequence: Please input an integer.\n");
+				# Reserved one word on stack for temp var -20($fp)
+
+	.data
+L_main_func_string_5:	.asciiz	"Fibonacci sequence: Please input an integer.\n"
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_5	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# var fib int;
+				# Reserve 1 words on stack for var fib at -20($fp)
+				# a = read_int();
+				# Reserved one word on stack for temp var -24($fp)
+	li	$v0,5	# Syscall for read_int
+	syscall			
+	sw	$v0,-24($fp)	
+	lw	$t0,-24($fp)	
+	sw	$t0,-8($fp)	# Store directly on the stack
+				# fib = fibonacci(a);
+				# Reserve 1 words on stack for var return_var at -24($fp)
+	addi	$t0,$fp,-8	# Make pointer
+	sw	$t0,-28($fp)	# Add param to stack for param at -28($fp)
+	addi	$sp,$fp,-32	
+	sw	$fp,($sp)	# store old control link
+	move	$fp,$sp	# make new control link
+	addi	$sp,$sp,-4	
+	sw	$ra,($sp)	# store return address
+	jal	func_fibonacci	
+	lw	$ra,-4($fp)	# restore old ra
+	move	$sp,$fp	# restore old sp
+	addi	$sp,$sp,8	# remove params and control link from stack
+	lw	$fp,($fp)	# restore old fp
+	lw	$t0,-24($fp)	
+	sw	$t0,-20($fp)	# Store directly on the stack
+				# print("Fibonacci Number ", a, " is: ", fib, ".\n\n");
+				# Reserved one word on stack for temp var -24($fp)
+				# Reserved one word on stack for temp var -28($fp)
+				# Reserved one word on stack for temp var -32($fp)
+
+	.data
+L_main_func_string_6:	.asciiz	"Fibonacci Number "
+
+	.text
+				# print(string)
+	la	$a0,L_main_func_string_6	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print(int)
+	lw	$a0,-8($fp)	
+	li	$v0,1	# Syscall for print_int
+	syscall			
+				# print(string)
+	la	$a0,L_main_func_string_3	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# print(int)
+	lw	$a0,-20($fp)	
+	li	$v0,1	# Syscall for print_int
+	syscall			
+				# print(string)
+	la	$a0,L_main_func_string_4	
+	li	$v0,4	# Syscall for print_string
+	syscall			
+				# return;
+	jr	$ra	
+	jr	$ra	